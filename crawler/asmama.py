@@ -20,15 +20,16 @@ class AsmamaCrawler(BaseCrawler):
     BASE_URL = "http://www.asmama.com"
     PRODUCT_URL_TEMPLATE = "http://www.asmama.com/shop/shopdetail.html?branduid={branduid}"
     
-    def __init__(self, storage: Any = None, max_workers: int = 1):
+    def __init__(self, storage: Any = None, max_workers: int = 1, headless: Optional[bool] = None):
         """
         Asmama 크롤러를 초기화한다.
         
         Args:
             storage: 데이터 저장소 인스턴스
             max_workers: 최대 동시 세션 수 (서버 부담 경감을 위해 기본값 1)
+            headless: headless 모드 여부 (None이면 환경변수 CRAWLER_HEADLESS)
         """
-        super().__init__(storage, max_workers)
+        super().__init__(storage, max_workers, headless=headless)
         self.semaphore = asyncio.Semaphore(max_workers)  # 동시성 제어
         
         # 지속적인 컨텍스트 및 페이지 관리
@@ -7,7 +7,9 @@ import asyncio
 from pathlib import Path
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
-from .utils import get_random_user_agent, get_random_viewport, random_delay, log_error
+from .utils import get_random_user_agent, get_random_viewport, headless_from_env, random_delay, log_error
+from .browser_pool import BrowserPool
+from .resource_blocking import ResourceBlocker
 
 
 class BaseCrawler(ABC):
@@ -17,16 +19,27 @@ class BaseCrawler(ABC):
     Playwright를 사용한 웹 크롤링의 공통 기능을 제공한다.
     """
     
-    def __init__(self, storage: Any = None, max_workers: int = 3):
+    # create_context()에서 사용할 리소스 차단 규칙 프로필 (crawler/resource_blocking.py)
+    RESOURCE_BLOCK_PROFILE = "default"
+    
+    def __init__(self, storage: Any = None, max_workers: int = 3, browser_pool: Optional[BrowserPool] = None,
+                 headless: Optional[bool] = None):
         """
         베이스 크롤러를 초기화한다.
         
         Args:
             storage: 데이터 저장소 인스턴스
             max_workers: 최대 동시 세션 수
+            browser_pool: 공유 브라우저 풀 (None이면 크롤러 전용 브라우저를 직접 실행)
+            headless: 전용 브라우저의 headless 모드 여부 (None이면 환경변수 CRAWLER_HEADLESS, 공유 풀은 풀의 설정을 따름)
         """
         self.storage = storage
         self.max_workers = max_workers
+        self.browser_pool = browser_pool
+        if browser_pool is not None:
+            self.headless = browser_pool.headless
+        else:
+            self.headless = headless_from_env() if headless is None else headless
         
         # 로거 설정 - setup_logger와 동일한 핸들러 사용
         from .utils import setup_logger
@@ -36,6 +49,7 @@ class BaseCrawler(ABC):
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.contexts: List[BrowserContext] = []
+        self.resource_blocker: Optional[ResourceBlocker] = None
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입."""
@@ -51,12 +65,18 @@ class BaseCrawler(ABC):
         크롤러를 시작하고 브라우저를 초기화한다.
         """
         try:
+            if self.browser_pool:
+                # 공유 풀의 브라우저 사용 (별도 프로세스를 띄우지 않음)
+                self.browser = await self.browser_pool.start()
+                self.playwright = self.browser_pool.playwright
+                self.logger.info("브라우저 초기화 완료 (공유 풀)")
+                return
+            
             self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=False,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
+            self.browser = await BrowserPool.launch_browser(
+                self.playwright, self.headless, list(BrowserPool.DEFAULT_LAUNCH_ARGS), self.logger
             )
-            self.logger.info("브라우저 초기화 완료")
+            self.logger.info(f"브라우저 초기화 완료 ({'headless' if self.headless else 'headed'})")
         except Exception as e:
             self.logger.error(f"브라우저 초기화 실패: {str(e)}")
             raise
@@ -71,11 +91,20 @@ class BaseCrawler(ABC):
                 await context.close()
             self.contexts.clear()
             
-            if self.browser:
-                await self.browser.close()
-                
-            if self.playwright:
-                await self.playwright.stop()
+            if self.resource_blocker:
+                self.logger.info(f"리소스 차단 통계: {self.resource_blocker.format_stats()}")
+            
+            if self.browser_pool:
+                # 공유 풀은 참조 카운트만 감소 (마지막 사용자가 브라우저 종료)
+                await self.browser_pool.stop()
+                self.browser = None
+                self.playwright = None
+            else:
+                if self.browser:
+                    await self.browser.close()
+                    
+                if self.playwright:
+                    await self.playwright.stop()
                 
             self.logger.info("크롤러 종료 완료")
         except Exception as e:
@@ -109,57 +138,16 @@ class BaseCrawler(ABC):
         """
         서버 부담 경감을 위한 리소스 차단을 설정한다.
         
+        차단 규칙은 RESOURCE_BLOCK_PROFILE 프로필로 정해지며 RESOURCE_BLOCK_RULES 파일로 바꿀 수 있다.
+        
         Args:
             context: 브라우저 컨텍스트
         """
-        async def handle_route(route):
-            """리소스 요청을 처리한다."""
-            url = route.request.url
-            resource_type = route.request.resource_type
-            
-            # 이미지 파일 차단 (URL은 수집하되 실제 다운로드 방지)
-            if resource_type == "image":
-                await route.abort()
-                return
-            
-            # 폰트 파일 차단
-            if resource_type == "font" or any(ext in url.lower() for ext in ['.woff', '.woff2', '.ttf', '.otf', '.eot']):
-                await route.abort()
-                return
-            
-            # 미디어 파일 차단
-            if resource_type == "media" or any(ext in url.lower() for ext in ['.mp4', '.avi', '.mov', '.wmv', '.mp3', '.wav', '.ogg']):
-                await route.abort()
-                return
-            
-            # 광고 및 추적 스크립트 차단
-            blocked_domains = [
-                'google-analytics.com',
-                'googletagmanager.com',
-                'facebook.com/tr',
-                'doubleclick.net',
-                'googlesyndication.com',
-                'adsystem.com',
-                'ads.yahoo.com',
-                'amazon-adsystem.com'
-            ]
-            
-            if any(domain in url.lower() for domain in blocked_domains):
-                await route.abort()
-                return
-            
-            # 불필요한 CSS 파일 차단 (일부만)
-            if resource_type == "stylesheet" and any(keyword in url.lower() for keyword in ['font', 'icon', 'ads']):
-                await route.abort()
-                return
-            
-            # 그 외 요청은 정상 처리
-            await route.continue_()
-        
-        # 라우터 설정
-        await context.route("**/*", handle_route)
+        if self.resource_blocker is None:
+            self.resource_blocker = ResourceBlocker.for_profile(self.RESOURCE_BLOCK_PROFILE)
+        await self.resource_blocker.attach(context)
         
-        self.logger.debug("리소스 차단 설정 완료 (이미지, 폰트, 미디어, 광고 스크립트)")
+        self.logger.debug(f"리소스 차단 설정 완료 (프로필: {self.resource_blocker.name})")
         
     async def create_page(self, context: Optional[BrowserContext] = None) -> Page:
         """
@@ -0,0 +1,258 @@
+"""Playwright 브라우저 프로세스 공유 풀."""
+
+from typing import Dict, List, Optional, Set
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from .utils import headless_from_env, setup_logger
+
+
+class BrowserPool:
+    """
+    하나의 Chromium 프로세스를 여러 구성 요소가 공유하도록 관리하는 풀.
+
+    쿠키 부트스트랩(OliveyoungCookieManager)과 크롤링(BaseCrawler)이 같은 브라우저를
+    사용하고, 컨텍스트별로 사용이 끝난 페이지를 보관했다가 재사용한다.
+    start()/stop()은 참조 카운트 방식이므로 마지막 사용자가 stop()할 때 브라우저가 종료된다.
+    retire_context()로 교체된 컨텍스트는 사용 중인 페이지가 모두 반납된 뒤 닫힌다.
+    headless 모드는 X 서버 없이 동작하며, 지문 관련 실행 인자는 headed 모드와 동일하게 사용한다.
+    """
+
+    # 쿠키 매니저에서 사용하던 지문(fingerprint) 관련 실행 인자
+    DEFAULT_LAUNCH_ARGS = [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-features=VizDisplayCompositor',
+        '--use-gl=swiftshader'  # WebGL 지문 생성
+    ]
+
+    # headless 모드에서 사용할 Chromium 채널 ("chromium"은 headed와 같은 브라우저 빌드의 new headless 모드,
+    # 기본 headless shell은 렌더링 경로와 navigator/WebGL 지문이 headed 모드와 다름)
+    HEADLESS_CHANNEL = "chromium"
+    
+    def __init__(self, headless: Optional[bool] = None, launch_args: Optional[List[str]] = None,
+                 max_idle_pages: int = 2, max_contexts: int = 4):
+        """
+        브라우저 풀을 초기화한다.
+
+        Args:
+            headless: headless 모드 여부 (None이면 환경변수 CRAWLER_HEADLESS, 기본 headed)
+            launch_args: Chromium 실행 인자 (None이면 DEFAULT_LAUNCH_ARGS)
+            max_idle_pages: 컨텍스트당 재사용을 위해 보관할 최대 유휴 페이지 수
+            max_contexts: 풀이 동시에 유지할 최대 컨텍스트 수 (초과 시 사용 중이 아닌 가장 오래된 컨텍스트 정리)
+        """
+        self.headless = headless_from_env() if headless is None else headless
+        self.launch_args = launch_args or list(self.DEFAULT_LAUNCH_ARGS)
+        self.max_idle_pages = max_idle_pages
+        self.max_contexts = max_contexts
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._ref_count = 0
+
+        # 풀이 생성한 컨텍스트와 컨텍스트별 유휴 페이지
+        self._contexts: List[BrowserContext] = []
+        self._idle_pages: Dict[BrowserContext, List[Page]] = {}
+        # acquire_page로 빌려 간 페이지 수와 교체되어 반납을 기다리는 컨텍스트
+        self._in_use: Dict[BrowserContext, int] = {}
+        self._retiring: Set[BrowserContext] = set()
+
+    async def start(self) -> Browser:
+        """
+        브라우저를 시작하고 참조 카운트를 증가시킨다 (이미 실행 중이면 재사용).
+
+        Returns:
+            공유 브라우저 인스턴스
+        """
+        if self.browser is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.launch_browser(self.playwright, self.headless, self.launch_args, self.logger)
+            mode = "headless" if self.headless else "headed"
+            self.logger.info(f"공유 브라우저 시작 완료 ({mode})")
+
+        self._ref_count += 1
+        return self.browser
+
+    @classmethod
+    async def launch_browser(cls, playwright: Playwright, headless: bool, args: List[str], logger=None) -> Browser:
+        """
+        Chromium을 실행한다 (headless면 new headless 채널, 실패 시 기본 headless shell로 폴백).
+        
+        Args:
+            playwright: Playwright 인스턴스
+            headless: headless 모드 여부
+            args: Chromium 실행 인자
+            logger: 폴백 경고를 남길 로거
+            
+        Returns:
+            실행된 브라우저
+        """
+        if headless:
+            try:
+                return await playwright.chromium.launch(headless=True, channel=cls.HEADLESS_CHANNEL, args=args)
+            except Exception as e:
+                if logger:
+                    logger.warning(f"new headless 모드 실행 실패, 기본 headless로 실행: {e}")
+        return await playwright.chromium.launch(headless=headless, args=args)
+    
+    async def stop(self) -> None:
+        """참조 카운트를 감소시키고 마지막 사용자면 브라우저를 종료한다."""
+        if self._ref_count > 0:
+            self._ref_count -= 1
+        if self._ref_count > 0:
+            return
+
+        for context in list(self._contexts):
+            await self.close_context(context)
+
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self.logger.info("공유 브라우저 종료 완료")
+
+    async def new_context(self, keep: Optional[BrowserContext] = None, **kwargs) -> BrowserContext:
+        """
+        공유 브라우저에 새 컨텍스트를 생성하고 풀에 등록한다.
+
+        최대 컨텍스트 수에 도달하면 빌려 간 페이지가 없고 교체 대기 중이 아닌 가장 오래된 컨텍스트부터
+        retire_context로 정리한다. 정리할 컨텍스트가 없으면 진행 중인 크롤링을 끊지 않도록 한도를 넘겨 생성한다.
+
+        Args:
+            keep: 정리하지 않을 호출 측의 현재 컨텍스트 (새 컨텍스트로 교체되기 전까지 사용 중)
+            **kwargs: Browser.new_context 인자
+
+        Returns:
+            생성된 브라우저 컨텍스트
+        """
+        if not self.browser:
+            raise RuntimeError("브라우저 풀이 시작되지 않았습니다.")
+
+        excess = len(self._contexts) - self.max_contexts + 1
+        if excess > 0:
+            candidates = [
+                context for context in self._contexts
+                if context is not keep and context not in self._retiring and not self._in_use.get(context)
+            ]
+            for context in candidates[:excess]:
+                await self.retire_context(context)
+            if len(self._contexts) >= self.max_contexts:
+                self.logger.warning(
+                    f"최대 컨텍스트 수({self.max_contexts}) 초과: 사용 중/교체 대기 중인 컨텍스트만 남아 있어 추가 생성"
+                )
+
+        context = await self.browser.new_context(**kwargs)
+        self._contexts.append(context)
+        self._idle_pages[context] = []
+        return context
+
+    async def close_context(self, context: BrowserContext) -> None:
+        """
+        컨텍스트와 보관 중인 유휴 페이지를 정리한다.
+
+        Args:
+            context: 정리할 브라우저 컨텍스트
+        """
+        self._idle_pages.pop(context, None)
+        self._in_use.pop(context, None)
+        self._retiring.discard(context)
+        if context in self._contexts:
+            self._contexts.remove(context)
+        try:
+            await context.close()
+        except Exception as e:
+            self.logger.debug(f"컨텍스트 종료 중 오류 (무시): {e}")
+
+    async def retire_context(self, context: BrowserContext) -> None:
+        """
+        교체된 컨텍스트를 정리한다.
+
+        사용 중인 페이지가 없으면 바로 닫고, 있으면 유휴 페이지만 닫은 뒤
+        마지막 페이지가 release_page로 반납될 때 닫는다 (진행 중인 상품 크롤링은 끝까지 진행).
+
+        Args:
+            context: 더 이상 새 페이지를 열지 않을 컨텍스트
+        """
+        if not self._in_use.get(context):
+            await self.close_context(context)
+            return
+
+        self._retiring.add(context)
+        for page in self._idle_pages.pop(context, []):
+            try:
+                await page.close()
+            except Exception as e:
+                self.logger.debug(f"페이지 종료 중 오류 (무시): {e}")
+        self.logger.debug(f"컨텍스트 교체 대기: 사용 중인 페이지 {self._in_use[context]}개")
+
+    async def prewarm(self, context: BrowserContext, count: Optional[int] = None) -> None:
+        """
+        컨텍스트에 유휴 페이지를 미리 열어 둔다.
+
+        Args:
+            context: 대상 컨텍스트
+            count: 열어 둘 페이지 수 (None이면 max_idle_pages)
+        """
+        idle = self._idle_pages.setdefault(context, [])
+        target = min(count if count is not None else self.max_idle_pages, self.max_idle_pages)
+        while len(idle) < target:
+            idle.append(await context.new_page())
+        self.logger.debug(f"유휴 페이지 {len(idle)}개 준비 완료")
+
+    async def acquire_page(self, context: BrowserContext) -> Page:
+        """
+        컨텍스트의 유휴 페이지를 꺼내거나 없으면 새 페이지를 연다.
+
+        Args:
+            context: 페이지를 사용할 컨텍스트
+
+        Returns:
+            사용 가능한 페이지
+        """
+        idle = self._idle_pages.get(context, [])
+        page = None
+        while idle and page is None:
+            candidate = idle.pop()
+            if not candidate.is_closed():
+                page = candidate
+        if page is None:
+            page = await context.new_page()
+        self._in_use[context] = self._in_use.get(context, 0) + 1
+        return page
+
+    async def release_page(self, page: Page, failed: bool = False) -> None:
+        """
+        사용이 끝난 페이지를 반납한다 (보관 한도 초과 또는 미등록 컨텍스트면 닫는다).
+
+        보관하는 페이지는 about:blank로 초기화하여 이전 상품의 DOM/진행 중인 요청이 다음 사용에 남지 않게 한다.
+        실패한(또는 중간에 중단된) 페이지와 초기화에 실패한 페이지는 재사용하지 않고 닫는다.
+
+        Args:
+            page: 반납할 페이지
+            failed: 페이지 작업이 실패했으면 True (재사용하지 않음)
+        """
+        context = page.context
+        if self._in_use.get(context):
+            self._in_use[context] -= 1
+
+        if not page.is_closed():
+            idle = self._idle_pages.get(context)
+            if not failed and idle is not None and len(idle) < self.max_idle_pages and context not in self._retiring:
+                try:
+                    await page.goto("about:blank")
+                    idle.append(page)
+                    return
+                except Exception as e:
+                    self.logger.debug(f"페이지 초기화 실패, 닫음: {e}")
+
+            try:
+                await page.close()
+            except Exception as e:
+                self.logger.debug(f"페이지 종료 중 오류 (무시): {e}")
+
+        if context in self._retiring and not self._in_use.get(context):
+            await self.close_context(context)
@@ -0,0 +1,112 @@
+"""Oliveyoung 카테고리 트리 디스크 캐시."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .utils import setup_logger
+
+
+class CategoryTreeCache:
+    """
+    extract_all_category_ids() 결과를 JSON 파일에 저장하는 캐시.
+
+    저장 후 ttl초 동안은 메인 페이지를 열지 않고 캐시를 그대로 사용한다.
+    ttl이 지나면 호출자가 GNB 메뉴를 다시 읽어 save()하며, 메뉴 해시(menu_hash)로
+    트리가 실제로 바뀌었는지 확인할 수 있다.
+    """
+
+    def __init__(self, path: str = "oy_categories.json", ttl: float = 24 * 3600):
+        """
+        카테고리 캐시를 초기화한다.
+
+        Args:
+            path: 캐시 파일 경로
+            ttl: 캐시를 검증 없이 사용할 시간(초)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.logger = setup_logger(self.__class__.__name__)
+
+    @staticmethod
+    def menu_hash(categories: List[Dict[str, str]]) -> str:
+        """
+        카테고리 목록의 해시를 계산한다 (ID/이름만 사용하므로 메뉴 HTML의 추적 파라미터 등에 영향받지 않음).
+
+        Args:
+            categories: [{"id", "name"}, ...]
+
+        Returns:
+            sha256 hex 문자열
+        """
+        payload = json.dumps(
+            sorted((category["id"], category["name"]) for category in categories),
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _read(self) -> Optional[Dict]:
+        """캐시 파일을 읽는다 (없거나 손상되었으면 None)."""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if not isinstance(entry.get("categories"), list):
+                return None
+            return entry
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"카테고리 캐시 읽기 실패, 무시: {e}")
+            return None
+
+    def load(self, allow_stale: bool = False) -> Optional[List[Dict[str, str]]]:
+        """
+        캐시된 카테고리 목록을 반환한다.
+
+        Args:
+            allow_stale: True이면 ttl이 지난 캐시도 반환
+
+        Returns:
+            카테고리 목록 또는 None (캐시 없음/만료)
+        """
+        entry = self._read()
+        if entry is None:
+            return None
+        age = time.time() - entry.get("fetched_at", 0)
+        if age > self.ttl and not allow_stale:
+            return None
+        return entry["categories"]
+
+    def is_unchanged(self, categories: List[Dict[str, str]]) -> bool:
+        """
+        새로 읽은 카테고리 목록이 캐시와 같은지 확인한다.
+
+        Args:
+            categories: 새로 추출한 카테고리 목록
+
+        Returns:
+            메뉴 해시 일치 여부
+        """
+        entry = self._read()
+        return entry is not None and entry.get("menu_hash") == self.menu_hash(categories)
+
+    def save(self, categories: List[Dict[str, str]]) -> None:
+        """
+        카테고리 목록을 저장한다 (임시 파일 후 rename으로 원자적 교체).
+
+        Args:
+            categories: [{"id", "name"}, ...]
+        """
+        entry = {
+            "fetched_at": time.time(),
+            "menu_hash": self.menu_hash(categories),
+            "categories": categories,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,152 @@
+"""재개 가능한 크롤링 체크포인트."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .utils import setup_logger
+
+
+class CrawlCheckpoint:
+    """
+    전체 카테고리 크롤링 진행 상황을 append-only JSONL 파일에 기록하는 체크포인트.
+
+    카테고리별로 추출한 goodsNo 목록, 저장소에 기록된 goodsNo, 실패한 goodsNo,
+    완료된 카테고리를 이벤트로 남기고, 재시작 시 이벤트를 재생해 상태를 복원한다.
+    마지막 줄이 잘린 경우(크래시 중 기록)는 건너뛴다.
+    """
+
+    SUFFIX = ".checkpoint.jsonl"
+
+    def __init__(self, path: str, resume: bool = True):
+        """
+        체크포인트를 초기화한다.
+
+        Args:
+            path: 체크포인트 파일 경로
+            resume: True이면 기존 파일을 재생해 상태를 복원, False이면 기존 파일을 삭제하고 새로 시작
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = setup_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        self.category_goods: Dict[str, List[str]] = {}
+        self.completed_categories: Set[str] = set()
+        self.persisted: Set[str] = set()
+        self.failed: Set[str] = set()
+
+        if resume:
+            self._replay()
+        elif self.path.exists():
+            self.path.unlink()
+
+    @classmethod
+    def for_output(cls, output_path: str, resume: bool = True) -> "CrawlCheckpoint":
+        """
+        출력 파일 옆에 체크포인트를 생성한다 (예: products.xlsx → products.xlsx.checkpoint.jsonl).
+
+        Args:
+            output_path: 크롤링 결과 파일 경로
+            resume: 기존 체크포인트 재사용 여부
+
+        Returns:
+            체크포인트 인스턴스
+        """
+        output = Path(output_path)
+        return cls(str(output.with_name(output.name + cls.SUFFIX)), resume=resume)
+
+    def _replay(self) -> None:
+        """기존 이벤트를 읽어 상태를 복원한다."""
+        if not self.path.exists():
+            return
+
+        skipped = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    skipped += 1
+
+        if skipped:
+            self.logger.warning(f"손상된 체크포인트 이벤트 {skipped}개 건너뜀: {self.path}")
+        self.logger.info(
+            f"체크포인트 복원: 완료 카테고리 {len(self.completed_categories)}개, "
+            f"goodsNo 목록 {len(self.category_goods)}개 카테고리, 저장 완료 {len(self.persisted)}개, "
+            f"실패 {len(self.failed - self.persisted)}개"
+        )
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        """이벤트 하나를 상태에 반영한다."""
+        kind = event["event"]
+        if kind == "category_goods":
+            self.category_goods[event["category_id"]] = list(event["goods_no"])
+        elif kind == "persisted":
+            self.persisted.update(event["goods_no"])
+        elif kind == "failed":
+            self.failed.update(event["goods_no"])
+        elif kind == "category_done":
+            self.completed_categories.add(event["category_id"])
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        """이벤트를 상태에 반영하고 파일에 append + fsync한다."""
+        with self._lock:
+            self._apply(event)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_category_goods(self, category_id: str, goods_no_list: List[str]) -> None:
+        """카테고리에서 추출한 goodsNo 목록을 기록한다."""
+        self._record({"event": "category_goods", "category_id": category_id, "goods_no": list(goods_no_list)})
+
+    def record_persisted(self, goods_no_list: Iterable[str]) -> None:
+        """저장소에 기록된 goodsNo를 기록한다."""
+        goods_no_list = [str(goods_no) for goods_no in goods_no_list]
+        if goods_no_list:
+            self._record({"event": "persisted", "goods_no": goods_no_list})
+
+    def record_failed(self, goods_no_list: Iterable[str]) -> None:
+        """크롤링에 실패한 goodsNo를 기록한다."""
+        goods_no_list = list(goods_no_list)
+        if goods_no_list:
+            self._record({"event": "failed", "goods_no": goods_no_list})
+
+    def record_category_done(self, category_id: str) -> None:
+        """카테고리 처리 완료를 기록한다."""
+        self._record({"event": "category_done", "category_id": category_id})
+
+    def get_category_goods(self, category_id: str) -> Optional[List[str]]:
+        """이전 실행에서 추출한 카테고리의 goodsNo 목록 (없으면 None)."""
+        return self.category_goods.get(category_id)
+
+    def pending_goods(self, goods_no_list: List[str]) -> List[str]:
+        """아직 저장되지 않은 goodsNo만 순서를 유지해 반환한다."""
+        return [goods_no for goods_no in goods_no_list if goods_no not in self.persisted]
+
+    def is_category_done(self, category_id: str) -> bool:
+        """
+        카테고리를 건너뛸 수 있는지 확인한다.
+
+        완료 표시가 있고 모든 goodsNo가 저장된 경우에만 True (실패한 goodsNo가 있으면 재시도 대상).
+        """
+        if category_id not in self.completed_categories:
+            return False
+        return not self.pending_goods(self.category_goods.get(category_id, []))
+
+    def unfinished_goods(self) -> List[str]:
+        """실패한 뒤 아직 저장되지 않은 goodsNo 목록."""
+        return sorted(self.failed - self.persisted)
+
+    def remove(self) -> None:
+        """전체 크롤링 완료 후 체크포인트 파일을 삭제한다."""
+        if self.path.exists():
+            self.path.unlink()
+            self.logger.info(f"체크포인트 삭제: {self.path}")
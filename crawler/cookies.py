@@ -6,11 +6,13 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
-from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from typing import Awaitable, Callable, Dict, List, Optional
+from playwright.async_api import Browser, BrowserContext, Playwright
 from filelock import FileLock
 
 from .utils import setup_logger
+from .browser_pool import BrowserPool
+from .resource_blocking import ResourceBlocker
 
 class OliveyoungCookieManager:
     """올리브영 Cloudflare 쿠키 발급 및 관리를 담당하는 클래스."""
@@ -18,24 +20,47 @@ class OliveyoungCookieManager:
     # 고정 User-Agent (일관성 유지)
     FIXED_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
+    # 브라우저 컨텍스트와 HTTP 클라이언트가 공유하는 요청 헤더
+    EXTRA_HTTP_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"',
+        'accept-language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'accept-encoding': 'gzip, deflate, br'
+    }
+    
     # 필수 쿠키 목록
     REQUIRED_COOKIES = ['cf_clearance', '__cf_bm', 'OYSESSIONID']
     
     # 올리브영 URL
     BOOTSTRAP_URL = "https://www.oliveyoung.co.kr/store/main/main.do"
     
-    def __init__(self, cookie_file: str = "oy_state.json"):
+    # 백그라운드 갱신: cf_clearance 만료 이 시간(초) 전에 새 쿠키를 발급
+    REFRESH_MARGIN = 300
+    
+    # 기본 viewport (FIXED_USER_AGENT와 함께 사용)
+    DEFAULT_VIEWPORT = {'width': 1920, 'height': 1080}
+    
+    def __init__(self, cookie_file: str = "oy_state.json", browser_pool: Optional[BrowserPool] = None,
+                 user_agent: Optional[str] = None, viewport: Optional[Dict[str, int]] = None):
         """
         쿠키 매니저 초기화.
         
         Args:
             cookie_file: 쿠키 저장 파일 경로
+            browser_pool: 크롤러와 공유할 브라우저 풀 (None이면 전용 풀 생성)
+            user_agent: 이 쿠키 세션의 User-Agent (None이면 FIXED_USER_AGENT, cf_clearance가 UA에 묶이므로 세션 동안 고정)
+            viewport: 이 쿠키 세션의 viewport (None이면 DEFAULT_VIEWPORT)
         """
         self.cookie_file = Path(cookie_file)
+        self.user_agent = user_agent or self.FIXED_USER_AGENT
+        self.viewport = dict(viewport or self.DEFAULT_VIEWPORT)
         
         # 디렉토리 선처리
         self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
         
+        self.browser_pool = browser_pool or BrowserPool()
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         
@@ -44,6 +69,15 @@ class OliveyoungCookieManager:
         log_level = getattr(logging, log_level_str, logging.INFO)
         self.logger = setup_logger(__name__, log_level)
         
+        # 만료 전 쿠키 재발급 백그라운드 태스크 (start_background_refresh)
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # 마지막으로 만든 크롤링 컨텍스트 (새 컨텍스트를 만들 때 풀의 한도 정리 대상에서 제외)
+        self.current_context: Optional[BrowserContext] = None
+        
+        # 크롤링 컨텍스트 공용 리소스 차단 규칙 (재발급으로 교체된 컨텍스트까지 통계 누적)
+        self.resource_blocker = ResourceBlocker.for_profile("oliveyoung")
+        
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입."""
         await self.start()
@@ -53,33 +87,30 @@ class OliveyoungCookieManager:
         """비동기 컨텍스트 매니저 종료."""
         await self.stop()
         
+    @property
+    def http_headers(self) -> Dict[str, str]:
+        """User-Agent에 맞는 요청 헤더 (Chromium이 아닌 UA에는 sec-ch-ua 클라이언트 힌트를 보내지 않음)."""
+        if "Chrome/" in self.user_agent:
+            return dict(self.EXTRA_HTTP_HEADERS)
+        return {key: value for key, value in self.EXTRA_HTTP_HEADERS.items() if not key.startswith('sec-ch-ua')}
+    
     async def start(self):
-        """Playwright 및 브라우저 초기화."""
-        self.playwright = await async_playwright().start()
+        """브라우저 풀에서 공유 브라우저를 획득한다."""
+        # 지문 관련 실행 인자는 BrowserPool.DEFAULT_LAUNCH_ARGS로 통일
+        self.browser = await self.browser_pool.start()
+        self.playwright = self.browser_pool.playwright
         
-        # 환경변수 OY_DEBUG로 headless 모드 제어
-        is_headless = False # os.getenv('OY_DEBUG')
-        
-        self.browser = await self.playwright.chromium.launch(
-            headless=is_headless,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-features=VizDisplayCompositor',
-                '--use-gl=swiftshader'  # WebGL 지문 생성
-            ]
-        )
-        
-        debug_status = "DEBUG" if not is_headless else "운영"
+        debug_status = "DEBUG" if not self.browser_pool.headless else "운영"
         self.logger.info(f"올리브영 쿠키 매니저 초기화 완료 ({debug_status} 모드)")
         
     async def stop(self):
-        """리소스 정리."""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        """리소스 정리 (공유 브라우저는 풀의 참조 카운트로 관리)."""
+        await self.stop_background_refresh()
+        if sum(self.resource_blocker.allowed.values()) or sum(self.resource_blocker.blocked.values()):
+            self.logger.info(f"리소스 차단 통계: {self.resource_blocker.format_stats()}")
+        await self.browser_pool.stop()
+        self.browser = None
+        self.playwright = None
         self.logger.info("올리브영 쿠키 매니저 종료 완료")
     
     async def bootstrap_cookies(self) -> bool:
@@ -92,18 +123,11 @@ class OliveyoungCookieManager:
         self.logger.info("올리브영 쿠키 부트스트랩 시작")
         
         try:
-            # 리소스 차단 없는 컨텍스트 생성
+            # 리소스 차단 없는 컨텍스트 생성 (부트스트랩 전용, 풀에 등록하지 않음)
             context = await self.browser.new_context(
-                user_agent=self.FIXED_USER_AGENT,
-                viewport={'width': 1920, 'height': 1080},
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                    'sec-ch-ua-mobile': '?0',
-                    'sec-ch-ua-platform': '"Windows"',
-                    'accept-language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                    'accept-encoding': 'gzip, deflate, br'
-                }
+                user_agent=self.user_agent,
+                viewport=self.viewport,
+                extra_http_headers=self.http_headers
             )
             
             page = await context.new_page()
@@ -165,9 +189,8 @@ class OliveyoungCookieManager:
             else:
                 self.logger.info("모든 필수 쿠키 획득 완료")
             
-            # 쿠키 상태 저장 (파일 잠금 사용)
-            with FileLock(str(self.cookie_file) + ".lock"):
-                await context.storage_state(path=str(self.cookie_file))
+            # 쿠키 상태 저장 (await 중에는 파일 잠금을 잡지 않음)
+            self._save_state(await context.storage_state())
             self.logger.info(f"쿠키 상태 저장 완료: {self.cookie_file}")
             
             await context.close()
@@ -177,6 +200,57 @@ class OliveyoungCookieManager:
             self.logger.error(f"쿠키 부트스트랩 실패: {e}")
             return False
     
+    def _load_state(self) -> dict:
+        """
+        쿠키 파일을 파일 잠금 안에서 읽는다.
+
+        잠금 구간에는 await가 없으므로 이벤트 루프에서 잠금을 기다려도 잠금 보유자가 멈추지 않는다.
+
+        Returns:
+            저장된 브라우저 상태 딕셔너리
+        """
+        with FileLock(str(self.cookie_file) + ".lock"):
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    
+    def _save_state(self, state: dict) -> None:
+        """
+        브라우저 상태를 임시 파일에 쓴 뒤 파일 잠금 안에서 쿠키 파일로 교체한다.
+        
+        Args:
+            state: BrowserContext.storage_state() 결과
+        """
+        temp_file = self.cookie_file.with_name(f"{self.cookie_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        with FileLock(str(self.cookie_file) + ".lock"):
+            os.replace(temp_file, self.cookie_file)
+    
+    def _clearance_expires(self, state: dict) -> Optional[float]:
+        """저장된 상태에서 cf_clearance 쿠키의 만료 시각(epoch)을 반환한다 (없으면 None)."""
+        for cookie in state.get('cookies', []):
+            if cookie.get('name') == 'cf_clearance':
+                return cookie.get('expires', 0)
+        return None
+    
+    def seconds_until_expiry(self) -> Optional[float]:
+        """
+        저장된 cf_clearance 쿠키가 만료될 때까지 남은 시간을 반환한다.
+        
+        Returns:
+            남은 시간(초, 이미 만료면 음수) 또는 None (쿠키 파일/cf_clearance 없음)
+        """
+        if not self.cookie_file.exists():
+            return None
+        try:
+            state = self._load_state()
+        except Exception as e:
+            self.logger.debug(f"쿠키 파일 로드 실패: {e}")
+            return None
+        
+        expires = self._clearance_expires(state)
+        return None if expires is None else expires - time.time()
+    
     def _cookie_expired(self, state: dict) -> bool:
         """
         쿠키 만료 여부를 검사한다.
@@ -188,21 +262,12 @@ class OliveyoungCookieManager:
             만료되었으면 True, 유효하면 False
         """
         try:
-            # cf_clearance 쿠키 찾기
-            cookies = state.get('cookies', [])
-            cf_clearance_cookie = None
-            
-            for cookie in cookies:
-                if cookie.get('name') == 'cf_clearance':
-                    cf_clearance_cookie = cookie
-                    break
-            
-            if not cf_clearance_cookie:
+            expires = self._clearance_expires(state)
+            if expires is None:
                 self.logger.warning("cf_clearance 쿠키를 찾을 수 없음")
                 return True
             
             # 만료 시점 확인 (현재 시간 + 60초 여유)
-            expires = cf_clearance_cookie.get('expires', 0)
             current_time = time.time()
             
             if expires < current_time + 60:
@@ -235,16 +300,12 @@ class OliveyoungCookieManager:
         else:
             # 쿠키 만료 검사
             try:
-                with FileLock(str(self.cookie_file) + ".lock"):
-                    with open(self.cookie_file, 'r', encoding='utf-8') as f:
-                        state = json.load(f)
+                if self._cookie_expired(self._load_state()):
+                    self.logger.info("쿠키가 만료되어 재부트스트랩 실행")
+                    needs_bootstrap = True
+                else:
+                    self.logger.info("쿠키가 유효함")
                     
-                    if self._cookie_expired(state):
-                        self.logger.info("쿠키가 만료되어 재부트스트랩 실행")
-                        needs_bootstrap = True
-                    else:
-                        self.logger.info("쿠키가 유효함")
-                        
             except Exception as e:
                 self.logger.warning(f"쿠키 파일 로드 실패: {e}, 재부트스트랩 실행")
                 needs_bootstrap = True
@@ -276,25 +337,19 @@ class OliveyoungCookieManager:
         try:
             self.logger.info(f"저장된 쿠키 상태 로드: {self.cookie_file}")
             
-            # 파일 잠금을 사용한 안전한 컨텍스트 생성
-            with FileLock(str(self.cookie_file) + ".lock"):
-                context = await self.browser.new_context(
-                    storage_state=str(self.cookie_file),
-                    user_agent=self.FIXED_USER_AGENT,
-                    viewport={'width': 1920, 'height': 1080},
-                    extra_http_headers={
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                        'sec-ch-ua-mobile': '?0',
-                        'sec-ch-ua-platform': '"Windows"',
-                        'accept-language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                        'accept-encoding': 'gzip, deflate, br'
-                    }
-                )
+            # 쿠키 파일은 잠금 안에서 읽고, 컨텍스트 생성(await)은 잠금 밖에서 수행
+            context = await self.browser_pool.new_context(
+                keep=self.current_context,
+                storage_state=self._load_state(),
+                user_agent=self.user_agent,
+                viewport=self.viewport,
+                extra_http_headers=self.http_headers
+            )
             
             # 리소스 차단 설정 적용
             await self._setup_resource_blocking(context)
             
+            self.current_context = context
             self.logger.info("크롤링용 컨텍스트 생성 완료")
             return context
             
@@ -304,65 +359,12 @@ class OliveyoungCookieManager:
     
     async def _setup_resource_blocking(self, context: BrowserContext) -> None:
         """
-        올리브영 전용 리소스 차단 설정.
+        올리브영 전용 리소스 차단 설정 ("oliveyoung" 프로필: 옵션/상세정보 AJAX 통과, CSS/외부 이미지/폰트/광고 차단).
         
         Args:
             context: 브라우저 컨텍스트
         """
-        # 필수 API 화이트리스트
-        ESSENTIAL_XHR = (
-            "/getGoodsArtcAjax.do",
-            "/getOptInfoListAjax.do",
-        )
-        
-        async def handle_route(route):
-            """리소스 요청 처리"""
-            url = route.request.url
-            resource_type = route.request.resource_type
-            
-            # 1. 필수 API 화이트리스트 - 최우선 통과
-            if any(essential_api in url for essential_api in ESSENTIAL_XHR):
-                self.logger.debug(f"필수 API 통과: {url}")
-                await route.continue_()
-                return
-            
-            # 2. Stylesheet 무조건 차단 (속도 최적화)
-            if resource_type == "stylesheet":
-                await route.abort()
-                return
-            
-            # 3. 이미지 리소스 처리 - 허용 조건 완화
-            if resource_type == "image":
-                if ("oliveyoung.co.kr" in url or "cloudfront" in url):
-                    await route.continue_()
-                    return
-                else:
-                    await route.abort()
-                    return
-            
-            # 4. 폰트, 미디어 파일 차단
-            if (resource_type in ["font", "media"] or 
-                any(ext in url.lower() for ext in 
-                    ['.woff', '.woff2', '.ttf', '.otf', '.eot', 
-                     '.mp4', '.avi', '.mov', '.wmv', '.mp3', '.wav', '.ogg'])):
-                await route.abort()
-                return
-            
-            # 5. 광고 및 추적 스크립트 차단 (확장)
-            blocked_domains = [
-                'google-analytics.com', 'googletagmanager.com', 'facebook.com/tr',
-                'doubleclick.net', 'googlesyndication.com', 'adsystem.com',
-                'datadog', 'amplitude'
-            ]
-            
-            if any(domain in url.lower() for domain in blocked_domains):
-                await route.abort()
-                return
-            
-            # 6. 그 외 요청은 정상 처리
-            await route.continue_()
-        
-        await context.route("**/*", handle_route)
+        await self.resource_blocker.attach(context)
         self.logger.info("리소스 차단 설정 완료")
     
     async def refresh_cookies_if_needed(self, context: Optional[BrowserContext] = None) -> Optional[BrowserContext]:
@@ -376,7 +378,7 @@ class OliveyoungCookieManager:
             새로운 크롤링용 컨텍스트 또는 None
         """
         if context:
-            await context.close()
+            await self.browser_pool.close_context(context)
             self.logger.info("기존 컨텍스트 종료")
         
         self.logger.info("쿠키 리프레시 시작")
@@ -390,4 +392,70 @@ class OliveyoungCookieManager:
                 return new_context
         
         self.logger.error("쿠키 리프레시 실패")
-        return None
\ No newline at end of file
+        return None
+    
+    def start_background_refresh(
+        self,
+        on_refreshed: Callable[[BrowserContext], Awaitable[None]],
+        refresh_margin: Optional[float] = None,
+        check_interval: float = 60.0
+    ) -> None:
+        """
+        cf_clearance 만료 전에 쿠키를 미리 재발급하는 백그라운드 태스크를 시작한다.
+        
+        부트스트랩은 크롤링 컨텍스트와 별개의 전용 컨텍스트에서 진행되므로 크롤링은 멈추지 않는다.
+        새 쿠키로 만든 컨텍스트는 on_refreshed로 넘겨 호출 측이 상품 사이에 교체하게 한다.
+        
+        Args:
+            on_refreshed: 새 크롤링 컨텍스트를 받는 코루틴 함수
+            refresh_margin: 만료 몇 초 전에 재발급할지 (None이면 REFRESH_MARGIN)
+            check_interval: 만료 시각 재확인/실패 후 재시도 간격(초)
+        """
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        margin = self.REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self._refresh_task = asyncio.create_task(
+            self._background_refresh_loop(on_refreshed, margin, check_interval)
+        )
+        self.logger.info(f"백그라운드 쿠키 갱신 시작 (만료 {margin:.0f}초 전 재발급)")
+    
+    async def stop_background_refresh(self) -> None:
+        """백그라운드 쿠키 갱신 태스크를 중지한다."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+    
+    async def _background_refresh_loop(
+        self,
+        on_refreshed: Callable[[BrowserContext], Awaitable[None]],
+        refresh_margin: float,
+        check_interval: float
+    ) -> None:
+        """만료 시각을 감시하다가 여유 시간 안으로 들어오면 쿠키를 재발급한다."""
+        while True:
+            # 파일 잠금 대기로 이벤트 루프를 막지 않도록 스레드에서 확인
+            remaining = await asyncio.to_thread(self.seconds_until_expiry)
+            # cf_clearance가 없는 상태(세션 쿠키만 발급)는 감시할 만료 시각이 없음
+            if remaining is None or remaining > refresh_margin:
+                wait = check_interval if remaining is None else min(remaining - refresh_margin, check_interval)
+                await asyncio.sleep(wait)
+                continue
+            
+            self.logger.info(f"cf_clearance 만료 {remaining:.0f}초 전, 백그라운드 쿠키 재발급")
+            try:
+                if await self.bootstrap_cookies():
+                    context = await self.get_crawl_context()
+                    if context:
+                        await on_refreshed(context)
+                        continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"백그라운드 쿠키 갱신 중 오류: {e}")
+            
+            self.logger.warning(f"백그라운드 쿠키 재발급 실패, {check_interval:.0f}초 후 재시도")
+            await asyncio.sleep(check_interval)
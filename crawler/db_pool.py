@@ -0,0 +1,237 @@
+"""프로세스 단위 PostgreSQL 연결 풀."""
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    from psycopg2.pool import PoolError, ThreadedConnectionPool
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from .utils import setup_logger
+
+
+class PostgresConnectionPool:
+    """
+    크기가 제한된 스레드 안전 PostgreSQL 연결 풀.
+
+    PostgresStorage, PostgresDataAdapter, ProductFilter, Qoo10ProductsStorage, PostgresJobQueue가
+    같은 DSN이면 하나의 풀을 공유하므로 크롤링→업로드 전체 실행에서 연결 수가 max_size로 제한된다.
+    - 풀이 가득 차면 acquire_timeout초까지 대기한 뒤 PoolError를 발생시킨다.
+    - health_check_interval초 이상 쉬었던 연결은 빌려주기 전에 SELECT 1로 확인하고, 끊겼으면 새로 연결한다.
+    - 반납 시 열린 트랜잭션은 롤백해 다음 사용자에게 깨끗한 연결을 준다.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = 1,
+        max_size: int = 5,
+        health_check_interval: float = 30.0,
+        acquire_timeout: float = 30.0
+    ):
+        """
+        연결 풀을 초기화한다.
+
+        Args:
+            connection_string: PostgreSQL 연결 문자열
+            min_size: 미리 열어둘 연결 수
+            max_size: 최대 연결 수
+            health_check_interval: 이 시간(초) 이상 쉬었던 연결은 빌려주기 전에 상태 확인
+            acquire_timeout: 연결을 얻기 위해 기다릴 최대 시간(초)
+        """
+        if not PSYCOPG2_AVAILABLE:
+            raise ImportError("psycopg2가 설치되지 않았습니다. pip install psycopg2-binary를 실행하세요.")
+
+        self.logger = setup_logger(self.__class__.__name__)
+        self.max_size = max(1, max_size)
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self.pid = os.getpid()
+
+        self._pool = ThreadedConnectionPool(min(min_size, self.max_size), self.max_size, connection_string)
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._last_used: Dict[int, float] = {}
+        self.logger.info(f"PostgreSQL 연결 풀 생성 (최대 {self.max_size}개)")
+
+    def _is_healthy(self, conn) -> bool:
+        """연결이 살아 있는지 확인한다 (새로 만든 연결과 최근 사용한 연결은 확인 생략)."""
+        if conn.closed:
+            return False
+        last_used = self._last_used.get(id(conn))
+        if last_used is None or time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self):
+        """
+        풀에서 상태가 확인된 연결을 빌린다 (반드시 putconn으로 반납).
+
+        끊긴 연결은 폐기하고 다음 연결을 다시 확인한다. DB 재시작 직후에는 쉬던 연결이 모두
+        끊겼을 수 있으므로 최대 max_size + 1번까지 시도한다.
+
+        Returns:
+            psycopg2 연결
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolError(f"{self.acquire_timeout}초 안에 연결을 얻지 못했습니다 (최대 {self.max_size}개 사용 중)")
+        try:
+            for _ in range(self.max_size + 1):
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    return conn
+                self.logger.warning("끊긴 연결 폐기 후 재연결")
+                self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=True)
+            raise PoolError(f"정상 연결을 얻지 못했습니다 ({self.max_size + 1}번 시도)")
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn) -> None:
+        """
+        빌린 연결을 반납한다 (열린 트랜잭션은 롤백).
+
+        Args:
+            conn: getconn으로 빌린 연결
+        """
+        try:
+            broken = conn.closed
+            if not broken and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
+            if broken:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            self._pool.putconn(conn, close=broken)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        with 블록 동안 연결을 빌린다. 예외가 나면 롤백한다 (커밋은 호출자가 한다).
+
+        Yields:
+            psycopg2 연결
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        """풀의 모든 연결을 닫는다."""
+        if not self._pool.closed:
+            self._pool.closeall()
+            self.logger.info("PostgreSQL 연결 풀 종료")
+
+
+class AsyncConnectionPool:
+    """
+    이벤트 루프용 연결 풀 래퍼.
+
+    psycopg2 호출은 블로킹이므로 연결 대여와 쿼리 실행을 함께 스레드로 넘겨 이벤트 루프를 막지 않는다.
+    동기 풀과 같은 연결/크기 제한을 공유한다.
+    """
+
+    def __init__(self, pool: PostgresConnectionPool):
+        """
+        비동기 래퍼를 초기화한다.
+
+        Args:
+            pool: 공유할 동기 연결 풀
+        """
+        self.pool = pool
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        연결을 빌려 func(conn, *args, **kwargs)를 스레드에서 실행한다.
+
+        Args:
+            func: 첫 인자로 연결을 받는 동기 함수
+
+        Returns:
+            func의 반환값
+        """
+        def call():
+            with self.pool.connection() as conn:
+                return func(conn, *args, **kwargs)
+
+        return await asyncio.to_thread(call)
+
+
+_pools: Dict[str, PostgresConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(connection_string: Optional[str] = None, **kwargs: Any) -> PostgresConnectionPool:
+    """
+    DSN별 프로세스 공유 연결 풀을 반환한다 (없으면 생성).
+
+    최대 크기는 DB_POOL_SIZE 환경변수로 조절한다 (기본값 5). fork된 자식 프로세스는 새 풀을 만든다.
+
+    Args:
+        connection_string: PostgreSQL 연결 문자열 (기본값: DATABASE_URL 환경변수)
+        **kwargs: 처음 생성할 때 PostgresConnectionPool에 넘길 옵션
+
+    Returns:
+        공유 연결 풀
+    """
+    connection_string = connection_string or os.getenv("DATABASE_URL")
+    if not connection_string:
+        raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다.")
+
+    with _pools_lock:
+        pool = _pools.get(connection_string)
+        if pool is None or pool.pid != os.getpid():
+            kwargs.setdefault("max_size", int(os.getenv("DB_POOL_SIZE", "5")))
+            pool = PostgresConnectionPool(connection_string, **kwargs)
+            _pools[connection_string] = pool
+        return pool
+
+
+def get_async_pool(connection_string: Optional[str] = None, **kwargs: Any) -> AsyncConnectionPool:
+    """
+    공유 연결 풀의 비동기 래퍼를 반환한다.
+
+    Args:
+        connection_string: PostgreSQL 연결 문자열 (기본값: DATABASE_URL 환경변수)
+        **kwargs: 처음 생성할 때 PostgresConnectionPool에 넘길 옵션
+
+    Returns:
+        비동기 연결 풀
+    """
+    return AsyncConnectionPool(get_pool(connection_string, **kwargs))
+
+
+@atexit.register
+def close_all_pools() -> None:
+    """이 프로세스가 만든 모든 공유 풀을 닫는다."""
+    with _pools_lock:
+        for pool in _pools.values():
+            if pool.pid == os.getpid():
+                pool.close()
+        _pools.clear()
@@ -1,36 +1,153 @@
 """PostgreSQL 데이터베이스 저장소 구현."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, Sequence, Tuple, Union, Optional
+import hashlib
+import io
 import logging
 import os
-from datetime import datetime
+from datetime import date, datetime
 import json
 
 try:
-    import psycopg2
     from psycopg2.extras import execute_values, RealDictCursor
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+from .db_pool import get_pool
+from .price_history import PriceHistoryStore
 from .storage import BaseStorage
 
 
+def _copy_text_value(value: Any) -> str:
+    """값 하나를 COPY text 형식 필드로 변환한다 (None → \\N, 구분자/개행 이스케이프)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_upsert(
+    cursor,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Sequence[Tuple[Any, ...]],
+    conflict_clause: str
+) -> int:
+    """
+    COPY FROM STDIN으로 임시 스테이징 테이블에 행을 적재한 뒤 한 번의 INSERT ... ON CONFLICT로 병합한다.
+
+    행마다 파라미터를 바인딩하는 execute_values보다 대량 적재(수만~수십만 행)에서 훨씬 빠르다.
+    스테이징 테이블은 세션 임시 테이블(ON COMMIT DROP)이므로 커밋은 호출자가 한다.
+
+    Args:
+        cursor: psycopg2 커서
+        table_name: 대상 테이블명
+        columns: 적재할 칼럼 목록 (rows의 튜플 순서와 동일)
+        rows: 적재할 행 목록
+        conflict_clause: ON CONFLICT 뒤에 붙일 절 (예: "(unique_item_id) DO NOTHING")
+
+    Returns:
+        병합 쿼리가 삽입/갱신한 행 수
+    """
+    if not rows:
+        return 0
+
+    staging_table = f"_staging_{table_name}"
+    column_list = ", ".join(columns)
+
+    cursor.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table_name} WITH NO DATA"
+    )
+    cursor.execute(f"TRUNCATE {staging_table}")
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_text_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN", buffer)
+
+    cursor.execute(
+        f"INSERT INTO {table_name} ({column_list}) "
+        f"SELECT {column_list} FROM {staging_table} "
+        f"ON CONFLICT {conflict_clause}"
+    )
+    return cursor.rowcount
+
+
 class PostgresStorage(BaseStorage):
     """
     PostgreSQL 데이터베이스 기반 데이터 저장소.
 
     crawled_products 테이블에 크롤링 데이터를 저장한다.
+    연결은 프로세스 공유 풀(db_pool)에서 작업마다 빌려 쓴다.
+    정규화된 상품 필드의 content_hash가 DB와 같은 행은 upsert하지 않으므로
+    재크롤링 시 바뀐 상품만 updated_at이 갱신된다.
+    copy_threshold개 이상을 한 번에 저장하면 execute_values 대신 COPY 기반 대량 upsert를 사용한다.
     """
 
-    def __init__(self, connection_string: Optional[str] = None, table_name: str = "crawled_products"):
+    # INSERT 칼럼 순서
+    COLUMNS = (
+        'goods_no', 'item_name', 'price', 'origin_price', 'is_discounted',
+        'discount_info', 'discount_start_date', 'discount_end_date',
+        'brand_name', 'manufacturer', 'origin_country',
+        'category_main', 'category_sub', 'category_detail',
+        'category_main_id', 'category_sub_id', 'category_detail_id',
+        'category_name', 'images', 'is_option_available', 'option_info',
+        'benefit_info', 'shipping_info', 'refund_info', 'is_soldout',
+        'others', 'unique_item_id', 'source', 'origin_product_url',
+        'crawled_at', 'created_at', 'updated_at', 'content_hash'
+    )
+
+    # 가격/품절 갱신(--refresh) 시 덮어쓰는 칼럼
+    REFRESH_COLUMNS = (
+        'price', 'origin_price', 'is_discounted', 'discount_info',
+        'discount_start_date', 'discount_end_date', 'is_soldout'
+    )
+
+    # 마지막 갱신 확인 시각/연속 실패 횟수 테이블 (crawled_products 행을 건드리지 않아 updated_at/WAL 증가 없음)
+    REFRESH_STATE_TABLE = "product_refresh_state"
+
+    # 기존 행과 충돌 시 갱신할 칼럼 (REFRESH_COLUMNS 포함)
+    UPSERT_COLUMNS = (
+        'item_name', 'price', 'origin_price', 'is_discounted', 'discount_info',
+        'discount_start_date', 'discount_end_date',
+        'images', 'option_info', 'is_soldout', 'crawled_at', 'updated_at', 'content_hash'
+    )
+
+    # content_hash 계산 칼럼: upsert가 실제로 쓰는 내용 칼럼만 (저장 시각 제외)
+    # 다른 칼럼까지 해시하면 그 칼럼만 바뀐 경우 해시는 갱신되고 값은 남아 저장된 해시가 행 내용과 어긋난다
+    HASH_COLUMNS = tuple(
+        column for column in UPSERT_COLUMNS if column not in ('crawled_at', 'updated_at', 'content_hash')
+    )
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        table_name: str = "crawled_products",
+        copy_threshold: Optional[int] = 500,
+        record_price_history: bool = True
+    ):
         """
         PostgreSQL 저장소를 초기화한다.
 
         Args:
             connection_string: PostgreSQL 연결 문자열 (기본값: DATABASE_URL 환경변수)
             table_name: 데이터를 저장할 테이블명 (기본값: crawled_products)
+            copy_threshold: 이 개수 이상이면 COPY 기반 대량 upsert 사용 (0이면 항상, None이면 사용 안 함)
+            record_price_history: 내용이 바뀐 상품의 가격/재고 상태를 product_price_history에 기록할지 여부
         """
         from .utils import setup_logger
         self.logger = setup_logger(self.__class__.__name__)
@@ -44,29 +161,61 @@ class PostgresStorage(BaseStorage):
             raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다.")
 
         self.table_name = table_name
-        self.conn = None
+        self.copy_threshold = copy_threshold
+        self.pool = get_pool(self.connection_string)
 
         # 연결 테스트
         self._connect()
+        self._ensure_content_hash_column()
+
+        # 가격/재고 이력 (본 테이블 upsert와 같은 트랜잭션에서 기록)
+        self.price_history = PriceHistoryStore(self.pool) if record_price_history else None
 
     def _connect(self):
-        """데이터베이스에 연결한다."""
+        """공유 풀에서 연결을 한 번 빌려 연결 상태를 확인한다."""
         try:
-            if self.conn is None or self.conn.closed:
-                self.conn = psycopg2.connect(self.connection_string)
+            with self.pool.connection():
                 self.logger.info(f"PostgreSQL 연결 성공: {self.table_name}")
         except Exception as e:
             self.logger.error(f"PostgreSQL 연결 실패: {str(e)}")
             raise
 
-    def _ensure_connection(self):
-        """연결이 유효한지 확인하고 필요시 재연결한다."""
-        try:
-            if self.conn is None or self.conn.closed:
-                self._connect()
-        except Exception as e:
-            self.logger.error(f"연결 확인 실패: {str(e)}")
-            raise
+    def _ensure_content_hash_column(self):
+        """기존 DB에 content_hash 칼럼/인덱스와 갱신 확인 테이블/칼럼이 없으면 추가한다 (scripts/init.sql과 동일)."""
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_content_hash ON {self.table_name}(content_hash)"
+            )
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.REFRESH_STATE_TABLE} (
+                    unique_item_id VARCHAR(100) PRIMARY KEY,
+                    last_checked_at TIMESTAMP NOT NULL,
+                    refresh_failures INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute(
+                f"ALTER TABLE {self.REFRESH_STATE_TABLE} ADD COLUMN IF NOT EXISTS refresh_failures INTEGER NOT NULL DEFAULT 0"
+            )
+            conn.commit()
+
+    def _filter_unchanged(self, cursor, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        DB에 같은 content_hash로 저장된 행을 제외한다.
+
+        Args:
+            cursor: psycopg2 커서
+            items: DB 스키마로 변환된 데이터
+
+        Returns:
+            새로 추가되거나 내용이 바뀐 데이터
+        """
+        cursor.execute(
+            f"SELECT unique_item_id, content_hash FROM {self.table_name} WHERE unique_item_id = ANY(%s)",
+            ([item['unique_item_id'] for item in items],)
+        )
+        stored_hashes = dict(cursor.fetchall())
+        return [item for item in items if stored_hashes.get(item['unique_item_id']) != item['content_hash']]
 
     def save(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
         """
@@ -79,8 +228,6 @@ class PostgresStorage(BaseStorage):
             저장 성공 여부
         """
         try:
-            self._ensure_connection()
-
             # 단일 데이터를 리스트로 변환
             if isinstance(data, dict):
                 data = [data]
@@ -92,63 +239,217 @@ class PostgresStorage(BaseStorage):
             # 데이터 변환: 크롤러 형식 → DB 형식
             transformed_data = [self._transform_to_db_schema(item) for item in data]
 
-            # INSERT 쿼리 실행
-            with self.conn.cursor() as cursor:
-                # UPSERT 쿼리 (unique_item_id 기준 중복 체크)
-                insert_query = f"""
-                    INSERT INTO {self.table_name} (
-                        goods_no, item_name, price, origin_price, is_discounted,
-                        discount_info, discount_start_date, discount_end_date,
-                        brand_name, manufacturer, origin_country,
-                        category_main, category_sub, category_detail,
-                        category_main_id, category_sub_id, category_detail_id,
-                        category_name, images, is_option_available, option_info,
-                        benefit_info, shipping_info, refund_info, is_soldout,
-                        others, unique_item_id, source, origin_product_url,
-                        crawled_at, created_at, updated_at
-                    ) VALUES %s
-                    ON CONFLICT (unique_item_id) DO UPDATE SET
-                        item_name = EXCLUDED.item_name,
-                        price = EXCLUDED.price,
-                        origin_price = EXCLUDED.origin_price,
-                        is_discounted = EXCLUDED.is_discounted,
-                        discount_info = EXCLUDED.discount_info,
-                        images = EXCLUDED.images,
-                        option_info = EXCLUDED.option_info,
-                        is_soldout = EXCLUDED.is_soldout,
-                        crawled_at = EXCLUDED.crawled_at,
-                        updated_at = EXCLUDED.updated_at
-                """
-
-                values = [
-                    (
-                        item['goods_no'], item['item_name'], item['price'], item['origin_price'],
-                        item['is_discounted'], item['discount_info'], item['discount_start_date'],
-                        item['discount_end_date'], item['brand_name'], item['manufacturer'],
-                        item['origin_country'], item['category_main'], item['category_sub'],
-                        item['category_detail'], item['category_main_id'], item['category_sub_id'],
-                        item['category_detail_id'], item['category_name'], item['images'],
-                        item['is_option_available'], item['option_info'], item['benefit_info'],
-                        item['shipping_info'], item['refund_info'], item['is_soldout'],
-                        item['others'], item['unique_item_id'], item['source'],
-                        item['origin_product_url'], item['crawled_at'], item['created_at'],
-                        item['updated_at']
+            # 같은 배치에 같은 unique_item_id가 있으면 ON CONFLICT가 한 행을 두 번 갱신할 수 없으므로 마지막 값만 유지
+            deduped = list({item['unique_item_id']: item for item in transformed_data}.values())
+
+            with self.pool.connection() as conn, conn.cursor() as cursor:
+                # 내용이 바뀌지 않은 행은 upsert하지 않음 (WAL/updated_at 갱신 방지)
+                changed = self._filter_unchanged(cursor, deduped)
+                if not changed:
+                    conn.rollback()
+                    self.logger.info(f"PostgreSQL 저장 생략: {len(deduped)}개 모두 변경 없음")
+                    return True
+
+                values = [tuple(item[column] for column in self.COLUMNS) for item in changed]
+                if self.copy_threshold is not None and len(values) >= self.copy_threshold:
+                    # 대량 저장: COPY → 스테이징 테이블 → 한 번의 INSERT ... ON CONFLICT
+                    copy_upsert(cursor, self.table_name, self.COLUMNS, values, self._conflict_clause())
+                else:
+                    # UPSERT 쿼리 (unique_item_id 기준 중복 체크)
+                    insert_query = f"""
+                        INSERT INTO {self.table_name} ({', '.join(self.COLUMNS)}) VALUES %s
+                        ON CONFLICT {self._conflict_clause()}
+                    """
+                    execute_values(cursor, insert_query, values)
+
+                if self.price_history:
+                    self.price_history.append(cursor, changed)
+                conn.commit()
+
+            self.logger.info(f"PostgreSQL 저장 완료: {len(changed)}개 항목 (변경 없음 {len(deduped) - len(changed)}개 생략)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"PostgreSQL 저장 실패: {str(e)}")
+            return False
+
+    def load_refresh_targets(self, limit: Optional[int] = None, source: str = "oliveyoung") -> List[str]:
+        """
+        가격/품절 갱신 대상 goods_no를 마지막 확인이 오래된 순서로 반환한다.
+
+        한 번도 갱신 확인하지 않은 상품은 crawled_at 기준으로 정렬한다.
+
+        Args:
+            limit: 최대 개수 (None이면 전체)
+            source: 소스 필터
+
+        Returns:
+            goods_no 목록
+        """
+        query = f"""
+            SELECT p.goods_no
+            FROM {self.table_name} p
+            LEFT JOIN {self.REFRESH_STATE_TABLE} r ON r.unique_item_id = p.unique_item_id
+            WHERE p.source = %s
+            ORDER BY COALESCE(r.last_checked_at, p.crawled_at) ASC NULLS FIRST
+        """
+        params: List[Any] = [source]
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
+                cursor.execute(query, params)
+                return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"갱신 대상 조회 실패: {str(e)}")
+            return []
+
+    def refresh_prices(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        가격/할인/품절 상태만 갱신한다 (--refresh).
+
+        수집값을 save()와 같은 _transform_to_db_schema로 정규화한 뒤 저장된 행에 REFRESH_COLUMNS만
+        덮어써 content_hash를 다시 계산하고, 바뀐 행만 UPDATE 및 가격 이력에 기록한다.
+        가격이 0 이하이거나 숫자가 아닌 수집값은 버리고 실패로 기록한다. 확인한 모든 상품은
+        product_refresh_state에 확인 시각을 남긴다.
+
+        Args:
+            data: goods_no/unique_item_id와 REFRESH_COLUMNS 값을 가진 데이터 목록
+
+        Returns:
+            저장 성공 여부
+        """
+        if not data:
+            return True
+
+        try:
+            now = datetime.now()
+            refreshed = {}
+            invalid = []
+            for item in data:
+                normalized = self._transform_to_db_schema(item)
+                if self._is_valid_price(normalized['price']):
+                    refreshed[item['unique_item_id']] = normalized
+                else:
+                    invalid.append(item['unique_item_id'])
+            if invalid:
+                self.logger.warning(f"유효하지 않은 가격으로 갱신 제외: {len(invalid)}개")
+
+            with self.pool.connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(
+                        f"SELECT {', '.join(self.COLUMNS)} FROM {self.table_name} WHERE unique_item_id = ANY(%s)",
+                        (list(refreshed),)
                     )
-                    for item in transformed_data
-                ]
+                    stored_rows = [dict(row) for row in cursor.fetchall()]
+
+                changed = []
+                for stored in stored_rows:
+                    merged = {**stored, **{column: refreshed[stored['unique_item_id']][column] for column in self.REFRESH_COLUMNS}}
+                    merged['crawled_at'] = now
+                    merged['content_hash'] = self._compute_content_hash(merged)
+                    if merged['content_hash'] != stored['content_hash']:
+                        changed.append(merged)
+
+                with conn.cursor() as cursor:
+                    if changed:
+                        update_columns = self.REFRESH_COLUMNS + ('content_hash', 'crawled_at')
+                        assignments = ", ".join(f"{column} = v.{column}" for column in update_columns)
+                        execute_values(
+                            cursor,
+                            f"""
+                                UPDATE {self.table_name} AS p SET {assignments}
+                                FROM (VALUES %s) AS v (unique_item_id, {', '.join(update_columns)})
+                                WHERE p.unique_item_id = v.unique_item_id
+                            """,
+                            [(item['unique_item_id'],) + tuple(item[column] for column in update_columns) for item in changed],
+                            template="(%s, %s::integer, %s::integer, %s::boolean, %s, %s, %s, %s::boolean, %s, %s::timestamp)"
+                        )
+                        if self.price_history:
+                            self.price_history.append(cursor, changed)
+
+                    self._mark_refresh_checked(cursor, [row['unique_item_id'] for row in stored_rows], now)
+                    self._mark_refresh_checked(cursor, invalid, now, failed=True)
+                conn.commit()
+
+            self.logger.info(f"PostgreSQL 가격/품절 갱신: {len(stored_rows)}개 확인, {len(changed)}개 변경")
+            return True
 
-                execute_values(cursor, insert_query, values)
-                self.conn.commit()
+        except Exception as e:
+            self.logger.error(f"PostgreSQL 가격/품절 갱신 실패: {str(e)}")
+            return False
+
+    def record_refresh_failures(self, goods_no_list: List[str], source: str = "oliveyoung") -> bool:
+        """
+        가격/품절 갱신에 실패한 상품의 확인 시각을 갱신하고 연속 실패 횟수를 늘린다.
+
+        확인 시각을 남기지 않으면 계속 실패하는 상품이 load_refresh_targets의 맨 앞에 남아
+        다른 상품의 갱신을 막는다.
+
+        Args:
+            goods_no_list: 갱신에 실패한 goods_no 목록
+            source: 소스 (unique_item_id 접두어)
 
-            self.logger.info(f"PostgreSQL 저장 완료: {len(data)}개 항목")
+        Returns:
+            저장 성공 여부
+        """
+        if not goods_no_list:
             return True
 
+        try:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
+                self._mark_refresh_checked(
+                    cursor, [f"{source}_{goods_no}" for goods_no in goods_no_list], datetime.now(), failed=True
+                )
+                conn.commit()
+            self.logger.info(f"가격/품절 갱신 실패 기록: {len(goods_no_list)}개")
+            return True
         except Exception as e:
-            self.logger.error(f"PostgreSQL 저장 실패: {str(e)}")
-            if self.conn:
-                self.conn.rollback()
+            self.logger.error(f"가격/품절 갱신 실패 기록 실패: {str(e)}")
             return False
 
+    def _mark_refresh_checked(self, cursor, unique_item_ids: List[str], checked_at: datetime, failed: bool = False) -> None:
+        """
+        product_refresh_state에 확인 시각을 기록한다 (성공하면 연속 실패 횟수 초기화, 실패하면 1 증가).
+
+        Args:
+            cursor: 호출자 트랜잭션의 커서
+            unique_item_ids: 확인한 상품의 unique_item_id 목록
+            checked_at: 확인 시각
+            failed: 갱신 실패 여부
+        """
+        if not unique_item_ids:
+            return
+        execute_values(
+            cursor,
+            f"""
+                INSERT INTO {self.REFRESH_STATE_TABLE} AS r (unique_item_id, last_checked_at, refresh_failures) VALUES %s
+                ON CONFLICT (unique_item_id) DO UPDATE SET
+                    last_checked_at = EXCLUDED.last_checked_at,
+                    refresh_failures = CASE WHEN EXCLUDED.refresh_failures = 0 THEN 0 ELSE r.refresh_failures + 1 END
+            """,
+            [(unique_item_id, checked_at, int(failed)) for unique_item_id in dict.fromkeys(unique_item_ids)]
+        )
+
+    @staticmethod
+    def _is_valid_price(price: Any) -> bool:
+        """가격이 0보다 큰 숫자인지 확인한다."""
+        try:
+            return int(price) > 0
+        except (TypeError, ValueError):
+            return False
+
+    def _conflict_clause(self) -> str:
+        """unique_item_id 충돌 시 UPSERT_COLUMNS를 갱신하는 ON CONFLICT 절."""
+        updates = ",\n".join(f"{column} = EXCLUDED.{column}" for column in self.UPSERT_COLUMNS)
+        # 동시에 같은 내용을 저장한 다른 워커가 있어도 변경 없는 행은 갱신하지 않음
+        return (
+            f"(unique_item_id) DO UPDATE SET\n{updates}\n"
+            f"WHERE {self.table_name}.content_hash IS DISTINCT FROM EXCLUDED.content_hash"
+        )
+
     def _transform_to_db_schema(self, crawler_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         크롤러 데이터를 DB 스키마로 변환한다.
@@ -245,8 +546,29 @@ class PostgresStorage(BaseStorage):
         else:
             db_data['option_info'] = ''
 
+        db_data['content_hash'] = self._compute_content_hash(db_data)
+
         return db_data
 
+    def _compute_content_hash(self, db_data: Dict[str, Any]) -> str:
+        """
+        HASH_COLUMNS(upsert로 갱신되는 상품 필드)를 정규화한 SHA-256 해시를 계산한다.
+
+        None과 빈 문자열, 앞뒤 공백 차이는 같은 값으로 본다.
+
+        Args:
+            db_data: DB 스키마로 변환된 데이터
+
+        Returns:
+            16진수 해시 문자열 (64자)
+        """
+        normalized = [
+            "" if db_data.get(column) is None else str(db_data.get(column)).strip()
+            for column in self.HASH_COLUMNS
+        ]
+        payload = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def load(self) -> List[Dict[str, Any]]:
         """
         PostgreSQL에서 데이터를 로드한다.
@@ -255,9 +577,7 @@ class PostgresStorage(BaseStorage):
             로드된 데이터 목록
         """
         try:
-            self._ensure_connection()
-
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            with self.pool.connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
                 cursor.execute(f"SELECT * FROM {self.table_name} ORDER BY created_at DESC")
                 rows = cursor.fetchall()
 
@@ -278,27 +598,16 @@ class PostgresStorage(BaseStorage):
             삭제 성공 여부
         """
         try:
-            self._ensure_connection()
-
-            with self.conn.cursor() as cursor:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
                 cursor.execute(f"DELETE FROM {self.table_name}")
-                self.conn.commit()
+                conn.commit()
 
             self.logger.info(f"테이블 초기화 완료: {self.table_name}")
             return True
 
         except Exception as e:
             self.logger.error(f"테이블 초기화 실패: {str(e)}")
-            if self.conn:
-                self.conn.rollback()
             return False
 
     def close(self):
-        """데이터베이스 연결을 닫는다."""
-        if self.conn and not self.conn.closed:
-            self.conn.close()
-            self.logger.info("PostgreSQL 연결 종료")
-
-    def __del__(self):
-        """소멸자에서 연결을 닫는다."""
-        self.close()
+        """공유 풀을 사용하므로 개별 연결은 닫지 않는다 (풀은 프로세스 종료 시 닫힘)."""
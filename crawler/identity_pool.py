@@ -0,0 +1,220 @@
+"""Oliveyoung 다중 쿠키 ID(세션) 풀."""
+
+import asyncio
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import BrowserContext
+
+from .browser_pool import BrowserPool
+from .cookies import OliveyoungCookieManager
+from .utils import get_random_user_agent, get_random_viewport, setup_logger
+
+
+class CookieIdentity:
+    """독립된 storage_state/UA/viewport를 가진 쿠키 세션 하나와 그 상태."""
+
+    def __init__(self, index: int, manager: OliveyoungCookieManager):
+        """
+        쿠키 ID를 초기화한다.
+
+        Args:
+            index: ID 번호 (0은 크롤러의 기본 세션)
+            manager: 이 ID의 쿠키 매니저
+        """
+        self.index = index
+        self.manager = manager
+        self.context: Optional[BrowserContext] = None
+        self.successes = 0
+        self.failures = 0  # 연속 차단 횟수
+        self.retired = False
+
+    @property
+    def active(self) -> bool:
+        """크롤링에 배정할 수 있는지 여부."""
+        return not self.retired and self.context is not None
+
+
+class OliveyoungIdentityPool:
+    """
+    여러 쿠키 ID로 상품 페이지 요청을 나눠 보내는 풀.
+
+    ID 0은 크롤러의 기본 세션(cookie_manager/crawl_context)으로 목록 페이지와 HTTP 클라이언트도
+    함께 쓰므로 풀 밖에서 관리하고, 풀은 ID 1..N-1을 관리한다.
+    - 각 ID는 자체 쿠키 파일(oy_state.{i}.json)과 UA/viewport(oy_state.{i}.meta.json에 고정)를 가진다.
+    - next_context()가 기본 세션과 활성 ID들을 라운드로빈으로 배정한다.
+    - Cloudflare/로그인 페이지가 max_failures번 연속으로 나온 ID는 퇴역시킨다.
+    - 각 ID의 쿠키는 만료 전에 백그라운드에서 재발급되고 컨텍스트가 교체된다.
+    """
+
+    def __init__(self, cookie_file: str, identities: int, browser_pool: BrowserPool, max_failures: int = 3):
+        """
+        ID 풀을 초기화한다.
+
+        Args:
+            cookie_file: 기본 세션 쿠키 파일 경로 (추가 ID 파일명의 기준)
+            identities: 기본 세션을 포함한 전체 ID 수
+            browser_pool: 크롤러와 공유하는 브라우저 풀
+            max_failures: 퇴역시키기 전 허용할 연속 차단 횟수
+        """
+        self.logger = setup_logger(self.__class__.__name__)
+        self.browser_pool = browser_pool
+        self.max_failures = max_failures
+        self.identities: List[CookieIdentity] = []
+
+        for index in range(1, max(1, identities)):
+            identity_file = self.identity_cookie_file(cookie_file, index)
+            user_agent, viewport = self._load_fingerprint(identity_file)
+            manager = OliveyoungCookieManager(
+                identity_file, browser_pool=browser_pool, user_agent=user_agent, viewport=viewport
+            )
+            self.identities.append(CookieIdentity(index, manager))
+
+        self._cycle = itertools.count()
+
+    @staticmethod
+    def identity_cookie_file(cookie_file: str, index: int) -> str:
+        """
+        ID별 쿠키 파일 경로를 반환한다 (oy_state.json → oy_state.{index}.json, 0은 그대로).
+
+        Args:
+            cookie_file: 기본 세션 쿠키 파일 경로
+            index: ID 번호
+
+        Returns:
+            쿠키 파일 경로
+        """
+        if index == 0:
+            return cookie_file
+        path = Path(cookie_file)
+        return str(path.with_name(f"{path.stem}.{index}{path.suffix}"))
+
+    def _load_fingerprint(self, identity_file: str) -> tuple:
+        """
+        ID의 UA/viewport를 메타 파일에서 읽는다 (없으면 랜덤으로 정해 저장).
+
+        cf_clearance는 발급받은 UA에 묶이므로 재시작해도 같은 쿠키 파일에는 같은 UA를 사용해야 한다.
+        """
+        meta_file = Path(identity_file).with_suffix(".meta.json")
+        if meta_file.exists():
+            try:
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                return meta["user_agent"], meta["viewport"]
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.warning(f"ID 메타 파일 로드 실패, 새로 생성: {meta_file} ({e})")
+
+        meta = {"user_agent": get_random_user_agent(), "viewport": get_random_viewport()}
+        meta_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(meta_file, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        return meta["user_agent"], meta["viewport"]
+
+    async def start(self) -> None:
+        """모든 추가 ID의 쿠키를 동시에 확인/발급하고 컨텍스트를 만든다 (실패한 ID는 퇴역)."""
+        for identity in self.identities:
+            await identity.manager.start()
+
+        results = await asyncio.gather(
+            *(identity.manager.ensure_context() for identity in self.identities),
+            return_exceptions=True
+        )
+        for identity, result in zip(self.identities, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"쿠키 ID {identity.index} 준비 실패, 제외: {result}")
+                identity.retired = True
+                continue
+            identity.context = result
+            await self.browser_pool.prewarm(identity.context, 1)
+            identity.manager.start_background_refresh(
+                lambda context, identity=identity: self._swap_context(identity, context)
+            )
+
+        active = sum(1 for identity in self.identities if identity.active)
+        self.logger.info(f"추가 쿠키 ID {active}/{len(self.identities)}개 준비 완료")
+
+    async def stop(self) -> None:
+        """모든 ID의 백그라운드 갱신과 컨텍스트를 정리한다."""
+        for identity in self.identities:
+            if identity.context:
+                await self.browser_pool.close_context(identity.context)
+                identity.context = None
+            await identity.manager.stop()
+
+    async def _swap_context(self, identity: CookieIdentity, new_context: BrowserContext) -> None:
+        """백그라운드 재발급된 쿠키의 컨텍스트로 교체한다 (기존 컨텍스트는 사용 중인 페이지 반납 후 닫힘)."""
+        if identity.retired:
+            await self.browser_pool.close_context(new_context)
+            return
+        old_context = identity.context
+        identity.context = new_context
+        if old_context and old_context is not new_context:
+            await self.browser_pool.retire_context(old_context)
+        self.logger.info(f"쿠키 ID {identity.index} 컨텍스트 교체 완료")
+
+    def next_context(self, primary_context: BrowserContext) -> BrowserContext:
+        """
+        다음 상품 페이지에 사용할 컨텍스트를 라운드로빈으로 고른다.
+
+        Args:
+            primary_context: 크롤러 기본 세션(ID 0)의 현재 컨텍스트
+
+        Returns:
+            브라우저 컨텍스트
+        """
+        contexts = [primary_context] + [identity.context for identity in self.identities if identity.active]
+        return contexts[next(self._cycle) % len(contexts)]
+
+    async def record_result(self, context: BrowserContext, page_state: Dict[str, Any], valid: bool) -> None:
+        """
+        상품 페이지 유효성 검사 결과를 해당 ID의 상태에 반영한다.
+
+        Cloudflare/로그인 페이지는 세션 차단으로 보고, max_failures번 연속이면 ID를 퇴역시킨다.
+        상품 없음/에러 페이지는 ID와 무관하므로 세지 않는다.
+
+        Args:
+            context: 페이지를 연 컨텍스트
+            page_state: 스냅샷의 page_state
+            valid: 유효한 상품 페이지였는지 여부
+        """
+        identity = next((identity for identity in self.identities if identity.context is context), None)
+        if identity is None or identity.retired:
+            return
+
+        if page_state.get("cloudflare") or page_state.get("login"):
+            identity.failures += 1
+            self.logger.warning(f"쿠키 ID {identity.index} 차단 감지 ({identity.failures}/{self.max_failures})")
+            if identity.failures >= self.max_failures:
+                self.logger.warning(f"쿠키 ID {identity.index} 퇴역 (성공 {identity.successes}회)")
+                await self._retire(identity)
+        elif valid:
+            identity.failures = 0
+            identity.successes += 1
+
+    async def _retire(self, identity: CookieIdentity) -> None:
+        """ID를 배정에서 빼고 백그라운드 갱신을 멈춘 뒤 컨텍스트를 정리한다."""
+        identity.retired = True
+        await identity.manager.stop_background_refresh()
+        if identity.context:
+            context, identity.context = identity.context, None
+            await self.browser_pool.retire_context(context)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        ID별 상태를 반환한다.
+
+        Returns:
+            [{"index", "user_agent", "successes", "failures", "retired"}, ...]
+        """
+        return [
+            {
+                "index": identity.index,
+                "user_agent": identity.manager.user_agent,
+                "successes": identity.successes,
+                "failures": identity.failures,
+                "retired": identity.retired,
+            }
+            for identity in self.identities
+        ]
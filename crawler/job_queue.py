@@ -0,0 +1,270 @@
+"""PostgreSQL 기반 분산 크롤링 작업 큐."""
+
+import os
+import socket
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from psycopg2.extras import execute_values, RealDictCursor
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from .db_pool import get_pool
+from .utils import setup_logger
+
+
+class PostgresJobQueue:
+    """
+    crawl_jobs 테이블을 이용한 goodsNo 작업 큐.
+
+    여러 크롤러 노드가 같은 DB를 바라보며 작업을 나눠 가진다.
+    - claim(): SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 잡은 행을 건너뛰고 lease를 설정
+    - complete(): 저장까지 끝난 작업을 done으로 표시
+    - fail(): 재시도 횟수가 남으면 지수 백오프 후 pending, 아니면 dead로 이동 (dead-letter)
+    - lease가 만료된 작업(워커 크래시)은 다른 워커가 다시 가져간다.
+
+    상태: pending → leased → done | pending(재시도) | dead
+    """
+
+    STATUSES = ("pending", "leased", "done", "dead")
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        table_name: str = "crawl_jobs",
+        lease_seconds: int = 600,
+        max_attempts: int = 3,
+        retry_delay: int = 60,
+        worker_id: Optional[str] = None
+    ):
+        """
+        작업 큐를 초기화한다.
+
+        Args:
+            connection_string: PostgreSQL 연결 문자열 (기본값: DATABASE_URL 환경변수)
+            table_name: 작업 테이블명
+            lease_seconds: claim한 작업의 lease 유지 시간(초). 한 번에 claim한 묶음을 처리할 시간보다 길어야 한다.
+            max_attempts: dead로 보내기 전 최대 시도 횟수
+            retry_delay: 첫 재시도 대기 시간(초), 시도마다 2배씩 증가
+            worker_id: lease 소유자 식별자 (기본값: 호스트명-PID)
+        """
+        self.logger = setup_logger(self.__class__.__name__)
+
+        if not PSYCOPG2_AVAILABLE:
+            raise ImportError("psycopg2가 설치되지 않았습니다. pip install psycopg2-binary를 실행하세요.")
+
+        self.connection_string = connection_string or os.getenv("DATABASE_URL")
+        if not self.connection_string:
+            raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다.")
+
+        self.table_name = table_name
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.pool = get_pool(self.connection_string)
+
+        self.ensure_table()
+        self.logger.info(f"작업 큐 준비 완료: {self.table_name} (worker={self.worker_id})")
+
+    def _execute(self, query: str, params: Any = None, fetch: bool = False) -> List[Dict[str, Any]]:
+        """쿼리 하나를 트랜잭션으로 실행하고 필요하면 결과를 반환한다."""
+        with self.pool.connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(query, params)
+                rows = [dict(row) for row in cursor.fetchall()] if fetch else []
+            conn.commit()
+            return rows
+
+    def ensure_table(self) -> None:
+        """crawl_jobs 테이블과 claim용 인덱스가 없으면 생성한다 (scripts/init.sql과 동일)."""
+        self._execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                id BIGSERIAL PRIMARY KEY,
+                goods_no VARCHAR(50) NOT NULL UNIQUE,
+                category_id VARCHAR(50),
+                status VARCHAR(10) NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                lease_owner VARCHAR(100),
+                lease_expires_at TIMESTAMP,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_{self.table_name}_claim
+                ON {self.table_name}(status, available_at) WHERE status IN ('pending', 'leased');
+        """)
+
+    def enqueue(self, goods_no_list: Iterable[str], category_id: Optional[str] = None) -> int:
+        """
+        goodsNo를 작업으로 등록한다.
+
+        이미 대기/처리 중인 goodsNo는 그대로 두고, 완료된 goodsNo는 다시 pending으로 돌린다 (재크롤링).
+        dead 상태 작업은 requeue_dead()로만 되살린다.
+
+        Args:
+            goods_no_list: 등록할 goodsNo 목록
+            category_id: goodsNo를 발견한 카테고리 ID
+
+        Returns:
+            새로 등록되거나 다시 pending이 된 작업 수
+        """
+        goods_no_list = list(dict.fromkeys(goods_no_list))
+        if not goods_no_list:
+            return 0
+
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                rows = execute_values(
+                    cursor,
+                    f"""
+                        INSERT INTO {self.table_name} (goods_no, category_id) VALUES %s
+                        ON CONFLICT (goods_no) DO UPDATE SET
+                            status = 'pending',
+                            attempts = 0,
+                            available_at = CURRENT_TIMESTAMP,
+                            category_id = EXCLUDED.category_id,
+                            last_error = NULL,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE {self.table_name}.status = 'done'
+                        RETURNING goods_no
+                    """,
+                    [(goods_no, category_id) for goods_no in goods_no_list],
+                    fetch=True
+                )
+            conn.commit()
+
+        self.logger.info(f"작업 등록: {len(rows)}/{len(goods_no_list)}개 (카테고리 {category_id})")
+        return len(rows)
+
+    def claim(self, limit: int = 20) -> List[str]:
+        """
+        처리할 작업을 최대 limit개 가져오고 lease를 설정한다.
+
+        다른 워커가 잠근 행은 SKIP LOCKED로 건너뛰므로 여러 노드가 동시에 호출해도 같은 작업을 받지 않는다.
+        lease가 만료된 작업 중 시도 횟수를 모두 쓴 작업은 먼저 dead로 옮긴다.
+
+        Args:
+            limit: 가져올 최대 작업 수
+
+        Returns:
+            goodsNo 목록
+        """
+        self._execute(f"""
+            UPDATE {self.table_name}
+            SET status = 'dead', lease_owner = NULL, lease_expires_at = NULL,
+                last_error = COALESCE(last_error, 'lease expired'), updated_at = CURRENT_TIMESTAMP
+            WHERE status = 'leased' AND lease_expires_at < CURRENT_TIMESTAMP AND attempts >= %s
+        """, (self.max_attempts,))
+
+        rows = self._execute(f"""
+            UPDATE {self.table_name} AS jobs
+            SET status = 'leased',
+                attempts = jobs.attempts + 1,
+                lease_owner = %s,
+                lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                updated_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT id FROM {self.table_name}
+                WHERE (status = 'pending' AND available_at <= CURRENT_TIMESTAMP)
+                   OR (status = 'leased' AND lease_expires_at < CURRENT_TIMESTAMP)
+                ORDER BY available_at, id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            ) AS claimable
+            WHERE jobs.id = claimable.id
+            RETURNING jobs.goods_no
+        """, (self.worker_id, self.lease_seconds, limit), fetch=True)
+
+        return [row["goods_no"] for row in rows]
+
+    def complete(self, goods_no_list: Iterable[str]) -> None:
+        """
+        이 워커가 lease한 작업을 완료 처리한다.
+
+        Args:
+            goods_no_list: 저장까지 끝난 goodsNo 목록
+        """
+        goods_no_list = list(goods_no_list)
+        if not goods_no_list:
+            return
+        self._execute(f"""
+            UPDATE {self.table_name}
+            SET status = 'done', lease_owner = NULL, lease_expires_at = NULL,
+                last_error = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE goods_no = ANY(%s) AND status = 'leased' AND lease_owner = %s
+        """, (goods_no_list, self.worker_id))
+
+    def fail(self, goods_no_list: Iterable[str], error: str = "crawl failed") -> None:
+        """
+        이 워커가 lease한 작업을 실패 처리한다.
+
+        시도 횟수가 남았으면 retry_delay * 2^(attempts-1)초 뒤 재시도되도록 pending으로,
+        max_attempts에 도달했으면 dead로 옮긴다.
+
+        Args:
+            goods_no_list: 실패한 goodsNo 목록
+            error: 실패 사유
+        """
+        goods_no_list = list(goods_no_list)
+        if not goods_no_list:
+            return
+        self._execute(f"""
+            UPDATE {self.table_name}
+            SET status = CASE WHEN attempts >= %s THEN 'dead' ELSE 'pending' END,
+                available_at = CURRENT_TIMESTAMP + make_interval(secs => %s * power(2, attempts - 1)),
+                lease_owner = NULL, lease_expires_at = NULL,
+                last_error = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE goods_no = ANY(%s) AND status = 'leased' AND lease_owner = %s
+        """, (self.max_attempts, self.retry_delay, error, goods_no_list, self.worker_id))
+
+    def seconds_until_claimable(self) -> Optional[float]:
+        """
+        남은 작업 중 가장 먼저 claim 가능해지는 시점까지의 시간을 반환한다.
+
+        재시도 대기 중인 pending 작업은 available_at, 다른 워커가 lease 중인 작업은
+        lease_expires_at(워커가 죽었으면 그때 다시 claim 가능)을 기준으로 한다.
+
+        Returns:
+            초 단위 대기 시간 (이미 가능하면 0 이하), 남은 작업이 없으면 None
+        """
+        rows = self._execute(f"""
+            SELECT EXTRACT(EPOCH FROM MIN(
+                CASE WHEN status = 'pending' THEN available_at ELSE lease_expires_at END
+            ) - CURRENT_TIMESTAMP) AS wait_seconds
+            FROM {self.table_name}
+            WHERE status IN ('pending', 'leased')
+        """, fetch=True)
+        wait_seconds = rows[0]["wait_seconds"] if rows else None
+        return float(wait_seconds) if wait_seconds is not None else None
+
+    def requeue_dead(self) -> int:
+        """
+        dead 작업을 시도 횟수를 초기화해 다시 pending으로 돌린다.
+
+        Returns:
+            되살린 작업 수
+        """
+        rows = self._execute(f"""
+            UPDATE {self.table_name}
+            SET status = 'pending', attempts = 0, available_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE status = 'dead'
+            RETURNING goods_no
+        """, fetch=True)
+        return len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        상태별 작업 수를 반환한다.
+
+        Returns:
+            {"pending": n, "leased": n, "done": n, "dead": n}
+        """
+        rows = self._execute(
+            f"SELECT status, COUNT(*) AS count FROM {self.table_name} GROUP BY status", fetch=True
+        )
+        counts = {status: 0 for status in self.STATUSES}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
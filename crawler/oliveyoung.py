@@ -2,22 +2,38 @@
 
 import asyncio
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import traceback
-import re
 import logging
 
 from .cookies import OliveyoungCookieManager
 from playwright.async_api import BrowserContext
 from .base import BaseCrawler
+from .browser_pool import BrowserPool
+from .category_cache import CategoryTreeCache
+from .checkpoint import CrawlCheckpoint
+from .identity_pool import OliveyoungIdentityPool
+from .job_queue import PostgresJobQueue
+from .rate_controller import AdaptiveRateController
+from .scheduler import SlidingWindowScheduler
 from .utils import log_error, setup_logger
 from .oliveyoung_extractors import (
     OliveyoungProductExtractor,
     OliveyoungPriceExtractor,
     OliveyoungBenefitExtractor,
-    OliveyoungImageExtractor
+    OliveyoungImageExtractor,
+    collect_product_snapshot,
+    is_snapshot_incomplete,
+    wait_for_product_ready
 )
 from .oliveyoung_dynamic_content import OliveyoungDynamicContentExtractor
+from .oliveyoung_http import (
+    HTTPX_AVAILABLE,
+    OliveyoungHttpFetcher,
+    parse_category_menu,
+    parse_goods_no_list,
+    parse_product_snapshot
+)
 
 
 class OliveyoungCrawler(BaseCrawler):
@@ -33,23 +49,61 @@ class OliveyoungCrawler(BaseCrawler):
     CATEGORY_URL_TEMPLATE = "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo={categoryId}"
     MAIN_PAGE_URL = "https://www.oliveyoung.co.kr/store/main/main.do"
     
-    def __init__(self, storage: Any = None, max_workers: int = 1, cookie_file: str = "oy_state.json", db_storage: Any = None):
+    # 상품 상세 페이지 수집 방식
+    FETCH_MODES = ("browser", "http")
+
+    # create_context()로 만든 페이지는 상품 이미지가 로딩되어야 동적 콘텐츠가 표시되므로 상품 이미지 허용
+    # (크롤링 컨텍스트는 쿠키 매니저의 "oliveyoung" 프로필 사용)
+    RESOURCE_BLOCK_PROFILE = "oliveyoung_page"
+
+    # 카테고리 목록 페이지당 상품 수 (사이트가 제공하는 최대 보기 개수, 더 필요하면 pageIdx로 페이지네이션)
+    LIST_ROWS_PER_PAGE = 48
+    
+    def __init__(self, storage: Any = None, max_workers: int = 1, cookie_file: str = "oy_state.json", db_storage: Any = None,
+                 browser_pool: Optional[BrowserPool] = None, fetch_mode: str = "browser", direct_ajax: bool = True,
+                 rate_limit: float = 1.0, max_rate: Optional[float] = None, job_queue: Optional[PostgresJobQueue] = None,
+                 category_cache_file: Optional[str] = "oy_categories.json", category_cache_ttl: float = 24 * 3600,
+                 identities: int = 1, headless: Optional[bool] = None):
         """
         Oliveyoung 크롤러를 초기화한다.
 
         Args:
             storage: 데이터 저장소 인스턴스 (엑셀)
-            max_workers: 최대 동시 세션 수 (서버 부담 경감을 위해 기본값 1)
+            max_workers: 최대 동시 세션 수 (적응형 제어기가 1부터 이 값까지 늘림, 기본값 1)
             cookie_file: 쿠키 저장 파일 경로
             db_storage: PostgreSQL 저장소 인스턴스 (옵션)
+            browser_pool: 쿠키 매니저와 공유할 브라우저 풀 (None이면 max_workers개 유휴 페이지를 유지하는 풀 생성)
+            fetch_mode: 상품 페이지 수집 방식 ("browser": Playwright, "http": 쿠키 기반 HTTP 직접 요청 후 필요 시 브라우저 폴백)
+            direct_ajax: 옵션/상세정보 AJAX 엔드포인트를 직접 호출할지 여부 (http 모드는 페이지와 동시에, browser 모드는 버튼이 있는 상품만 요청; 실패/빈 응답 시 버튼 클릭 방식으로 폴백)
+            rate_limit: 초기 초당 요청 수 (차단 신호가 없으면 max_rate까지 점진적으로 증가)
+            max_rate: 최대 초당 요청 수 (None이면 rate_limit의 5배)
+            job_queue: 여러 노드가 공유하는 crawl_jobs 작업 큐 (enqueue_all_categories/crawl_from_queue에서 사용)
+            category_cache_file: 카테고리 트리 캐시 파일 경로 (None이면 매번 메인 페이지에서 추출)
+            category_cache_ttl: 카테고리 캐시를 검증 없이 사용할 시간(초)
+            identities: 상품 페이지를 나눠 요청할 독립 쿠키 세션 수 (1이면 기본 세션만 사용)
+            headless: 쿠키 발급과 크롤링을 headless로 실행할지 여부 (None이면 환경변수 CRAWLER_HEADLESS, browser_pool을 넘기면 무시)
         """
-        super().__init__(storage, max_workers)
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"지원하지 않는 fetch_mode: {fetch_mode} (가능: {', '.join(self.FETCH_MODES)})")
+        if browser_pool is None:
+            # ID마다 컨텍스트 하나 + 쿠키 갱신으로 교체 중인 컨텍스트
+            browser_pool = BrowserPool(
+                headless=headless, max_idle_pages=max_workers, max_contexts=max(4, identities * 2)
+            )
+        super().__init__(storage, max_workers, browser_pool=browser_pool)
         self.db_storage = db_storage
         # 환경변수 OY_LOG_LVL로 로그 레벨 제어 (기본: INFO)
         log_level_str = os.getenv('OY_LOG_LVL', 'INFO').upper()
         log_level = getattr(logging, log_level_str, logging.INFO)
         self.logger = setup_logger(__name__, log_level)
-        self.semaphore = asyncio.Semaphore(max_workers)  # 동시성 제어
+        # 모든 Oliveyoung 요청이 공유하는 AIMD 속도/동시성 제어 (카테고리 간 공유)
+        self.rate_controller = AdaptiveRateController(
+            host="www.oliveyoung.co.kr",
+            initial_rate=rate_limit,
+            max_rate=max_rate,
+            max_concurrency=max_workers
+        )
+        self.rate_limiter = self.rate_controller.bucket
         
         # 데이터 추출기 초기화
         self.product_extractor = OliveyoungProductExtractor(self.logger)
@@ -64,6 +118,27 @@ class OliveyoungCrawler(BaseCrawler):
         self.crawl_context = None
         self.list_page = None  # 상품 목록 페이지를 계속 열어둘 페이지
         self.current_category_id = None  # 현재 열려있는 카테고리 ID
+        self.current_list_url = None  # 현재 열려있는 목록 페이지 URL (정렬/페이지 포함)
+        
+        # HTTP 직접 요청 (상품 페이지: fetch_mode="http", 옵션/상세정보 AJAX: direct_ajax)
+        self.fetch_mode = fetch_mode
+        self.direct_ajax = direct_ajax
+        self.http_fetcher: Optional[OliveyoungHttpFetcher] = None
+        
+        # 전체 카테고리 크롤링 재개용 체크포인트 (crawl_all_categories에서 설정)
+        self.checkpoint: Optional[CrawlCheckpoint] = None
+        
+        # 분산 크롤링 작업 큐 (저장 완료 시 작업 완료 처리)
+        self.job_queue = job_queue
+
+        # 다중 쿠키 세션 (identities > 1일 때 start()에서 생성)
+        self.identities = max(1, identities)
+        self.identity_pool: Optional[OliveyoungIdentityPool] = None
+
+        # 카테고리 트리 캐시 (extract_all_category_ids)
+        self.category_cache = (
+            CategoryTreeCache(category_cache_file, ttl=category_cache_ttl) if category_cache_file else None
+        )
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입."""
@@ -80,30 +155,88 @@ class OliveyoungCrawler(BaseCrawler):
         """
         await super().start()
         
-        # 쿠키 관리자 시작
-        self.cookie_manager = OliveyoungCookieManager(self.cookie_file)
+        # 쿠키 관리자 시작 (크롤러와 같은 브라우저 프로세스 공유)
+        self.cookie_manager = OliveyoungCookieManager(self.cookie_file, browser_pool=self.browser_pool)
         await self.cookie_manager.start()
         
         # 자동 쿠키 만료 검증 및 컨텍스트 생성
         try:
             self.crawl_context = await self.cookie_manager.ensure_context()
+            await self.browser_pool.prewarm(self.crawl_context)
             self.logger.info("Oliveyoung 향상된 크롤러 시작 완료 (자동 쿠키 관리)")
         except Exception as e:
             raise RuntimeError(f"크롤링용 컨텍스트 생성 실패: {e}")
+        
+        # HTTP 모드/AJAX 직접 호출: 부트스트랩된 쿠키 파일로 HTTP 클라이언트 준비
+        # (브라우저 모드에서는 옵션/상세정보 버튼이 있는 상품을 처음 만날 때 클라이언트 시작)
+        if self.fetch_mode == "http" or (self.direct_ajax and HTTPX_AVAILABLE):
+            self.http_fetcher = OliveyoungHttpFetcher(
+                self.cookie_file,
+                max_connections=self.max_workers * 2,
+                rate_controller=self.rate_controller
+            )
+            if self.fetch_mode == "http":
+                await self.http_fetcher.start()
+        
+        # cf_clearance 만료 전에 별도 컨텍스트에서 쿠키를 재발급하고 상품 사이에 컨텍스트 교체
+        self.cookie_manager.start_background_refresh(self._swap_crawl_context)
+        
+        # 추가 쿠키 세션: 상품 페이지를 기본 세션과 라운드로빈으로 나눠 요청
+        if self.identities > 1:
+            self.identity_pool = OliveyoungIdentityPool(self.cookie_file, self.identities, self.browser_pool)
+            await self.identity_pool.start()
+    
+    async def _swap_crawl_context(self, new_context: BrowserContext) -> None:
+        """
+        백그라운드에서 재발급된 쿠키의 컨텍스트로 교체한다.
+        
+        이후 acquire_page는 새 컨텍스트를 사용하고, 기존 컨텍스트는 진행 중인 상품 페이지와
+        목록 페이지(list_page)가 모두 반납된 뒤 닫힌다. 목록 페이지는 다음 ensure_list_page 호출 때
+        새 컨텍스트에서 다시 열린다. HTTP 클라이언트도 새 쿠키 파일을 다시 읽는다.
+        
+        Args:
+            new_context: 새 쿠키로 생성한 크롤링 컨텍스트
+        """
+        old_context = self.crawl_context
+        await self.browser_pool.prewarm(new_context)
+        self.crawl_context = new_context
+        if self.http_fetcher:
+            self.http_fetcher.reload_cookies()
+        if old_context and old_context is not new_context:
+            await self.browser_pool.retire_context(old_context)
+        self.logger.info("쿠키 갱신 후 크롤링 컨텍스트 교체 완료")
+    
+    def _product_context(self) -> BrowserContext:
+        """상품 페이지에 사용할 컨텍스트 (추가 쿠키 세션이 있으면 라운드로빈)."""
+        if self.identity_pool:
+            return self.identity_pool.next_context(self.crawl_context)
+        return self.crawl_context
     
     async def stop(self) -> None:
         """
         크롤러를 종료하고 지속적인 컨텍스트를 정리한다.
         """
         try:
+            if self.identity_pool:
+                for identity in self.identity_pool.stats():
+                    self.logger.info(f"쿠키 ID 통계: {identity}")
+                await self.identity_pool.stop()
+                self.identity_pool = None
+
+            if self.cookie_manager:
+                await self.cookie_manager.stop_background_refresh()
+
+            if self.http_fetcher:
+                await self.http_fetcher.stop()
+                self.http_fetcher = None
+            
             # 지속적인 페이지와 컨텍스트 정리
             if self.list_page:
-                await self.list_page.close()
-                self.list_page = None
+                await self._release_list_page(failed=True)
                 self.logger.info("Oliveyoung 상품 목록 페이지 닫기 완료")
                 
             if self.crawl_context:
-                await self.crawl_context.close()
+                await self.browser_pool.close_context(self.crawl_context)
                 self.crawl_context = None
                 self.logger.info("Oliveyoung 크롤링용 브라우저 컨텍스트 닫기 완료")
 
@@ -112,60 +245,56 @@ class OliveyoungCrawler(BaseCrawler):
                 self.cookie_manager = None
                 self.logger.info("Oliveyoung 쿠키 매니저 종료 완료")
 
-            if self.list_page:
-                await self.list_page.close()
-                self.list_page = None
-                self.logger.info("Oliveyoung 상품 목록 페이지 닫기 완료")
-
         except Exception as e:
             self.logger.error(f"Oliveyoung 지속적인 리소스 정리 중 오류: {str(e)}")
         
         await super().stop()
+
+    async def _release_list_page(self, failed: bool = False) -> None:
+        """
+        목록 페이지를 브라우저 풀에 반납한다.
+
+        교체 대기 중인 컨텍스트의 마지막 페이지였다면 이때 기존 컨텍스트가 닫힌다.
+
+        Args:
+            failed: 페이지 작업이 실패했으면 True (재사용하지 않고 닫음)
+        """
+        page, self.list_page = self.list_page, None
+        if page:
+            await self.browser_pool.release_page(page, failed=failed)
         
-    async def _refresh_session(self):
-        """세션 리프레시 (쿠키 만료 시)."""
-        self.logger.info("세션 리프레시 시작")
-        
-        if self.page:
-            await self.page.close()
-        
-        # 기존 컨텍스트 정리 후 새 컨텍스트 생성
-        if self.crawl_context:
-            await self.crawl_context.close()
-            self.crawl_context = None
-        
-        try:
-            self.crawl_context = await self.cookie_manager.ensure_context()
-        except Exception as e:
-            raise RuntimeError(f"세션 리프레시 실패: {e}")
-            
-        self.page = await self.crawl_context.new_page()
-        self.logger.info("세션 리프레시 완료")
-    
-    async def ensure_list_page(self, category_id: str, rows_per_page: int = 1000, sort_type: str = "01") -> bool:
+    async def ensure_list_page(self, category_id: str, rows_per_page: int = 1000, sort_type: str = "01",
+                               page_idx: int = 1) -> bool:
         """
         카테고리 목록 페이지를 지속적으로 유지한다.
 
-        카테고리가 변경되거나 페이지가 없으면 새로 생성하고,
-        동일한 카테고리면 기존 페이지를 재사용한다.
+        카테고리/정렬/페이지가 변경되거나 페이지가 없으면 새로 생성하고,
+        동일한 목록이면 기존 페이지를 재사용한다.
 
         Args:
             category_id: 카테고리 ID
             rows_per_page: 페이지당 표시할 아이템 수 (기본값: 1000)
             sort_type: 정렬 타입 (01=판매순, 02=최신순)
+            page_idx: 목록 페이지 번호 (1부터)
 
         Returns:
             페이지 준비 성공 여부
         """
+        # 카테고리 URL 생성 (rowsPerPage, prdSort, pageIdx 파라미터 추가)
+        category_url = (
+            f"{self.CATEGORY_URL_TEMPLATE.format(categoryId=category_id)}"
+            f"&prdSort={sort_type}&rowsPerPage={rows_per_page}&pageIdx={page_idx}"
+        )
         try:
-            # 카테고리가 변경되거나 페이지가 없으면 새로 생성
+            # 목록이 변경되거나 페이지가 없거나 쿠키 갱신으로 컨텍스트가 교체되었으면 새로 생성
             if (not self.list_page or
-                self.current_category_id != category_id or
-                self.list_page.is_closed()):
+                self.current_list_url != category_url or
+                self.list_page.is_closed() or
+                self.list_page.context is not self.crawl_context):
 
-                # 기존 페이지가 있으면 닫기
-                if self.list_page and not self.list_page.is_closed():
-                    await self.list_page.close()
+                # 기존 페이지가 있으면 반납 (교체된 컨텍스트는 이때 닫힘)
+                if self.list_page:
+                    await self._release_list_page(failed=True)
                     self.logger.info(f"이전 카테고리 페이지 닫기: {self.current_category_id}")
 
                 # 컨텍스트 확인
@@ -176,17 +305,13 @@ class OliveyoungCrawler(BaseCrawler):
                         self.logger.error(f"크롤링 컨텍스트 생성 실패: {e}")
                         return False
 
-                # 새 카테고리 페이지 생성
-                self.list_page = await self.crawl_context.new_page()
-
-                # 카테고리 URL 생성 및 이동 (rowsPerPage, prdSort 파라미터 추가)
-                category_url = f"{self.CATEGORY_URL_TEMPLATE.format(categoryId=category_id)}&prdSort={sort_type}&rowsPerPage={rows_per_page}"
+                # 새 카테고리 페이지 생성 (풀에서 빌려 컨텍스트 교체 시 사용 중으로 집계)
+                self.list_page = await self.browser_pool.acquire_page(self.crawl_context)
 
                 self.logger.info(f"카테고리 페이지 이동: {category_url}")
 
                 if not await self.safe_goto(self.list_page, category_url):
-                    await self.list_page.close()
-                    self.list_page = None
+                    await self._release_list_page(failed=True)
                     return False
 
                 # 페이지 로딩 대기
@@ -194,6 +319,7 @@ class OliveyoungCrawler(BaseCrawler):
                 await random_delay(0.5, 1.5)
 
                 self.current_category_id = category_id
+                self.current_list_url = category_url
                 self.logger.info(f"카테고리 목록 페이지 준비 완료: {category_id}")
             else:
                 self.logger.debug(f"기존 카테고리 페이지 재사용: {category_id}")
@@ -202,199 +328,143 @@ class OliveyoungCrawler(BaseCrawler):
 
         except Exception as e:
             self.logger.error(f"카테고리 목록 페이지 준비 실패: {e}")
-            if self.list_page and not self.list_page.is_closed():
-                await self.list_page.close()
-            self.list_page = None
+            await self._release_list_page(failed=True)
             self.current_category_id = None
+            self.current_list_url = None
             return False
     
-    async def _validate_page_content(self, page, goods_no: str) -> bool:
+    async def safe_goto(self, page, url: str, timeout: int = 60000) -> bool:
         """
-        페이지 내용이 유효한 상품 페이지인지 검사한다.
+        페이지로 이동한다 (고정 지연 대신 적응형 속도 제어 사용).
+        
+        403 응답은 차단 신호로 속도 제어기에 전달한다.
+        
+        Args:
+            page: 페이지 인스턴스
+            url: 이동할 URL
+            timeout: 타임아웃 (밀리초, 기본값 60초)
+            
+        Returns:
+            성공 여부
+        """
+        try:
+            response = await page.goto(url, timeout=timeout, wait_until='domcontentloaded')
+            if response is not None and response.status == 403:
+                self.logger.warning(f"페이지 403 응답 ({url})")
+                self.rate_controller.record_block("http_403")
+            return True
+        except Exception as e:
+            self.logger.warning(f"페이지 이동 실패 ({url}): {str(e)}")
+            return False
+    
+    async def _load_page_snapshot(self, page, goods_no: str, record_rate: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        로드된 상품 페이지에서 스냅샷을 수집하고 유효성을 검사한다.
         
         Args:
             page: Playwright 페이지 인스턴스
             goods_no: 상품 번호 (로깅용)
+            record_rate: 검사 결과를 속도 제어기에 반영할지 여부 (같은 상품을 이미 검사했으면 False)
             
         Returns:
-            True if valid product page, False if login/error page
+            유효한 상품 페이지의 스냅샷 또는 None (로그인/에러 페이지)
         """
         try:
-            # 0. Cloudflare 봇 차단 페이지 감지
-            page_content = await page.content()
-            
-            # Cloudflare 에러 페이지 특징 검사
-            cloudflare_indicators = [
-                '페이지를 제대로 표시할 수 없어요',
-            ]
-            
-            if any(indicator in page_content for indicator in cloudflare_indicators):
-                self.logger.error(f"Oliveyoung Cloudflare 봇 차단 페이지 감지 ({goods_no}) - anti-bot 대응 필요")
-                return False
-            
-            # 1. 상품 없음 페이지 감지
-            error_element = page.locator('#error-contents.error-page.noProduct')
-            if await error_element.count() > 0:
-                error_msg = await error_element.locator('#error-contents-head').inner_text() if await error_element.locator('#error-contents-head').count() > 0 else "상품을 찾을 수 없음"
-                self.logger.warning(f"Oliveyoung 상품 없음 페이지 감지 ({goods_no}): {error_msg}")
-                return False
-            
-            # 2. 로그인 페이지 감지
-            login_element = page.locator('.loginArea.new-loginArea')
-            if await login_element.count() > 0:
-                self.logger.warning(f"Oliveyoung 로그인 페이지 감지({goods_no}) - 세션 만료 또는 성인 물품")  
-                return False
-            
-            # 3. 일반적인 에러 페이지 감지 (추가 안전장치)
-            general_error = page.locator('#error-contents')
-            if await general_error.count() > 0:
-                self.logger.warning(f"Oliveyoung 에러 페이지 감지 ({goods_no})")
-                return False
-            
-            # 4. 상품 페이지 핵심 요소 존재 확인
-            product_name = page.locator('.prd_name')
-            if await product_name.count() == 0:
-                # 상품명이 없으면 잘못된 페이지일 가능성
-                # 하지만 동적 로딩일 수도 있으므로 짧게 대기 후 재확인
+            # domcontentloaded 이후 늦게 그려지는 가격/이미지까지 기다린 뒤 수집
+            await wait_for_product_ready(page)
+            snapshot = await collect_product_snapshot(page)
+            
+            # 핵심 값이 비어 있으면 동적 로딩일 수 있으므로 짧게 대기 후 재수집
+            if is_snapshot_incomplete(snapshot):
                 from .utils import random_delay
                 await random_delay(0.5, 1.5)
-                if await product_name.count() == 0:
-                    self.logger.warning(f"Oliveyoung 상품명 요소를 찾을 수 없음 ({goods_no}) - 유효하지 않은 페이지")
-                    return False
+                snapshot = await collect_product_snapshot(page)
             
-            self.logger.debug(f"Oliveyoung 페이지 유효성 검사 통과 ({goods_no})")
-            return True
+            valid = self._validate_snapshot(snapshot, goods_no, record_rate)
+            if self.identity_pool:
+                await self.identity_pool.record_result(page.context, snapshot["page_state"], valid)
+            return snapshot if valid else None
             
         except Exception as e:
             self.logger.error(f"Oliveyoung 페이지 유효성 검사 실패 ({goods_no}): {str(e)}")
-            return False
+            return None
     
-    async def _setup_resource_blocking(self, context: BrowserContext) -> None:
+    def _validate_snapshot(self, snapshot: Dict[str, Any], goods_no: str, record_rate: bool = True) -> bool:
         """
-        올리브영 전용 리소스 차단 설정 - 상품 이미지 로딩 허용.
-
-        올리브영은 상품 이미지가 로딩되면서 함께 상품 정보도 동적으로 로드되므로
-        이미지 로딩을 허용해야 48개 상품이 모두 표시됩니다.
-
+        스냅샷의 페이지 상태로 유효한 상품 페이지인지 검사한다.
+        
         Args:
-            context: 브라우저 컨텍스트
-        """
-        
-        async def handle_route(route):
-            """올리브영 전용 리소스 요청 처리"""
-            url = route.request.url
-            resource_type = route.request.resource_type
-            
-            # 1. 이미지 리소스 처리 - 올리브영 도메인만 허용
-            if resource_type == "image":
-                # 올리브영 도메인의 상품 이미지는 허용 (동적 콘텐츠 로딩을 위해 필수)
-                if ("oliveyoung.co.kr" in url and 
-                    any(keyword in url.lower() for keyword in 
-                        ['goods', 'product', 'prd'])):
-                    await route.continue_()
-                    return
-                # 광고 및 추적 이미지는 차단
-                elif any(ad_keyword in url.lower() for ad_keyword in 
-                         ['ad', 'banner', 'tracking', 'analytics']):
-                    await route.abort()
-                    return
-                # 기타 외부 이미지 차단
-                else:
-                    await route.abort()
-                    return
-            
-            # 2. 폰트 파일 차단 (성능 향상)
-            if (resource_type == "font" or 
-                any(ext in url.lower() for ext in 
-                    ['.woff', '.woff2', '.ttf', '.otf', '.eot'])):
-                await route.abort()
-                return
-            
-            # 3. 미디어 파일 차단 (성능 향상)
-            if (resource_type == "media" or 
-                any(ext in url.lower() for ext in 
-                    ['.mp4', '.avi', '.mov', '.wmv', '.mp3', '.wav', '.ogg'])):
-                await route.abort()
-                return
-            
-            # 4. 광고 및 추적 스크립트 차단
-            blocked_domains = [
-                'google-analytics.com',
-                'googletagmanager.com', 
-                'facebook.com/tr',
-                'doubleclick.net',
-                'googlesyndication.com',
-                'adsystem.com',
-                'ads.yahoo.com',
-                'amazon-adsystem.com'
-            ]
-            
-            if any(domain in url.lower() for domain in blocked_domains):
-                await route.abort()
-                return
-            
-            # 5. 불필요한 CSS 파일 차단 (일부만)
-            if (resource_type == "stylesheet" and 
-                any(keyword in url.lower() for keyword in 
-                    ['font', 'icon', 'ads'])):
-                await route.abort()
-                return
-            
-            # 6. 그 외 요청은 정상 처리 (XHR, fetch, document, script 등)
-            await route.continue_()
-        
-        # 라우터 설정
-        await context.route("**/*", handle_route)
+            snapshot: collect_product_snapshot() 또는 parse_product_snapshot() 결과
+            goods_no: 상품 번호 (로깅용)
+            record_rate: 차단/성공을 속도 제어기(AIMD)에 기록할지 여부
+            
+        Returns:
+            True if valid product page, False if login/error page
+        """
+        page_state = snapshot["page_state"]
         
-        self.logger.info(
-            "올리브영 전용 리소스 차단 설정 완료 (상품 이미지 로딩 허용)")
+        # 0. Cloudflare 봇 차단 페이지 감지
+        if page_state["cloudflare"]:
+            self.logger.error(f"Oliveyoung Cloudflare 봇 차단 페이지 감지 ({goods_no}) - anti-bot 대응 필요")
+            if record_rate:
+                self.rate_controller.record_block("cloudflare")
+            return False
         
+        # 1. 상품 없음 페이지 감지
+        if page_state["no_product"]:
+            self.logger.warning(f"Oliveyoung 상품 없음 페이지 감지 ({goods_no})")
+            return False
+        
+        # 2. 로그인 페이지 감지
+        if page_state["login"]:
+            self.logger.warning(f"Oliveyoung 로그인 페이지 감지({goods_no}) - 세션 만료 또는 성인 물품")
+            if record_rate:
+                self.rate_controller.record_block("login")
+            return False
+        
+        # 3. 일반적인 에러 페이지 감지 (추가 안전장치)
+        if page_state["error"]:
+            self.logger.warning(f"Oliveyoung 에러 페이지 감지 ({goods_no})")
+            return False
+        
+        # 4. 상품 페이지 핵심 요소 존재 확인
+        if not snapshot.get("item_name"):
+            self.logger.warning(f"Oliveyoung 상품명 요소를 찾을 수 없음 ({goods_no}) - 유효하지 않은 페이지")
+            return False
+        
+        self.logger.debug(f"Oliveyoung 페이지 유효성 검사 통과 ({goods_no})")
+        if record_rate:
+            self.rate_controller.record_success()
+        return True
+    
     async def crawl_single_product(self, goods_no: str) -> Optional[Dict[str, Any]]:
         """
         단일 제품을 크롤링한다.
         
+        fetch_mode가 "http"이면 HTTP 직접 요청을 먼저 시도하고, Cloudflare 챌린지나
+        요청 실패 시 Playwright 경로로 폴백한다.
+        
         Args:
             goods_no: 제품의 goodsNo (Oliveyoung 상품 번호)
             
         Returns:
             크롤링된 제품 데이터 또는 None (실패 시)
         """
-        async with self.semaphore:
-            url = self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no)
-            
+        async with self.rate_controller.slot():
             try:
-                # 쿠키 만료 검증 후 자동 재생성
-                if not self.crawl_context:
-                    try:
-                        self.crawl_context = await self.cookie_manager.ensure_context()
-                    except Exception as e:
-                        log_error(self.logger, goods_no, f"Oliveyoung 크롤링 컨텍스트 생성 실패: {e}", None)
-                        return None
-                
-                page = await self.crawl_context.new_page()
-                
-                # 페이지 로드
-                if not await self.safe_goto(page, url):
-                    log_error(self.logger, goods_no, "Oliveyoung 페이지 로드 실패", None)
-                    await page.close()  # 페이지만 닫기
-                    return None
-                
-                # 페이지 내용 유효성 검사
-                if not await self._validate_page_content(page, goods_no):
-                    log_error(self.logger, goods_no, "Oliveyoung 유효하지 않은 페이지 (로그인/에러 페이지)", None)
-                    await page.close()
-                    return None
-                
-                # 제품 데이터 추출
-                product_data = await self._extract_product_data(page, goods_no)
-    
-                await page.close()
+                dynamic_content = None
+                if self.fetch_mode == "http":
+                    snapshot, dynamic_content = await self._fetch_product_http(goods_no)
+                    if snapshot is not None:
+                        product_data = await self._crawl_single_product_http(snapshot, goods_no, dynamic_content)
+                        if product_data:
+                            self.logger.info(f"Oliveyoung 제품 크롤링 성공 (HTTP): {goods_no} - {product_data['item_name']}")
+                        return product_data
+                    self.logger.info(f"Oliveyoung HTTP 수집 불가 - 브라우저로 폴백 ({goods_no})")
                 
+                product_data = await self._crawl_single_product_browser(goods_no, dynamic_content)
                 if product_data:
                     self.logger.info(f"Oliveyoung 제품 크롤링 성공: {goods_no} - {product_data['item_name']}")
-                else:
-                    log_error(self.logger, goods_no, "Oliveyoung 제품 데이터 추출 실패", None)
-                
                 return product_data
 
             except Exception as e:
@@ -402,17 +472,219 @@ class OliveyoungCrawler(BaseCrawler):
                 log_error(self.logger, goods_no, str(e), error_trace)
                 return None
     
+    async def _fetch_product_http(
+        self,
+        goods_no: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]]]:
+        """
+        HTTP 모드에서 상품 페이지와 옵션/상세정보 AJAX를 동시에 요청한다.
+        
+        AJAX는 goodsNo만 있으면 요청할 수 있으므로 페이지 응답을 기다리지 않고 함께 보낸다.
+        버튼이 없는 상품의 응답은 _await_dynamic_content에서 버린다.
+        
+        Args:
+            goods_no: 제품 goodsNo
+            
+        Returns:
+            (스냅샷 또는 None, (옵션 목록, 상품정보제공고시) 또는 None (AJAX 직접 호출을 쓰지 않음))
+        """
+        if not (self.http_fetcher and self.direct_ajax):
+            return await self._fetch_product_snapshot(goods_no), None
+        
+        snapshot, dynamic_content = await asyncio.gather(
+            self._fetch_product_snapshot(goods_no),
+            self.http_fetcher.fetch_dynamic_content(goods_no),
+            return_exceptions=True
+        )
+        if isinstance(dynamic_content, Exception):
+            self.logger.debug(f"Oliveyoung AJAX 직접 호출 실패 ({goods_no}): {dynamic_content}")
+            dynamic_content = None
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot, dynamic_content
+    
+    async def _await_dynamic_content(
+        self,
+        snapshot: Dict[str, Any],
+        goods_no: str,
+        dynamic_content: Optional[Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]] = None
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]:
+        """
+        옵션/상세정보 버튼이 있는 항목만 AJAX 엔드포인트로 직접 요청한다.
+        
+        페이지에 옵션/상세정보 버튼이 없으면 버튼 클릭 방식과 같은 빈 값을 돌려주고,
+        버튼이 있는데 AJAX 응답이 실패하거나 비어 있으면 None을 돌려줘 버튼 클릭으로 추출하게 한다.
+        
+        Args:
+            snapshot: 상품 페이지 스냅샷
+            goods_no: 제품 goodsNo
+            dynamic_content: 페이지와 함께 미리 요청한 (옵션 목록, 상품정보제공고시) (있으면 다시 요청하지 않음)
+            
+        Returns:
+            (옵션 목록, 상품정보제공고시) - None인 항목은 페이지에서 버튼 클릭으로 추출해야 함
+        """
+        has_option_button = bool(snapshot.get("has_option_button"))
+        has_detail_button = bool(snapshot.get("has_detail_button"))
+        
+        option_list, product_info = None, None
+        if dynamic_content is not None:
+            option_list, product_info = dynamic_content
+        elif self.http_fetcher and self.direct_ajax and (has_option_button or has_detail_button):
+            try:
+                option_list, product_info = await self.http_fetcher.fetch_dynamic_content(
+                    goods_no, fetch_options=has_option_button, fetch_info=has_detail_button
+                )
+            except Exception as e:
+                self.logger.debug(f"Oliveyoung AJAX 직접 호출 실패 ({goods_no}): {e}")
+        
+        if not has_option_button:
+            option_list = []
+        elif not option_list:
+            option_list = None
+        if not has_detail_button:
+            product_info = {}
+        elif not product_info:
+            product_info = None
+        return option_list, product_info
+    
+    async def _fetch_product_snapshot(self, goods_no: str) -> Optional[Dict[str, Any]]:
+        """
+        HTTP로 상품 페이지를 받아 스냅샷으로 변환한다.
+        
+        Args:
+            goods_no: 제품 goodsNo
+            
+        Returns:
+            스냅샷 또는 None (요청 실패/Cloudflare 챌린지 - 브라우저 폴백 필요)
+        """
+        html_text = await self.http_fetcher.fetch_product_page(goods_no)
+        if html_text is None:
+            return None
+        
+        snapshot = parse_product_snapshot(html_text)
+        if snapshot["page_state"]["cloudflare"]:
+            self.logger.warning(f"Oliveyoung HTTP 응답에서 Cloudflare 챌린지 감지 ({goods_no})")
+            self.rate_controller.record_block("cloudflare")
+            return None
+        return snapshot
+    
+    async def _crawl_single_product_http(
+        self,
+        snapshot: Dict[str, Any],
+        goods_no: str,
+        dynamic_content: Optional[Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        HTTP 스냅샷으로 제품 데이터를 구성한다.
+        
+        옵션/상세정보 AJAX 직접 호출이 실패한 항목만 브라우저 페이지에서 버튼을 클릭해 추출한다.
+        
+        Args:
+            snapshot: parse_product_snapshot() 결과
+            goods_no: 제품 goodsNo
+            dynamic_content: 페이지와 함께 미리 요청한 AJAX 결과 (_fetch_product_http)
+            
+        Returns:
+            제품 데이터 또는 None (유효하지 않은 페이지)
+        """
+        if not self._validate_snapshot(snapshot, goods_no):
+            log_error(self.logger, goods_no, "Oliveyoung 유효하지 않은 페이지 (로그인/에러 페이지)", None)
+            return None
+        
+        product_data = self._apply_snapshot(snapshot, goods_no)
+        
+        option_list, product_info = await self._await_dynamic_content(snapshot, goods_no, dynamic_content)
+        if option_list is not None and product_info is not None:
+            await self.dynamic_extractor.extract_all_dynamic_content(None, product_data, option_list, product_info)
+            return product_data
+        
+        # 클릭이 필요한 동적 콘텐츠는 브라우저 페이지에서 추출
+        if not self.crawl_context:
+            self.crawl_context = await self.cookie_manager.ensure_context()
+        
+        page = await self.browser_pool.acquire_page(self._product_context())
+        failed = True
+        try:
+            url = self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no)
+            # HTTP 스냅샷에서 이미 검사/기록한 상품이므로 속도 제어기에는 다시 기록하지 않음
+            if not await self.safe_goto(page, url) or not await self._load_page_snapshot(page, goods_no, record_rate=False):
+                log_error(self.logger, goods_no, "Oliveyoung 동적 콘텐츠용 페이지 로드 실패", None)
+                return None
+            await self.dynamic_extractor.extract_all_dynamic_content(page, product_data, option_list, product_info)
+            failed = False
+        finally:
+            await self.browser_pool.release_page(page, failed=failed)
+        
+        return product_data
+    
+    async def _crawl_single_product_browser(
+        self,
+        goods_no: str,
+        dynamic_content: Optional[Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Playwright 페이지로 단일 제품을 크롤링한다.
+        
+        Args:
+            goods_no: 제품 goodsNo
+            dynamic_content: HTTP 모드에서 이미 받은 AJAX 결과 (폴백 시 다시 요청하지 않음)
+            
+        Returns:
+            크롤링된 제품 데이터 또는 None (실패 시)
+        """
+        url = self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no)
+        
+        # 쿠키 만료 검증 후 자동 재생성
+        if not self.crawl_context:
+            try:
+                self.crawl_context = await self.cookie_manager.ensure_context()
+            except Exception as e:
+                log_error(self.logger, goods_no, f"Oliveyoung 크롤링 컨텍스트 생성 실패: {e}", None)
+                return None
+        
+        # 풀에 보관된 유휴 페이지 재사용 (없으면 새로 생성)
+        page = await self.browser_pool.acquire_page(self._product_context())
+        failed = True
+        
+        try:
+            # 페이지 로드
+            if not await self.safe_goto(page, url):
+                log_error(self.logger, goods_no, "Oliveyoung 페이지 로드 실패", None)
+                return None
+            
+            # 페이지 내용 유효성 검사 (추출 대상 값도 한 번에 수집)
+            snapshot = await self._load_page_snapshot(page, goods_no)
+            if not snapshot:
+                log_error(self.logger, goods_no, "Oliveyoung 유효하지 않은 페이지 (로그인/에러 페이지)", None)
+                return None
+            
+            # 제품 데이터 추출 (AJAX 응답이 있으면 옵션/상세정보 버튼 클릭 생략)
+            option_list, product_info = await self._await_dynamic_content(snapshot, goods_no, dynamic_content)
+            product_data = await self._extract_product_data(page, goods_no, snapshot, option_list, product_info)
+            failed = False
+        finally:
+            await self.browser_pool.release_page(page, failed=failed)
+        
+        if not product_data:
+            log_error(self.logger, goods_no, "Oliveyoung 제품 데이터 추출 실패", None)
+        
+        return product_data
+    
     async def crawl_from_branduid_list(
         self, 
         goods_no_list: List[str],
         batch_size: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        goodsNo 목록에서 여러 제품을 배치 단위로 크롤링한다.
+        goodsNo 목록에서 여러 제품을 슬라이딩 윈도우 방식으로 크롤링한다.
+        
+        최대 max_workers개를 동시에 처리하면서 하나가 끝나는 즉시 다음 제품을 시작하고,
+        시작 간격은 토큰 버킷(rate_limit)으로 조절한다. 결과는 writer 태스크가
+        batch_size개 단위로 저장소에 기록한다.
         
         Args:
             goods_no_list: goodsNo 목록 (Oliveyoung 상품 번호 목록)
-            batch_size: 배치 크기 (서버 부담 경감을 위해 기본값 50)
+            batch_size: 저장 단위 제품 수
             
         Returns:
             크롤링된 제품 데이터 목록
@@ -434,51 +706,22 @@ class OliveyoungCrawler(BaseCrawler):
                 removed_count = original_count - len(goods_no_list)
                 self.logger.info(f"Oliveyoung 중복된 goodsNo {removed_count}개 제거: {original_count} → {len(goods_no_list)}")
             
-            self.logger.info(f"Oliveyoung goodsNo 목록에서 {len(goods_no_list)}개 제품 발견 (배치 크기: {batch_size})")
+            self.logger.info(
+                f"Oliveyoung goodsNo 목록에서 {len(goods_no_list)}개 제품 발견 "
+                f"(최대 동시 {self.max_workers}개, {self.rate_controller.format_metrics()}, 저장 단위 {batch_size}개)"
+            )
             
-            all_products = []
-            total_saved = 0
-
-            # 배치 단위로 처리 (크롤링 + 즉시 저장으로 메모리 절약)
-            for i in range(0, len(goods_no_list), batch_size):
-                batch = goods_no_list[i:i + batch_size]
-                batch_num = (i // batch_size) + 1
-                total_batches = (len(goods_no_list) + batch_size - 1) // batch_size
-
-                self.logger.info(f"Oliveyoung 배치 {batch_num}/{total_batches} 처리 중 ({len(batch)}개 제품)")
-
-                # 각 제품 크롤링 (순차 처리, max_workers=1)
-                tasks = [self.crawl_single_product(goods_no) for goods_no in batch]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # 성공한 결과만 필터링
-                batch_products = [
-                    result for result in results
-                    if isinstance(result, dict) and result is not None
-                ]
-
-                # 배치별로 즉시 저장 (메모리 절약)
-                if batch_products:
-                    # 엑셀 저장
-                    if self.storage:
-                        self.storage.save(batch_products)
-                        total_saved += len(batch_products)
-                        self.logger.info(f"Oliveyoung 배치 {batch_num} 저장: {len(batch_products)}개 (누적: {total_saved}개)")
-
-                    # DB 저장 (옵션)
-                    if self.db_storage:
-                        self.db_storage.save(batch_products)
-                        self.logger.info(f"Oliveyoung 배치 {batch_num} DB 저장: {len(batch_products)}개")
-
-                    all_products.extend(batch_products)
-
-                # 배치 간 지연 (서버 부담 경감)
-                if i + batch_size < len(goods_no_list):  # 마지막 배치가 아닌 경우만
-                    from .utils import random_delay
-                    await random_delay(1, 2)  # 배치 간 1-2초 지연
-                    self.logger.info(f"Oliveyoung 배치 간 지연 완료 (다음 배치: {batch_num + 1}/{total_batches})")
+            scheduler = SlidingWindowScheduler(
+                worker=self.crawl_single_product,
+                window=self.max_workers,
+                rate_limiter=self.rate_limiter,
+                on_flush=self._save_products,
+                flush_size=batch_size
+            )
+            all_products = await scheduler.run(goods_no_list)
 
             self.logger.info(f"Oliveyoung 전체 크롤링 완료: {len(all_products)}/{len(goods_no_list)}개 성공")
+            self.logger.info(f"Oliveyoung 요청 속도 지표: {self.rate_controller.format_metrics()}")
             
             return all_products
             
@@ -486,17 +729,53 @@ class OliveyoungCrawler(BaseCrawler):
             self.logger.error(f"Oliveyoung 배치 크롤링 실패: {str(e)}")
             return []
     
-    async def crawl_all_categories(self, max_items_per_category: int = 15, category_filter: List[str] = None) -> List[Dict[str, Any]]:
+    def _save_products(self, products: List[Dict[str, Any]]) -> None:
+        """
+        크롤링 결과를 엑셀/DB 저장소에 기록한다 (스케줄러 writer 태스크에서 호출).
+        
+        Args:
+            products: 저장할 제품 데이터 목록
+        """
+        saved = True
+        
+        # 엑셀 저장
+        if self.storage:
+            saved = self.storage.save(products) and saved
+        
+        # DB 저장 (옵션)
+        if self.db_storage:
+            saved = self.db_storage.save(products) and saved
+            self.logger.info(f"Oliveyoung DB 저장: {len(products)}개")
+        
+        # 모든 저장소에 기록된 뒤에만 체크포인트에 반영 (재시작 시 건너뜀)
+        if self.checkpoint and saved:
+            self.checkpoint.record_persisted(product["goods_no"] for product in products if product.get("goods_no"))
+        
+        # 저장에 실패한 작업은 lease 만료 후 다른 워커가 다시 가져감
+        if self.job_queue and saved:
+            self.job_queue.complete(product["goods_no"] for product in products if product.get("goods_no"))
+    
+    async def crawl_all_categories(
+        self,
+        max_items_per_category: int = 15,
+        category_filter: List[str] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None
+    ) -> List[Dict[str, Any]]:
         """
         모든 카테고리에서 제품을 크롤링한다.
         
+        checkpoint가 주어지면 카테고리별 goodsNo 목록과 저장 완료된 goodsNo를 기록하고,
+        이전 실행의 체크포인트가 있으면 완료된 카테고리와 이미 저장된 제품을 건너뛴다.
+        
         Args:
             max_items_per_category: 카테고리당 최대 크롤링 개수
             category_filter: 포함할 카테고리 이름 목록 (None이면 모든 카테고리)
+            checkpoint: 재개용 체크포인트 (None이면 기록하지 않음)
             
         Returns:
-            크롤링된 제품 데이터 목록
+            크롤링된 제품 데이터 목록 (이번 실행에서 크롤링한 제품만)
         """
+        self.checkpoint = checkpoint
         try:
             # 카테고리 목록 추출 (ID와 이름 포함)
             all_categories = await self.extract_all_category_ids()
@@ -536,6 +815,10 @@ class OliveyoungCrawler(BaseCrawler):
                 category_id = category["id"]
                 category_name = category["name"]
                 
+                if checkpoint and checkpoint.is_category_done(category_id):
+                    self.logger.info(f"Oliveyoung 카테고리 {i}/{len(categories)} 건너뜀 (체크포인트 완료): {category_id} ({category_name})")
+                    continue
+                
                 self.logger.info(f"Oliveyoung 카테고리 {i}/{len(categories)} 처리 중: {category_id} ({category_name})")
                 
                 # 카테고리별 제품 크롤링
@@ -544,18 +827,29 @@ class OliveyoungCrawler(BaseCrawler):
                 )
                 all_products.extend(category_products)
                 
-                # 카테고리 간 지연 (서버 부담 경감)
+                if checkpoint:
+                    checkpoint.record_category_done(category_id)
+                
+                # 카테고리 간 고정 지연 대신 상품 요청과 같은 토큰 버킷으로 다음 목록 페이지 요청을 조절
                 if i < len(categories):  # 마지막 카테고리가 아닌 경우만
-                    from .utils import random_delay
-                    await random_delay(1, 2)  # 카테고리 간 1-2초 지연
-                    self.logger.info(f"Oliveyoung 카테고리 간 지연 완료 (다음: {i + 1}/{len(categories)})")
+                    await self.rate_limiter.acquire()
             
             self.logger.info(f"Oliveyoung 전체 카테고리 크롤링 완료: {len(all_products)}개 제품")
+            
+            # 실패한 제품이 남아 있으면 --resume으로 재시도할 수 있도록 체크포인트 유지
+            if checkpoint:
+                unfinished = checkpoint.unfinished_goods()
+                if unfinished:
+                    self.logger.warning(f"저장되지 않은 제품 {len(unfinished)}개 - 체크포인트 유지: {checkpoint.path}")
+                else:
+                    checkpoint.remove()
             return all_products
             
         except Exception as e:
             self.logger.error(f"Oliveyoung 전체 카테고리 크롤링 실패: {str(e)}")
             return []
+        finally:
+            self.checkpoint = None
     
     async def crawl_from_category(self, category_id: str, max_items: int = 15, sort_type: str = "01") -> List[Dict[str, Any]]:
         """
@@ -570,8 +864,13 @@ class OliveyoungCrawler(BaseCrawler):
             크롤링된 제품 데이터 목록
         """
         try:
-            # 카테고리 페이지에서 goodsNo 목록 추출
-            goods_no_list = await self._extract_goods_no_list_from_category(category_id, max_items, sort_type)
+            # 체크포인트에 이전 실행의 goodsNo 목록이 있으면 목록 페이지를 다시 열지 않음
+            goods_no_list = self.checkpoint.get_category_goods(category_id) if self.checkpoint else None
+            if goods_no_list is None:
+                # 카테고리 페이지에서 goodsNo 목록 추출
+                goods_no_list = await self._extract_goods_no_list_from_category(category_id, max_items, sort_type)
+                if self.checkpoint and goods_no_list:
+                    self.checkpoint.record_category_goods(category_id, goods_no_list)
 
             if not goods_no_list:
                 self.logger.warning(f"Oliveyoung 카테고리 {category_id}에서 제품을 찾을 수 없음")
@@ -579,13 +878,226 @@ class OliveyoungCrawler(BaseCrawler):
 
             self.logger.info(f"Oliveyoung 카테고리 {category_id}에서 {len(goods_no_list)}개 제품 발견")
 
+            if self.checkpoint:
+                pending = self.checkpoint.pending_goods(goods_no_list)
+                if len(pending) < len(goods_no_list):
+                    self.logger.info(f"체크포인트: 이미 저장된 {len(goods_no_list) - len(pending)}개 건너뜀, 남은 제품 {len(pending)}개")
+                goods_no_list = pending
+                if not goods_no_list:
+                    return []
+
             # goodsNo 목록으로 제품 크롤링
-            return await self.crawl_from_branduid_list(goods_no_list, batch_size=50)  # 카테고리별로는 배치 크기 작게
+            products = await self.crawl_from_branduid_list(goods_no_list, batch_size=50)  # 카테고리별로는 배치 크기 작게
+
+            if self.checkpoint:
+                succeeded = {product.get("goods_no") for product in products}
+                self.checkpoint.record_failed(goods_no for goods_no in goods_no_list if goods_no not in succeeded)
+
+            return products
 
         except Exception as e:
             self.logger.error(f"Oliveyoung 카테고리 {category_id} 크롤링 실패: {str(e)}")
             return []
 
+    async def refresh_single_product(self, goods_no: str) -> Optional[Dict[str, Any]]:
+        """
+        단일 제품의 가격/할인/품절 상태만 수집한다 (--refresh).
+
+        옵션/상세정보 AJAX, 이미지, 혜택, 카테고리 처리는 생략하고 상품 페이지 스냅샷에서
+        OliveyoungPriceExtractor가 쓰는 가격 값과 구매 버튼 유무만 사용한다.
+
+        Args:
+            goods_no: 제품의 goodsNo
+
+        Returns:
+            goods_no, unique_item_id, 가격/할인/품절 필드 또는 None (실패 시)
+        """
+        async with self.rate_controller.slot():
+            try:
+                snapshot = None
+                if self.fetch_mode == "http":
+                    snapshot = await self._fetch_product_snapshot(goods_no)
+                    if snapshot is not None and not self._validate_snapshot(snapshot, goods_no):
+                        return None
+                if snapshot is None:
+                    snapshot = await self._fetch_product_snapshot_browser(goods_no)
+                if not snapshot:
+                    return None
+
+                product_data = self.product_extractor.new_product_data(goods_no)
+                self.price_extractor.apply_snapshot(snapshot, product_data)
+                product_data["is_soldout"] = not snapshot.get("has_buy_button", True)
+                return {
+                    key: product_data[key]
+                    for key in (
+                        "goods_no", "unique_item_id", "price", "origin_price", "is_discounted",
+                        "discount_info", "discount_start_date", "discount_end_date", "is_soldout"
+                    )
+                }
+
+            except Exception as e:
+                log_error(self.logger, goods_no, f"Oliveyoung 가격/품절 갱신 실패: {e}", traceback.format_exc())
+                return None
+
+    async def _fetch_product_snapshot_browser(self, goods_no: str) -> Optional[Dict[str, Any]]:
+        """
+        Playwright 페이지로 상품 페이지를 열어 유효한 스냅샷만 반환한다.
+
+        Args:
+            goods_no: 제품 goodsNo
+
+        Returns:
+            스냅샷 또는 None (로드 실패/유효하지 않은 페이지)
+        """
+        if not self.crawl_context:
+            self.crawl_context = await self.cookie_manager.ensure_context()
+
+        page = await self.browser_pool.acquire_page(self._product_context())
+        failed = True
+        try:
+            url = self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no)
+            if not await self.safe_goto(page, url):
+                log_error(self.logger, goods_no, "Oliveyoung 페이지 로드 실패", None)
+                return None
+            snapshot = await self._load_page_snapshot(page, goods_no)
+            failed = False
+            return snapshot
+        finally:
+            await self.browser_pool.release_page(page, failed=failed)
+
+    async def refresh_products(self, goods_no_list: List[str], batch_size: int = 200) -> List[Dict[str, Any]]:
+        """
+        이미 저장된 제품들의 가격/할인/품절 상태만 갱신한다.
+
+        전체 크롤링과 같은 슬라이딩 윈도우/속도 제어를 사용하고, 결과는 batch_size개 단위로
+        PostgresStorage.refresh_prices()에 기록한다. 수집에 실패한 제품은 마지막에
+        PostgresStorage.record_refresh_failures()로 확인 시각을 남겨 다음 실행의 맨 앞에 다시 오지 않게 한다.
+
+        Args:
+            goods_no_list: 갱신할 goodsNo 목록 (오래 확인하지 않은 순서)
+            batch_size: 저장 단위 제품 수
+
+        Returns:
+            갱신한 가격/품절 데이터 목록
+        """
+        if not self.db_storage:
+            raise ValueError("가격/품절 갱신에는 db_storage가 필요합니다.")
+
+        self.logger.info(
+            f"Oliveyoung 가격/품절 갱신 시작: {len(goods_no_list)}개 "
+            f"(최대 동시 {self.max_workers}개, {self.rate_controller.format_metrics()})"
+        )
+        scheduler = SlidingWindowScheduler(
+            worker=self.refresh_single_product,
+            window=self.max_workers,
+            rate_limiter=self.rate_limiter,
+            on_flush=self.db_storage.refresh_prices,
+            flush_size=batch_size
+        )
+        refreshed = await scheduler.run(goods_no_list)
+
+        refreshed_goods_nos = {item["goods_no"] for item in refreshed}
+        failed = [goods_no for goods_no in goods_no_list if goods_no not in refreshed_goods_nos]
+        if failed:
+            await asyncio.to_thread(self.db_storage.record_refresh_failures, failed)
+
+        self.logger.info(f"Oliveyoung 가격/품절 갱신 완료: {len(refreshed)}/{len(goods_no_list)}개 ({self.rate_controller.format_metrics()})")
+        return refreshed
+
+    async def enqueue_all_categories(self, max_items_per_category: int = 15, category_filter: List[str] = None) -> int:
+        """
+        모든 카테고리의 goodsNo를 추출해 작업 큐에 등록한다 (상품 크롤링은 crawl_from_queue 워커가 수행).
+
+        Args:
+            max_items_per_category: 카테고리당 최대 등록 개수
+            category_filter: 제외할 카테고리 이름 목록 (None이면 모든 카테고리)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+        if not self.job_queue:
+            raise ValueError("job_queue가 설정되지 않았습니다.")
+
+        try:
+            all_categories = await self.extract_all_category_ids()
+            if not all_categories:
+                self.logger.warning("Oliveyoung 카테고리 목록을 찾을 수 없음")
+                return 0
+
+            if category_filter:
+                filter_lower = [name.lower() for name in category_filter]
+                categories = [
+                    category for category in all_categories
+                    if category["name"].strip().lower() not in filter_lower
+                ]
+                self.logger.info(f"카테고리 필터링 적용: {len(all_categories)}개 → {len(categories)}개")
+            else:
+                categories = all_categories
+
+            enqueued = 0
+            for i, category in enumerate(categories, 1):
+                category_id = category["id"]
+                self.logger.info(f"카테고리 {i}/{len(categories)} 작업 등록 중: {category_id} ({category['name']})")
+
+                goods_no_list = await self._extract_goods_no_list_from_category(category_id, max_items_per_category)
+                if goods_no_list:
+                    enqueued += await asyncio.to_thread(self.job_queue.enqueue, goods_no_list, category_id)
+
+                if i < len(categories):
+                    await self.rate_limiter.acquire()
+
+            self.logger.info(f"작업 등록 완료: {enqueued}개 (큐 상태: {await asyncio.to_thread(self.job_queue.stats)})")
+            return enqueued
+
+        except Exception as e:
+            self.logger.error(f"Oliveyoung 작업 등록 실패: {str(e)}")
+            return 0
+
+    async def crawl_from_queue(self, claim_size: int = 20, batch_size: int = 50, poll_interval: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        작업 큐에서 goodsNo를 claim해 큐가 빌 때까지 크롤링한다.
+
+        여러 프로세스/머신에서 동시에 실행해도 SKIP LOCKED로 같은 작업을 나눠 갖지 않는다.
+        저장이 끝난 작업은 _save_products에서 완료 처리되고, 크롤링에 실패한 작업은 재시도 또는 dead로 이동한다.
+        당장 claim할 작업이 없어도 재시도 대기 중이거나 다른 워커가 lease 중인 작업이 남아 있으면
+        claim 가능해질 때까지 기다렸다가 다시 가져온다 (pending/leased가 모두 없어야 종료).
+
+        Args:
+            claim_size: 한 번에 claim할 작업 수 (lease_seconds 안에 처리 가능한 양)
+            batch_size: 저장 단위 제품 수
+            poll_interval: 남은 작업을 기다릴 때 최대 대기 간격(초)
+
+        Returns:
+            이 워커가 크롤링한 제품 데이터 목록
+        """
+        if not self.job_queue:
+            raise ValueError("job_queue가 설정되지 않았습니다.")
+
+        all_products = []
+        while True:
+            goods_no_list = await asyncio.to_thread(self.job_queue.claim, claim_size)
+            if not goods_no_list:
+                wait_seconds = await asyncio.to_thread(self.job_queue.seconds_until_claimable)
+                if wait_seconds is None:
+                    break
+                wait_seconds = min(max(wait_seconds, 1.0), poll_interval)
+                self.logger.info(f"claim 가능한 작업 없음 - 재시도/lease 대기 작업 확인까지 {wait_seconds:.0f}초 대기")
+                await asyncio.sleep(wait_seconds)
+                continue
+
+            self.logger.info(f"작업 {len(goods_no_list)}개 claim (worker={self.job_queue.worker_id})")
+            products = await self.crawl_from_branduid_list(goods_no_list, batch_size=batch_size)
+            all_products.extend(products)
+
+            succeeded = {product.get("goods_no") for product in products}
+            failed = [goods_no for goods_no in goods_no_list if goods_no not in succeeded]
+            await asyncio.to_thread(self.job_queue.fail, failed)
+
+        self.logger.info(
+            f"작업 큐 처리 완료: {len(all_products)}개 제품 (큐 상태: {await asyncio.to_thread(self.job_queue.stats)})"
+        )
+        return all_products
+
     async def crawl_new_products_only(
         self,
         existing_excel_path: str,
@@ -681,10 +1193,9 @@ class OliveyoungCrawler(BaseCrawler):
 
                 all_new_goods_no.extend(new_goods_no)
 
-                # 카테고리 간 지연
+                # 카테고리 간 지연 (토큰 버킷)
                 if i < len(categories):
-                    from .utils import random_delay
-                    await random_delay(1, 2)
+                    await self.rate_limiter.acquire()
 
             # 4. 신규 상품 크롤링
             if not all_new_goods_no:
@@ -718,15 +1229,60 @@ class OliveyoungCrawler(BaseCrawler):
             return []
     
 
-    async def extract_all_category_ids(self) -> List[Dict[str, str]]:
+    async def extract_all_category_ids(self, force_refresh: bool = False) -> List[Dict[str, str]]:
         """
-        메인 페이지에서 모든 카테고리 ID와 이름을 추출한다.
-        
-        data-ref-dispcatno 속성과 내부 텍스트를 추출하여 전체 카테고리 트리를 가져온다.
-        
+        모든 카테고리 ID와 이름을 반환한다.
+
+        캐시가 ttl 안이면 그대로 사용하고, 아니면 GNB 전체 메뉴(data-ref-dispcatno 링크)를 다시 읽는다.
+        메뉴는 HTTP로 메인 페이지를 한 번 받아 파싱하고, 실패하면 브라우저로 메인 페이지를 연 뒤
+        #gnbAllMenu HTML을 한 번에 가져와 같은 파서로 읽는다. 추출에 실패하면 만료된 캐시라도 사용한다.
+
+        Args:
+            force_refresh: True이면 캐시 유효 기간과 관계없이 메뉴를 다시 읽음
+
         Returns:
             카테고리 정보 리스트 [{"id": "category_id", "name": "category_name"}]
         """
+        if self.category_cache and not force_refresh:
+            cached = self.category_cache.load()
+            if cached:
+                self.logger.info(f"캐시된 카테고리 {len(cached)}개 사용: {self.category_cache.path}")
+                return cached
+
+        category_list = []
+        if self.http_fetcher:
+            html_text = await self.http_fetcher.fetch_main_page()
+            if html_text:
+                category_list = parse_category_menu(html_text)
+            if not category_list:
+                self.logger.info("HTTP 메인 페이지에서 카테고리 메뉴를 찾지 못해 브라우저로 폴백")
+
+        if not category_list:
+            category_list = await self._extract_category_menu_browser()
+
+        if not category_list:
+            stale = self.category_cache.load(allow_stale=True) if self.category_cache else None
+            if stale:
+                self.logger.warning(f"카테고리 추출 실패, 만료된 캐시 {len(stale)}개 사용")
+                return stale
+            return []
+
+        if self.category_cache:
+            if self.category_cache.is_unchanged(category_list):
+                self.logger.info("카테고리 메뉴 변경 없음, 캐시 유효 기간 연장")
+            self.category_cache.save(category_list)
+
+        self.logger.info(f"전체 카테고리 {len(category_list)}개 추출 완료")
+        self._log_category_structure(category_list)
+        return category_list
+
+    async def _extract_category_menu_browser(self) -> List[Dict[str, str]]:
+        """
+        브라우저로 메인 페이지를 열어 GNB 전체 메뉴에서 카테고리를 추출한다.
+
+        Returns:
+            카테고리 정보 리스트 (실패 시 빈 리스트)
+        """
         try:
             # 컨텍스트 확인
             if not self.crawl_context:
@@ -735,112 +1291,50 @@ class OliveyoungCrawler(BaseCrawler):
                 except Exception as e:
                     self.logger.error(f"크롤링 컨텍스트 생성 실패: {e}")
                     return []
-            
-            # 메인 페이지 전용 페이지 생성 (기존 list_page와 분리)
-            main_page = await self.crawl_context.new_page()
-            
+
+            # 메인 페이지 전용 페이지 (기존 list_page와 분리, 풀에서 빌려 컨텍스트 교체 중에도 유지)
+            main_page = await self.browser_pool.acquire_page(self.crawl_context)
+
             try:
                 self.logger.info(f"메인 페이지로 이동: {self.MAIN_PAGE_URL}")
-                
+
                 if not await self.safe_goto(main_page, self.MAIN_PAGE_URL):
                     self.logger.error("메인 페이지 로드 실패")
                     return []
-                
+
                 # 페이지 로딩 대기
                 from .utils import random_delay
                 await random_delay(2, 3)
-                
-                # 메인 메뉴 내의 카테고리 링크만 선택 (더 정확한 선택자 사용)
-                # 메인 카테고리 (대분류): #gnbAllMenu .all_menu_wrap .sub_menu_box .sub_depth > a[data-ref-dispcatno]
-                # 서브 카테고리 (중/소분류): #gnbAllMenu .all_menu_wrap .sub_menu_box ul > li > a[data-ref-dispcatno]
-                main_category_selector = '#gnbAllMenu .all_menu_wrap .sub_menu_box .sub_depth > a[data-ref-dispcatno]'
-                sub_category_selector = '#gnbAllMenu .all_menu_wrap .sub_menu_box ul > li > a[data-ref-dispcatno]'
-                
-                # 메인 카테고리 요소들 추출
-                main_category_elements = main_page.locator(main_category_selector)
-                main_count = await main_category_elements.count()
-                
-                # 서브 카테고리 요소들 추출
-                sub_category_elements = main_page.locator(sub_category_selector)
-                sub_count = await sub_category_elements.count()
-                
-                total_count = main_count + sub_count
-                self.logger.info(f"카테고리 링크 발견: 메인 {main_count}개, 서브 {sub_count}개, 총 {total_count}개")
-                
-                categories = {}  # 중복 제거를 위해 dict 사용 (id: name)
-                
-                # 메인 카테고리 처리
-                for i in range(main_count):
-                    try:
-                        element = main_category_elements.nth(i)
-                        cat_id = await element.get_attribute('data-ref-dispcatno')
-                        
-                        if cat_id and cat_id.strip() and cat_id.isdigit():
-                            # 15자리 카테고리 ID만 추출
-                            if len(cat_id) == 15:
-                                cat_name = await element.inner_text()
-                                cat_name = cat_name.strip() if cat_name else ""
-                                
-                                if cat_name:  # 카테고리 이름이 있는 경우만 추가
-                                    categories[cat_id.strip()] = cat_name
-                                    self.logger.debug(f"메인 카테고리 추가: {cat_id} - {cat_name}")
-
-                    except Exception as e:
-                        self.logger.debug(f"메인 카테고리 요소 {i} 처리 중 오류: {e}")
-                        continue
-                
-                # 서브 카테고리 처리
-                for i in range(sub_count):
-                    try:
-                        element = sub_category_elements.nth(i)
-                        cat_id = await element.get_attribute('data-ref-dispcatno')
-                        
-                        if cat_id and cat_id.strip() and cat_id.isdigit():
-                            # 15자리 카테고리 ID만 추출
-                            if len(cat_id) == 15:
-                                cat_name = await element.inner_text()
-                                cat_name = cat_name.strip() if cat_name else ""
-                                
-                                if cat_name:  # 카테고리 이름이 있는 경우만 추가
-                                    categories[cat_id.strip()] = cat_name
-                                    self.logger.debug(f"서브 카테고리 추가: {cat_id} - {cat_name}")
 
-                    except Exception as e:
-                        self.logger.debug(f"서브 카테고리 요소 {i} 처리 중 오류: {e}")
-                        continue
+                # 요소를 하나씩 읽지 않고 메뉴 HTML을 한 번에 가져와 파싱
+                menu = main_page.locator('#gnbAllMenu')
+                if not await menu.count():
+                    self.logger.error("카테고리 메뉴(#gnbAllMenu)를 찾을 수 없습니다")
+                    return []
+                menu_html = await menu.first.evaluate('el => el.outerHTML')
+                return parse_category_menu(menu_html)
 
-                # dict를 list of dict로 변환하고 ID순으로 정렬
-                category_list = [{"id": cat_id, "name": cat_name} 
-                               for cat_id, cat_name in sorted(categories.items())]
-                
-                self.logger.info(f"전체 카테고리 {len(category_list)}개 추출 완료")
-                
-                # 카테고리 구조 분석 로깅
-                by_length = {}
-                for category in category_list:
-                    cat_id = category["id"]
-                    length = len(cat_id)
-                    if length not in by_length:
-                        by_length[length] = []
-                    by_length[length].append(f"{cat_id}({category['name']})")
-                
-                self.logger.info("카테고리 구조:")
-                for length in sorted(by_length.keys()):
-                    count = len(by_length[length])
-                    examples = ', '.join(by_length[length][:3])
-                    if count > 3:
-                        examples += '...'
-                    self.logger.info(f"  길이 {length:2d}자리: {count:3d}개 - {examples}")
-                
-                return category_list
-                
             finally:
-                await main_page.close()
-                
+                await self.browser_pool.release_page(main_page, failed=True)
+
         except Exception as e:
             self.logger.error(f"전체 카테고리 ID 추출 실패: {str(e)}")
             return []
-    
+
+    def _log_category_structure(self, category_list: List[Dict[str, str]]) -> None:
+        """카테고리 ID 길이별 개수와 예시를 로깅한다."""
+        by_length = {}
+        for category in category_list:
+            by_length.setdefault(len(category["id"]), []).append(f"{category['id']}({category['name']})")
+
+        self.logger.info("카테고리 구조:")
+        for length in sorted(by_length.keys()):
+            count = len(by_length[length])
+            examples = ', '.join(by_length[length][:3])
+            if count > 3:
+                examples += '...'
+            self.logger.info(f"  길이 {length:2d}자리: {count:3d}개 - {examples}")
+
     async def _extract_categories(self) -> List[str]:
         """기존 메서드 호환성을 위한 래퍼. 카테고리 ID만 반환."""
         categories = await self.extract_all_category_ids()
@@ -848,8 +1342,10 @@ class OliveyoungCrawler(BaseCrawler):
     
     async def _extract_goods_no_list_from_category(self, category_id: str, max_items: int = 48, sort_type: str = "01") -> List[str]:
         """
-        카테고리 페이지에서 goodsNo 목록을 추출한다.
-        지속적인 list_page를 사용하여 효율성을 높인다.
+        카테고리 목록에서 goodsNo 목록을 추출한다.
+
+        LIST_ROWS_PER_PAGE개 단위로 pageIdx를 넘기며 max_items개를 모을 때까지 페이지네이션하고,
+        페이지마다 본문 전체에서 goodsNo를 한 번에 추출한다 (_fetch_category_goods_page).
 
         Args:
             category_id: 카테고리 ID
@@ -857,49 +1353,86 @@ class OliveyoungCrawler(BaseCrawler):
             sort_type: 정렬 타입 (01=판매순, 02=최신순)
         """
         try:
-            # 카테고리 목록 페이지 준비 (지속적으로 유지) - sort_type 추가
-            if not await self.ensure_list_page(category_id, max_items, sort_type):
-                self.logger.error(f"카테고리 페이지 준비 실패: {category_id}")
-                return []
-
-            # 상품 링크에서 goodsNo 추출
-            product_links = self.list_page.locator('a[href*="goodsNo="]')
-            link_count = await product_links.count()
-
-            goods_no_list = []
-            processed_count = 0
-
-            self.logger.info(f"카테고리 {category_id}에서 {link_count}개 상품 링크 발견")
-
-            for i in range(min(link_count, max_items * 2)):  # 여유있게 추출 (중복 고려)
-                if processed_count >= max_items:
+            rows_per_page = max(1, min(max_items, self.LIST_ROWS_PER_PAGE))
+            goods_no_list: List[str] = []
+            seen = set()
+            page_idx = 1
+
+            while len(goods_no_list) < max_items:
+                page_goods = await self._fetch_category_goods_page(category_id, page_idx, rows_per_page, sort_type)
+                if page_goods is None:
+                    if page_idx == 1:
+                        self.logger.error(f"카테고리 페이지 준비 실패: {category_id}")
                     break
 
-                try:
-                    link = product_links.nth(i)
-                    href = await link.get_attribute('href')
-
-                    if href and 'goodsNo=' in href:
-                        # goodsNo 값 추출
-                        match = re.search(r'goodsNo=([A-Z0-9]+)', href)
-                        if match:
-                            goods_no = match.group(1)
-                            if goods_no not in goods_no_list:  # 중복 제거
-                                goods_no_list.append(goods_no)
-                                processed_count += 1
+                new_goods = [goods_no for goods_no in page_goods if goods_no not in seen]
+                self.logger.debug(f"카테고리 {category_id} {page_idx}페이지: {len(page_goods)}개 중 신규 {len(new_goods)}개")
+                if not new_goods:
+                    # 마지막 페이지 이후에는 같은 목록이 반복되거나 비어 있다
+                    break
 
-                except Exception as e:
-                    self.logger.debug(f"상품 링크 {i} 처리 중 오류: {e}")
-                    continue
+                seen.update(new_goods)
+                goods_no_list.extend(new_goods)
+                if len(page_goods) < rows_per_page:
+                    break
+                page_idx += 1
 
-            self.logger.info(f"Oliveyoung 카테고리 {category_id}에서 {len(goods_no_list)}개 goodsNo 추출")
+            goods_no_list = goods_no_list[:max_items]
+            self.logger.info(f"Oliveyoung 카테고리 {category_id}에서 {len(goods_no_list)}개 goodsNo 추출 ({page_idx}페이지)")
             return goods_no_list
 
         except Exception as e:
             self.logger.error(f"Oliveyoung 카테고리 goodsNo 목록 추출 실패: {str(e)}")
             return []
+
+    async def _fetch_category_goods_page(
+        self,
+        category_id: str,
+        page_idx: int,
+        rows_per_page: int,
+        sort_type: str
+    ) -> Optional[List[str]]:
+        """
+        카테고리 목록 한 페이지의 goodsNo를 추출한다.
+
+        HTTP 클라이언트가 있으면 목록 HTML을 직접 받아 정규식으로 추출하고, 실패하거나 없으면
+        list_page로 이동한 뒤 page.content() 한 번으로 받은 HTML에 같은 정규식을 적용한다.
+
+        Args:
+            category_id: 카테고리 ID
+            page_idx: 목록 페이지 번호 (1부터)
+            rows_per_page: 페이지당 상품 수
+            sort_type: 정렬 타입 (01=판매순, 02=최신순)
+
+        Returns:
+            페이지 내 순서대로의 goodsNo 목록 또는 None (목록 로드 실패)
+        """
+        if self.http_fetcher:
+            html_text = await self.http_fetcher.fetch_category_list_page(category_id, page_idx, rows_per_page, sort_type)
+            if html_text is not None:
+                return parse_goods_no_list(html_text)
+            self.logger.debug(f"카테고리 {category_id} {page_idx}페이지 HTTP 요청 실패, 브라우저로 폴백")
+
+        if not await self.ensure_list_page(category_id, rows_per_page, sort_type, page_idx):
+            return None
+        return parse_goods_no_list(await self.list_page.content())
+
+    def _apply_snapshot(self, snapshot: Dict[str, Any], goods_no: str) -> Dict[str, Any]:
+        """스냅샷에서 기본/가격/혜택/이미지 정보를 구성한다."""
+        product_data = self.product_extractor.apply_snapshot(snapshot, goods_no)
+        self.price_extractor.apply_snapshot(snapshot, product_data)
+        self.benefit_extractor.apply_snapshot(snapshot, product_data)
+        self.image_extractor.apply_snapshot(snapshot, product_data)
+        return product_data
     
-    async def _extract_product_data(self, page, goods_no: str) -> Optional[Dict[str, Any]]:
+    async def _extract_product_data(
+        self,
+        page,
+        goods_no: str,
+        snapshot: Optional[Dict[str, Any]] = None,
+        option_list: Optional[List[Dict[str, Any]]] = None,
+        product_info: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         향상된 API 모니터링이 포함된 제품 데이터 추출.
 
@@ -937,29 +1470,21 @@ class OliveyoungCrawler(BaseCrawler):
         Args:
             page: Playwright 페이지 인스턴스
             goods_no: 제품 goodsNo
+            snapshot: 이미 수집한 페이지 스냅샷 (None이면 새로 수집)
+            option_list: AJAX로 받은 옵션 목록 (None이면 옵션 버튼 클릭으로 추출)
+            product_info: AJAX로 받은 상품정보제공고시 (None이면 상세정보 버튼 클릭으로 추출)
             
         Returns:
             추출된 제품 데이터 또는 None
         """
         try:
-            # 페이지 로딩 대기
-            from .utils import random_delay
-            await random_delay(0.5, 1.5)  # Oliveyoung 안티봇 대응 지연
-            
-            # 1. 기본 상품 정보 추출
-            product_data = await self.product_extractor.extract_basic_info(page, goods_no)
-            
-            # 2. 가격 정보 추출
-            await self.price_extractor.extract_price_info(page, product_data)
-            
-            # 3. 혜택 정보 추출
-            await self.benefit_extractor.extract_benefit_info(page, product_data)
-            
-            # 4. 이미지 정보 추출
-            await self.image_extractor.extract_images(page, product_data)
+            # 1~4. 기본/가격/혜택/이미지 정보는 한 번의 page.evaluate()로 수집한 스냅샷에서 구성
+            if snapshot is None:
+                snapshot = await collect_product_snapshot(page)
+            product_data = self._apply_snapshot(snapshot, goods_no)
             
             # 5. 모든 동적 콘텐츠 추출 (향상된 API 모니터링 포함)
-            await self.dynamic_extractor.extract_all_dynamic_content(page, product_data)
+            await self.dynamic_extractor.extract_all_dynamic_content(page, product_data, option_list, product_info)
             
             return product_data
             
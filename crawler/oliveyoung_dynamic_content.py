@@ -1,10 +1,11 @@
 """Oliveyoung 동적 콘텐츠 처리 로직."""
 
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from .utils import clean_text
 from .oliveyoung_category_mapper import OliveyoungCategoryDetector, OliveyoungCategoryMapper
+from .oliveyoung_http import parse_goods_artc, parse_option_list
 from .utils import random_delay
 
 
@@ -190,50 +191,18 @@ class OliveyoungOptionExtractor:
                                         "is_soldout": is_soldout
                                     })
                         
-                        if option_list:
-                            # 새로운 옵션 형식: 옵션명||*옵션값||*옵션가격||*재고수량||*판매자옵션코드$$
-                            formatted_options = []
-                            base_price = product_data.get("price", 0)
-
-                            # 1단계: 옵션 개수에 따라 단일/옵션 상품 결정
-                            if len(option_list) == 1:
-                                product_data["is_option_available"] = False
-                                self.logger.info(f"옵션 1개만 존재: 단일 상품으로 변경")
-                            else:
-                                # 2단계: 가격 검증 - 이상한 가격의 옵션은 품절 처리
-                                for idx, option in enumerate(option_list):
-                                    option_name = option["name"]
-                                    option_price = option["price"]
-                                    is_soldout = option["is_soldout"]
-
-                                    # 추가 가격 계산 (옵션 가격 - 기본 판매가)
-                                    additional_price = option_price - base_price
-
-                                    # 가격 검증: ±50% 초과 시 삭제
-                                    if additional_price < -(base_price * 0.5) or additional_price > base_price * 0.5:
-                                        self.logger.warning(f"옵션 가격이 상품 가격 ±50% 초과: {option_name} (추가금액: {additional_price}) - 상품에서 제외")
-                                        continue
-                                    else:
-                                        stock_qty = "0" if is_soldout else "200"  # 품절 상태 반영
-
-                                    unique_item_id = product_data['unique_item_id']
-
-                                    # 3단계: 옵션 포맷팅 (모든 옵션 포함, 이상 가격은 삭제)
-                                    formatted_option = f"Option||*{option_name}||*{additional_price}||*{stock_qty}||*{unique_item_id}_{idx+1}$$"
-                                    formatted_options.append(formatted_option)
-
-                                product_data["option_info"] = "".join(formatted_options)  # $$ 구분자로 이미 연결됨
-                                self.logger.debug(f"옵션 정보 추출 완료: {len(option_list)}개 (가격 검증 포함)")
+                        self.apply_option_list(option_list, product_data)
                         
                 except PlaywrightTimeoutError:
-                    self.logger.debug("옵션 DOM 로딩 타임아웃")
+                    # DOM 렌더링은 늦어도 API 응답을 받았으면 응답에서 옵션 추출
+                    if api_response_data:
+                        self.logger.debug("옵션 DOM 로딩 타임아웃 - API 응답으로 추출")
+                        self.apply_option_list(parse_option_list(api_response_data), product_data)
+                    else:
+                        self.logger.debug("옵션 DOM 로딩 타임아웃")
                     if not product_data.get("option_info"):
                         product_data["option_info"] = ""
                     
-                # API 데이터가 있으면 추가 정보로 활용
-                if api_response_data:
-                    self.logger.debug("옵션 API 데이터 획득 성공")
-                    
             finally:
                 page.remove_listener("response", handle_response)
                 
@@ -242,6 +211,55 @@ class OliveyoungOptionExtractor:
             if not product_data.get("option_info"):
                 product_data["option_info"] = ""
 
+    def apply_option_list(self, option_list: List[Dict[str, Any]], product_data: Dict[str, Any]):
+        """
+        옵션 목록을 option_info 형식으로 변환한다 (DOM/AJAX 응답 공통).
+
+        Args:
+            option_list: {"name", "price", "is_soldout"} 딕셔너리 목록
+            product_data: 채울 상품 데이터
+        """
+        if not option_list:
+            if not product_data.get("option_info"):
+                product_data["option_info"] = ""
+            return
+
+        product_data["is_option_available"] = True
+
+        # 새로운 옵션 형식: 옵션명||*옵션값||*옵션가격||*재고수량||*판매자옵션코드$$
+        formatted_options = []
+        base_price = product_data.get("price", 0)
+
+        # 1단계: 옵션 개수에 따라 단일/옵션 상품 결정
+        if len(option_list) == 1:
+            product_data["is_option_available"] = False
+            self.logger.info(f"옵션 1개만 존재: 단일 상품으로 변경")
+        else:
+            # 2단계: 가격 검증 - 이상한 가격의 옵션은 품절 처리
+            for idx, option in enumerate(option_list):
+                option_name = option["name"]
+                option_price = option["price"]
+                is_soldout = option["is_soldout"]
+
+                # 추가 가격 계산 (옵션 가격 - 기본 판매가)
+                additional_price = option_price - base_price
+
+                # 가격 검증: ±50% 초과 시 삭제
+                if additional_price < -(base_price * 0.5) or additional_price > base_price * 0.5:
+                    self.logger.warning(f"옵션 가격이 상품 가격 ±50% 초과: {option_name} (추가금액: {additional_price}) - 상품에서 제외")
+                    continue
+                else:
+                    stock_qty = "0" if is_soldout else "200"  # 품절 상태 반영
+
+                unique_item_id = product_data['unique_item_id']
+
+                # 3단계: 옵션 포맷팅 (모든 옵션 포함, 이상 가격은 삭제)
+                formatted_option = f"Option||*{option_name}||*{additional_price}||*{stock_qty}||*{unique_item_id}_{idx+1}$$"
+                formatted_options.append(formatted_option)
+
+            product_data["option_info"] = "".join(formatted_options)  # $$ 구분자로 이미 연결됨
+            self.logger.debug(f"옵션 정보 추출 완료: {len(option_list)}개 (가격 검증 포함)")
+
 class OliveyoungDetailInfoExtractor:
     """Oliveyoung 상품 상세 정보 추출을 담당하는 클래스 (동적 로딩)."""
 
@@ -272,9 +290,9 @@ class OliveyoungDetailInfoExtractor:
                     self.logger.debug(f"상세정보 API 응답: {response.status}")
                     if response.status == 200:
                         try:
-                            api_response_data = await response.json()
+                            api_response_data = await response.text()
                         except Exception as e:
-                            self.logger.debug(f"상세정보 API JSON 파싱 실패: {e}")
+                            self.logger.debug(f"상세정보 API 응답 읽기 실패: {e}")
                     elif response.status == 403:
                         self.logger.warning("상세정보 API 403 Forbidden")
             
@@ -316,8 +334,13 @@ class OliveyoungDetailInfoExtractor:
                     await self._apply_category_mapping(product_info_dict, product_data)
                         
                 except PlaywrightTimeoutError:
-                    self.logger.debug("상세정보 DOM 로딩 타임아웃 - 기본 매핑 적용")
-                    await self._apply_category_mapping({}, product_data)
+                    # DOM 렌더링은 늦어도 API 응답을 받았으면 응답에서 추출
+                    product_info_dict = parse_goods_artc(api_response_data) if api_response_data else {}
+                    if product_info_dict:
+                        self.logger.debug("상세정보 DOM 로딩 타임아웃 - API 응답으로 매핑 적용")
+                    else:
+                        self.logger.debug("상세정보 DOM 로딩 타임아웃 - 기본 매핑 적용")
+                    await self._apply_category_mapping(product_info_dict, product_data)
                     
             except Exception as click_error:
                 self.logger.debug(f"상세정보 버튼 클릭 실패: {str(click_error)}")
@@ -330,6 +353,17 @@ class OliveyoungDetailInfoExtractor:
         # 정적 배송/반품 정보 추출
         await self._extract_static_additional_info(page, product_data)
 
+    async def apply_product_info(self, product_info_dict: Dict[str, str], product_data: Dict[str, Any]):
+        """
+        이미 수집한 상품정보제공고시로 카테고리 매핑과 정적 정보를 적용한다.
+
+        Args:
+            product_info_dict: 상품정보제공고시 항목 (dt → dd)
+            product_data: 채울 상품 데이터
+        """
+        await self._apply_category_mapping(product_info_dict, product_data)
+        self.apply_static_additional_info(product_data)
+
     async def _apply_category_mapping(self, product_info_dict: Dict[str, str], product_data: Dict[str, Any]):
         """카테고리 감지 및 필드 매핑 적용."""
         try:
@@ -350,6 +384,10 @@ class OliveyoungDetailInfoExtractor:
 
     async def _extract_static_additional_info(self, page: Page, product_data: Dict[str, Any]):
         """정적 배송/반품 정보 추출."""
+        self.apply_static_additional_info(product_data)
+
+    def apply_static_additional_info(self, product_data: Dict[str, Any]):
+        """페이지와 무관한 정적 배송/반품 정보를 채운다."""
 
         # 배송안내 정보
         product_data["shipping_info"] = "일반배송||*2,500원(2만원↑ 무료)||*평균 4일 소요$$오늘드림||*빠름 5,000원·미드나잇 2,500원(3만원↑ 무료)||*당일 도착(마감 20시·13시)"
@@ -367,13 +405,36 @@ class OliveyoungDynamicContentExtractor:
         self.option_extractor = OliveyoungOptionExtractor(logger)
         self.detail_extractor = OliveyoungDetailInfoExtractor(logger)
 
-    async def extract_all_dynamic_content(self, page: Page, product_data: Dict[str, Any]):
-        """모든 동적 콘텐츠 추출."""
+    async def extract_all_dynamic_content(
+        self,
+        page: Optional[Page],
+        product_data: Dict[str, Any],
+        option_list: Optional[List[Dict[str, Any]]] = None,
+        product_info: Optional[Dict[str, str]] = None
+    ):
+        """
+        모든 동적 콘텐츠 추출.
+
+        AJAX 엔드포인트에서 미리 받은 옵션 목록/상품정보제공고시가 있으면 그대로 적용하고,
+        없는 항목만 페이지에서 버튼을 클릭해 추출한다.
+
+        Args:
+            page: 상품 페이지 (option_list와 product_info가 모두 있으면 None 가능)
+            product_data: 채울 상품 데이터
+            option_list: getOptInfoListAjax.do 응답에서 파싱한 옵션 목록
+            product_info: getGoodsArtcAjax.do 응답에서 파싱한 상품정보제공고시
+        """
         # 증정품 정보 추출
         # await self.gift_extractor.extract_gift_info(page, product_data)
         
         # 상품 옵션 정보 추출
-        await self.option_extractor.extract_option_info(page, product_data)
+        if option_list is not None:
+            self.option_extractor.apply_option_list(option_list, product_data)
+        else:
+            await self.option_extractor.extract_option_info(page, product_data)
         
         # 상품 상세 정보 추출
-        await self.detail_extractor.extract_detail_info(page, product_data)
\ No newline at end of file
+        if product_info is not None:
+            await self.detail_extractor.apply_product_info(product_info, product_data)
+        else:
+            await self.detail_extractor.extract_detail_info(page, product_data)
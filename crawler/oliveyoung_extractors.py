@@ -7,6 +7,198 @@ from playwright.async_api import Page
 from .utils import clean_text, parse_price
 
 
+# 상품 상세 페이지 셀렉터 (Playwright 추출기와 HTML 스냅샷 파서가 공유)
+PRODUCT_SELECTORS = {
+    "item_name": ".prd_name",
+    "brand_name": ".prd_brand a",
+    "category_1": ".loc_history .goods_category1.on",
+    "category_2": ".loc_history .goods_category2.on",
+    "category_3": ".loc_history .goods_category3.on",
+    "buy_button": ".goods_buy",
+    "sale_price": ".price-2 strong",
+    "origin_price": ".price-1 strike",
+    "sale_items": "#saleLayer .flex-item",
+    "flags": ".prd_flag .icon_flag",
+    "payment_benefits": ".txt_list p",
+    "thumbnails": ".prd_thumb_list img",
+    "option_button": "#buyOpt",
+    "detail_button": ".goods_buyinfo",
+}
+
+# 유효하지 않은 페이지 판별 셀렉터
+PAGE_STATE_SELECTORS = {
+    "no_product": "#error-contents.error-page.noProduct",
+    "login": ".loginArea.new-loginArea",
+    "error": "#error-contents",
+}
+
+# Cloudflare 봇 차단 페이지 특징 문구
+CLOUDFLARE_INDICATORS = [
+    '페이지를 제대로 표시할 수 없어요',
+]
+
+# 스냅샷 수집 전에 렌더링을 기다릴 셀렉터 (가격/이미지는 상품명보다 늦게 그려질 수 있음)
+SNAPSHOT_READY_KEYS = ["item_name", "sale_price", "thumbnails"]
+
+# 핵심 셀렉터가 모두 나타나거나 유효하지 않은 페이지로 판별되면 true
+PRODUCT_READY_SCRIPT = """
+([selectors, stateSelectors, cloudflareIndicators]) => {
+    if (Object.values(stateSelectors).some((selector) => document.querySelector(selector))) return true;
+    const body = document.body ? document.body.innerText : "";
+    if (cloudflareIndicators.some((indicator) => body.includes(indicator))) return true;
+    return selectors.every((selector) => document.querySelector(selector));
+}
+"""
+
+# PRODUCT_SELECTORS 전체를 한 번의 page.evaluate()로 수집하는 스크립트
+# (반환 형식은 oliveyoung_http.parse_product_snapshot()과 동일)
+PRODUCT_SNAPSHOT_SCRIPT = """
+([selectors, stateSelectors, cloudflareIndicators]) => {
+    const first = (selector) => document.querySelector(selector);
+    const all = (selector) => Array.from(document.querySelectorAll(selector));
+    const text = (el) => el ? el.innerText : null;
+
+    const html = document.documentElement ? document.documentElement.outerHTML : "";
+    const pageState = {
+        cloudflare: cloudflareIndicators.some((indicator) => html.includes(indicator)),
+    };
+    for (const [key, selector] of Object.entries(stateSelectors)) {
+        pageState[key] = !!first(selector);
+    }
+
+    // 카테고리 ID는 가장 바깥쪽 li[data-ref-dispcatno]에서 추출 (기존 ancestor::li .first와 동일)
+    const categories = [];
+    for (const key of ["category_1", "category_2", "category_3"]) {
+        const el = first(selectors[key]);
+        if (!el) continue;
+        let categoryId = "";
+        for (let node = el.parentElement; node; node = node.parentElement) {
+            if (node.tagName === "LI" && node.hasAttribute("data-ref-dispcatno")) {
+                categoryId = node.getAttribute("data-ref-dispcatno");
+            }
+        }
+        categories.push({ name: el.innerText, id: categoryId || "" });
+    }
+
+    const saleItems = [];
+    for (const item of all(selectors.sale_items)) {
+        const label = item.querySelector(".label");
+        const price = item.querySelector(".price");
+        if (label && price) {
+            saleItems.push({ label: label.innerText, price: price.innerText });
+        }
+    }
+
+    return {
+        page_state: pageState,
+        item_name: text(first(selectors.item_name)),
+        brand_name: text(first(selectors.brand_name)),
+        categories: categories,
+        has_buy_button: !!first(selectors.buy_button),
+        sale_price: text(first(selectors.sale_price)),
+        origin_price: text(first(selectors.origin_price)),
+        sale_items: saleItems,
+        flags: all(selectors.flags).map((el) => el.innerText),
+        // a 태그를 제외한 첫 노드의 텍스트만 사용
+        payment_benefits: all(selectors.payment_benefits).map((el) =>
+            (el.childNodes[0] ? el.childNodes[0].textContent : el.textContent).trim()),
+        images: all(selectors.thumbnails).map((el) => el.getAttribute("src")),
+        has_option_button: !!first(selectors.option_button),
+        has_detail_button: !!first(selectors.detail_button),
+    };
+}
+"""
+
+
+async def wait_for_product_ready(page: Page, timeout: int = 5000) -> bool:
+    """
+    추출기가 읽는 핵심 요소(상품명/가격/썸네일)가 렌더링될 때까지 기다린다.
+
+    Args:
+        page: 상품 상세 페이지
+        timeout: 최대 대기 시간 (밀리초)
+
+    Returns:
+        준비 완료 여부 (시간 초과 시 False, 그래도 스냅샷은 수집 가능)
+    """
+    try:
+        await page.wait_for_function(
+            PRODUCT_READY_SCRIPT,
+            arg=[[PRODUCT_SELECTORS[key] for key in SNAPSHOT_READY_KEYS], PAGE_STATE_SELECTORS, CLOUDFLARE_INDICATORS],
+            timeout=timeout,
+            polling=200
+        )
+        return True
+    except Exception:
+        return False
+
+
+def is_snapshot_incomplete(snapshot: Dict[str, Any]) -> bool:
+    """
+    유효하지 않은 페이지가 아닌데 핵심 값(상품명/가격/이미지)이 비어 있는지 확인한다.
+
+    Args:
+        snapshot: collect_product_snapshot() 결과
+
+    Returns:
+        재수집이 필요하면 True
+    """
+    if any(snapshot["page_state"].values()):
+        return False
+    return not (snapshot.get("item_name") and snapshot.get("sale_price") and snapshot.get("images"))
+
+
+async def collect_product_snapshot(page: Page) -> Dict[str, Any]:
+    """
+    상품 페이지의 추출 대상 값을 한 번의 브라우저 왕복으로 수집한다.
+
+    Args:
+        page: 상품 상세 페이지
+
+    Returns:
+        각 추출기의 apply_snapshot()이 소비하는 스냅샷
+    """
+    return await page.evaluate(
+        PRODUCT_SNAPSHOT_SCRIPT,
+        [PRODUCT_SELECTORS, PAGE_STATE_SELECTORS, CLOUDFLARE_INDICATORS]
+    )
+
+
+def parse_discount_period(period_text):
+    """할인 기간 텍스트를 파싱하여 시작/종료 날짜를 반환"""
+    if not period_text:
+        return None, None
+    
+    # 날짜 패턴 찾기 (YY.MM.DD 형태)
+    date_pattern = r'\d{2}\.\d{2}\.\d{2}'
+    
+    start_date = None
+    end_date = None
+    
+    if '~' in period_text:
+        parts = period_text.split('~')
+        
+        # 시작 날짜 찾기
+        if len(parts) > 0:
+            start_matches = re.findall(date_pattern, parts[0].strip())
+            if start_matches:
+                start_date = start_matches[0]
+        
+        # 종료 날짜 찾기
+        if len(parts) > 1:
+            end_matches = re.findall(date_pattern, parts[1].strip())
+            if end_matches:
+                end_date = end_matches[0]
+    else:
+        # ~ 없이 날짜만 있는 경우 - 시작일로 간주 (소진시까지)
+        dates = re.findall(date_pattern, period_text)
+        if dates:
+            start_date = dates[0]
+            # 종료일 없음 (소진시까지)
+    
+    return start_date, end_date
+
+
 class OliveyoungProductExtractor:
     """Oliveyoung 기본 상품 정보 추출을 담당하는 클래스."""
 
@@ -15,8 +207,44 @@ class OliveyoungProductExtractor:
 
     async def extract_basic_info(self, page: Page, goods_no: str) -> Dict[str, Any]:
         """기본 상품 정보 추출."""
+        snapshot = await collect_product_snapshot(page)
+        return self.apply_snapshot(snapshot, goods_no)
 
-        product_data = {
+    def apply_snapshot(self, snapshot: Dict[str, Any], goods_no: str) -> Dict[str, Any]:
+        """
+        페이지 스냅샷(셀렉터별 원시 값)에서 기본 상품 정보를 구성한다.
+
+        Args:
+            snapshot: PRODUCT_SELECTORS 기준으로 수집한 페이지 스냅샷
+            goods_no: 상품 번호
+
+        Returns:
+            기본 정보가 채워진 상품 데이터
+        """
+        product_data = self.new_product_data(goods_no)
+
+        if snapshot.get("item_name"):
+            product_data["item_name"] = clean_text(snapshot["item_name"])
+        if snapshot.get("brand_name"):
+            product_data["brand_name"] = clean_text(snapshot["brand_name"])
+
+        category_list = []
+        category_id_list = []
+        for category in snapshot.get("categories", []):
+            category_name = clean_text(category.get("name"))
+            if category_name:
+                category_list.append(category_name)
+                category_id_list.append((category.get("id") or "").strip())
+        self._assign_categories(category_list, category_id_list, product_data)
+
+        # 품절 상태 판단 (.goods_buy 버튼 존재 여부)
+        product_data["is_soldout"] = not snapshot.get("has_buy_button", True)
+        self.logger.debug(f"Oliveyoung 상품 추출: {product_data['item_name']} / {product_data['brand_name']} (품절: {product_data['is_soldout']})")
+        return product_data
+
+    def new_product_data(self, goods_no: str) -> Dict[str, Any]:
+        """기본값으로 채워진 상품 데이터를 생성한다."""
+        return {
             "goods_no": goods_no,
             "item_name": "",
             "brand_name": "",
@@ -47,135 +275,27 @@ class OliveyoungProductExtractor:
             "origin_product_url": f"https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goods_no}",
         }
 
-        # 상품명 추출
-        await self._extract_product_name(page, product_data)
+    def _assign_categories(self, category_list: List[str], category_id_list: List[str], product_data: Dict[str, Any]):
+        """추출된 카테고리를 단계별로 할당."""
+        if len(category_list) >= 1:
+            product_data["category_main"] = category_list[0]
+            product_data["category_main_id"] = category_id_list[0] if len(category_id_list) >= 1 else ""
         
-        # 브랜드명 추출
-        await self._extract_brand_name(page, product_data)
+        if len(category_list) >= 2:
+            product_data["category_sub"] = category_list[1] 
+            product_data["category_sub_id"] = category_id_list[1] if len(category_id_list) >= 2 else ""
         
-        # 카테고리 추출
-        await self._extract_category(page, product_data)
+        if len(category_list) >= 3:
+            product_data["category_detail"] = category_list[2]
+            product_data["category_detail_id"] = category_id_list[2] if len(category_id_list) >= 3 else ""
         
-        # 품절 상태 판단
-        await self._extract_soldout_status(page, product_data)
-
-        return product_data
-
-    async def _extract_product_name(self, page: Page, product_data: Dict[str, Any]):
-        """상품명 추출."""
-        try:
-            name_element = page.locator('.prd_name')
-            if await name_element.count() > 0:
-                name_text = await name_element.inner_text()
-                product_data["item_name"] = clean_text(name_text)
-                self.logger.debug(f"Oliveyoung 상품명 추출: {product_data['item_name']}")
-            else:
-                self.logger.debug("Oliveyoung 상품명(.prd_name)을 찾을 수 없음")
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 상품명 추출 실패: {str(e)}")
-
-    async def _extract_brand_name(self, page: Page, product_data: Dict[str, Any]):
-        """브랜드명 추출."""
-        try:
-            brand_element = page.locator('.prd_brand a')
-            if await brand_element.count() > 0:
-                brand_text = await brand_element.inner_text()
-                product_data["brand_name"] = clean_text(brand_text)
-                self.logger.debug(f"Oliveyoung 브랜드명 추출: {product_data['brand_name']}")
-            else:
-                self.logger.debug("Oliveyoung 브랜드명(.prd_brand a)을 찾을 수 없음")
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 브랜드명 추출 실패: {str(e)}")
-
-    async def _extract_category(self, page: Page, product_data: Dict[str, Any]):
-        """카테고리 정보 추출 (기존 크롤러 방식 유지)."""
-        try:
-            category_list = []
-            category_id_list = []
-            
-            # 1단계 카테고리: .goods_category1.on이 있는 요소 찾기
-            cat1_element = page.locator('.loc_history .goods_category1.on')
-            if await cat1_element.count() > 0:
-                category_name = clean_text(await cat1_element.inner_text())
-                if category_name:
-                    category_list.append(category_name)
-                    
-                    # 상위 li 요소에서 data-ref-dispcatno 추출
-                    parent_li = cat1_element.locator('xpath=ancestor::li[@data-ref-dispcatno]').first
-                    if await parent_li.count() > 0:
-                        category_id = await parent_li.get_attribute('data-ref-dispcatno')
-                        category_id_list.append(category_id.strip() if category_id else "")
-                    else:
-                        category_id_list.append("")
-            
-            # 2단계 카테고리: .goods_category2.on이 있는 요소 찾기
-            cat2_element = page.locator('.loc_history .goods_category2.on')
-            if await cat2_element.count() > 0:
-                category_name = clean_text(await cat2_element.inner_text())
-                if category_name:
-                    category_list.append(category_name)
-                    
-                    # 상위 li 요소에서 data-ref-dispcatno 추출
-                    parent_li = cat2_element.locator('xpath=ancestor::li[@data-ref-dispcatno]').first
-                    if await parent_li.count() > 0:
-                        category_id = await parent_li.get_attribute('data-ref-dispcatno')
-                        category_id_list.append(category_id.strip() if category_id else "")
-                    else:
-                        category_id_list.append("")
-            
-            # 3단계 카테고리: .goods_category3.on이 있는 요소 찾기
-            cat3_element = page.locator('.loc_history .goods_category3.on')
-            if await cat3_element.count() > 0:
-                category_name = clean_text(await cat3_element.inner_text())
-                if category_name:
-                    category_list.append(category_name)
-                    
-                    # 상위 li 요소에서 data-ref-dispcatno 추출
-                    parent_li = cat3_element.locator('xpath=ancestor::li[@data-ref-dispcatno]').first
-                    if await parent_li.count() > 0:
-                        category_id = await parent_li.get_attribute('data-ref-dispcatno')
-                        category_id_list.append(category_id.strip() if category_id else "")
-                    else:
-                        category_id_list.append("")
-            
-            # 추출된 카테고리를 단계별로 할당
-            if len(category_list) >= 1:
-                product_data["category_main"] = category_list[0]
-                product_data["category_main_id"] = category_id_list[0] if len(category_id_list) >= 1 else ""
-            
-            if len(category_list) >= 2:
-                product_data["category_sub"] = category_list[1] 
-                product_data["category_sub_id"] = category_id_list[1] if len(category_id_list) >= 2 else ""
-            
-            if len(category_list) >= 3:
-                product_data["category_detail"] = category_list[2]
-                product_data["category_detail_id"] = category_id_list[2] if len(category_id_list) >= 3 else ""
-            
-            # 전체 카테고리 경로 생성 (category 필드)
-            if category_list:
-                product_data["category_name"] = " > ".join(category_list)
-                self.logger.debug(f"Oliveyoung 카테고리 추출 ({len(category_list)}단계): {product_data['category_name']}")
-                self.logger.debug(f"Oliveyoung 카테고리 ID: {category_id_list}")
-            else:
-                self.logger.debug("Oliveyoung 카테고리 정보를 찾을 수 없음")
-                
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 카테고리 추출 실패: {str(e)}")
-
-    async def _extract_soldout_status(self, page: Page, product_data: Dict[str, Any]):
-        """품절 상태 판단 (.goods_buy 버튼 존재 여부)."""
-        try:
-            buy_button = page.locator('.goods_buy')
-            if await buy_button.count() > 0:
-                product_data["is_soldout"] = False
-                self.logger.debug("Oliveyoung 판매 중 (구매 버튼 존재)")
-            else:
-                product_data["is_soldout"] = True
-                self.logger.debug("Oliveyoung 품절 (구매 버튼 없음)")
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 품절 상태 판단 실패: {str(e)}")
-            # 기본값은 판매 중으로 설정
-            product_data["is_soldout"] = False
+        # 전체 카테고리 경로 생성 (category 필드)
+        if category_list:
+            product_data["category_name"] = " > ".join(category_list)
+            self.logger.debug(f"Oliveyoung 카테고리 추출 ({len(category_list)}단계): {product_data['category_name']}")
+            self.logger.debug(f"Oliveyoung 카테고리 ID: {category_id_list}")
+        else:
+            self.logger.debug("Oliveyoung 카테고리 정보를 찾을 수 없음")
 
 
 class OliveyoungPriceExtractor:
@@ -186,140 +306,81 @@ class OliveyoungPriceExtractor:
 
     async def extract_price_info(self, page: Page, product_data: Dict[str, Any]):
         """가격 정보 추출."""
+        snapshot = await collect_product_snapshot(page)
+        self.apply_snapshot(snapshot, product_data)
+
+    def apply_snapshot(self, snapshot: Dict[str, Any], product_data: Dict[str, Any]):
+        """
+        페이지 스냅샷에서 가격 정보를 구성한다.
+
+        Args:
+            snapshot: PRODUCT_SELECTORS 기준으로 수집한 페이지 스냅샷
+            product_data: 채울 상품 데이터
+        """
         try:
-            # 1. 판매가 추출 (필수)
-            await self._extract_sale_price(page, product_data)
+            if snapshot.get("sale_price") is not None:
+                product_data["price"] = parse_price(snapshot["sale_price"])
             
-            # 2. 정상가 추출 및 할인 여부 판단
-            await self._extract_origin_price(page, product_data)
+            if snapshot.get("origin_price") is not None:
+                product_data["origin_price"] = parse_price(snapshot["origin_price"])
+                product_data["is_discounted"] = True
+            else:
+                product_data["origin_price"] = product_data["price"]
+                product_data["is_discounted"] = False
             
-            # 3. 할인 혜택 정보 추출 (할인 시에만)
             if product_data["is_discounted"]:
-                await self._extract_discount_info(page, product_data)
+                self._apply_discount_items(snapshot.get("sale_items", []), product_data)
                 
         except Exception as e:
             self.logger.debug(f"Oliveyoung 가격 정보 추출 실패: {str(e)}")
 
-    async def _extract_sale_price(self, page: Page, product_data: Dict[str, Any]):
-        """판매가 추출."""
-        price_element = page.locator('.price-2 strong')
-        if await price_element.count() > 0:
-            price_text = await price_element.inner_text()
-            product_data["price"] = parse_price(price_text)
-            self.logger.debug(f"Oliveyoung 판매가 추출: {product_data['price']}")
-        else:
-            self.logger.debug("Oliveyoung 판매가(.price-2 strong)를 찾을 수 없음")
-
-    async def _extract_origin_price(self, page: Page, product_data: Dict[str, Any]):
-        """정상가 추출 및 할인 여부 판단."""
-        origin_price_element = page.locator('.price-1 strike')
-        if await origin_price_element.count() > 0:
-            # 할인 중인 경우
-            origin_price_text = await origin_price_element.inner_text()
-            product_data["origin_price"] = parse_price(origin_price_text)
-            product_data["is_discounted"] = True
-            self.logger.debug(f"Oliveyoung 정상가 추출 (할인 중): {product_data['origin_price']}")
-        else:
-            # 할인 없는 경우
-            product_data["origin_price"] = product_data["price"]
-            product_data["is_discounted"] = False
-            self.logger.debug("Oliveyoung 할인 없음 - 정상가와 판매가 동일")
-
-    async def _extract_discount_info(self, page: Page, product_data: Dict[str, Any]):
-        """할인 혜택 정보 추출."""
-        try:
-            discount_items = []
-            discount_periods = []
-            sale_items = page.locator('#saleLayer .flex-item')
-            count = await sale_items.count()
+    def _apply_discount_items(self, items: List[Dict[str, str]], product_data: Dict[str, Any]):
+        """할인 항목(label/price 원문)을 discount_info와 할인 기간 필드로 변환."""
+        discount_items = []
+        start_dates = []
+        end_dates = []
+        
+        for item in items:
+            label = clean_text(item.get("label"))
+            price = clean_text(item.get("price"))
             
-            def parse_discount_period(period_text):
-                """할인 기간 텍스트를 파싱하여 시작/종료 날짜를 반환"""
-                if not period_text:
-                    return None, None
-                
-                # 날짜 패턴 찾기 (YY.MM.DD 형태)
-                date_pattern = r'\d{2}\.\d{2}\.\d{2}'
-                
-                start_date = None
-                end_date = None
-                
-                if '~' in period_text:
-                    parts = period_text.split('~')
+            if label and price:
+                # 할인 기간 파싱 (괄호 안의 날짜 정보)
+                period_match = re.search(r'\(([^)]+)\)', label)
+                if period_match:
+                    period = period_match.group(1)
                     
-                    # 시작 날짜 찾기
-                    if len(parts) > 0:
-                        start_matches = re.findall(date_pattern, parts[0].strip())
-                        if start_matches:
-                            start_date = start_matches[0]
+                    # 시작/종료 날짜 분리
+                    start_date, end_date = parse_discount_period(period)
+                    if start_date:
+                        start_dates.append(start_date)
+                    if end_date:
+                        end_dates.append(end_date)
                     
-                    # 종료 날짜 찾기
-                    if len(parts) > 1:
-                        end_matches = re.findall(date_pattern, parts[1].strip())
-                        if end_matches:
-                            end_date = end_matches[0]
+                    # 기간 정보를 제외한 할인 이유만 추출
+                    discount_reason = re.sub(r'\s*\([^)]+\)', '', label).strip()
+                    discount_items.append(f"{discount_reason}||*{price}||*{period}")
                 else:
-                    # ~ 없이 날짜만 있는 경우 - 시작일로 간주 (소진시까지)
-                    dates = re.findall(date_pattern, period_text)
-                    if dates:
-                        start_date = dates[0]
-                        # 종료일 없음 (소진시까지)
-                
-                return start_date, end_date
-            
-            start_dates = []
-            end_dates = []
+                    discount_items.append(f"{label}||*{price}")
+        
+        # FIXME: 할인정보
+        if discount_items:
+            product_data["discount_info"] = "$$".join(discount_items)
+            self.logger.debug(f"Oliveyoung 할인 혜택 정보 추출: {len(discount_items)}개 항목")
             
-            for i in range(count):
-                item = sale_items.nth(i)
-                label_element = item.locator('.label')
-                price_element = item.locator('.price')
-                
-                if await label_element.count() > 0 and await price_element.count() > 0:
-                    label = clean_text(await label_element.inner_text())
-                    price = clean_text(await price_element.inner_text())
-                    
-                    if label and price:
-                        # 할인 기간 파싱 (괄호 안의 날짜 정보)
-                        period_match = re.search(r'\(([^)]+)\)', label)
-                        if period_match:
-                            period = period_match.group(1)
-                            discount_periods.append(period)
-                            
-                            # 시작/종료 날짜 분리
-                            start_date, end_date = parse_discount_period(period)
-                            if start_date:
-                                start_dates.append(start_date)
-                            if end_date:
-                                end_dates.append(end_date)
-                            
-                            # 기간 정보를 제외한 할인 이유만 추출
-                            discount_reason = re.sub(r'\s*\([^)]+\)', '', label).strip()
-                            discount_items.append(f"{discount_reason}||*{price}||*{period}")
-                        else:
-                            discount_items.append(f"{label}||*{price}")
+            # 시작/종료 날짜 저장 (가장 이른 시작일, 가장 늦은 종료일)
+            if start_dates:
+                product_data["discount_start_date"] = "$$".join(start_dates)
+                self.logger.debug(f"Oliveyoung 할인 시작일: {product_data['discount_start_date']}")
             
-            # FIXME: 할인정보
-            if discount_items:
-                product_data["discount_info"] = "$$".join(discount_items)
-                self.logger.debug(f"Oliveyoung 할인 혜택 정보 추출: {len(discount_items)}개 항목")
-                
-                # 시작/종료 날짜 저장 (가장 이른 시작일, 가장 늦은 종료일)
-                if start_dates:
-                    product_data["discount_start_date"] = "$$".join(start_dates)
-                    self.logger.debug(f"Oliveyoung 할인 시작일: {product_data['discount_start_date']}")
-                
-                if end_dates:
-                    product_data["discount_end_date"] = "$$".join(end_dates)
-                    self.logger.debug(f"Oliveyoung 할인 종료일: {product_data['discount_end_date']}")
-                else:
-                    self.logger.debug("Oliveyoung 할인 종료일 없음 (소진시까지)")
-                    
+            if end_dates:
+                product_data["discount_end_date"] = "$$".join(end_dates)
+                self.logger.debug(f"Oliveyoung 할인 종료일: {product_data['discount_end_date']}")
             else:
-                self.logger.debug("Oliveyoung 할인 혜택 정보가 비어있음")
+                self.logger.debug("Oliveyoung 할인 종료일 없음 (소진시까지)")
                 
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 할인 혜택 정보 추출 실패: {str(e)}")
+        else:
+            self.logger.debug("Oliveyoung 할인 혜택 정보가 비어있음")
 
 
 class OliveyoungBenefitExtractor:
@@ -330,67 +391,30 @@ class OliveyoungBenefitExtractor:
 
     async def extract_benefit_info(self, page: Page, product_data: Dict[str, Any]):
         """혜택 정보 추출."""
-        # 상품 플래그 정보 추출
-        await self._extract_product_flags(page, product_data)
-        
-        # 결제 혜택 정보 추출
-        await self._extract_payment_benefits(page, product_data)
+        snapshot = await collect_product_snapshot(page)
+        self.apply_snapshot(snapshot, product_data)
 
-    async def _extract_product_flags(self, page: Page, product_data: Dict[str, Any]):
-        """상품 플래그 정보 추출 (세일, 쿠폰, 증정, 오늘드림 등)."""
-        try:
-            product_flags = ["상품혜택"]
-            flag_elements = page.locator('.prd_flag .icon_flag')
-            count = await flag_elements.count()
-            
-            for i in range(count):
-                flag_element = flag_elements.nth(i)
-                flag_text = clean_text(await flag_element.inner_text())
-                if flag_text:
-                    product_flags.append(flag_text)
-            
-            if product_flags:
-                # 기존 benefit_info에 플래그 정보 추가
-                flag_info = '||*'.join(product_flags)
-                if product_data["benefit_info"]:
-                    product_data["benefit_info"] += f"$${flag_info}"
-                else:
-                    product_data["benefit_info"] = flag_info
-                self.logger.debug(f"Oliveyoung 상품 플래그 추출: {product_flags}")
-            else:
-                self.logger.debug("Oliveyoung 상품 플래그 정보를 찾을 수 없음")
-                
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 상품 플래그 추출 실패: {str(e)}")
+    def apply_snapshot(self, snapshot: Dict[str, Any], product_data: Dict[str, Any]):
+        """
+        페이지 스냅샷에서 혜택 정보를 구성한다.
+
+        Args:
+            snapshot: PRODUCT_SELECTORS 기준으로 수집한 페이지 스냅샷
+            product_data: 채울 상품 데이터
+        """
+        self._append_benefits("상품혜택", snapshot.get("flags", []), product_data)
+        self._append_benefits("결제혜택", snapshot.get("payment_benefits", []), product_data)
+
+    def _append_benefits(self, title: str, texts: List[str], product_data: Dict[str, Any]):
+        """혜택 텍스트 목록을 benefit_info에 추가."""
+        benefits = [title] + [text for text in (clean_text(t) for t in texts) if text]
+        benefit_info = '||*'.join(benefits)
+        self.logger.debug(f"Oliveyoung {title} 추출: {benefits[1:]}")
+        if product_data["benefit_info"]:
+            product_data["benefit_info"] += f"$${benefit_info}"
+        else:
+            product_data["benefit_info"] = benefit_info
 
-    async def _extract_payment_benefits(self, page: Page, product_data: Dict[str, Any]):
-        """결제 혜택 정보 추출."""
-        try:
-            payment_benefits = ["결제혜택"]
-            payment_elements = page.locator('.txt_list p')
-            count = await payment_elements.count()
-            
-            for i in range(count):
-                benefit_element = payment_elements.nth(i)
-                # a 태그 제거하고 텍스트만 추출
-                benefit_text = await benefit_element.evaluate('el => el.childNodes[0] ? el.childNodes[0].textContent.trim() : el.textContent.trim()')
-                benefit_text = clean_text(benefit_text)
-                if benefit_text:
-                    payment_benefits.append(benefit_text)
-            
-            if payment_benefits:
-                # 기존 benefit_info에 결제 혜택 정보 추가
-                payment_info = '||*'.join(payment_benefits)
-                if product_data["benefit_info"]:
-                    product_data["benefit_info"] += f"$${payment_info}"
-                else:
-                    product_data["benefit_info"] = payment_info
-                self.logger.debug(f"Oliveyoung 결제 혜택 추출: {payment_benefits}")
-            else:
-                self.logger.debug("Oliveyoung 결제 혜택 정보를 찾을 수 없음")
-                
-        except Exception as e:
-            self.logger.debug(f"Oliveyoung 결제 혜택 추출 실패: {str(e)}")
 
 class OliveyoungImageExtractor:
     """Oliveyoung 이미지 정보 추출을 담당하는 클래스."""
@@ -400,25 +424,30 @@ class OliveyoungImageExtractor:
 
     async def extract_images(self, page: Page, product_data: Dict[str, Any]):
         """상품 이미지 추출."""
+        snapshot = await collect_product_snapshot(page)
+        self.apply_snapshot(snapshot, product_data)
+
+    def apply_snapshot(self, snapshot: Dict[str, Any], product_data: Dict[str, Any]):
+        """
+        페이지 스냅샷에서 이미지 정보를 구성한다.
+
+        Args:
+            snapshot: PRODUCT_SELECTORS 기준으로 수집한 페이지 스냅샷
+            product_data: 채울 상품 데이터
+        """
         try:
-            image_urls = []
-            image_elements = page.locator('.prd_thumb_list img')
-            count = await image_elements.count()
-            
-            for i in range(count):
-                img_element = image_elements.nth(i)
-                src = await img_element.get_attribute('src')
-                if src:
-                    # /85/를 /550/로 대체하여 고해상도 이미지 URL 생성
-                    high_res_src = src.replace('/85/', '/550/')
-                    image_urls.append(high_res_src)
-            
-            if image_urls:
-                # $$ 구분자로 이미지 URL들을 연결
-                product_data["images"] = "$$".join(image_urls)
-                self.logger.debug(f"Oliveyoung 상품 이미지 추출: {len(image_urls)}개")
-            else:
-                self.logger.debug("Oliveyoung 상품 이미지를 찾을 수 없음")
-                
+            self._apply_image_srcs(snapshot.get("images", []), product_data)
         except Exception as e:
-            self.logger.debug(f"Oliveyoung 상품 이미지 추출 실패: {str(e)}")
\ No newline at end of file
+            self.logger.debug(f"Oliveyoung 상품 이미지 추출 실패: {str(e)}")
+
+    def _apply_image_srcs(self, srcs: List[str], product_data: Dict[str, Any]):
+        """썸네일 src 목록을 고해상도 URL로 변환해 images에 저장."""
+        # /85/를 /550/로 대체하여 고해상도 이미지 URL 생성
+        image_urls = [src.replace('/85/', '/550/') for src in srcs if src]
+        
+        if image_urls:
+            # $$ 구분자로 이미지 URL들을 연결
+            product_data["images"] = "$$".join(image_urls)
+            self.logger.debug(f"Oliveyoung 상품 이미지 추출: {len(image_urls)}개")
+        else:
+            self.logger.debug("Oliveyoung 상품 이미지를 찾을 수 없음")
\ No newline at end of file
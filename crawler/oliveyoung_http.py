@@ -0,0 +1,597 @@
+"""Oliveyoung 상품 페이지 HTTP 직접 요청 및 HTML 스냅샷 파싱."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from filelock import FileLock
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from .cookies import OliveyoungCookieManager
+from .rate_controller import AdaptiveRateController
+from .oliveyoung_extractors import CLOUDFLARE_INDICATORS, PAGE_STATE_SELECTORS, PRODUCT_SELECTORS
+from .utils import clean_text, setup_logger
+
+
+# 목록 HTML의 상품 링크(goodsNo=...), data-ref-goodsno 속성, JSON 응답의 "goodsNo": "..." 모두와 일치
+GOODS_NO_PATTERN = re.compile(r"""(?i:goodsNo)(?:=|["']?\s*[:=]\s*["'])([A-Z0-9]+)""")
+
+# 메인 페이지 GNB 전체 메뉴의 카테고리 링크 (대분류, 중/소분류)
+CATEGORY_MENU_SELECTORS = (
+    '#gnbAllMenu .all_menu_wrap .sub_menu_box .sub_depth > a[data-ref-dispcatno]',
+    '#gnbAllMenu .all_menu_wrap .sub_menu_box ul > li > a[data-ref-dispcatno]',
+)
+
+
+def _first_text(doc, selector: str) -> Optional[str]:
+    """셀렉터와 일치하는 첫 요소의 텍스트 (없으면 None)."""
+    elements = doc.cssselect(selector)
+    if not elements:
+        return None
+    return elements[0].text_content()
+
+
+def parse_product_snapshot(html_text: str) -> Dict[str, Any]:
+    """
+    상품 상세 HTML을 PRODUCT_SELECTORS 기준의 스냅샷으로 변환한다.
+
+    스냅샷은 PRODUCT_SNAPSHOT_SCRIPT(page.evaluate) 결과와 같은 형태로
+    Oliveyoung*Extractor.apply_snapshot()이 소비하며,
+    page_state에 Cloudflare/상품 없음/로그인/에러 페이지 여부를 함께 담는다.
+
+    Args:
+        html_text: 상품 상세 페이지 HTML
+
+    Returns:
+        셀렉터별 원시 값과 페이지 상태를 담은 딕셔너리
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError("lxml이 설치되지 않았습니다. pip install lxml cssselect")
+
+    page_state = {
+        "cloudflare": any(indicator in html_text for indicator in CLOUDFLARE_INDICATORS),
+        "no_product": False,
+        "login": False,
+        "error": False,
+    }
+    snapshot: Dict[str, Any] = {"page_state": page_state}
+
+    if page_state["cloudflare"] or not html_text.strip():
+        return snapshot
+
+    doc = lxml_html.fromstring(html_text)
+
+    for key, selector in PAGE_STATE_SELECTORS.items():
+        page_state[key] = bool(doc.cssselect(selector))
+
+    snapshot["item_name"] = _first_text(doc, PRODUCT_SELECTORS["item_name"])
+    snapshot["brand_name"] = _first_text(doc, PRODUCT_SELECTORS["brand_name"])
+
+    # 카테고리 (가장 바깥쪽 li의 data-ref-dispcatno를 ID로 사용)
+    categories = []
+    for level in ("category_1", "category_2", "category_3"):
+        elements = doc.cssselect(PRODUCT_SELECTORS[level])
+        if not elements:
+            continue
+        element = elements[0]
+        parent_li = element.xpath('ancestor::li[@data-ref-dispcatno]')
+        category_id = parent_li[0].get('data-ref-dispcatno') if parent_li else ""
+        categories.append({"name": element.text_content(), "id": category_id or ""})
+    snapshot["categories"] = categories
+
+    snapshot["has_buy_button"] = bool(doc.cssselect(PRODUCT_SELECTORS["buy_button"]))
+
+    snapshot["sale_price"] = _first_text(doc, PRODUCT_SELECTORS["sale_price"])
+    snapshot["origin_price"] = _first_text(doc, PRODUCT_SELECTORS["origin_price"])
+
+    sale_items = []
+    for item in doc.cssselect(PRODUCT_SELECTORS["sale_items"]):
+        label = item.cssselect('.label')
+        price = item.cssselect('.price')
+        if label and price:
+            sale_items.append({"label": label[0].text_content(), "price": price[0].text_content()})
+    snapshot["sale_items"] = sale_items
+
+    snapshot["flags"] = [el.text_content() for el in doc.cssselect(PRODUCT_SELECTORS["flags"])]
+
+    # 결제 혜택은 a 태그를 제외한 첫 텍스트 노드만 사용 (Playwright 추출기와 동일)
+    payment_benefits = []
+    for element in doc.cssselect(PRODUCT_SELECTORS["payment_benefits"]):
+        if element.text is not None:
+            payment_benefits.append(element.text.strip())
+        elif len(element):
+            payment_benefits.append(element[0].text_content().strip())
+        else:
+            payment_benefits.append(element.text_content().strip())
+    snapshot["payment_benefits"] = payment_benefits
+
+    snapshot["images"] = [el.get('src') for el in doc.cssselect(PRODUCT_SELECTORS["thumbnails"])]
+
+    snapshot["has_option_button"] = bool(doc.cssselect(PRODUCT_SELECTORS["option_button"]))
+    snapshot["has_detail_button"] = bool(doc.cssselect(PRODUCT_SELECTORS["detail_button"]))
+
+    return snapshot
+
+
+def parse_goods_no_list(response_text: str) -> List[str]:
+    """
+    카테고리 목록 응답(HTML 또는 JSON)에서 goodsNo를 등장 순서대로 중복 없이 추출한다.
+
+    요소를 하나씩 읽지 않고 본문 전체에 정규식을 한 번 적용한다.
+
+    Args:
+        response_text: 목록 페이지 HTML 또는 목록 API 응답 본문
+
+    Returns:
+        goodsNo 목록 (페이지 내 순서 유지)
+    """
+    if not response_text:
+        return []
+    return list(dict.fromkeys(GOODS_NO_PATTERN.findall(response_text)))
+
+
+def parse_category_menu(html_text: str) -> List[Dict[str, str]]:
+    """
+    메인 페이지(또는 #gnbAllMenu outerHTML)에서 카테고리 ID와 이름을 추출한다.
+
+    15자리 숫자 data-ref-dispcatno와 비어 있지 않은 이름을 가진 링크만 사용한다.
+
+    Args:
+        html_text: 메인 페이지 HTML 또는 GNB 메뉴 HTML 조각
+
+    Returns:
+        ID순 정렬된 [{"id", "name"}, ...]
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError("lxml이 설치되지 않았습니다. pip install lxml cssselect")
+    if not html_text or not html_text.strip():
+        return []
+
+    doc = lxml_html.document_fromstring(html_text)
+    categories = {}
+    for selector in CATEGORY_MENU_SELECTORS:
+        for element in doc.cssselect(selector):
+            cat_id = (element.get('data-ref-dispcatno') or "").strip()
+            cat_name = element.text_content().strip()
+            if len(cat_id) == 15 and cat_id.isdigit() and cat_name:
+                categories[cat_id] = cat_name
+    return [{"id": cat_id, "name": cat_name} for cat_id, cat_name in sorted(categories.items())]
+
+
+def parse_option_list(html_text: str, max_options: int = 20) -> List[Dict[str, Any]]:
+    """
+    getOptInfoListAjax.do 응답(옵션 목록 HTML 조각)을 옵션 딕셔너리 목록으로 변환한다.
+
+    #option_list li를 DOM에서 읽던 기존 방식과 같은 규칙(최대 20개, .option_value,
+    .tx_num 가격, soldout 클래스)을 적용한다.
+
+    Args:
+        html_text: 옵션 목록 HTML 조각
+        max_options: 최대 옵션 수
+
+    Returns:
+        {"name", "price", "is_soldout"} 딕셔너리 목록
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError("lxml이 설치되지 않았습니다. pip install lxml cssselect")
+    if not html_text or not html_text.strip():
+        return []
+
+    fragment = lxml_html.fragment_fromstring(html_text, create_parent="div")
+    option_list = []
+    for item in fragment.cssselect('li')[:max_options]:
+        name_element = item.cssselect('.option_value')
+        if not name_element:
+            continue
+        option_name = clean_text(name_element[0].text_content())
+        if not option_name:
+            continue
+
+        # "27,600원" 형태에서 숫자만 추출
+        option_price = 0
+        price_element = item.cssselect('.tx_num')
+        if price_element:
+            price_match = re.search(r'([\d,]+)', clean_text(price_element[0].text_content()))
+            if price_match:
+                option_price = int(price_match.group(1).replace(',', ''))
+
+        option_list.append({
+            "name": option_name,
+            "price": option_price,
+            "is_soldout": "soldout" in item.classes,
+        })
+    return option_list
+
+
+def parse_goods_artc(response_text: str, max_items: int = 15) -> Dict[str, str]:
+    """
+    getGoodsArtcAjax.do 응답을 상품정보제공고시 딕셔너리로 변환한다.
+
+    응답이 HTML 조각이면 .detail_info_list의 dt/dd를 읽고, JSON이면 문자열 값에 담긴
+    HTML 조각을 같은 방식으로 읽는다. "상세페이지 참조" 값은 제외한다.
+
+    Args:
+        response_text: 엔드포인트 응답 본문
+        max_items: 최대 항목 수
+
+    Returns:
+        항목명 → 내용 딕셔너리
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError("lxml이 설치되지 않았습니다. pip install lxml cssselect")
+    if not response_text or not response_text.strip():
+        return {}
+
+    html_parts = [response_text]
+    try:
+        payload = json.loads(response_text)
+        html_parts = _collect_strings(payload)
+    except ValueError:
+        pass
+
+    product_info = {}
+    for html_part in html_parts:
+        if '<' not in html_part:
+            continue
+        fragment = lxml_html.fragment_fromstring(html_part, create_parent="div")
+        for item in fragment.cssselect('.detail_info_list'):
+            if len(product_info) >= max_items:
+                return product_info
+            dt_element = item.cssselect('dt')
+            dd_element = item.cssselect('dd')
+            if not dt_element or not dd_element:
+                continue
+            key = clean_text(dt_element[0].text_content())
+            value = clean_text(dd_element[0].text_content())
+            if key and value and "상세페이지 참조" not in value:
+                product_info[key] = value
+    return product_info
+
+
+def _collect_strings(payload: Any) -> List[str]:
+    """JSON 값에서 문자열을 재귀적으로 수집한다."""
+    if isinstance(payload, str):
+        return [payload]
+    if isinstance(payload, dict):
+        payload = list(payload.values())
+    if isinstance(payload, list):
+        strings = []
+        for value in payload:
+            strings.extend(_collect_strings(value))
+        return strings
+    return []
+
+
+class OliveyoungHttpFetcher:
+    """
+    저장된 쿠키(oy_state.json)로 상품 페이지를 직접 요청하는 HTTP 클라이언트.
+
+    브라우저와 같은 User-Agent/헤더를 사용하고 연결 풀을 공유하는 비동기 클라이언트로
+    상품 상세 HTML을 가져온다. Cloudflare 챌린지나 클릭이 필요한 콘텐츠는
+    호출 측에서 Playwright 경로로 폴백해야 한다.
+    """
+
+    PRODUCT_URL_TEMPLATE = "https://www.oliveyoung.co.kr/store/goods/getGoodsDetail.do?goodsNo={goodsNo}"
+    # 상품 페이지의 옵션/상세정보 버튼이 호출하는 AJAX 엔드포인트
+    OPTION_API_URL = "https://www.oliveyoung.co.kr/store/goods/getOptInfoListAjax.do"
+    GOODS_ARTC_API_URL = "https://www.oliveyoung.co.kr/store/goods/getGoodsArtcAjax.do"
+    CATEGORY_LIST_URL = "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do"
+    MAIN_PAGE_URL = "https://www.oliveyoung.co.kr/store/main/main.do"
+
+    def __init__(self, cookie_file: str = "oy_state.json", max_connections: int = 10, timeout: float = 30.0,
+                 rate_controller: Optional[AdaptiveRateController] = None):
+        """
+        HTTP 페처를 초기화한다.
+
+        Args:
+            cookie_file: Playwright storage_state 쿠키 파일 경로
+            max_connections: 연결 풀 최대 연결 수
+            timeout: 요청 타임아웃 (초)
+            rate_controller: 403/Cloudflare 응답을 전달하고 AJAX 요청 속도를 맞출 적응형 속도 제어기
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx가 설치되지 않았습니다. pip install httpx")
+
+        self.cookie_file = Path(cookie_file)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_controller = rate_controller
+        self.client: Optional["httpx.AsyncClient"] = None
+
+        log_level_str = os.getenv('OY_LOG_LVL', 'INFO').upper()
+        log_level = getattr(logging, log_level_str, logging.INFO)
+        self.logger = setup_logger(__name__, log_level)
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """연결 풀을 가진 비동기 클라이언트를 생성하고 쿠키를 로드한다."""
+        if self.client is not None:
+            return
+
+        headers = dict(OliveyoungCookieManager.EXTRA_HTTP_HEADERS)
+        headers['User-Agent'] = OliveyoungCookieManager.FIXED_USER_AGENT
+        # brotli 디코더가 없는 환경에서도 본문을 읽을 수 있도록 gzip/deflate만 요청
+        headers['accept-encoding'] = 'gzip, deflate'
+
+        self.client = httpx.AsyncClient(
+            headers=headers,
+            cookies=self._load_cookies(),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            ),
+            timeout=self.timeout,
+            follow_redirects=True
+        )
+        self.logger.info(f"Oliveyoung HTTP 클라이언트 시작 (최대 연결 {self.max_connections}개)")
+
+    async def stop(self) -> None:
+        """클라이언트와 연결 풀을 정리한다."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+            self.logger.info("Oliveyoung HTTP 클라이언트 종료")
+
+    def reload_cookies(self) -> None:
+        """쿠키 파일이 갱신된 뒤 클라이언트 쿠키를 다시 로드한다."""
+        if self.client is not None:
+            self.client.cookies = self._load_cookies()
+            self.logger.info("Oliveyoung HTTP 클라이언트 쿠키 재로드 완료")
+
+    def _load_cookies(self) -> "httpx.Cookies":
+        """storage_state 파일의 쿠키를 httpx.Cookies로 변환한다."""
+        cookies = httpx.Cookies()
+        if not self.cookie_file.exists():
+            self.logger.warning(f"쿠키 파일이 존재하지 않습니다: {self.cookie_file}")
+            return cookies
+
+        try:
+            with FileLock(str(self.cookie_file) + ".lock"):
+                with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"쿠키 파일 로드 실패: {e}")
+            return cookies
+
+        for cookie in state.get('cookies', []):
+            cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+        return cookies
+
+    async def fetch_product_page(self, goods_no: str) -> Optional[str]:
+        """
+        상품 상세 페이지 HTML을 가져온다.
+
+        Args:
+            goods_no: 상품 번호
+
+        Returns:
+            HTML 문자열 또는 None (요청 실패 또는 비정상 상태 코드)
+        """
+        if self.client is None:
+            await self.start()
+
+        url = self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no)
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"Oliveyoung HTTP 요청 실패 ({goods_no}): {e}")
+            return None
+
+        if response.status_code != 200:
+            self.logger.warning(f"Oliveyoung HTTP 응답 상태 {response.status_code} ({goods_no})")
+            if response.status_code == 403:
+                self._record_block("http_403")
+            return None
+
+        return response.text
+
+    async def fetch_main_page(self) -> Optional[str]:
+        """
+        카테고리 메뉴(GNB)가 포함된 메인 페이지 HTML을 가져온다.
+
+        Returns:
+            HTML 문자열 또는 None (요청 실패/Cloudflare - 브라우저로 폴백 필요)
+        """
+        if self.client is None:
+            await self.start()
+
+        try:
+            response = await self.client.get(self.MAIN_PAGE_URL)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"Oliveyoung 메인 페이지 요청 실패: {e}")
+            return None
+
+        if response.status_code != 200:
+            self.logger.warning(f"Oliveyoung 메인 페이지 응답 상태 {response.status_code}")
+            if response.status_code == 403:
+                self._record_block("http_403")
+            return None
+
+        if any(indicator in response.text for indicator in CLOUDFLARE_INDICATORS):
+            self.logger.warning("메인 페이지 응답에서 Cloudflare 챌린지 감지")
+            self._record_block("cloudflare")
+            return None
+
+        return response.text
+
+    async def fetch_category_list_page(
+        self,
+        category_id: str,
+        page_idx: int = 1,
+        rows_per_page: int = 48,
+        sort_type: str = "01"
+    ) -> Optional[str]:
+        """
+        카테고리 목록 페이지 하나를 가져온다.
+
+        Args:
+            category_id: 카테고리 ID (dispCatNo)
+            page_idx: 페이지 번호 (1부터)
+            rows_per_page: 페이지당 상품 수
+            sort_type: 정렬 타입 (01=판매순, 02=최신순)
+
+        Returns:
+            목록 HTML 또는 None (요청 실패/Cloudflare - 브라우저로 폴백 필요)
+        """
+        if self.client is None:
+            await self.start()
+
+        params = {
+            "dispCatNo": category_id,
+            "pageIdx": page_idx,
+            "rowsPerPage": rows_per_page,
+            "prdSort": sort_type,
+        }
+        try:
+            response = await self.client.get(self.CATEGORY_LIST_URL, params=params)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"Oliveyoung 목록 요청 실패 ({category_id} p{page_idx}): {e}")
+            return None
+
+        if response.status_code != 200:
+            self.logger.warning(f"Oliveyoung 목록 응답 상태 {response.status_code} ({category_id} p{page_idx})")
+            if response.status_code == 403:
+                self._record_block("http_403")
+            return None
+
+        if any(indicator in response.text for indicator in CLOUDFLARE_INDICATORS):
+            self.logger.warning(f"목록 응답에서 Cloudflare 챌린지 감지 ({category_id} p{page_idx})")
+            self._record_block("cloudflare")
+            return None
+
+        return response.text
+
+    async def fetch_option_list(self, goods_no: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        옵션 목록 엔드포인트를 직접 호출한다.
+
+        Args:
+            goods_no: 상품 번호
+
+        Returns:
+            옵션 목록 또는 None (요청 실패/빈 응답 - DOM 추출로 폴백 필요)
+        """
+        response_text = await self._post_ajax(self.OPTION_API_URL, {"goodsNo": goods_no}, goods_no)
+        if response_text is None:
+            return None
+        # 옵션 버튼이 있는 상품에서만 호출하므로 빈 목록은 요청 파라미터가 맞지 않은 것으로 본다
+        return parse_option_list(response_text) or None
+
+    async def fetch_product_info(self, goods_no: str) -> Optional[Dict[str, str]]:
+        """
+        상품정보제공고시 엔드포인트를 직접 호출한다.
+
+        Args:
+            goods_no: 상품 번호
+
+        Returns:
+            상품정보제공고시 딕셔너리 또는 None (요청 실패/빈 응답 - DOM 추출로 폴백 필요)
+        """
+        response_text = await self._post_ajax(
+            self.GOODS_ARTC_API_URL,
+            {"goodsNo": goods_no, "itemNo": "001", "pkgGoodsYn": "N"},
+            goods_no
+        )
+        if response_text is None:
+            return None
+        # itemNo/pkgGoodsYn을 고정값으로 보내므로 세트 상품 등은 빈 응답일 수 있음 (버튼 클릭으로 폴백)
+        return parse_goods_artc(response_text) or None
+
+    async def fetch_dynamic_content(
+        self,
+        goods_no: str,
+        fetch_options: bool = True,
+        fetch_info: bool = True
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Dict[str, str]]]:
+        """
+        옵션 목록과 상품정보제공고시를 동시에 요청한다.
+
+        Args:
+            goods_no: 상품 번호
+            fetch_options: 옵션 목록 요청 여부 (False면 빈 목록)
+            fetch_info: 상품정보제공고시 요청 여부 (False면 빈 딕셔너리)
+
+        Returns:
+            (옵션 목록, 상품정보제공고시) - 실패한 항목은 None
+        """
+        async def skipped(value):
+            return value
+
+        option_list, product_info = await asyncio.gather(
+            self.fetch_option_list(goods_no) if fetch_options else skipped([]),
+            self.fetch_product_info(goods_no) if fetch_info else skipped({}),
+            return_exceptions=True
+        )
+        if isinstance(option_list, Exception):
+            self.logger.debug(f"옵션 API 파싱 실패 ({goods_no}): {option_list}")
+            option_list = None
+        if isinstance(product_info, Exception):
+            self.logger.debug(f"상세정보 API 파싱 실패 ({goods_no}): {product_info}")
+            product_info = None
+        return option_list, product_info
+
+    async def _post_ajax(self, url: str, data: Dict[str, str], goods_no: str) -> Optional[str]:
+        """상품 페이지에서 호출하는 것과 같은 헤더로 AJAX 엔드포인트에 POST한다 (속도 제어기의 토큰 버킷 사용)."""
+        if self.client is None:
+            await self.start()
+        if self.rate_controller:
+            await self.rate_controller.acquire()
+
+        headers = {
+            'X-Requested-With': 'XMLHttpRequest',
+            'Referer': self.PRODUCT_URL_TEMPLATE.format(goodsNo=goods_no),
+            'Accept': '*/*',
+        }
+        try:
+            response = await self.client.post(url, data=data, headers=headers)
+        except httpx.HTTPError as e:
+            self.logger.debug(f"AJAX 요청 실패 ({url}, {goods_no}): {e}")
+            return None
+
+        if response.status_code != 200:
+            if response.status_code == 403:
+                self.logger.warning(f"AJAX 403 Forbidden ({url}, {goods_no})")
+                self._record_block("http_403")
+            else:
+                self.logger.debug(f"AJAX 응답 상태 {response.status_code} ({url}, {goods_no})")
+            return None
+
+        if any(indicator in response.text for indicator in CLOUDFLARE_INDICATORS):
+            self.logger.warning(f"AJAX 응답에서 Cloudflare 챌린지 감지 ({url}, {goods_no})")
+            self._record_block("cloudflare")
+            return None
+
+        return response.text
+
+    def _record_block(self, signal: str) -> None:
+        """차단 신호를 속도 제어기에 전달한다."""
+        if self.rate_controller:
+            self.rate_controller.record_block(signal)
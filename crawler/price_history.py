@@ -0,0 +1,203 @@
+"""월별 파티션 가격/재고 이력 저장소."""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from psycopg2 import errors
+    from psycopg2.extras import execute_values, RealDictCursor
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from .db_pool import PostgresConnectionPool
+from .utils import setup_logger
+
+
+class PriceHistoryStore:
+    """
+    product_price_history 테이블(append-only, recorded_at 기준 월별 RANGE 파티션) 저장소.
+
+    PostgresStorage.save가 content_hash가 바뀐 행만 넘기므로 이력에는 실제 변경만 쌓인다.
+    쓰기는 호출자의 커서/트랜잭션에서 수행해 본 테이블 upsert와 함께 커밋된다.
+    """
+
+    # 생성 시 미리 만들어 두는 다음 달 파티션 수 (월 경계에서 워커들이 동시에 만들지 않도록)
+    PRECREATE_MONTHS = 2
+
+    # 이력으로 남기는 칼럼
+    COLUMNS = (
+        'unique_item_id', 'goods_no', 'price', 'origin_price',
+        'is_discounted', 'is_soldout', 'option_info', 'content_hash', 'recorded_at'
+    )
+
+    def __init__(self, pool: PostgresConnectionPool, table_name: str = "product_price_history"):
+        """
+        이력 저장소를 초기화한다.
+
+        Args:
+            pool: 공유 연결 풀
+            table_name: 이력 테이블명 (파티션은 {table_name}_YYYYMM)
+        """
+        self.logger = setup_logger(self.__class__.__name__)
+        self.pool = pool
+        self.table_name = table_name
+
+        self.ensure_table()
+
+    def ensure_table(self) -> None:
+        """파티션 부모 테이블과 인덱스, 이번 달부터 PRECREATE_MONTHS달 뒤까지의 파티션이 없으면 생성한다 (scripts/init.sql과 동일)."""
+        with self.pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    unique_item_id VARCHAR(100) NOT NULL,
+                    goods_no VARCHAR(50) NOT NULL,
+                    price INTEGER,
+                    origin_price INTEGER,
+                    is_discounted BOOLEAN,
+                    is_soldout BOOLEAN,
+                    option_info TEXT,
+                    content_hash VARCHAR(64),
+                    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                ) PARTITION BY RANGE (recorded_at)
+            """)
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_goods_no "
+                f"ON {self.table_name}(goods_no, recorded_at DESC)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_unique_item_id "
+                f"ON {self.table_name}(unique_item_id, recorded_at DESC)"
+            )
+            month_start = date.today().replace(day=1)
+            for _ in range(self.PRECREATE_MONTHS + 1):
+                self._ensure_partition(cursor, month_start)
+                month_start = self._next_month(month_start)
+            conn.commit()
+
+    @staticmethod
+    def _next_month(month_start: date) -> date:
+        """다음 달 1일을 반환한다."""
+        return date(month_start.year + month_start.month // 12, month_start.month % 12 + 1, 1)
+
+    def _ensure_partition(self, cursor, month_start: date) -> None:
+        """
+        해당 달의 파티션이 없으면 생성한다.
+
+        호출자 트랜잭션이 롤백되면 파티션 생성도 함께 롤백되므로 결과를 캐시하지 않는다.
+        다른 워커가 같은 파티션을 동시에 만들면 IF NOT EXISTS로도 DuplicateTable/UniqueViolation이
+        날 수 있으므로 세이브포인트 안에서 생성하고, 이 경우 세이브포인트만 되돌리고 계속한다
+        (상대 트랜잭션이 커밋된 뒤에 오류가 나므로 파티션은 이미 존재한다).
+        """
+        partition = f"{self.table_name}_{month_start:%Y%m}"
+        cursor.execute("SELECT to_regclass(%s)", (partition,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            return
+
+        next_month = self._next_month(month_start)
+        cursor.execute("SAVEPOINT ensure_partition")
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {self.table_name} "
+                f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+            )
+        except (errors.DuplicateTable, errors.UniqueViolation):
+            cursor.execute("ROLLBACK TO SAVEPOINT ensure_partition")
+            self.logger.debug(f"다른 워커가 파티션을 먼저 생성: {partition}")
+        cursor.execute("RELEASE SAVEPOINT ensure_partition")
+
+    def append(self, cursor, items: List[Dict[str, Any]]) -> int:
+        """
+        변경된 상품의 가격/재고 상태를 이력에 추가한다 (커밋은 호출자가 한다).
+
+        Args:
+            cursor: 본 테이블 upsert와 같은 트랜잭션의 커서
+            items: DB 스키마로 변환된 데이터 (content_hash가 바뀐 행만)
+
+        Returns:
+            추가한 이력 수
+        """
+        if not items:
+            return 0
+
+        rows = []
+        months = set()
+        for item in items:
+            recorded_at = item.get('crawled_at') or datetime.now()
+            months.add(date(recorded_at.year, recorded_at.month, 1))
+            rows.append(tuple(
+                recorded_at if column == 'recorded_at' else item.get(column)
+                for column in self.COLUMNS
+            ))
+
+        for month_start in sorted(months):
+            self._ensure_partition(cursor, month_start)
+
+        execute_values(
+            cursor,
+            f"INSERT INTO {self.table_name} ({', '.join(self.COLUMNS)}) VALUES %s",
+            rows
+        )
+        return len(rows)
+
+    def price_series(self, goods_no: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        상품 하나의 가격/재고 변경 이력을 시간순으로 반환한다.
+
+        Args:
+            goods_no: 상품 번호
+            since: 이 시각 이후 이력만 조회 (None이면 전체)
+
+        Returns:
+            [{"recorded_at", "price", "origin_price", "is_discounted", "is_soldout"}, ...]
+        """
+        query = (
+            f"SELECT recorded_at, price, origin_price, is_discounted, is_soldout "
+            f"FROM {self.table_name} WHERE goods_no = %s"
+        )
+        params: List[Any] = [goods_no]
+        if since is not None:
+            query += " AND recorded_at >= %s"
+            params.append(since)
+        query += " ORDER BY recorded_at"
+
+        with self.pool.connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def price_drops(self, since: datetime, min_drop_pct: float) -> List[Dict[str, Any]]:
+        """
+        since 시점 가격 대비 현재 가격이 min_drop_pct% 이상 내린 상품을 찾는다.
+
+        since 시점 가격은 since 이전 마지막 이력, 현재 가격은 가장 최근 이력이다.
+
+        Args:
+            since: 기준 시각
+            min_drop_pct: 최소 하락률(%)
+
+        Returns:
+            하락률 내림차순 [{"unique_item_id", "goods_no", "price_before", "price_now", "drop_pct", "recorded_at"}, ...]
+        """
+        query = f"""
+            WITH baseline AS (
+                SELECT DISTINCT ON (unique_item_id) unique_item_id, goods_no, price
+                FROM {self.table_name}
+                WHERE recorded_at <= %s
+                ORDER BY unique_item_id, recorded_at DESC
+            ),
+            latest AS (
+                SELECT DISTINCT ON (unique_item_id) unique_item_id, price, recorded_at
+                FROM {self.table_name}
+                ORDER BY unique_item_id, recorded_at DESC
+            )
+            SELECT b.unique_item_id, b.goods_no, b.price AS price_before, l.price AS price_now,
+                   ROUND(100.0 * (b.price - l.price) / b.price, 2) AS drop_pct, l.recorded_at
+            FROM baseline b
+            JOIN latest l USING (unique_item_id)
+            WHERE b.price > 0 AND l.price <= b.price * (1 - %s / 100.0)
+            ORDER BY drop_pct DESC
+        """
+        with self.pool.connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(query, (since, min_drop_pct))
+            return [dict(row) for row in cursor.fetchall()]
@@ -0,0 +1,143 @@
+"""호스트 단위 AIMD 적응형 요청 속도 제어."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .scheduler import TokenBucket
+from .utils import setup_logger
+
+
+class AdaptiveRateController:
+    """
+    차단 신호에 따라 요청 속도와 동시 실행 수를 조절하는 AIMD 제어기.
+
+    정상 응답마다 속도/동시 실행 수를 조금씩 늘리고(additive increase), Cloudflare 차단,
+    로그인 페이지, 403 같은 차단 신호가 오면 비율로 줄인다(multiplicative decrease).
+    한 번의 차단이 여러 요청에서 동시에 관측될 수 있으므로 감소는 cooldown 간격으로 한 번만 적용한다.
+    요청 시작 간격은 내부 TokenBucket으로, 동시 실행 수는 slot()으로 제한한다.
+    """
+
+    # 속도 감소를 유발하는 신호
+    BLOCK_SIGNALS = ("cloudflare", "login", "http_403")
+
+    def __init__(
+        self,
+        host: str,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        max_concurrency: int = 1,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        cooldown: float = 5.0
+    ):
+        """
+        제어기를 초기화한다.
+
+        Args:
+            host: 제어 대상 호스트 (로그/지표 구분용)
+            initial_rate: 초기 초당 요청 수
+            min_rate: 최소 초당 요청 수
+            max_rate: 최대 초당 요청 수 (None이면 initial_rate의 5배)
+            max_concurrency: 최대 동시 실행 수 (시작은 1)
+            increase_step: 정상 응답 누적 시 초당 요청 수 증가 폭 (약 rate번 성공마다 한 번)
+            decrease_factor: 차단 신호 시 곱할 감소 비율
+            cooldown: 연속 감소를 막는 최소 간격(초)
+        """
+        self.host = host
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else initial_rate * 5
+        self.max_concurrency = max(1, max_concurrency)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self.rate = min(max(initial_rate, min_rate), self.max_rate)
+        self.concurrency = 1.0
+        self.bucket = TokenBucket(self.rate)
+
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._last_decrease_at = 0.0
+        self._successes = 0
+        self._blocks: Dict[str, int] = {signal: 0 for signal in self.BLOCK_SIGNALS}
+
+    @property
+    def concurrency_limit(self) -> int:
+        """현재 허용된 동시 실행 수."""
+        return max(1, min(self.max_concurrency, int(self.concurrency)))
+
+    async def acquire(self) -> None:
+        """다음 요청을 시작할 수 있을 때까지 대기한다 (토큰 버킷)."""
+        await self.bucket.acquire()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """현재 동시 실행 한도 안에서 작업 슬롯을 점유한다."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.concurrency_limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """정상 응답을 기록하고 속도/동시 실행 수를 조금 늘린다."""
+        self._successes += 1
+        previous_limit = self.concurrency_limit
+
+        self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+        self.concurrency = min(float(self.max_concurrency), self.concurrency + 1.0 / self.concurrency)
+        self.bucket.set_rate(self.rate)
+
+        if self.concurrency_limit != previous_limit:
+            self.logger.info(f"[{self.host}] 동시 실행 수 증가: {previous_limit} → {self.concurrency_limit} ({self.format_metrics()})")
+
+    def record_block(self, signal: str) -> None:
+        """
+        차단 신호를 기록하고 cooldown이 지났으면 속도/동시 실행 수를 줄인다.
+
+        Args:
+            signal: 차단 신호 종류 (BLOCK_SIGNALS 중 하나)
+        """
+        self._blocks[signal] = self._blocks.get(signal, 0) + 1
+
+        now = time.monotonic()
+        if now - self._last_decrease_at < self.cooldown:
+            return
+        self._last_decrease_at = now
+
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.concurrency = max(1.0, self.concurrency * self.decrease_factor)
+        self.bucket.set_rate(self.rate)
+        self.logger.warning(f"[{self.host}] 차단 신호({signal}) - 속도 감소 ({self.format_metrics()})")
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        현재 제어 상태를 지표로 반환한다.
+
+        Returns:
+            host, rate(초당 요청 수), concurrency(동시 실행 한도), in_flight, successes, blocks
+        """
+        return {
+            "host": self.host,
+            "rate": round(self.rate, 3),
+            "concurrency": self.concurrency_limit,
+            "in_flight": self._in_flight,
+            "successes": self._successes,
+            "blocks": dict(self._blocks),
+        }
+
+    def format_metrics(self) -> str:
+        """로그용 지표 문자열."""
+        blocks = sum(self._blocks.values())
+        return (
+            f"rate={self.rate:.2f}/s, concurrency={self.concurrency_limit}, "
+            f"in_flight={self._in_flight}, success={self._successes}, blocked={blocks}"
+        )
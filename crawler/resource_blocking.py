@@ -0,0 +1,219 @@
+"""Playwright 라우트 핸들러용 사전 컴파일 리소스 차단 규칙."""
+
+import json
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Pattern
+
+from .utils import setup_logger
+
+
+# 확장자/광고·추적 도메인은 모든 리소스 타입에 공통으로 적용
+_MEDIA_EXTENSIONS = [r"\.(?:woff2?|ttf|otf|eot|mp4|avi|mov|wmv|mp3|wav|ogg)"]
+_AD_DOMAINS = [
+    r"google-analytics\.com", r"googletagmanager\.com", r"facebook\.com/tr", r"doubleclick\.net",
+    r"googlesyndication\.com", r"adsystem\.com", r"ads\.yahoo\.com",
+]
+
+# 규칙 형식 (RESOURCE_BLOCK_RULES 파일도 같은 형식의 {프로필명: 규칙} JSON):
+#   allow: 타입과 관계없이 항상 통과시킬 URL 정규식 (가장 먼저 검사)
+#   types: 리소스 타입별 규칙. "block"/"allow" 또는 {"allow": [...], "block": [...], "default": "block"|"allow"}
+#          default가 없으면 타입 규칙에 걸리지 않은 요청은 공통 block 목록으로 넘어간다.
+#   block: 타입 규칙으로 결정되지 않은 요청에 적용할 URL 정규식
+# 정규식은 대소문자를 구분하지 않는다.
+BUILTIN_PROFILES: Dict[str, Dict[str, Any]] = {
+    # BaseCrawler: 이미지/폰트/미디어/광고 차단
+    "default": {
+        "types": {
+            "image": "block",
+            "font": "block",
+            "media": "block",
+            "stylesheet": {"block": ["font", "icon", "ads"]},
+        },
+        "block": _MEDIA_EXTENSIONS + _AD_DOMAINS,
+    },
+    # OliveyoungCrawler.create_context: 상품 이미지는 동적 콘텐츠 로딩에 필요하므로 허용
+    "oliveyoung_page": {
+        "types": {
+            "image": {"allow": [r"^(?=.*oliveyoung\.co\.kr)(?=.*(?:goods|product|prd))"], "default": "block"},
+            "font": "block",
+            "media": "block",
+            "stylesheet": {"block": ["font", "icon", "ads"]},
+        },
+        "block": _MEDIA_EXTENSIONS + _AD_DOMAINS,
+    },
+    # OliveyoungCookieManager 크롤링 컨텍스트: 옵션/상세정보 AJAX는 항상 통과, CSS 전부 차단
+    "oliveyoung": {
+        "allow": [r"/getGoodsArtcAjax\.do", r"/getOptInfoListAjax\.do"],
+        "types": {
+            "stylesheet": "block",
+            "image": {"allow": [r"oliveyoung\.co\.kr", "cloudfront"], "default": "block"},
+            "font": "block",
+            "media": "block",
+        },
+        "block": _MEDIA_EXTENSIONS + _AD_DOMAINS[:6] + ["datadog", "amplitude"],
+    },
+}
+
+
+def _compile(patterns: Optional[Iterable[str]]) -> Optional[Pattern]:
+    """정규식 목록을 하나의 대안(|) 정규식으로 컴파일한다 (비어 있으면 None)."""
+    patterns = list(patterns or [])
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+class _TypeRule:
+    """리소스 타입 하나의 허용/차단 규칙."""
+
+    def __init__(self, rule: Any):
+        if isinstance(rule, str):
+            rule = {"default": rule}
+        self.allow = _compile(rule.get("allow"))
+        self.block = _compile(rule.get("block"))
+        default = rule.get("default")
+        self.default: Optional[bool] = None if default is None else default == "block"
+
+    def decide(self, url: str) -> Optional[bool]:
+        """차단이면 True, 허용이면 False, 결정하지 않으면 None."""
+        if self.allow and self.allow.search(url):
+            return False
+        if self.block and self.block.search(url):
+            return True
+        return self.default
+
+
+class ResourceBlocker:
+    """
+    컨텍스트 라우트 핸들러에서 요청마다 차단 여부를 결정하는 규칙 엔진.
+
+    규칙은 생성 시 한 번만 정규식으로 컴파일하고, 요청마다 타입별 규칙(dict 조회)을 먼저 적용한 뒤
+    필요할 때만 URL 정규식 하나를 검사한다. 허용/차단 요청 수와 허용된 응답의 전송 바이트
+    (content-length)를 타입별로 집계한다. 차단된 요청은 내려받지 않으므로 바이트 대신 요청 수만 센다.
+    """
+
+    # 규칙 파일 경로 환경변수 ({프로필명: 규칙} JSON, 없는 프로필은 내장 규칙 사용)
+    RULES_ENV = "RESOURCE_BLOCK_RULES"
+
+    def __init__(self, rules: Dict[str, Any], name: str = "default"):
+        """
+        규칙을 컴파일한다.
+
+        Args:
+            rules: allow/types/block 규칙 딕셔너리
+            name: 통계 로깅용 프로필명
+        """
+        self.name = name
+        self.logger = setup_logger(self.__class__.__name__)
+        self._allow = _compile(rules.get("allow"))
+        self._block = _compile(rules.get("block"))
+        self._types = {resource_type: _TypeRule(rule) for resource_type, rule in rules.get("types", {}).items()}
+
+        self.blocked: Counter = Counter()
+        self.allowed: Counter = Counter()
+        self.allowed_bytes: Counter = Counter()
+
+    @classmethod
+    def from_file(cls, path: str, profile: str) -> "ResourceBlocker":
+        """
+        JSON 규칙 파일에서 프로필을 읽어 생성한다.
+
+        Args:
+            path: {프로필명: 규칙} JSON 파일 경로
+            profile: 사용할 프로필명
+
+        Returns:
+            ResourceBlocker 인스턴스
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            profiles = json.load(f)
+        if profile not in profiles:
+            raise KeyError(f"리소스 차단 규칙 파일에 '{profile}' 프로필이 없습니다: {path}")
+        return cls(profiles[profile], name=profile)
+
+    @classmethod
+    def for_profile(cls, profile: str) -> "ResourceBlocker":
+        """
+        RESOURCE_BLOCK_RULES 파일에 프로필이 있으면 그 규칙을, 없으면 내장 규칙을 사용한다.
+
+        Args:
+            profile: 프로필명 ("default", "oliveyoung", "oliveyoung_page")
+
+        Returns:
+            ResourceBlocker 인스턴스
+        """
+        rules_file = os.getenv(cls.RULES_ENV)
+        if rules_file:
+            try:
+                return cls.from_file(rules_file, profile)
+            except KeyError:
+                pass
+            except (OSError, ValueError) as e:
+                setup_logger(cls.__name__).warning(f"리소스 차단 규칙 파일 로드 실패, 내장 규칙 사용: {e}")
+        return cls(BUILTIN_PROFILES[profile], name=profile)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        요청을 차단할지 결정한다.
+
+        Args:
+            resource_type: Playwright request.resource_type
+            url: 요청 URL
+
+        Returns:
+            차단 여부
+        """
+        if self._allow and self._allow.search(url):
+            return False
+        rule = self._types.get(resource_type)
+        if rule is not None:
+            decision = rule.decide(url)
+            if decision is not None:
+                return decision
+        return bool(self._block and self._block.search(url))
+
+    async def attach(self, context) -> None:
+        """
+        컨텍스트의 모든 요청에 규칙을 적용하고 허용된 응답 크기를 집계한다.
+
+        Args:
+            context: Playwright 브라우저 컨텍스트
+        """
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+
+    async def _handle_route(self, route) -> None:
+        """라우트 핸들러 (요청마다 호출)."""
+        request = route.request
+        resource_type = request.resource_type
+        if self.should_block(resource_type, request.url):
+            self.blocked[resource_type] += 1
+            await route.abort()
+        else:
+            self.allowed[resource_type] += 1
+            await route.continue_()
+
+    def _on_response(self, response) -> None:
+        """허용된 응답의 전송 크기(content-length)를 타입별로 더한다."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.allowed_bytes[response.request.resource_type] += int(length)
+
+    def format_stats(self) -> str:
+        """
+        차단/허용 통계를 로그용 문자열로 반환한다.
+
+        Returns:
+            "차단 N건 (image 10, font 3) / 허용 M건 1.2MB (document 0.5MB, ...)" 형식 문자열
+        """
+        def by_type(counter: Counter, unit=lambda value: str(value)) -> str:
+            return ", ".join(f"{resource_type} {unit(value)}" for resource_type, value in counter.most_common(5))
+
+        mb = lambda value: f"{value / 1024 / 1024:.1f}MB"
+        return (
+            f"[{self.name}] 차단 {sum(self.blocked.values())}건 ({by_type(self.blocked)}) / "
+            f"허용 {sum(self.allowed.values())}건 {mb(sum(self.allowed_bytes.values()))} "
+            f"({by_type(self.allowed_bytes, mb)})"
+        )
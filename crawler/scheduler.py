@@ -0,0 +1,197 @@
+"""슬라이딩 윈도우 방식 크롤링 스케줄러."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .utils import setup_logger
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰을 채우는 토큰 버킷 속도 제한기.
+
+    고정 지연 대신 요청 시작 간격을 평균 rate로 맞추고, capacity만큼의 순간 버스트를 허용한다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        토큰 버킷을 초기화한다.
+
+        Args:
+            rate: 초당 토큰 충전량 (초당 허용 요청 수)
+            capacity: 최대 토큰 수 (None이면 max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰을 충전한다."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def set_rate(self, rate: float) -> None:
+        """
+        충전 속도를 변경한다 (이미 쌓인 토큰은 유지).
+
+        Args:
+            rate: 새 초당 토큰 충전량
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self._refill()
+        self.rate = rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        토큰을 얻을 때까지 대기한다.
+
+        Args:
+            tokens: 소비할 토큰 수
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class SlidingWindowScheduler:
+    """
+    동시 실행 수를 window로 제한하며 하나가 끝나는 즉시 다음 작업을 시작하는 스케줄러.
+
+    배치 단위 gather와 달리 가장 느린 작업을 기다리지 않으며, 결과는 비동기 큐를 통해
+    별도 writer 태스크로 흘려보내 flush_size개 단위(또는 flush_interval초 경과 시)로 저장한다.
+    """
+
+    def __init__(
+        self,
+        worker: Callable[[str], Awaitable[Optional[Dict[str, Any]]]],
+        window: int,
+        rate_limiter: Optional[TokenBucket] = None,
+        on_flush: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        flush_size: int = 50,
+        flush_interval: float = 10.0
+    ):
+        """
+        스케줄러를 초기화한다.
+
+        Args:
+            worker: 식별자 하나를 처리해 결과(또는 None)를 반환하는 코루틴 함수
+            window: 동시에 실행할 최대 작업 수
+            rate_limiter: 작업 시작 속도를 제한할 토큰 버킷 (None이면 제한 없음)
+            on_flush: 결과 묶음을 저장하는 동기 함수 (writer 태스크에서 스레드로 실행)
+            flush_size: 저장 단위 결과 수
+            flush_interval: 결과가 flush_size에 못 미쳐도 저장할 최대 대기 시간(초)
+        """
+        self.worker = worker
+        self.window = max(1, window)
+        self.rate_limiter = rate_limiter
+        self.on_flush = on_flush
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
+        self.logger = setup_logger(self.__class__.__name__)
+
+        self.completed = 0
+        self.succeeded = 0
+        self.saved = 0
+
+    async def run(self, identifiers: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        모든 식별자를 처리하고 성공한 결과 목록을 반환한다.
+
+        Args:
+            identifiers: 처리할 식별자 목록
+
+        Returns:
+            성공한 결과 목록 (입력 순서가 아닌 완료 순서)
+        """
+        results: List[Dict[str, Any]] = []
+        result_queue: asyncio.Queue = asyncio.Queue()
+        window = asyncio.Semaphore(self.window)
+        writer = asyncio.create_task(self._writer(result_queue))
+        in_flight = set()
+        started_at = time.monotonic()
+
+        async def run_one(identifier: str) -> None:
+            try:
+                result = await self.worker(identifier)
+            except Exception as e:
+                self.logger.error(f"작업 실패 ({identifier}): {e}")
+                result = None
+            finally:
+                window.release()
+
+            self.completed += 1
+            if isinstance(result, dict):
+                self.succeeded += 1
+                results.append(result)
+                await result_queue.put(result)
+
+        try:
+            for identifier in identifiers:
+                await window.acquire()
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                task = asyncio.create_task(run_one(identifier))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            for task in list(in_flight):
+                task.cancel()
+            await result_queue.put(None)
+            await writer
+
+        elapsed = time.monotonic() - started_at
+        throughput = self.completed / elapsed if elapsed > 0 else 0.0
+        self.logger.info(
+            f"스케줄러 완료: {self.succeeded}/{self.completed}개 성공, 저장 {self.saved}개, "
+            f"처리율 {throughput:.2f}개/초"
+        )
+        return results
+
+    async def _writer(self, result_queue: asyncio.Queue) -> None:
+        """결과 큐를 소비해 flush_size/flush_interval 단위로 저장한다."""
+        buffer: List[Dict[str, Any]] = []
+
+        while True:
+            try:
+                item = await asyncio.wait_for(result_queue.get(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                await self._flush(buffer)
+                continue
+
+            if item is None:
+                break
+
+            buffer.append(item)
+            if len(buffer) >= self.flush_size:
+                await self._flush(buffer)
+
+        await self._flush(buffer)
+
+    async def _flush(self, buffer: List[Dict[str, Any]]) -> None:
+        """버퍼의 결과를 저장하고 비운다."""
+        if not buffer or not self.on_flush:
+            buffer.clear()
+            return
+
+        batch = list(buffer)
+        buffer.clear()
+        try:
+            await asyncio.to_thread(self.on_flush, batch)
+            self.saved += len(batch)
+            self.logger.info(f"결과 {len(batch)}개 저장 (누적: {self.saved}개, 진행: {self.completed}개)")
+        except Exception as e:
+            self.logger.error(f"결과 저장 실패 ({len(batch)}개): {e}")
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Union
 from pathlib import Path
 import json
 import logging
+import os
 
 try:
     import pandas as pd
@@ -68,14 +69,21 @@ class ExcelStorage(BaseStorage):
     PostgreSQL 마이그레이션을 위해 호환 가능한 스키마를 유지한다.
     """
     
-    def __init__(self, file_path: str):
+    JOURNAL_SUFFIX = ".journal.jsonl"
+    COLUMN_ORDER = ['branduid', 'name', 'price', 'options', 'image_urls', 'detail_html']
+    
+    def __init__(self, file_path: str, journal: bool = False):
         """
         Excel 저장소를 초기화한다.
         
         Args:
             file_path: Excel 파일 경로
+            journal: True이면 배치를 append-only JSONL 저널에 기록하고
+                Excel 파일은 materialize() 호출 시 한 번만 생성한다
         """
         self.file_path = Path(file_path)
+        self.journal = journal
+        self.journal_path = self.file_path.with_name(self.file_path.name + self.JOURNAL_SUFFIX)
         
         # 로거 설정 - setup_logger와 동일한 핸들러 사용
         from .utils import setup_logger
@@ -91,8 +99,14 @@ class ExcelStorage(BaseStorage):
         # 디렉토리 생성
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # 기존 데이터 로드 (있는 경우)
-        self.data = self._load_existing_data()
+        # 저널 모드에서는 기존 Excel을 미리 읽지 않는다 (materialize 시 한 번만 로드)
+        if self.journal:
+            self.data = []
+            if self.journal_path.exists():
+                self.logger.info(f"이전 실행의 저널 발견 (materialize 시 병합): {self.journal_path}")
+        else:
+            # 기존 데이터 로드 (있는 경우)
+            self.data = self._load_existing_data()
     
     def _load_existing_data(self) -> List[Dict[str, Any]]:
         """
@@ -121,18 +135,23 @@ class ExcelStorage(BaseStorage):
         - UsedRange 문제 → 새 파일 생성으로 회피
         - 메모리 오버헤드 → 스트리밍 방식으로 최소화
         
+        저널 모드에서는 Excel을 다시 쓰지 않고 JSONL 저널에 append만 한다.
+        
         Args:
             data: 저장할 데이터 (단일 또는 리스트)
             
         Returns:
             저장 성공 여부
         """
+        # 단일 데이터를 리스트로 변환
+        if isinstance(data, dict):
+            data = [data]
+
+        if self.journal:
+            return self._append_journal(data)
+
         try:
             import xlsxwriter
-            
-            # 단일 데이터를 리스트로 변환
-            if isinstance(data, dict):
-                data = [data]
 
             # 기존 Excel 파일에서 데이터 로드 (메모리 절약을 위해 매번 로드)
             existing_data = []
@@ -149,30 +168,8 @@ class ExcelStorage(BaseStorage):
             # self.data는 누적하지 않고 현재 배치만 유지 (메모리 절약)
             self.data = all_data
 
-            # DataFrame으로 변환
-            df = pd.DataFrame(all_data)
-            
-            # FIX ME: 스키마 변경 시 컬럼 순서 및 타입 조정 필요
-            # 현재 스키마: branduid, name, price, options, image_urls, detail_html
-            column_order = ['branduid', 'name', 'price', 'options', 'image_urls', 'detail_html']
-            
-            # 컬럼 순서 정렬 (없는 컬럼은 무시)
-            existing_columns = [col for col in column_order if col in df.columns]
-            additional_columns = [col for col in df.columns if col not in column_order]
-            final_columns = existing_columns + additional_columns
-            
-            if final_columns:
-                df = df[final_columns]
-            
-            # 리스트 타입 컬럼을 문자열로 변환 (Excel 호환성)
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    df[col] = df[col].apply(lambda x: json.dumps(x, ensure_ascii=False) if isinstance(x, list) else x)
-            
             # xlsxwriter 엔진을 사용한 빠른 저장
-            with pd.ExcelWriter(self.file_path, engine='xlsxwriter', 
-                              engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
-                df.to_excel(writer, index=False, sheet_name='Sheet1')
+            self._write_excel(all_data)
             
             self.logger.info(f"데이터 저장 완료: {len(data)}개 항목 → {self.file_path}")
             return True
@@ -182,21 +179,7 @@ class ExcelStorage(BaseStorage):
             self.logger.warning("xlsxwriter를 찾을 수 없어 openpyxl 방식으로 저장합니다.")
             try:
                 # DataFrame으로 변환
-                df = pd.DataFrame(self.data)
-                
-                # 컬럼 순서 정렬
-                column_order = ['branduid', 'name', 'price', 'options', 'image_urls', 'detail_html']
-                existing_columns = [col for col in column_order if col in df.columns]
-                additional_columns = [col for col in df.columns if col not in column_order]
-                final_columns = existing_columns + additional_columns
-                
-                if final_columns:
-                    df = df[final_columns]
-                
-                # 리스트 타입 컬럼을 문자열로 변환
-                for col in df.columns:
-                    if df[col].dtype == 'object':
-                        df[col] = df[col].apply(lambda x: json.dumps(x, ensure_ascii=False) if isinstance(x, list) else x)
+                df = self._to_dataframe(self.data)
                 
                 # openpyxl 엔진으로 저장
                 df.to_excel(self.file_path, index=False, engine='openpyxl')
@@ -212,16 +195,144 @@ class ExcelStorage(BaseStorage):
             self.logger.error(f"데이터 저장 실패: {str(e)}")
             return False
     
+    def _to_dataframe(self, rows: List[Dict[str, Any]]) -> "pd.DataFrame":
+        """
+        저장용 DataFrame을 생성한다 (컬럼 순서 정렬 + 리스트 컬럼 직렬화).
+        
+        Args:
+            rows: 저장할 데이터 목록
+            
+        Returns:
+            Excel 저장용 DataFrame
+        """
+        df = pd.DataFrame(rows)
+        
+        # FIX ME: 스키마 변경 시 컬럼 순서 및 타입 조정 필요
+        # 컬럼 순서 정렬 (없는 컬럼은 무시)
+        existing_columns = [col for col in self.COLUMN_ORDER if col in df.columns]
+        additional_columns = [col for col in df.columns if col not in self.COLUMN_ORDER]
+        final_columns = existing_columns + additional_columns
+        
+        if final_columns:
+            df = df[final_columns]
+        
+        # 리스트 타입 컬럼을 문자열로 변환 (Excel 호환성)
+        for col in df.columns:
+            if df[col].dtype == 'object':
+                df[col] = df[col].apply(lambda x: json.dumps(x, ensure_ascii=False) if isinstance(x, list) else x)
+        
+        return df
+    
+    def _write_excel(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        전체 데이터를 xlsxwriter 엔진으로 Excel 파일에 기록한다.
+        
+        Args:
+            rows: 저장할 전체 데이터 목록
+        """
+        df = self._to_dataframe(rows)
+        with pd.ExcelWriter(self.file_path, engine='xlsxwriter', 
+                          engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
+            df.to_excel(writer, index=False, sheet_name='Sheet1')
+    
+    def _append_journal(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        배치를 append-only JSONL 저널에 기록한다.
+        
+        기존 데이터 양과 무관하게 배치 크기에 비례하는 비용만 든다.
+        
+        Args:
+            rows: 저장할 데이터 목록
+            
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            
+            self.logger.info(f"저널 기록 완료: {len(rows)}개 항목 → {self.journal_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"저널 기록 실패: {str(e)}")
+            return False
+    
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        저널 파일의 모든 레코드를 읽는다.
+        
+        마지막 줄이 중단된 쓰기로 잘려 있으면 해당 줄만 건너뛴다.
+        
+        Returns:
+            저널에 기록된 데이터 목록
+        """
+        if not self.journal_path.exists():
+            return []
+        
+        rows = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self.logger.warning(f"손상된 저널 레코드 건너뜀: {self.journal_path}:{line_no}")
+        return rows
+    
+    def materialize(self) -> bool:
+        """
+        저널에 쌓인 데이터를 기존 Excel 데이터와 병합해 Excel 파일을 한 번에 생성한다.
+        
+        크롤링 종료 시 또는 필요할 때 호출한다. 성공하면 저널 파일은 삭제된다.
+        
+        Returns:
+            생성 성공 여부
+        """
+        try:
+            journal_rows = self._read_journal()
+            if not journal_rows:
+                self.logger.info("materialize할 저널 데이터가 없습니다.")
+                return True
+            
+            existing_data = []
+            if self.file_path.exists():
+                try:
+                    existing_data = pd.read_excel(self.file_path).to_dict('records')
+                except Exception as e:
+                    self.logger.warning(f"기존 파일 로드 실패 (새로 생성): {str(e)}")
+            
+            self._write_excel(existing_data + journal_rows)
+            self.journal_path.unlink()
+            
+            self.logger.info(
+                f"저널 materialize 완료: {len(journal_rows)}개 항목 추가 "
+                f"(총 {len(existing_data) + len(journal_rows)}개) → {self.file_path}"
+            )
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"저널 materialize 실패: {str(e)}")
+            return False
+    
     def load(self) -> List[Dict[str, Any]]:
         """
         Excel 파일에서 데이터를 로드한다.
         
+        저널에 아직 materialize되지 않은 데이터가 있으면 함께 반환한다.
+        
         Returns:
             로드된 데이터 목록
         """
         try:
+            journal_rows = self._read_journal()
+            
             if not self.file_path.exists():
-                return []
+                return journal_rows
             
             df = pd.read_excel(self.file_path)
             
@@ -230,7 +341,7 @@ class ExcelStorage(BaseStorage):
                 if col in ['options', 'image_urls']:
                     df[col] = df[col].apply(lambda x: json.loads(x) if isinstance(x, str) and x.startswith('[') else x)
             
-            return df.to_dict('records')
+            return df.to_dict('records') + journal_rows
             
         except Exception as e:
             self.logger.error(f"데이터 로드 실패: {str(e)}")
@@ -248,6 +359,9 @@ class ExcelStorage(BaseStorage):
                 self.file_path.unlink()
                 self.data = []
                 self.logger.info(f"데이터 파일 삭제 완료: {self.file_path}")
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+                self.logger.info(f"저널 파일 삭제 완료: {self.journal_path}")
             return True
         except Exception as e:
             self.logger.error(f"데이터 파일 삭제 실패: {str(e)}")
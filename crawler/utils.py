@@ -105,6 +105,24 @@ def get_random_viewport() -> dict:
     return random.choice(viewports)
 
 
+def headless_from_env(default: bool = False) -> bool:
+    """
+    환경변수 CRAWLER_HEADLESS로 headless 모드 여부를 결정한다.
+    
+    Makefile(HEADLESS=true)과 gradio에서 실행하는 스크립트까지 같은 설정이 전달되도록 환경변수를 사용한다.
+    
+    Args:
+        default: 환경변수가 없거나 비어 있을 때의 값
+        
+    Returns:
+        headless 모드 여부 ("1", "true", "yes", "on"이면 True)
+    """
+    value = os.getenv('CRAWLER_HEADLESS', '').strip().lower()
+    if not value:
+        return default
+    return value in ('1', 'true', 'yes', 'on')
+
+
 async def random_delay(min_seconds: float = 2.0, max_seconds: float = 3.0) -> None:
     """
     랜덤한 시간 동안 비동기 대기한다.
@@ -55,13 +55,14 @@ def save_category_file(filepath: str, categories: list[str]):
             f.write(f"{category}\n")
 
 
-def run_command_streaming(cmd: list[str], task_id: str) -> Generator[str, None, None]:
+def run_command_streaming(cmd: list[str], task_id: str, extra_env: Optional[dict] = None) -> Generator[str, None, None]:
     """
     셸 명령어를 실행하고 실시간으로 출력을 스트리��
 
     Args:
         cmd: 실행할 명령어 리스트
         task_id: 작업 ID (프로세스 추적용)
+        extra_env: 추가로 설정할 환경변수
 
     Yields:
         실시간 출력 문자열
@@ -81,6 +82,8 @@ def run_command_streaming(cmd: list[str], task_id: str) -> Generator[str, None,
         # unbuffered 모드로 실행
         env = os.environ.copy()
         env['PYTHONUNBUFFERED'] = '1'
+        if extra_env:
+            env.update(extra_env)
 
         # 프로세스 그룹 생성 (자식 프로세스도 함께 종료하기 위해)
         process = subprocess.Popen(
@@ -224,7 +227,7 @@ def install_dependencies():
         yield output
 
 
-def oliveyoung_crawl(max_items: int, output_filename: str, save_to_db: bool, selected_categories: list):
+def oliveyoung_crawl(max_items: int, output_filename: str, save_to_db: bool, selected_categories: list, headless: bool = False):
     """Oliveyoung 크롤링 실행"""
     import shutil
 
@@ -253,6 +256,8 @@ def oliveyoung_crawl(max_items: int, output_filename: str, save_to_db: bool, sel
 
         if save_to_db:
             env_vars["USE_DB"] = "true"
+        if headless:
+            env_vars["HEADLESS"] = "true"
 
         cmd = ["make", "oliveyoung-crawl"] + [f"{k}={v}" for k, v in env_vars.items()]
 
@@ -267,7 +272,8 @@ def oliveyoung_crawl(max_items: int, output_filename: str, save_to_db: bool, sel
             os.remove(backup_file)
 
 
-def oliveyoung_crawl_new(existing_excel: str, max_items: int, output_filename: str, save_to_db: bool, selected_categories: list):
+def oliveyoung_crawl_new(existing_excel: str, max_items: int, output_filename: str, save_to_db: bool, selected_categories: list,
+                         headless: bool = False):
     """Oliveyoung 최신 상품 크롤링"""
     import shutil
 
@@ -297,6 +303,8 @@ def oliveyoung_crawl_new(existing_excel: str, max_items: int, output_filename: s
 
         if save_to_db:
             env_vars["USE_DB"] = "true"
+        if headless:
+            env_vars["HEADLESS"] = "true"
 
         cmd = ["make", "oliveyoung-crawl-new"] + [f"{k}={v}" for k, v in env_vars.items()]
 
@@ -360,7 +368,7 @@ def upload_celeb():
         yield output
 
 
-def oliveyoung_crawl_new_from_db(max_items: int, selected_categories: list):
+def oliveyoung_crawl_new_from_db(max_items: int, selected_categories: list, headless: bool = False):
     """DB 기반 새상품 크롤링 (crawled_products 중복 확인)"""
     import shutil
 
@@ -390,7 +398,8 @@ def oliveyoung_crawl_new_from_db(max_items: int, selected_categories: list):
         ]
 
         task_id = f"oliveyoung_crawl_new_db_{int(time.time())}"
-        for output in run_command_streaming(cmd, task_id):
+        extra_env = {"CRAWLER_HEADLESS": "true"} if headless else None
+        for output in run_command_streaming(cmd, task_id, extra_env):
             yield output
 
     finally:
@@ -469,7 +478,9 @@ with gr.Blocks(title="크롤러 컨트롤 패널", theme=gr.themes.Soft()) as de
                     with gr.Row():
                         oy_max_items = gr.Number(label="카테고리당 최대 아이템 수", value=1, precision=0)
                         oy_output_filename = gr.Textbox(label="출력 파일명", value="oliveyoung_products_0812.xlsx")
-                    oy_save_db = gr.Checkbox(label="PostgreSQL에도 저장", value=False)
+                    with gr.Row():
+                        oy_save_db = gr.Checkbox(label="PostgreSQL에도 저장", value=False)
+                        oy_headless = gr.Checkbox(label="헤드리스 모드 (브라우저 화면 없이 실행)", value=False)
                     with gr.Row():
                         oy_crawl_btn = gr.Button("크롤링 시작", variant="primary", scale=4)
                         oy_stop_btn = gr.Button("중지", variant="stop", scale=1)
@@ -477,7 +488,7 @@ with gr.Blocks(title="크롤러 컨트롤 패널", theme=gr.themes.Soft()) as de
 
                     oy_crawl_btn.click(
                         oliveyoung_crawl,
-                        inputs=[oy_max_items, oy_output_filename, oy_save_db, category_full],
+                        inputs=[oy_max_items, oy_output_filename, oy_save_db, category_full, oy_headless],
                         outputs=oy_crawl_output,
                         show_progress="full"
                     )
@@ -549,20 +560,25 @@ with gr.Blocks(title="크롤러 컨트롤 패널", theme=gr.themes.Soft()) as de
                         outputs=[excel_group, db_group]
                     )
 
+                    oy_new_headless = gr.Checkbox(label="헤드리스 모드 (브라우저 화면 없이 실행)", value=False)
+
                     with gr.Row():
                         oy_new_crawl_btn = gr.Button("새상품 크롤링 시작", variant="primary", scale=4)
                         oy_new_stop_btn = gr.Button("중지", variant="stop", scale=1)
                     oy_new_crawl_output = gr.Textbox(label="실행 결과", lines=15, max_lines=30, autoscroll=True)
 
-                    def new_crawl_wrapper(source, existing_excel, new_max_items, new_output_filename, db_max_items, category_new):
+                    def new_crawl_wrapper(source, existing_excel, new_max_items, new_output_filename, db_max_items, category_new,
+                                          headless):
                         if source == "Excel 기반":
-                            return oliveyoung_crawl_new(existing_excel, new_max_items, new_output_filename, False, category_new)
+                            return oliveyoung_crawl_new(existing_excel, new_max_items, new_output_filename, False, category_new,
+                                                        headless)
                         else:
-                            return oliveyoung_crawl_new_from_db(db_max_items, category_new)
+                            return oliveyoung_crawl_new_from_db(db_max_items, category_new, headless)
 
                     oy_new_crawl_btn.click(
                         new_crawl_wrapper,
-                        inputs=[new_source, oy_existing_excel, oy_new_max_items, oy_new_output_filename, oy_db_max_items, category_new],
+                        inputs=[new_source, oy_existing_excel, oy_new_max_items, oy_new_output_filename, oy_db_max_items, category_new,
+                                oy_new_headless],
                         outputs=oy_new_crawl_output,
                         show_progress="full"
                     )
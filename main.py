@@ -11,6 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from crawler.asmama import AsmamaCrawler
+from crawler.checkpoint import CrawlCheckpoint
 from crawler.oliveyoung import OliveyoungCrawler
 from crawler.storage import ExcelStorage
 from crawler.utils import setup_logger
@@ -31,6 +32,8 @@ def main():
     2. 특정 카테고리: --category-id 100000100010001 --max-items-per-category 20
     3. 모든 카테고리: --all-categories --max-items-per-category 15
     4. 기존 URL 방식: --list-url "https://www.oliveyoung.co.kr/store/display/getMCategoryList.do?dispCatNo=..."
+    5. 분산 크롤링: --all-categories --enqueue-jobs 로 작업 등록 후 각 노드에서 --queue-worker 실행
+    6. 가격/품절 갱신: --refresh [--refresh-limit 5000] (crawled_products의 상품을 오래 확인하지 않은 순서로)
     """
     parser = argparse.ArgumentParser(description="웹 제품 크롤러 (Asmama / Oliveyoung)")
     
@@ -107,6 +110,90 @@ def main():
         help="출력 Excel 파일 경로",
         default=None
     )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        help="브라우저를 화면 없이 실행 (--no-headless: 화면 표시, 미지정 시 환경변수 CRAWLER_HEADLESS, 기본: 화면 표시)",
+        default=None
+    )
+    parser.add_argument(
+        "--identities",
+        type=int,
+        help="Oliveyoung 상품 페이지를 나눠 요청할 독립 쿠키 세션 수 (세션마다 쿠키 파일/UA/viewport 분리, 기본: 1)",
+        default=1
+    )
+    parser.add_argument(
+        "--refresh-categories",
+        action="store_true",
+        help="Oliveyoung 카테고리 트리 캐시(oy_categories.json)를 무시하고 메인 페이지에서 다시 추출",
+        default=False
+    )
+    parser.add_argument(
+        "--no-journal",
+        action="store_true",
+        help="Oliveyoung 크롤링 시 저널 없이 배치마다 Excel 파일을 다시 씀 (기존 방식)",
+        default=False
+    )
+    parser.add_argument(
+        "--materialize-journal",
+        action="store_true",
+        help="--output 경로의 미완료 저널을 Excel로 변환하고 종료",
+        default=False
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="--all-categories 크롤링을 --output 옆의 체크포인트에서 이어서 진행 (완료된 카테고리/저장된 제품 건너뜀)",
+        default=False
+    )
+    parser.add_argument(
+        "--enqueue-jobs",
+        action="store_true",
+        help="--all-categories의 goodsNo를 크롤링하지 않고 crawl_jobs 작업 큐에 등록 (DATABASE_URL 필요)",
+        default=False
+    )
+    parser.add_argument(
+        "--queue-worker",
+        action="store_true",
+        help="crawl_jobs 작업 큐에서 goodsNo를 가져와 큐가 빌 때까지 크롤링 (여러 노드에서 동시 실행 가능)",
+        default=False
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="crawled_products에 저장된 Oliveyoung 상품의 가격/할인/품절 상태만 갱신 (DATABASE_URL 필요)",
+        default=False
+    )
+    parser.add_argument(
+        "--refresh-limit",
+        type=int,
+        help="--refresh 시 갱신할 최대 상품 수 (마지막 확인이 오래된 순, 기본: 전체)",
+        default=None
+    )
+    parser.add_argument(
+        "--fetch-mode",
+        choices=["browser", "http"],
+        help="Oliveyoung 상품 페이지 수집 방식 (http: 쿠키 기반 HTTP 직접 요청, 실패 시 브라우저 폴백)",
+        default="browser"
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Oliveyoung 최대 동시 크롤링 수 (적응형 제어기가 1부터 이 값까지 늘림)",
+        default=1
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="Oliveyoung 초기 초당 요청 수 (차단 신호가 없으면 --max-rate까지 자동 증가)",
+        default=1.0
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        help="Oliveyoung 최대 초당 요청 수 (기본: --rate-limit의 5배)",
+        default=None
+    )
     parser.add_argument(
         "--save-to-db",
         action="store_true",
@@ -116,6 +203,13 @@ def main():
 
     args = parser.parse_args()
     
+    # 저널 materialize 전용 실행
+    if args.materialize_journal:
+        if not args.output:
+            parser.error("--materialize-journal 사용 시 --output은 필수입니다.")
+        success = ExcelStorage(args.output, journal=True).materialize()
+        sys.exit(0 if success else 1)
+    
     # 입력 검증
     if args.site == "asmama":
         if not args.branduid and not args.list_url:
@@ -129,17 +223,26 @@ def main():
             bool(args.list_url),
             bool(args.category_id),
             args.all_categories,
-            args.new_products_only
+            args.new_products_only,
+            args.queue_worker,
+            args.refresh
         ])
 
         if options_count == 0:
-            parser.error("Oliveyoung: --goods-no, --list-url, --category-id, --all-categories, 또는 --new-products-only 중 하나는 필수입니다.")
+            parser.error("Oliveyoung: --goods-no, --list-url, --category-id, --all-categories, --new-products-only, --queue-worker, 또는 --refresh 중 하나는 필수입니다.")
         if options_count > 1:
             parser.error("Oliveyoung: 여러 옵션을 동시에 사용할 수 없습니다.")
 
         # --new-products-only 사용 시 --existing-excel 필수
         if args.new_products_only and not args.existing_excel:
             parser.error("Oliveyoung: --new-products-only 옵션 사용 시 --existing-excel은 필수입니다.")
+
+    if args.resume and not (args.site == "oliveyoung" and args.all_categories):
+        parser.error("--resume은 Oliveyoung --all-categories와 함께 사용해야 합니다.")
+    if args.enqueue_jobs and not (args.site == "oliveyoung" and args.all_categories):
+        parser.error("--enqueue-jobs는 Oliveyoung --all-categories와 함께 사용해야 합니다.")
+    if (args.enqueue_jobs or args.queue_worker or args.refresh) and not os.getenv("DATABASE_URL"):
+        parser.error("--enqueue-jobs/--queue-worker/--refresh 사용 시 DATABASE_URL 환경변수가 필요합니다.")
     
     # 기본 출력 파일 경로 설정
     if args.output is None:
@@ -148,6 +251,7 @@ def main():
         else:  # oliveyoung
             args.output = "data/oliveyoung_products.xlsx"
     
+    storage = None
     try:
         logger.info(f"{args.site.capitalize()} 크롤러 시작...")
         
@@ -156,11 +260,13 @@ def main():
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # 사이트별 크롤러 초기화
-        storage = ExcelStorage(str(output_path))
+        # Oliveyoung은 배치를 저널에 기록하고 종료 시 Excel을 한 번만 생성한다
+        use_journal = args.site == "oliveyoung" and not args.no_journal
+        storage = ExcelStorage(str(output_path), journal=use_journal)
 
         # DB 저장 옵션 처리
         db_storage = None
-        if args.save_to_db:
+        if args.save_to_db or args.refresh:
             if not os.getenv("DATABASE_URL"):
                 logger.error("--save-to-db 옵션 사용 시 DATABASE_URL 환경변수가 필요합니다.")
                 sys.exit(1)
@@ -170,7 +276,7 @@ def main():
             logger.info("PostgreSQL 저장소 활성화됨")
 
         if args.site == "asmama":
-            crawler = AsmamaCrawler(storage=storage)
+            crawler = AsmamaCrawler(storage=storage, headless=args.headless)
             
             # Asmama 크롤러 실행
             if args.branduid:
@@ -198,7 +304,24 @@ def main():
                 products = asyncio.run(run_asmama_list())
                 
         else:  # oliveyoung
-            crawler = OliveyoungCrawler(storage=storage, db_storage=db_storage)
+            job_queue = None
+            if args.enqueue_jobs or args.queue_worker:
+                from crawler.job_queue import PostgresJobQueue
+                job_queue = PostgresJobQueue()
+                logger.info(f"작업 큐 활성화됨 (worker={job_queue.worker_id})")
+
+            crawler = OliveyoungCrawler(
+                storage=storage,
+                db_storage=db_storage,
+                max_workers=args.max_workers,
+                fetch_mode=args.fetch_mode,
+                rate_limit=args.rate_limit,
+                max_rate=args.max_rate,
+                job_queue=job_queue,
+                category_cache_ttl=0 if args.refresh_categories else 24 * 3600,
+                identities=args.identities,
+                headless=args.headless
+            )
             
             # Oliveyoung 크롤러 실행
             if args.goods_no:
@@ -222,6 +345,27 @@ def main():
                 import asyncio
                 products = asyncio.run(run_oliveyoung_single_category())
                 
+            elif args.refresh:
+                refresh_targets = db_storage.load_refresh_targets(limit=args.refresh_limit)
+                logger.info(f"Oliveyoung 가격/품절 갱신: {len(refresh_targets)}개 상품 (마지막 확인이 오래된 순)")
+
+                async def run_oliveyoung_refresh():
+                    async with crawler:
+                        return await crawler.refresh_products(refresh_targets)
+
+                import asyncio
+                products = asyncio.run(run_oliveyoung_refresh())
+
+            elif args.queue_worker:
+                logger.info("Oliveyoung 작업 큐 워커 시작")
+
+                async def run_oliveyoung_queue_worker():
+                    async with crawler:
+                        return await crawler.crawl_from_queue()
+
+                import asyncio
+                products = asyncio.run(run_oliveyoung_queue_worker())
+
             elif args.all_categories:
                 logger.info(f"Oliveyoung 모든 카테고리 크롤링 (카테고리당 최대 {args.max_items_per_category}개)")
 
@@ -238,9 +382,26 @@ def main():
                     except Exception as e:
                         logger.warning(f"카테고리 필터 파일 읽기 실패: {str(e)}")
 
+                if args.enqueue_jobs:
+                    async def run_oliveyoung_enqueue():
+                        async with crawler:
+                            return await crawler.enqueue_all_categories(args.max_items_per_category, category_filter)
+
+                    import asyncio
+                    enqueued = asyncio.run(run_oliveyoung_enqueue())
+                    logger.info(f"작업 큐 등록 완료: {enqueued}개 - 각 노드에서 --queue-worker로 크롤링하세요.")
+                    return
+
+                # 체크포인트: --resume이면 이전 진행 상황을 이어서, 아니면 새로 시작
+                checkpoint = CrawlCheckpoint.for_output(str(output_path), resume=args.resume)
+                if args.resume:
+                    logger.info(f"체크포인트에서 재개: {checkpoint.path}")
+
                 async def run_oliveyoung_all_categories():
                     async with crawler:
-                        return await crawler.crawl_all_categories(args.max_items_per_category, category_filter)
+                        return await crawler.crawl_all_categories(
+                            args.max_items_per_category, category_filter, checkpoint=checkpoint
+                        )
 
                 import asyncio
                 products = asyncio.run(run_oliveyoung_all_categories())
@@ -317,6 +478,10 @@ def main():
     except Exception as e:
         logger.error(f"크롤러 실행 실패: {str(e)}", exc_info=True)
         sys.exit(1)
+    finally:
+        # 크롤링이 중단되어도 저널에 기록된 데이터는 Excel로 남긴다
+        if storage is not None and storage.journal:
+            storage.materialize()
 
 
 if __name__ == "__main__":
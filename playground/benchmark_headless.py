@@ -0,0 +1,221 @@
+"""Oliveyoung 크롤러 headed/headless 모드 벤치마크 스크립트.
+
+모드마다 별도 프로세스에서 같은 카테고리를 크롤링하고, 분당 상품 수와
+브라우저 프로세스를 포함한 프로세스 트리의 메모리(RSS)를 비교한다.
+모드별 쿠키 파일을 따로 사용하므로 headless 모드의 쿠키 부트스트랩(Cloudflare 통과)도 함께 확인된다.
+"""
+
+import sys
+import asyncio
+import argparse
+import json
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 상위 디렉토리의 모듈 임포트를 위한 경로 설정
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawler.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+RESULT_PREFIX = "BENCH_RESULT "
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+async def run_worker(mode: str, category_id: str, max_items: int) -> Dict:
+    """
+    한 가지 모드로 카테고리를 크롤링하고 소요 시간을 측정한다 (자식 프로세스에서 실행).
+
+    Args:
+        mode: "headed" 또는 "headless"
+        category_id: 크롤링할 카테고리 ID
+        max_items: 크롤링할 최대 상품 수
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    from crawler.oliveyoung import OliveyoungCrawler
+
+    started = time.perf_counter()
+    crawler = OliveyoungCrawler(
+        storage=None,
+        cookie_file=f"oy_state.bench_{mode}.json",
+        category_cache_file=None,
+        headless=(mode == "headless")
+    )
+    async with crawler:
+        ready = time.perf_counter()
+        products = await crawler.crawl_from_category(category_id, max_items)
+        finished = time.perf_counter()
+
+    crawl_seconds = finished - ready
+    return {
+        "mode": mode,
+        "products": len(products),
+        "startup_seconds": round(ready - started, 2),
+        "crawl_seconds": round(crawl_seconds, 2),
+        "products_per_minute": round(len(products) / crawl_seconds * 60, 2) if crawl_seconds > 0 else 0.0,
+    }
+
+
+def process_tree_rss_kb(root_pid: int) -> int:
+    """
+    프로세스와 모든 하위 프로세스(Chromium 렌더러/GPU 프로세스 포함)의 RSS 합계를 구한다.
+
+    Args:
+        root_pid: 루트 프로세스 ID
+
+    Returns:
+        RSS 합계 (KB)
+    """
+    output = subprocess.run(
+        ["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True, check=False
+    ).stdout
+
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        pid, ppid, rss_kb = (int(part) for part in parts)
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = rss_kb
+
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+def run_mode(mode: str, category_id: str, max_items: int, sample_interval: float) -> Optional[Dict]:
+    """
+    자식 프로세스로 한 모드를 실행하면서 프로세스 트리의 RSS를 주기적으로 측정한다.
+
+    Args:
+        mode: "headed" 또는 "headless"
+        category_id: 크롤링할 카테고리 ID
+        max_items: 크롤링할 최대 상품 수
+        sample_interval: RSS 측정 간격(초)
+
+    Returns:
+        측정 결과 딕셔너리 (실패 시 None)
+    """
+    cmd = [
+        sys.executable, __file__, "--worker", f"--mode={mode}",
+        f"--category-id={category_id}", f"--max-items={max_items}"
+    ]
+    logger.info(f"[{mode}] 벤치마크 시작")
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+
+    samples: List[int] = []
+    while process.poll() is None:
+        samples.append(process_tree_rss_kb(process.pid))
+        time.sleep(sample_interval)
+    stdout = process.stdout.read()
+
+    result = None
+    for line in stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+    if result is None:
+        logger.error(f"[{mode}] 벤치마크 실패 (종료 코드 {process.returncode})")
+        return None
+
+    samples = [sample for sample in samples if sample > 0]
+    result["peak_rss_mb"] = round(max(samples) / 1024, 1) if samples else None
+    result["mean_rss_mb"] = round(sum(samples) / len(samples) / 1024, 1) if samples else None
+    logger.info(f"[{mode}] 결과: {result}")
+    return result
+
+
+def print_comparison(results: List[Dict]) -> None:
+    """
+    모드별 결과를 표로 출력한다.
+
+    Args:
+        results: run_mode 결과 목록
+    """
+    header = f"{'mode':<10}{'products':>10}{'startup(s)':>12}{'crawl(s)':>10}{'products/min':>14}{'peak RSS(MB)':>14}{'mean RSS(MB)':>14}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['mode']:<10}{result['products']:>10}{result['startup_seconds']:>12}{result['crawl_seconds']:>10}"
+            f"{result['products_per_minute']:>14}{str(result['peak_rss_mb']):>14}{str(result['mean_rss_mb']):>14}"
+        )
+
+    by_mode = {result["mode"]: result for result in results}
+    headed, headless = by_mode.get("headed"), by_mode.get("headless")
+    if headed and headless and headed["products_per_minute"] and headed["peak_rss_mb"]:
+        print(
+            f"\nheadless / headed: 처리량 x{headless['products_per_minute'] / headed['products_per_minute']:.2f}, "
+            f"최대 RSS x{headless['peak_rss_mb'] / headed['peak_rss_mb']:.2f}"
+        )
+
+
+def main():
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="Oliveyoung 크롤러 headed/headless 벤치마크")
+    parser.add_argument(
+        "--category-id",
+        type=str,
+        help="벤치마크에 사용할 카테고리 ID",
+        default="100000100010013"
+    )
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        help="모드마다 크롤링할 상품 수",
+        default=20
+    )
+    parser.add_argument(
+        "--modes",
+        type=str,
+        help="비교할 모드 (쉼표 구분)",
+        default="headed,headless"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        help="RSS 측정 간격(초)",
+        default=0.5
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", type=str, choices=["headed", "headless"], help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        result = asyncio.run(run_worker(args.mode, args.category_id, args.max_items))
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+        return
+
+    results = []
+    for mode in [mode.strip() for mode in args.modes.split(",") if mode.strip()]:
+        result = run_mode(mode, args.category_id, args.max_items, args.sample_interval)
+        if result:
+            results.append(result)
+
+    if not results:
+        logger.error("벤치마크 결과가 없습니다.")
+        sys.exit(1)
+
+    print_comparison(results)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / f"benchmark_headless_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    logger.info(f"결과 저장 완료: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""축소 디코딩(analysis_size) 검증 스크립트.
+
+이미지 디렉토리의 파일들을 원본 해상도와 축소 해상도로 각각 디코딩/측정하여
+고급 필터 판정 일치율, 측정값 차이, 이미지당 처리 시간과 최대 메모리를 비교한다.
+"""
+
+import sys
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 상위 디렉토리의 모듈 임포트를 위한 경로 설정
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawler.utils import setup_logger
+from uploader.image_processor import ImageProcessor
+
+logger = setup_logger(__name__)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def measure_all(processor: ImageProcessor, files: List[Path]) -> Dict:
+    """
+    모든 파일을 디코딩/측정하고 판정과 자원 사용량을 기록한다.
+
+    Args:
+        processor: 측정에 사용할 ImageProcessor
+        files: 이미지 파일 목록
+
+    Returns:
+        {"verdicts": {파일명: 결과}, "ms_per_image", "peak_mb"}
+    """
+    verdicts = {}
+    tracemalloc.start()
+    started = time.perf_counter()
+    for path in files:
+        try:
+            measurements = processor._measure_image(processor._decode_image(path.read_bytes()))
+            result = processor._advanced_image_filter(str(path), measurements)
+            verdicts[path.name] = {**measurements, "passed": result["passed"]}
+        except Exception as e:
+            logger.warning(f"측정 실패: {path.name} - {str(e)}")
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "verdicts": verdicts,
+        "ms_per_image": round(elapsed / len(files) * 1000, 2) if files else 0.0,
+        "peak_mb": round(peak / 1024 ** 2, 1),
+    }
+
+
+def compare(full: Dict, reduced: Dict) -> Dict:
+    """
+    원본/축소 측정 결과를 비교한다.
+
+    Args:
+        full: 원본 해상도 measure_all 결과
+        reduced: 축소 해상도 measure_all 결과
+
+    Returns:
+        비교 요약 딕셔너리 (판정이 다른 파일 목록 포함)
+    """
+    names = [name for name in full["verdicts"] if name in reduced["verdicts"]]
+    mismatches = [name for name in names if full["verdicts"][name]["passed"] != reduced["verdicts"][name]["passed"]]
+    max_diff = max(
+        (
+            abs(full["verdicts"][name][key] - reduced["verdicts"][name][key])
+            for name in names for key in ("center_ratio", "outside_ratio")
+        ),
+        default=0.0,
+    )
+    return {
+        "images": len(names),
+        "verdict_agreement": round(1 - len(mismatches) / len(names), 4) if names else None,
+        "max_ratio_diff": round(max_diff, 4),
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="축소 디코딩 판정 검증")
+    parser.add_argument(
+        "--image-dir",
+        type=str,
+        required=True,
+        help="검증할 이미지 디렉토리 (jpg/png/webp)"
+    )
+    parser.add_argument(
+        "--site",
+        type=str,
+        choices=["asmama", "oliveyoung"],
+        default="oliveyoung",
+        help="사이트별 필터링 파라미터"
+    )
+    parser.add_argument(
+        "--analysis-size",
+        type=int,
+        default=256,
+        help="축소 디코딩 최대 변 길이"
+    )
+    args = parser.parse_args()
+
+    files = sorted(path for path in Path(args.image_dir).iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+    if not files:
+        logger.error(f"이미지가 없습니다: {args.image_dir}")
+        sys.exit(1)
+
+    results: Dict[str, Optional[Dict]] = {}
+    for name, analysis_size in (("full", None), ("reduced", args.analysis_size)):
+        processor = ImageProcessor(
+            filter_mode="advanced", site=args.site, cache_dir=None, verdict_db=None, analysis_size=analysis_size
+        )
+        results[name] = measure_all(processor, files)
+        processor.close()
+        logger.info(f"[{name}] {results[name]['ms_per_image']}ms/이미지, 최대 메모리 {results[name]['peak_mb']}MB")
+
+    summary = compare(results["full"], results["reduced"])
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    print(
+        f"\nreduced / full: 시간 x{results['reduced']['ms_per_image'] / max(results['full']['ms_per_image'], 1e-9):.2f}, "
+        f"최대 메모리 x{results['reduced']['peak_mb'] / max(results['full']['peak_mb'], 1e-9):.2f}"
+    )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    output_file = RESULTS_DIR / f"validate_analysis_size_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({"summary": summary, **results}, f, ensure_ascii=False, indent=2)
+    logger.info(f"결과 저장 완료: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 -- Created: 2025-01-15
 -- Database: PostgreSQL 16+
 -- Encoding: UTF-8
--- Total Tables: 6 (brands, categories, crawled_products, qoo10_products, brand_mapping_logs, qoo10_metrics_daily)
+-- Total Tables: 9 (brands, categories, crawled_products, crawl_jobs, product_price_history, product_refresh_state, qoo10_products, brand_mapping_logs, qoo10_metrics_daily)
 -- Excluded: registered_products (유저별 엑셀), qoo10_upload_fields (코드), processing_reports (파일), logs (파일)
 -- ============================================================================
 
@@ -141,6 +141,7 @@ CREATE TABLE crawled_products (
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    content_hash VARCHAR(64),  -- SHA-256 of normalized product fields (변경 감지)
 
     -- Constraints
     CONSTRAINT uq_source_goods_no UNIQUE (source, goods_no),
@@ -157,6 +158,7 @@ CREATE INDEX idx_is_soldout ON crawled_products(is_soldout) WHERE is_soldout = T
 CREATE INDEX idx_is_discounted ON crawled_products(is_discounted) WHERE is_discounted = TRUE;
 CREATE INDEX idx_crawled_at ON crawled_products(crawled_at DESC);
 CREATE INDEX idx_source ON crawled_products(source);
+CREATE INDEX idx_crawled_products_content_hash ON crawled_products(content_hash);
 
 -- Full-text search for item name and brand
 CREATE INDEX idx_crawled_products_fts ON crawled_products
@@ -167,6 +169,72 @@ COMMENT ON COLUMN crawled_products.goods_no IS '상품번호 (A-Z로 시작하
 COMMENT ON COLUMN crawled_products.images IS '이미지 URL 목록 ($ 구분자)';
 COMMENT ON COLUMN crawled_products.option_info IS '옵션 정보 (||* 구분자)';
 COMMENT ON COLUMN crawled_products.category_detail_id IS 'float64 scientific notation 방지용 VARCHAR';
+COMMENT ON COLUMN crawled_products.content_hash IS '저장 시각을 제외한 상품 필드 해시 - 같으면 upsert 생략, 증분 작업의 변경 기준';
+
+-- ============================================================================
+-- 3-1. CRAWL_JOBS TABLE
+-- ============================================================================
+-- Purpose: 여러 크롤러 노드가 공유하는 goodsNo 작업 큐 (crawler/job_queue.py)
+-- Flow: pending → leased (SELECT ... FOR UPDATE SKIP LOCKED) → done | pending(재시도) | dead
+
+CREATE TABLE crawl_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    goods_no VARCHAR(50) NOT NULL UNIQUE,
+    category_id VARCHAR(50),
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    lease_owner VARCHAR(100),
+    lease_expires_at TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_crawl_jobs_claim ON crawl_jobs(status, available_at) WHERE status IN ('pending', 'leased');
+
+COMMENT ON TABLE crawl_jobs IS '분산 크롤링 작업 큐 (lease/재시도/dead-letter)';
+COMMENT ON COLUMN crawl_jobs.status IS 'pending, leased, done, dead';
+COMMENT ON COLUMN crawl_jobs.lease_expires_at IS '만료 시 다른 워커가 다시 claim';
+
+-- ============================================================================
+-- 3-2. PRODUCT_PRICE_HISTORY TABLE
+-- ============================================================================
+-- Purpose: crawled_products의 가격/할인/품절/옵션 변경 이력 (append-only, crawler/price_history.py)
+-- Feed: PostgresStorage.save가 content_hash가 바뀐 행만 본 테이블 upsert와 같은 트랜잭션에서 기록
+-- Partition: recorded_at 기준 월별 RANGE 파티션 (product_price_history_YYYYMM, 저장 시 자동 생성)
+
+CREATE TABLE product_price_history (
+    unique_item_id VARCHAR(100) NOT NULL,
+    goods_no VARCHAR(50) NOT NULL,
+    price INTEGER,
+    origin_price INTEGER,
+    is_discounted BOOLEAN,
+    is_soldout BOOLEAN,
+    option_info TEXT,
+    content_hash VARCHAR(64),
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) PARTITION BY RANGE (recorded_at);
+
+CREATE INDEX idx_product_price_history_goods_no ON product_price_history(goods_no, recorded_at DESC);
+CREATE INDEX idx_product_price_history_unique_item_id ON product_price_history(unique_item_id, recorded_at DESC);
+
+COMMENT ON TABLE product_price_history IS '상품 가격/재고 변경 이력 (월별 파티션, append-only)';
+
+-- ============================================================================
+-- 3-3. PRODUCT_REFRESH_STATE TABLE
+-- ============================================================================
+-- Purpose: main.py --refresh 의 상품별 마지막 가격/품절 확인 시각과 연속 실패 횟수
+-- Note: crawled_products에 쓰면 updated_at 트리거와 넓은 행 재기록이 발생하므로 좁은 별도 테이블에 둔다
+-- Note: 실패한 확인도 last_checked_at을 갱신해 계속 실패하는 상품이 갱신 대상 맨 앞을 차지하지 않게 한다
+
+CREATE TABLE product_refresh_state (
+    unique_item_id VARCHAR(100) PRIMARY KEY,
+    last_checked_at TIMESTAMP NOT NULL,
+    refresh_failures INTEGER NOT NULL DEFAULT 0
+);
+
+COMMENT ON TABLE product_refresh_state IS '--refresh 마지막 확인 시각 (오래된 순으로 갱신 대상 선정)';
 
 -- ============================================================================
 -- 4. UPLOAD_HISTORY TABLE
@@ -21,6 +21,10 @@ import pandas as pd
 import psycopg2
 from psycopg2.extras import execute_values
 
+# 프로젝트 루트를 sys.path에 추가 (crawler.db_storage의 COPY 적재 사용)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from crawler.db_storage import copy_upsert
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -85,19 +89,15 @@ class CrawledDataMigrator:
                 logger.info(f"[DRY RUN] 샘플 데이터:\n{df.head()}")
                 return
 
-            # INSERT 쿼리 (ON CONFLICT DO NOTHING - 중복 방지)
-            query = """
-                INSERT INTO crawled_products (
-                    price, goods_no, item_name, brand_name, origin_price,
-                    is_discounted, discount_info, benefit_info, shipping_info, refund_info,
-                    is_soldout, images, is_option_available, unique_item_id, source,
-                    origin_product_url, others, option_info, discount_start_date, discount_end_date,
-                    manufacturer, origin_country, category_main, category_sub, category_detail,
-                    category_main_id, category_sub_id, category_detail_id, category_name, crawled_at, created_at
-                )
-                VALUES %s
-                ON CONFLICT (unique_item_id) DO NOTHING
-            """
+            # COPY 적재 칼럼 (ON CONFLICT DO NOTHING - 중복 방지)
+            columns = (
+                'price', 'goods_no', 'item_name', 'brand_name', 'origin_price',
+                'is_discounted', 'discount_info', 'benefit_info', 'shipping_info', 'refund_info',
+                'is_soldout', 'images', 'is_option_available', 'unique_item_id', 'source',
+                'origin_product_url', 'others', 'option_info', 'discount_start_date', 'discount_end_date',
+                'manufacturer', 'origin_country', 'category_main', 'category_sub', 'category_detail',
+                'category_main_id', 'category_sub_id', 'category_detail_id', 'category_name', 'crawled_at', 'created_at'
+            )
 
             # NULL 값 처리
             df = df.fillna({
@@ -167,8 +167,8 @@ class CrawledDataMigrator:
                 cur.execute("SELECT COUNT(*) FROM crawled_products")
                 count_before = cur.fetchone()[0]
 
-                # 데이터 삽입
-                execute_values(cur, query, values)
+                # 데이터 삽입 (COPY → 스테이징 테이블 → INSERT ... ON CONFLICT)
+                copy_upsert(cur, "crawled_products", columns, values, "(unique_item_id) DO NOTHING")
 
                 # 삽입 후 개수 확인
                 cur.execute("SELECT COUNT(*) FROM crawled_products")
@@ -0,0 +1,222 @@
+"""브라우저 풀 컨텍스트 교체 및 다중 쿠키 ID 테스트."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from filelock import FileLock
+
+from crawler.browser_pool import BrowserPool
+from crawler.cookies import OliveyoungCookieManager
+from crawler.identity_pool import OliveyoungIdentityPool
+from crawler.oliveyoung import OliveyoungCrawler
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.url = "https://www.oliveyoung.co.kr/"
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        self.url = url
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestBrowserPoolRetire:
+    """retire_context()가 사용 중인 페이지 반납 후에만 컨텍스트를 닫는지 확인."""
+
+    @pytest.mark.asyncio
+    async def test_retired_context_closes_after_last_release(self):
+        pool = BrowserPool(max_idle_pages=2)
+        old_context, new_context = FakeContext(), FakeContext()
+        pool._idle_pages[old_context] = []
+        pool._idle_pages[new_context] = []
+
+        in_flight = await pool.acquire_page(old_context)
+        idle_page = await pool.acquire_page(old_context)
+        await pool.release_page(idle_page)
+
+        await pool.retire_context(old_context)
+        assert idle_page.closed and not old_context.closed
+
+        # 교체 후 새 페이지는 새 컨텍스트에서, 진행 중이던 페이지는 반납 시 컨텍스트와 함께 닫힘
+        assert (await pool.acquire_page(new_context)).context is new_context
+        await pool.release_page(in_flight)
+        assert in_flight.closed and old_context.closed
+        assert old_context not in pool._in_use
+
+    @pytest.mark.asyncio
+    async def test_idle_context_closes_immediately(self):
+        pool = BrowserPool()
+        context = FakeContext()
+        pool._idle_pages[context] = []
+        await pool.release_page(await pool.acquire_page(context))
+
+        await pool.retire_context(context)
+        assert context.closed
+
+
+class FakeBrowser:
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+
+class TestBrowserPoolContextLimit:
+    """최대 컨텍스트 수에서 사용 중/교체 대기 중/현재 컨텍스트를 닫지 않는지 확인."""
+
+    @pytest.mark.asyncio
+    async def test_cap_skips_in_use_retiring_and_current_contexts(self):
+        pool = BrowserPool(max_contexts=3)
+        pool.browser = FakeBrowser()
+        in_use, retiring, current = [await pool.new_context() for _ in range(3)]
+        page = await pool.acquire_page(in_use)
+        await pool.acquire_page(retiring)
+        await pool.retire_context(retiring)
+
+        # 정리할 수 있는 컨텍스트가 없으면 한도를 넘겨 생성
+        extra = await pool.new_context(keep=current)
+        assert not any(context.closed for context in (in_use, retiring, current))
+        assert len(pool._contexts) == 4
+
+        # 사용 중이 아닌 컨텍스트를 오래된 순서로 한도까지 정리
+        await pool.release_page(page)
+        created = await pool.new_context(keep=current)
+        assert in_use.closed and extra.closed
+        assert not any(context.closed for context in (retiring, current, created))
+        assert len(pool._contexts) == 3
+
+
+class TestBrowserPoolRelease:
+    """반납한 페이지가 초기화되어 재사용되고 실패한 페이지는 닫히는지 확인."""
+
+    @pytest.mark.asyncio
+    async def test_release_resets_or_closes_page(self):
+        pool = BrowserPool(max_idle_pages=2)
+        context = FakeContext()
+        pool._idle_pages[context] = []
+
+        page = await pool.acquire_page(context)
+        await pool.release_page(page)
+        assert page.url == "about:blank" and pool._idle_pages[context] == [page]
+
+        failed_page = await pool.acquire_page(context)
+        assert failed_page is page
+        await pool.release_page(failed_page, failed=True)
+        assert failed_page.closed and pool._idle_pages[context] == []
+
+
+class TestCrawlContextSwap:
+    """쿠키 갱신으로 컨텍스트를 교체해도 목록 페이지가 닫힌 컨텍스트에 남지 않는지 확인."""
+
+    @pytest.mark.asyncio
+    async def test_list_page_moves_to_new_context(self, monkeypatch):
+        pool = BrowserPool(max_idle_pages=1)
+        crawler = OliveyoungCrawler(browser_pool=pool)
+        old_context, new_context = FakeContext(), FakeContext()
+        pool._idle_pages[old_context] = []
+        crawler.crawl_context = old_context
+
+        async def fake_goto(page, url, timeout=60000):
+            await page.goto(url)
+            return True
+
+        async def no_delay(*args):
+            return None
+
+        monkeypatch.setattr(crawler, "safe_goto", fake_goto)
+        monkeypatch.setattr("crawler.utils.random_delay", no_delay)
+
+        assert await crawler.ensure_list_page("10000010001")
+        old_list_page = crawler.list_page
+
+        # 목록 페이지를 읽는 중에 교체되어도 기존 컨텍스트는 열려 있음
+        await crawler._swap_crawl_context(new_context)
+        assert not old_list_page.closed and not old_context.closed
+
+        # 같은 목록이라도 다음 호출에서 새 컨텍스트로 다시 열고, 이때 기존 컨텍스트가 닫힘
+        assert await crawler.ensure_list_page("10000010001")
+        assert crawler.list_page.context is new_context
+        assert old_list_page.closed and old_context.closed
+
+        await crawler._release_list_page()
+        assert pool._in_use[new_context] == 0
+
+
+class TestIdentityPool:
+    """다중 쿠키 ID 배정/퇴역 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_and_retire(self, tmp_path):
+        """기본 세션과 추가 ID가 번갈아 배정되고 연속 차단된 ID는 배정에서 빠지는지 확인."""
+        browser_pool = BrowserPool()
+        pool = OliveyoungIdentityPool(str(tmp_path / "oy_state.json"), 3, browser_pool, max_failures=2)
+        assert [identity.manager.cookie_file.name for identity in pool.identities] == ["oy_state.1.json", "oy_state.2.json"]
+        # UA/viewport는 메타 파일에 고정되어 재시작해도 같은 값
+        again = OliveyoungIdentityPool(str(tmp_path / "oy_state.json"), 3, browser_pool)
+        assert again.identities[0].manager.user_agent == pool.identities[0].manager.user_agent
+
+        primary = FakeContext()
+        for identity in pool.identities:
+            identity.context = FakeContext()
+        assigned = [pool.next_context(primary) for _ in range(3)]
+        assert assigned == [primary, pool.identities[0].context, pool.identities[1].context]
+
+        blocked = pool.identities[0]
+        blocked_context = blocked.context
+        await pool.record_result(blocked_context, {"cloudflare": True}, valid=False)
+        await pool.record_result(blocked_context, {"no_product": True}, valid=False)
+        assert not blocked.retired
+        await pool.record_result(blocked_context, {"login": True}, valid=False)
+        assert blocked.retired and blocked_context.closed
+        assert {id(pool.next_context(primary)) for _ in range(4)} == {id(primary), id(pool.identities[1].context)}
+
+
+class TestCookieStateLock:
+    """쿠키 파일 잠금이 이벤트 루프를 막지 않는지 확인."""
+
+    @pytest.mark.asyncio
+    async def test_background_check_does_not_block_event_loop(self, tmp_path):
+        manager = OliveyoungCookieManager(str(tmp_path / "state.json"), browser_pool=BrowserPool())
+        manager._save_state({"cookies": [{"name": "cf_clearance", "expires": time.time() + 1000}]})
+        assert 990 < manager.seconds_until_expiry() <= 1000
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # 다른 작업이 잠금을 잡고 있어도 백그라운드 만료 확인은 스레드에서 기다림
+        locked = threading.Event()
+
+        def hold_lock():
+            with FileLock(str(manager.cookie_file) + ".lock"):
+                locked.set()
+                time.sleep(1.0)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait()
+
+        async def on_refreshed(context):
+            return None
+
+        manager.start_background_refresh(on_refreshed, refresh_margin=0, check_interval=60)
+        started = time.monotonic()
+        await asyncio.sleep(0.05)
+        assert time.monotonic() - started < 0.5
+        await manager.stop_background_refresh()
+        holder.join()
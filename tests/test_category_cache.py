@@ -0,0 +1,44 @@
+"""카테고리 트리 캐시 테스트."""
+
+import json
+
+from crawler.category_cache import CategoryTreeCache
+from crawler.oliveyoung_http import parse_category_menu
+
+
+MENU_HTML = """
+<div id="gnbAllMenu"><div class="all_menu_wrap"><div class="sub_menu_box">
+  <p class="sub_depth"><a data-ref-dispcatno="100000100010000">스킨케어</a></p>
+  <ul>
+    <li><a data-ref-dispcatno="100000100010013"> 스킨/토너 </a></li>
+    <li><a data-ref-dispcatno="1000001">짧은ID</a></li>
+    <li><a data-ref-dispcatno="100000100010014"></a></li>
+  </ul>
+</div></div></div>
+"""
+
+
+class TestCategoryTreeCache:
+    """GNB 메뉴 파싱과 캐시 TTL/해시 테스트."""
+
+    def test_menu_parse_and_ttl(self, tmp_path):
+        """15자리 ID와 이름이 있는 링크만 추출되고 TTL 안에서만 캐시가 사용되는지 확인."""
+        categories = parse_category_menu(MENU_HTML)
+        assert categories == [
+            {"id": "100000100010000", "name": "스킨케어"},
+            {"id": "100000100010013", "name": "스킨/토너"},
+        ]
+
+        cache = CategoryTreeCache(str(tmp_path / "categories.json"), ttl=3600)
+        assert cache.load() is None
+        cache.save(categories)
+        assert cache.load() == categories
+        assert cache.is_unchanged(list(reversed(categories)))
+        assert not cache.is_unchanged(categories[:1])
+
+        # 만료된 캐시는 allow_stale일 때만 반환
+        entry = json.loads(cache.path.read_text(encoding="utf-8"))
+        entry["fetched_at"] -= 7200
+        cache.path.write_text(json.dumps(entry), encoding="utf-8")
+        assert cache.load() is None
+        assert cache.load(allow_stale=True) == categories
@@ -0,0 +1,38 @@
+"""크롤링 체크포인트 테스트."""
+
+from crawler.checkpoint import CrawlCheckpoint
+
+
+class TestCrawlCheckpoint:
+    """CrawlCheckpoint 기록/재생 테스트."""
+
+    def test_replay_restores_progress(self, tmp_path):
+        """재시작 시 저장된 제품과 완료 카테고리가 복원되고 잘린 마지막 줄은 무시되는지 확인."""
+        checkpoint = CrawlCheckpoint.for_output(str(tmp_path / "products.xlsx"))
+        checkpoint.record_category_goods("100", ["A1", "A2", "A3"])
+        checkpoint.record_persisted(["A1", "A2"])
+        checkpoint.record_failed(["A3"])
+        checkpoint.record_category_done("100")
+        checkpoint.record_category_goods("200", ["B1", "B2"])
+        with open(checkpoint.path, "a", encoding="utf-8") as f:
+            f.write('{"event": "persisted", "goods_')  # 크래시로 잘린 줄
+
+        resumed = CrawlCheckpoint.for_output(str(tmp_path / "products.xlsx"))
+        assert resumed.path == tmp_path / "products.xlsx.checkpoint.jsonl"
+        # 실패한 A3가 남아 있으므로 완료 카테고리라도 재시도 대상
+        assert resumed.is_category_done("100") is False
+        assert resumed.pending_goods(resumed.get_category_goods("100")) == ["A3"]
+        assert resumed.get_category_goods("200") == ["B1", "B2"]
+        assert resumed.unfinished_goods() == ["A3"]
+
+        resumed.record_persisted(["A3"])
+        assert resumed.is_category_done("100") is True
+
+    def test_fresh_start_discards_previous(self, tmp_path):
+        """resume=False이면 기존 체크포인트를 버리고 새로 시작하는지 확인."""
+        checkpoint = CrawlCheckpoint(str(tmp_path / "run.checkpoint.jsonl"))
+        checkpoint.record_persisted(["A1"])
+
+        fresh = CrawlCheckpoint(str(tmp_path / "run.checkpoint.jsonl"), resume=False)
+        assert fresh.persisted == set()
+        assert not fresh.path.exists()
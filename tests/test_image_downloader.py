@@ -0,0 +1,197 @@
+"""이미지 병렬 다운로더 테스트."""
+
+import sqlite3
+from io import BytesIO
+
+import pytest
+import requests
+from PIL import Image
+
+from uploader.image_cache import ImageDiskCache
+from uploader.image_downloader import ImageDownloader
+from uploader.image_processor import ImageProcessor, PreparedImage
+
+
+def make_png(size=(40, 40)) -> bytes:
+    """흰 배경 중앙에 어두운 상품이 있는 이미지."""
+    img = Image.new("RGB", size, (255, 255, 255))
+    img.paste((40, 40, 40), (size[0] // 4, size[1] // 4, size[0] * 3 // 4, size[1] * 3 // 4))
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}", response=self)
+
+
+class TestImageDownloader:
+    """403 대체 헤더 재시도와 상품 이미지 사전 다운로드 테스트."""
+
+    def test_fetch_retries_403_with_fallback_headers(self, monkeypatch):
+        """Chrome UA가 403이면 대체 UA로 다시 요청하고 Referer 규칙을 유지하는지 확인."""
+        downloader = ImageDownloader(max_workers=2)
+        calls = []
+
+        def fake_get(url, headers=None, timeout=None):
+            calls.append(headers)
+            if "Chrome" in headers["User-Agent"]:
+                return FakeResponse(403)
+            return FakeResponse(200, b"image-bytes")
+
+        monkeypatch.setattr(downloader.session, "get", fake_get)
+
+        assert downloader.fetch("https://image.oliveyoung.co.kr/a.jpg") == b"image-bytes"
+        assert calls[0]["Referer"] == "https://www.oliveyoung.co.kr/"
+        assert "Safari" in calls[1]["User-Agent"] and "Referer" not in calls[1]
+
+        results = downloader.download_many(["https://x/1.jpg", "https://x/1.jpg", "https://x/2.jpg"])
+        assert list(results) == ["https://x/1.jpg", "https://x/2.jpg"]
+        downloader.close()
+
+    def test_prefetch_keeps_product_order(self, monkeypatch):
+        """묶음 단위로 미리 받은 이미지가 상품 순서대로 디코딩되어 전달되고 실패는 예외로 전달되는지 확인."""
+        processor = ImageProcessor(filter_mode="advanced", site="oliveyoung", cache_dir=None, verdict_db=None)
+
+        def fake_fetch(url):
+            if url.endswith("broken.jpg"):
+                raise requests.exceptions.ConnectionError("down")
+            return make_png()
+
+        monkeypatch.setattr(processor.downloader, "fetch", fake_fetch)
+        products = [
+            {"goods_no": f"A{i}", "images": f"https://img/{i}-1.jpg$$https://img/{i}-2.jpg"} for i in range(3)
+        ]
+        products[2]["images"] += "$$https://img/broken.jpg"
+
+        prefetched = list(processor.prefetch_product_images(products, chunk_size=2))
+        assert [product["goods_no"] for product, _ in prefetched] == ["A0", "A1", "A2"]
+        assert isinstance(prefetched[0][1]["https://img/0-1.jpg"], PreparedImage)
+        assert isinstance(prefetched[0][1]["https://img/0-1.jpg"].image, Image.Image)
+        assert isinstance(prefetched[2][1]["https://img/broken.jpg"], Exception)
+
+        product, images = prefetched[0]
+        result = processor.process_product_images(product, images)
+        assert result["representative_image"] == "https://img/0-1.jpg"
+        processor.downloader.close()
+
+    def test_disk_cache_revalidates_and_evicts(self, tmp_path, monkeypatch):
+        """재실행 시 조건부 GET(304)으로 캐시 blob을 쓰고, 최대 크기를 넘으면 오래된 URL부터 제거되는지 확인."""
+        cache = ImageDiskCache(str(tmp_path / "cache"), max_bytes=25, max_age=0)
+        downloader = ImageDownloader(max_workers=2, cache=cache)
+        sent = []
+
+        def fake_get(url, headers=None, timeout=None):
+            sent.append(headers.get("If-None-Match"))
+            if headers.get("If-None-Match") == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, url.encode().ljust(10, b"."), {"ETag": '"v1"'})
+
+        monkeypatch.setattr(downloader.session, "get", fake_get)
+
+        assert downloader.fetch("https://x/a.jpg") == b"https://x/a.jpg"
+        cached = downloader.fetch("https://x/a.jpg")
+        assert sent == [None, '"v1"']
+        assert cached[:] == b"https://x/a.jpg"
+        cached.close()
+
+        downloader.fetch("https://x/b.jpg")
+        assert cache.lookup("https://x/a.jpg") is None
+        assert cache.lookup("https://x/b.jpg") is not None
+        assert cache.stats == {"hits": 0, "revalidated": 1, "misses": 2, "evicted": 1}
+        downloader.close()
+
+    def test_verdict_store_skips_judged_images(self, tmp_path, monkeypatch):
+        """두 번째 실행은 다운로드 없이 저장된 판정을 쓰고, 측정 임계값을 바꾸면 고급 필터만 다시 계산되는지 확인."""
+        verdict_db = str(tmp_path / "verdicts.sqlite3")
+        product = {"goods_no": "A0", "images": "https://img/0-1.jpg"}
+        fetched = []
+
+        def run(border_threshold=None):
+            processor = ImageProcessor(filter_mode="both", site="oliveyoung", cache_dir=None, verdict_db=verdict_db)
+            if border_threshold is not None:
+                processor.border_threshold = border_threshold
+            monkeypatch.setattr(processor.downloader, "fetch", lambda url: fetched.append(url) or make_png())
+            monkeypatch.setattr(processor, "_request_rules_check", lambda url: {f"rule{i}": {"result": "PASS"} for i in range(1, 9)})
+            (product_data, images), = processor.prefetch_product_images([product])
+            result = processor.process_product_images(product_data, images)
+            processor.close()
+            with pytest.raises(sqlite3.ProgrammingError):
+                processor.verdict_store.has("digest", "advanced", "fingerprint")
+            return processor.verdict_store.stats, result
+
+        stats, result = run()
+        assert result["representative_image"] == "https://img/0-1.jpg"
+        assert stats == {"hits": 0, "misses": 2} and len(fetched) == 1
+
+        stats, result = run()
+        assert result["representative_image"] == "https://img/0-1.jpg"
+        assert stats == {"hits": 2, "misses": 0} and len(fetched) == 1
+
+        stats, _ = run(border_threshold=200)
+        assert stats == {"hits": 1, "misses": 1} and len(fetched) == 2
+
+    def test_failed_measurement_is_not_stored(self, tmp_path, monkeypatch):
+        """측정에 실패한 이미지는 판정 저장소에 남지 않아 다음 실행에서 다시 측정되는지 확인."""
+        from uploader import image_processor
+
+        verdict_db = str(tmp_path / "verdicts.sqlite3")
+        product = {"goods_no": "A0", "images": "https://img/0-1.jpg"}
+
+        def run():
+            processor = ImageProcessor(filter_mode="advanced", site="oliveyoung", cache_dir=None, verdict_db=verdict_db)
+            monkeypatch.setattr(processor.downloader, "fetch", lambda url: make_png())
+            (product_data, images), = processor.prefetch_product_images([product])
+            processor.process_product_images(product_data, images)
+            processor.close()
+            return processor.verdict_store.stats
+
+        def broken_kernel(images):
+            raise MemoryError("array allocation failed")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(image_processor.WhiteRatioKernel, "from_images", broken_kernel)
+            assert run() == {"hits": 0, "misses": 1}
+
+        # 실패한 측정값이 저장되지 않았으므로 다시 측정해 저장
+        assert run() == {"hits": 0, "misses": 1}
+        assert run() == {"hits": 1, "misses": 0}
+
+    def test_evicted_blob_is_redownloaded(self, tmp_path, monkeypatch):
+        """조회 후 blob이 제거되면 캐시 미스로 다시 받고, 누적 크기가 인덱스 합계와 일치하는지 확인."""
+        cache = ImageDiskCache(str(tmp_path / "cache"), max_bytes=25, max_age=3600)
+        downloader = ImageDownloader(max_workers=2, cache=cache)
+        sent = []
+
+        def fake_get(url, headers=None, timeout=None):
+            sent.append(url)
+            return FakeResponse(200, url.encode().ljust(10, b"."))
+
+        monkeypatch.setattr(downloader.session, "get", fake_get)
+        downloader.fetch("https://x/a.jpg")
+
+        # 다른 스레드의 제거가 lookup과 open 사이에 일어난 상황
+        real_lookup = cache.lookup
+
+        def lookup_then_evict(url):
+            entry = real_lookup(url)
+            cache._blob_path(entry["digest"]).unlink()
+            return entry
+
+        cache.lookup = lookup_then_evict
+        assert downloader.fetch("https://x/a.jpg") == b"https://x/a.jpg"
+        assert sent == ["https://x/a.jpg", "https://x/a.jpg"]
+        cache.lookup = real_lookup
+
+        downloader.fetch("https://x/b.jpg")
+        assert cache.lookup("https://x/a.jpg") is None
+        with cache._lock:
+            assert cache._total_bytes == cache._total_bytes_locked() == len(b"https://x/b.jpg")
+        downloader.close()
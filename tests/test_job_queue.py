@@ -0,0 +1,151 @@
+"""분산 작업 큐 테스트.
+
+PostgresJobQueue 테스트는 TEST_DATABASE_URL 환경변수로 지정한 PostgreSQL에서만 실행된다
+(테스트마다 임시 테이블을 만들고 삭제).
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from crawler.oliveyoung import OliveyoungCrawler
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def job_queue():
+    """임시 crawl_jobs 테이블을 쓰는 작업 큐."""
+    from crawler.job_queue import PostgresJobQueue
+
+    table_name = f"test_crawl_jobs_{uuid.uuid4().hex[:8]}"
+    queue = PostgresJobQueue(TEST_DATABASE_URL, table_name=table_name, max_attempts=2, retry_delay=60, worker_id="worker-a")
+    yield queue
+    queue._execute(f"DROP TABLE IF EXISTS {table_name}")
+
+
+def rows_by_goods_no(queue):
+    """작업 행을 goodsNo별로 조회한다."""
+    rows = queue._execute(
+        f"SELECT goods_no, status, attempts, lease_owner, available_at - updated_at AS delay FROM {queue.table_name}",
+        fetch=True
+    )
+    return {row["goods_no"]: row for row in rows}
+
+
+def expire(queue, column, goods_no):
+    """lease 만료/재시도 대기 시각을 과거로 돌린다."""
+    queue._execute(
+        f"UPDATE {queue.table_name} SET {column} = CURRENT_TIMESTAMP - INTERVAL '1 second' WHERE goods_no = %s",
+        (goods_no,)
+    )
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 설정되지 않음")
+class TestPostgresJobQueue:
+    """claim/complete/fail 상태 전이 테스트."""
+
+    def test_lease_expiry_lets_another_worker_claim(self, job_queue):
+        """lease가 만료되기 전에는 다른 워커가 가져가지 못하고, 만료 후에는 가져가는지 확인."""
+        from crawler.job_queue import PostgresJobQueue
+
+        job_queue.enqueue(["A1", "A2"])
+        assert job_queue.claim(limit=1) == ["A1"]
+
+        other = PostgresJobQueue(TEST_DATABASE_URL, table_name=job_queue.table_name, max_attempts=2, worker_id="worker-b")
+        assert other.claim(limit=5) == ["A2"]
+        assert other.claim(limit=5) == []
+        assert 0 < job_queue.seconds_until_claimable() <= job_queue.lease_seconds
+
+        # 첫 워커가 죽어 lease가 만료되면 다른 워커가 재시도 (완료 처리는 lease 소유자만 가능)
+        expire(job_queue, "lease_expires_at", "A1")
+        assert other.claim(limit=5) == ["A1"]
+        job_queue.complete(["A1"])
+        assert rows_by_goods_no(job_queue)["A1"]["status"] == "leased"
+        other.complete(["A1", "A2"])
+        assert job_queue.stats() == {"pending": 0, "leased": 0, "done": 2, "dead": 0}
+        assert job_queue.seconds_until_claimable() is None
+
+    def test_fail_backs_off_then_dead_letters(self, job_queue):
+        """실패하면 retry_delay 후 재시도되고, max_attempts에 도달하면 dead로 이동하는지 확인."""
+        job_queue.enqueue(["A1"])
+        assert job_queue.claim() == ["A1"]
+        job_queue.fail(["A1"], "timeout")
+
+        row = rows_by_goods_no(job_queue)["A1"]
+        assert (row["status"], row["attempts"], row["lease_owner"]) == ("pending", 1, None)
+        assert row["delay"].total_seconds() == pytest.approx(60, abs=1)
+        assert job_queue.claim() == []
+        assert job_queue.seconds_until_claimable() > 50
+
+        expire(job_queue, "available_at", "A1")
+        assert job_queue.claim() == ["A1"]
+        job_queue.fail(["A1"], "timeout")
+        assert job_queue.stats()["dead"] == 1
+        assert job_queue.claim() == []
+
+        # 시도 횟수를 다 쓴 작업의 lease가 만료되면 claim 전에 dead로 이동
+        job_queue.enqueue(["A2"])
+        assert job_queue.claim() == ["A2"]
+        expire(job_queue, "lease_expires_at", "A2")
+        assert job_queue.claim() == ["A2"]
+        expire(job_queue, "lease_expires_at", "A2")
+        assert job_queue.claim() == []
+        assert rows_by_goods_no(job_queue)["A2"]["status"] == "dead"
+        assert job_queue.requeue_dead() == 2
+
+
+class FakeJobQueue:
+    """claim 결과와 대기 시간을 순서대로 돌려주는 작업 큐."""
+
+    worker_id = "fake"
+
+    def __init__(self, claims, waits):
+        self.claims = list(claims)
+        self.waits = list(waits)
+        self.failed = []
+
+    def claim(self, limit):
+        return self.claims.pop(0)
+
+    def seconds_until_claimable(self):
+        return self.waits.pop(0)
+
+    def fail(self, goods_no_list, error="crawl failed"):
+        self.failed.extend(goods_no_list)
+
+    def stats(self):
+        return {}
+
+
+class TestCrawlFromQueue:
+    """crawl_from_queue 종료 조건 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_retries_before_exiting(self, monkeypatch):
+        """claim이 비어도 재시도 대기 작업이 남아 있으면 기다렸다가 다시 claim하는지 확인."""
+        queue = FakeJobQueue(claims=[["A1", "A2"], [], ["A2"], []], waits=[0.0, None])
+        crawler = OliveyoungCrawler(job_queue=queue)
+        attempts = {}
+
+        async def fake_crawl(goods_no_list, batch_size=50):
+            products = []
+            for goods_no in goods_no_list:
+                attempts[goods_no] = attempts.get(goods_no, 0) + 1
+                if goods_no != "A2" or attempts[goods_no] > 1:
+                    products.append({"goods_no": goods_no})
+            return products
+
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(crawler, "crawl_from_branduid_list", fake_crawl)
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        products = await crawler.crawl_from_queue(claim_size=2, poll_interval=5)
+        assert [product["goods_no"] for product in products] == ["A1", "A2"]
+        assert queue.failed == ["A2"] and sleeps == [1.0]
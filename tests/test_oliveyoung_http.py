@@ -0,0 +1,260 @@
+"""Oliveyoung HTML 스냅샷 및 AJAX 응답 파싱 테스트."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+from crawler.oliveyoung_extractors import (
+    OliveyoungProductExtractor,
+    OliveyoungPriceExtractor,
+    OliveyoungBenefitExtractor,
+    OliveyoungImageExtractor
+)
+from crawler.oliveyoung_dynamic_content import OliveyoungOptionExtractor
+from crawler.oliveyoung import OliveyoungCrawler
+from crawler.oliveyoung_http import OliveyoungHttpFetcher, parse_goods_artc, parse_goods_no_list, parse_option_list, parse_product_snapshot
+
+
+PRODUCT_HTML = """
+<html><body>
+<ul class="loc_history">
+  <li data-ref-dispcatno="100000100010000"><a class="goods_category1 on">스킨케어</a></li>
+  <li data-ref-dispcatno="100000100010013"><a class="goods_category2 on">스킨/토너</a></li>
+</ul>
+<p class="prd_brand"><a>라운드랩</a></p>
+<p class="prd_name">1025 독도 토너 200ml</p>
+<div class="price-1"><strike>20,000</strike></div>
+<div class="price-2"><strong>15,000</strong></div>
+<div id="saleLayer">
+  <div class="flex-item"><span class="label">세일 (25.01.01 ~ 25.01.31)</span><span class="price">-5,000원</span></div>
+</div>
+<p class="prd_flag"><span class="icon_flag">세일</span><span class="icon_flag">쿠폰</span></p>
+<div class="txt_list"><p>카드 결제 시 5% 할인<a>자세히</a></p></div>
+<ul class="prd_thumb_list"><li><img src="https://image.oliveyoung.co.kr/85/a.jpg"></li></ul>
+<button class="goods_buy">구매하기</button>
+</body></html>
+"""
+
+
+class TestParseProductSnapshot:
+    """parse_product_snapshot()과 추출기 apply_snapshot() 연동 테스트."""
+
+    def test_snapshot_to_product_data(self):
+        """스냅샷이 Playwright 추출기와 같은 필드 값으로 변환되는지 확인."""
+        snapshot = parse_product_snapshot(PRODUCT_HTML)
+        logger = logging.getLogger("test")
+
+        product_data = OliveyoungProductExtractor(logger).apply_snapshot(snapshot, "A000000001")
+        OliveyoungPriceExtractor(logger).apply_snapshot(snapshot, product_data)
+        OliveyoungBenefitExtractor(logger).apply_snapshot(snapshot, product_data)
+        OliveyoungImageExtractor(logger).apply_snapshot(snapshot, product_data)
+
+        assert product_data["item_name"] == "1025 독도 토너 200ml"
+        assert product_data["brand_name"] == "라운드랩"
+        assert product_data["category_main_id"] == "100000100010000"
+        assert product_data["category_sub"] == "스킨/토너"
+        assert product_data["price"] == 15000
+        assert product_data["origin_price"] == 20000
+        assert product_data["is_discounted"] is True
+        assert product_data["discount_start_date"] == "25.01.01"
+        assert product_data["discount_end_date"] == "25.01.31"
+        assert product_data["benefit_info"] == "상품혜택||*세일||*쿠폰$$결제혜택||*카드 결제 시 5% 할인"
+        assert product_data["images"] == "https://image.oliveyoung.co.kr/550/a.jpg"
+        assert product_data["is_soldout"] is False
+        assert snapshot["has_option_button"] is False
+
+    @pytest.mark.parametrize("html_text,state", [
+        ("<html><body>페이지를 제대로 표시할 수 없어요</body></html>", "cloudflare"),
+        ('<html><body><div id="error-contents" class="error-page noProduct"></div></body></html>', "no_product"),
+        ('<html><body><div class="loginArea new-loginArea"></div></body></html>', "login"),
+    ])
+    def test_page_state_detection(self, html_text, state):
+        """차단/상품 없음/로그인 페이지 감지."""
+        snapshot = parse_product_snapshot(html_text)
+        assert snapshot["page_state"][state] is True
+
+
+class TestParseAjaxResponses:
+    """옵션/상품정보제공고시 AJAX 응답 파싱 테스트."""
+
+    def test_option_list_to_option_info(self):
+        """옵션 목록 HTML 조각이 기존 option_info 형식으로 변환되는지 확인."""
+        option_html = """
+        <li><span class="option_value">01 라이트</span><span class="tx_num">15,000원</span></li>
+        <li class="soldout"><span class="option_value">02 미디엄</span><span class="tx_num">16,000원</span></li>
+        <li><span class="option_value">03 세트</span><span class="tx_num">40,000원</span></li>
+        """
+        option_list = parse_option_list(option_html)
+        assert option_list[1] == {"name": "02 미디엄", "price": 16000, "is_soldout": True}
+
+        product_data = {"price": 15000, "unique_item_id": "oliveyoung_A1", "option_info": ""}
+        OliveyoungOptionExtractor(logging.getLogger("test")).apply_option_list(option_list, product_data)
+
+        # ±50% 초과 옵션(03 세트)은 제외
+        assert product_data["is_option_available"] is True
+        assert product_data["option_info"] == (
+            "Option||*01 라이트||*0||*200||*oliveyoung_A1_1$$"
+            "Option||*02 미디엄||*1000||*0||*oliveyoung_A1_2$$"
+        )
+
+    def test_goods_artc_html_and_json(self):
+        """상품정보제공고시 응답이 HTML이든 JSON이든 dt/dd를 추출하는지 확인."""
+        artc_html = (
+            '<dl class="detail_info_list"><dt>제조국</dt><dd>대한민국</dd></dl>'
+            '<dl class="detail_info_list"><dt>사용방법</dt><dd>상세페이지 참조</dd></dl>'
+        )
+        assert parse_goods_artc(artc_html) == {"제조국": "대한민국"}
+        assert parse_goods_artc(json.dumps({"html": artc_html})) == {"제조국": "대한민국"}
+
+
+class TestCategoryListing:
+    """카테고리 목록 goodsNo 추출 및 페이지네이션 테스트."""
+
+    def test_parse_goods_no_list_html_and_json(self):
+        """목록 HTML 링크/속성과 JSON 응답에서 goodsNo를 순서대로 중복 없이 추출하는지 확인."""
+        list_html = (
+            '<li data-ref-goodsno="A000000002"><a href="/store/goods/getGoodsDetail.do?goodsNo=A000000002&amp;dispCatNo=1">'
+            '</a></li><li><a href="/store/goods/getGoodsDetail.do?goodsNo=A000000001">'
+        )
+        assert parse_goods_no_list(list_html) == ["A000000002", "A000000001"]
+        assert parse_goods_no_list(json.dumps({"list": [{"goodsNo": "B1"}, {"goodsNo": "B2"}]})) == ["B1", "B2"]
+
+    @pytest.mark.asyncio
+    async def test_paginates_until_max_items(self, monkeypatch):
+        """한 페이지보다 많이 요청하면 다음 페이지로 넘어가고 반복되는 마지막 페이지에서 멈추는지 확인."""
+        monkeypatch.setattr(OliveyoungCrawler, "LIST_ROWS_PER_PAGE", 2)
+        pages = {1: ["A1", "A2"], 2: ["A2", "A3"], 3: ["A3"]}
+        requested = []
+
+        async def fake_fetch(category_id, page_idx, rows_per_page, sort_type):
+            requested.append(page_idx)
+            return pages.get(page_idx, [])
+
+        crawler = OliveyoungCrawler()
+        monkeypatch.setattr(crawler, "_fetch_category_goods_page", fake_fetch)
+
+        assert await crawler._extract_goods_no_list_from_category("100", max_items=10) == ["A1", "A2", "A3"]
+        assert requested == [1, 2, 3]
+        assert await crawler._extract_goods_no_list_from_category("100", max_items=3) == ["A1", "A2", "A3"]
+
+
+class FakeSnapshotPage:
+    """evaluate() 호출마다 준비된 스냅샷을 차례로 돌려주는 페이지."""
+
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.waited = 0
+        self.context = None
+
+    async def wait_for_function(self, script, arg=None, timeout=None, polling=None):
+        self.waited += 1
+
+    async def evaluate(self, script, arg=None):
+        return self.snapshots.pop(0)
+
+
+class TestPageSnapshot:
+    """렌더링 대기/재수집과 속도 제어기 기록 횟수 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_recollects_late_price_and_records_once(self, monkeypatch):
+        """가격/이미지가 늦게 그려지면 다시 수집하고, record_rate=False면 성공을 기록하지 않는지 확인."""
+        async def no_delay(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr("crawler.utils.random_delay", no_delay)
+        complete = parse_product_snapshot(PRODUCT_HTML)
+        partial = {**complete, "sale_price": None, "images": []}
+
+        crawler = OliveyoungCrawler()
+        page = FakeSnapshotPage([partial, complete])
+        snapshot = await crawler._load_page_snapshot(page, "A0001")
+        assert page.waited == 1 and snapshot["sale_price"] == complete["sale_price"]
+        assert crawler.rate_controller._successes == 1
+
+        await crawler._load_page_snapshot(FakeSnapshotPage([complete]), "A0001", record_rate=False)
+        assert crawler.rate_controller._successes == 1
+
+
+class FakeAjaxClient:
+    """AJAX 엔드포인트별 응답 본문을 돌려주는 httpx 클라이언트 대역."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.posted = []
+
+    async def post(self, url, data=None, headers=None):
+        self.posted.append(url)
+        return httpx.Response(200, text=self.bodies[url], request=httpx.Request("POST", url))
+
+
+class TestDirectAjax:
+    """옵션/상세정보 AJAX 직접 호출과 버튼 클릭 폴백 판정 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_empty_response_falls_back_and_buttonless_skips_requests(self):
+        """버튼이 있는데 응답이 비면 None(클릭 폴백), 버튼이 없으면 요청 없이 빈 값인지 확인."""
+        fetcher = OliveyoungHttpFetcher("oy_state.json")
+        fetcher.client = FakeAjaxClient({
+            fetcher.OPTION_API_URL: "[]",
+            fetcher.GOODS_ARTC_API_URL: "<div></div>",
+        })
+        crawler = OliveyoungCrawler()
+        crawler.http_fetcher = fetcher
+
+        snapshot = {"has_option_button": True, "has_detail_button": True}
+        assert await crawler._await_dynamic_content(snapshot, "A0001") == (None, None)
+        assert len(fetcher.client.posted) == 2
+
+        snapshot = {"has_option_button": False, "has_detail_button": False}
+        assert await crawler._await_dynamic_content(snapshot, "A0001") == ([], {})
+        assert len(fetcher.client.posted) == 2
+
+    @pytest.mark.asyncio
+    async def test_http_mode_starts_ajax_with_page_fetch(self):
+        """HTTP 모드에서 AJAX가 페이지 응답을 기다리지 않고 함께 시작되는지 확인."""
+        ajax_started = asyncio.Event()
+
+        class FakeFetcher:
+            async def fetch_dynamic_content(self, goods_no, fetch_options=True, fetch_info=True):
+                ajax_started.set()
+                return [{"option_name": "단품"}], {"용량": "200ml"}
+
+        crawler = OliveyoungCrawler(fetch_mode="http")
+        crawler.http_fetcher = FakeFetcher()
+
+        async def fake_snapshot(goods_no):
+            # 페이지 응답이 끝나기 전에 AJAX가 이미 시작되어 있어야 한다
+            await asyncio.wait_for(ajax_started.wait(), timeout=1)
+            return {"has_option_button": True, "has_detail_button": False}
+
+        crawler._fetch_product_snapshot = fake_snapshot
+        snapshot, dynamic_content = await crawler._fetch_product_http("A0001")
+
+        assert await crawler._await_dynamic_content(snapshot, "A0001", dynamic_content) == (
+            [{"option_name": "단품"}], {}
+        )
+
+    @pytest.mark.asyncio
+    async def test_ajax_posts_use_rate_controller_tokens(self):
+        """AJAX POST마다 공유 속도 제어기의 토큰을 받는지 확인."""
+
+        class CountingRateController:
+            def __init__(self):
+                self.acquired = 0
+
+            async def acquire(self):
+                self.acquired += 1
+
+        rate_controller = CountingRateController()
+        fetcher = OliveyoungHttpFetcher("oy_state.json", rate_controller=rate_controller)
+        fetcher.client = FakeAjaxClient({
+            fetcher.OPTION_API_URL: "[]",
+            fetcher.GOODS_ARTC_API_URL: "<div></div>",
+        })
+
+        await fetcher.fetch_dynamic_content("A0001")
+        assert rate_controller.acquired == len(fetcher.client.posted) == 2
@@ -0,0 +1,150 @@
+"""가격/품절 갱신(--refresh) 테스트.
+
+PostgresStorage 테스트는 TEST_DATABASE_URL 환경변수로 지정한 PostgreSQL에서만 실행된다
+(scripts/init.sql의 crawled_products 정의로 임시 테이블을 만들고 삭제).
+"""
+
+import os
+import re
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from crawler.oliveyoung import OliveyoungCrawler
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+INIT_SQL = Path(__file__).resolve().parent.parent / "scripts" / "init.sql"
+
+
+@pytest.fixture
+def storage():
+    """임시 crawled_products/product_refresh_state 테이블을 쓰는 저장소."""
+    from crawler.db_pool import get_pool
+    from crawler.db_storage import PostgresStorage
+
+    suffix = uuid.uuid4().hex[:8]
+    table_name = f"test_crawled_products_{suffix}"
+    ddl = re.search(r"CREATE TABLE crawled_products \(.*?\n\);", INIT_SQL.read_text(encoding="utf-8"), re.S).group(0)
+    ddl = ddl.replace("crawled_products", table_name).replace("uq_source_goods_no", f"uq_{suffix}")
+
+    pool = get_pool(TEST_DATABASE_URL)
+    with pool.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(ddl)
+        conn.commit()
+
+    storage_class = type("TestStorage", (PostgresStorage,), {"REFRESH_STATE_TABLE": f"test_refresh_state_{suffix}"})
+    storage = storage_class(TEST_DATABASE_URL, table_name=table_name, record_price_history=False)
+    yield storage
+    with pool.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table_name}, {storage.REFRESH_STATE_TABLE}")
+        conn.commit()
+
+
+def seed(storage, prices):
+    """상품을 저장하고 crawled_at을 goodsNo 순서대로 과거 시각으로 맞춘다."""
+    storage.save([
+        {"goods_no": goods_no, "item_name": goods_no, "brand_name": "브랜드", "price": price, "images": ["a.jpg"]}
+        for goods_no, price in prices.items()
+    ])
+    with storage.pool.connection() as conn, conn.cursor() as cursor:
+        for offset, goods_no in enumerate(prices):
+            cursor.execute(
+                f"UPDATE {storage.table_name} SET crawled_at = %s WHERE goods_no = %s",
+                (datetime(2026, 1, 1) + timedelta(days=offset), goods_no)
+            )
+        conn.commit()
+
+
+def fetch(storage, query, params=None):
+    """조회 결과를 튜플 목록으로 반환한다."""
+    with storage.pool.connection() as conn, conn.cursor() as cursor:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+
+def refresh_item(goods_no, **fields):
+    """refresh_single_product 결과 형태의 데이터."""
+    return {"goods_no": goods_no, "unique_item_id": f"oliveyoung_{goods_no}", "is_soldout": False, **fields}
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 설정되지 않음")
+class TestPostgresRefresh:
+    """refresh_prices/load_refresh_targets 테스트."""
+
+    def test_refresh_normalizes_and_skips_invalid_prices(self, storage):
+        """수집값을 정규화해 바뀐 가격만 반영하고, 0원 가격은 버리고 실패로 기록하는지 확인."""
+        seed(storage, {"A1": 15000, "A2": 9000, "A3": 5000})
+        assert storage.load_refresh_targets() == ["A1", "A2", "A3"]
+        assert storage.load_refresh_targets(limit=2) == ["A1", "A2"]
+
+        assert storage.refresh_prices([refresh_item("A1", price="14000"), refresh_item("A2", price=0)])
+
+        prices = dict(fetch(storage, f"SELECT goods_no, price || '/' || origin_price FROM {storage.table_name}"))
+        # origin_price가 없으면 save()와 같이 price로 채움
+        assert prices == {"A1": "14000/14000", "A2": "9000/9000", "A3": "5000/5000"}
+        failures = dict(fetch(storage, f"SELECT unique_item_id, refresh_failures FROM {storage.REFRESH_STATE_TABLE}"))
+        assert failures == {"oliveyoung_A1": 0, "oliveyoung_A2": 1}
+
+        # 확인한 상품(실패 포함)은 한 번도 확인하지 않은 상품 뒤로 밀림
+        assert storage.load_refresh_targets()[0] == "A3"
+
+    def test_failures_are_counted_until_next_success(self, storage):
+        """수집 실패가 연속 실패 횟수를 늘리고 확인 시각을 갱신하며, 성공하면 초기화되는지 확인."""
+        seed(storage, {"A1": 15000, "A2": 9000})
+
+        assert storage.record_refresh_failures(["A1"])
+        assert storage.record_refresh_failures(["A1"])
+        assert storage.load_refresh_targets() == ["A2", "A1"]
+        assert fetch(storage, f"SELECT refresh_failures FROM {storage.REFRESH_STATE_TABLE}") == [(2,)]
+
+        assert storage.refresh_prices([refresh_item("A1", price=15000)])
+        assert fetch(storage, f"SELECT refresh_failures FROM {storage.REFRESH_STATE_TABLE}") == [(0,)]
+
+    def test_hash_matches_stored_row_after_unupserted_change(self, storage):
+        """upsert하지 않는 칼럼만 바뀌면 해시도 그대로라 이후 같은 가격 갱신이 아무것도 쓰지 않는지 확인."""
+        seed(storage, {"A1": 15000})
+        storage.save({"goods_no": "A1", "item_name": "A1", "brand_name": "새 브랜드", "price": 15000, "images": ["a.jpg"]})
+
+        row = fetch(storage, f"SELECT crawled_at, content_hash FROM {storage.table_name}")[0]
+        assert row[0] == datetime(2026, 1, 1)
+
+        assert storage.refresh_prices([refresh_item("A1", price=15000)])
+        assert fetch(storage, f"SELECT crawled_at, content_hash FROM {storage.table_name}")[0] == row
+
+
+class FakeRefreshStorage:
+    """refresh_prices/record_refresh_failures 호출을 기록하는 저장소."""
+
+    def __init__(self):
+        self.flushed = []
+        self.failed = []
+
+    def refresh_prices(self, data):
+        self.flushed.extend(item["goods_no"] for item in data)
+        return True
+
+    def record_refresh_failures(self, goods_no_list, source="oliveyoung"):
+        self.failed.extend(goods_no_list)
+        return True
+
+
+class TestRefreshProducts:
+    """refresh_products 저장/실패 기록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_failed_products_are_recorded(self, monkeypatch):
+        """수집한 상품은 refresh_prices로, 실패한 상품은 record_refresh_failures로 넘기는지 확인."""
+        storage = FakeRefreshStorage()
+        crawler = OliveyoungCrawler(db_storage=storage, max_workers=2)
+
+        async def fake_refresh(goods_no):
+            return None if goods_no == "A2" else refresh_item(goods_no, price=1000)
+
+        monkeypatch.setattr(crawler, "refresh_single_product", fake_refresh)
+
+        refreshed = await crawler.refresh_products(["A1", "A2", "A3"], batch_size=1)
+        assert sorted(item["goods_no"] for item in refreshed) == ["A1", "A3"]
+        assert sorted(storage.flushed) == ["A1", "A3"]
+        assert storage.failed == ["A2"]
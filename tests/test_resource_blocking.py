@@ -0,0 +1,43 @@
+"""리소스 차단 규칙 엔진 테스트."""
+
+import json
+
+from crawler.resource_blocking import ResourceBlocker
+
+
+class TestResourceBlocker:
+    """내장 프로필이 기존 라우트 핸들러와 같은 결정을 내리는지 확인."""
+
+    def test_builtin_profiles(self):
+        """필수 AJAX 허용, 타입별 규칙 우선, 공통 차단 목록 순서로 결정되는지 확인."""
+        crawl = ResourceBlocker.for_profile("oliveyoung")
+        assert not crawl.should_block("xhr", "https://www.oliveyoung.co.kr/store/goods/getOptInfoListAjax.do?goodsNo=A1")
+        assert crawl.should_block("stylesheet", "https://www.oliveyoung.co.kr/css/common.css")
+        assert not crawl.should_block("image", "https://image.oliveyoung.co.kr/uploads/images/goods/A1.jpg")
+        assert crawl.should_block("image", "https://cdn.example.com/banner.png")
+        assert crawl.should_block("script", "https://www.googletagmanager.com/gtm.js")
+        assert crawl.should_block("other", "https://static.example.com/Pretendard.WOFF2")
+        assert not crawl.should_block("script", "https://www.oliveyoung.co.kr/js/common.js")
+
+        page = ResourceBlocker.for_profile("oliveyoung_page")
+        assert not page.should_block("image", "https://image.oliveyoung.co.kr/uploads/images/goods/A1.jpg")
+        assert page.should_block("image", "https://www.oliveyoung.co.kr/images/logo.png")
+        assert page.should_block("stylesheet", "https://www.oliveyoung.co.kr/css/icons.css")
+        assert not page.should_block("stylesheet", "https://www.oliveyoung.co.kr/css/common.css")
+
+        default = ResourceBlocker.for_profile("default")
+        assert default.should_block("image", "https://image.oliveyoung.co.kr/uploads/images/goods/A1.jpg")
+        assert default.should_block("script", "https://c.amazon-adsystem.com/aax2/apstag.js")
+
+    def test_rules_file_overrides_profile(self, tmp_path, monkeypatch):
+        """RESOURCE_BLOCK_RULES 파일의 프로필이 내장 규칙을 대체하고, 없는 프로필은 내장 규칙을 쓰는지 확인."""
+        rules_file = tmp_path / "rules.json"
+        rules_file.write_text(json.dumps({"oliveyoung": {"types": {"image": "allow"}, "block": ["datadog"]}}))
+        monkeypatch.setenv(ResourceBlocker.RULES_ENV, str(rules_file))
+
+        crawl = ResourceBlocker.for_profile("oliveyoung")
+        assert not crawl.should_block("image", "https://cdn.example.com/banner.png")
+        assert crawl.should_block("script", "https://www.datadoghq-browser-agent.com/datadog-rum.js")
+        assert not crawl.should_block("stylesheet", "https://www.oliveyoung.co.kr/css/common.css")
+
+        assert ResourceBlocker.for_profile("default").should_block("image", "https://cdn.example.com/a.png")
@@ -0,0 +1,94 @@
+"""슬라이딩 윈도우 스케줄러 및 적응형 속도 제어 테스트."""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from crawler.rate_controller import AdaptiveRateController
+from crawler.scheduler import SlidingWindowScheduler, TokenBucket
+
+
+class TestSlidingWindowScheduler:
+    """SlidingWindowScheduler/TokenBucket 단위 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_window_and_streaming_writer(self):
+        """동시 실행 수가 window를 넘지 않고 결과가 flush_size 단위로 저장되는지 확인."""
+        in_flight = 0
+        max_in_flight = 0
+        flushed = []
+
+        async def worker(identifier):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(random.uniform(0.001, 0.01))
+            in_flight -= 1
+            return None if identifier == "bad" else {"id": identifier}
+
+        scheduler = SlidingWindowScheduler(
+            worker=worker, window=3, on_flush=lambda batch: flushed.append(len(batch)), flush_size=4
+        )
+        identifiers = [str(i) for i in range(10)] + ["bad"]
+        results = await scheduler.run(identifiers)
+
+        assert max_in_flight == 3
+        assert sorted(r["id"] for r in results) == sorted(str(i) for i in range(10))
+        assert sum(flushed) == 10
+        assert all(size <= 4 for size in flushed)
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        """버스트 이후에는 초당 rate개로 제한되는지 확인."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        started_at = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        # 첫 토큰은 즉시, 나머지 5개는 0.02초 간격
+        assert time.monotonic() - started_at >= 0.09
+
+
+class TestAdaptiveRateController:
+    """AdaptiveRateController AIMD 동작 테스트."""
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        """정상 응답에는 완만히 증가하고 차단 신호에는 cooldown 간격으로 절반 감소."""
+        controller = AdaptiveRateController(
+            "www.oliveyoung.co.kr", initial_rate=1.0, max_rate=3.0, max_concurrency=4, cooldown=60
+        )
+        for _ in range(30):
+            controller.record_success()
+
+        assert 1.0 < controller.rate <= 3.0
+        assert controller.concurrency_limit == 4
+        assert controller.bucket.rate == controller.rate
+
+        rate_before = controller.rate
+        controller.record_block("cloudflare")
+        controller.record_block("http_403")  # cooldown 중이므로 추가 감소 없음
+
+        metrics = controller.metrics()
+        assert metrics["rate"] == round(rate_before * 0.5, 3)
+        assert metrics["concurrency"] == 2
+        assert metrics["blocks"] == {"cloudflare": 1, "login": 0, "http_403": 1}
+
+    @pytest.mark.asyncio
+    async def test_slot_limits_concurrency(self):
+        """slot()이 현재 동시 실행 한도를 지키는지 확인."""
+        controller = AdaptiveRateController("host", max_concurrency=4)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def job():
+            nonlocal in_flight, max_in_flight
+            async with controller.slot():
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.005)
+                in_flight -= 1
+
+        await asyncio.gather(*(job() for _ in range(5)))
+        # 시작 동시 실행 한도는 1
+        assert max_in_flight == 1
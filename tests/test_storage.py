@@ -170,4 +170,231 @@ class TestExcelStorage:
             
             # 파일이 없는 경우
             stats = storage.get_stats()
-            assert "total_count" in stats
\ No newline at end of file
+            assert "total_count" in stats
+
+class TestExcelStorageJournal:
+    """Excel 저장소 저널 모드 테스트."""
+    
+    def test_save_appends_to_journal_only(self):
+        """저널 모드 저장 시 Excel 파일을 쓰지 않는지 테스트."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "test.xlsx"
+            storage = ExcelStorage(str(file_path), journal=True)
+            
+            assert storage.save([{"goods_no": "A001", "price": 1000}]) is True
+            assert storage.save({"goods_no": "A002", "price": 2000}) is True
+            
+            assert not file_path.exists()
+            assert storage.journal_path.exists()
+            assert [row["goods_no"] for row in storage.load()] == ["A001", "A002"]
+    
+    def test_materialize_merges_existing_excel(self):
+        """materialize 시 기존 Excel과 저널이 병합되는지 테스트."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "test.xlsx"
+            ExcelStorage(str(file_path)).save([{"goods_no": "A000", "price": 500}])
+            
+            storage = ExcelStorage(str(file_path), journal=True)
+            storage.save([{"goods_no": "A001", "price": 1000, "images": ["a.jpg"]}])
+            
+            assert storage.materialize() is True
+            assert not storage.journal_path.exists()
+            
+            loaded = ExcelStorage(str(file_path)).load()
+            assert [row["goods_no"] for row in loaded] == ["A000", "A001"]
+            assert loaded[1]["images"] == json.dumps(["a.jpg"])
+    
+    def test_materialize_skips_truncated_line(self):
+        """중단된 쓰기로 잘린 저널 줄을 건너뛰는지 테스트."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "test.xlsx"
+            storage = ExcelStorage(str(file_path), journal=True)
+            storage.save([{"goods_no": "A001"}])
+            with open(storage.journal_path, 'a', encoding='utf-8') as f:
+                f.write('{"goods_no": "A0')
+            
+            assert storage.materialize() is True
+            assert len(ExcelStorage(str(file_path)).load()) == 1
+
+
+class TestCopyUpsert:
+    """COPY 기반 대량 upsert 테스트."""
+
+    def test_copy_payload_and_merge_query(self):
+        """COPY text 형식 이스케이프와 스테이징 → 대상 테이블 병합 쿼리를 확인."""
+        from datetime import datetime
+        from crawler.db_storage import copy_upsert
+
+        cursor = MagicMock()
+        cursor.rowcount = 2
+        payloads = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: payloads.append((sql, buffer.read()))
+
+        rows = [
+            ("A1", "탭\t포함\n줄바꿈", True, None),
+            ("A2", "역슬래시\\", False, datetime(2025, 1, 1, 9, 30)),
+        ]
+        affected = copy_upsert(
+            cursor, "crawled_products", ("goods_no", "item_name", "is_soldout", "crawled_at"),
+            rows, "(unique_item_id) DO NOTHING"
+        )
+
+        assert affected == 2
+        copy_sql, payload = payloads[0]
+        assert copy_sql == "COPY _staging_crawled_products (goods_no, item_name, is_soldout, crawled_at) FROM STDIN"
+        assert payload == (
+            "A1\t탭\\t포함\\n줄바꿈\tt\t\\N\n"
+            "A2\t역슬래시\\\\\tf\t2025-01-01T09:30:00\n"
+        )
+        merge_sql = cursor.execute.call_args_list[-1].args[0]
+        assert merge_sql.startswith("INSERT INTO crawled_products (goods_no, item_name, is_soldout, crawled_at) SELECT")
+        assert merge_sql.endswith("ON CONFLICT (unique_item_id) DO NOTHING")
+
+
+class TestPostgresConnectionPool:
+    """공유 연결 풀 테스트 (psycopg2 풀을 가짜 연결로 대체)."""
+
+    class FakeConnection:
+        def __init__(self):
+            self.closed = 0
+            self.rollbacks = 0
+
+        def get_transaction_status(self):
+            import psycopg2.extensions
+            return psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+        def rollback(self):
+            self.rollbacks += 1
+
+    class FakeThreadedPool:
+        def __init__(self, minconn, maxconn, dsn):
+            self.closed = False
+            self.discarded = []
+
+        def getconn(self):
+            return TestPostgresConnectionPool.FakeConnection()
+
+        def putconn(self, conn, close=False):
+            if close:
+                self.discarded.append(conn)
+
+    def test_bounded_checkout_and_rollback_on_return(self):
+        """max_size를 넘는 대여는 대기 후 실패하고, 반납 시 열린 트랜잭션을 롤백하는지 확인."""
+        from crawler import db_pool
+
+        with patch.object(db_pool, "ThreadedConnectionPool", self.FakeThreadedPool):
+            pool = db_pool.PostgresConnectionPool("postgresql://test", max_size=1, acquire_timeout=0.05)
+
+            conn = pool.getconn()
+            with pytest.raises(db_pool.PoolError):
+                pool.getconn()
+            pool.putconn(conn)
+            assert conn.rollbacks == 1
+
+            # 끊긴 연결은 반납 시 폐기
+            with pool.connection() as conn:
+                conn.closed = 1
+            assert pool._pool.discarded == [conn]
+
+    def test_replacement_connection_is_health_checked(self):
+        """끊긴 연결 대신 받은 연결도 확인하고, 계속 끊겨 있으면 제한된 횟수 후 실패하는지 확인."""
+        from crawler import db_pool
+
+        with patch.object(db_pool, "ThreadedConnectionPool", self.FakeThreadedPool):
+            pool = db_pool.PostgresConnectionPool("postgresql://test", max_size=2)
+            stale = [self.FakeConnection(), self.FakeConnection()]
+            for conn in stale:
+                conn.closed = 1
+            healthy = self.FakeConnection()
+            pool._pool.getconn = MagicMock(side_effect=[*stale, healthy])
+
+            assert pool.getconn() is healthy
+            assert pool._pool.discarded == stale
+            pool.putconn(healthy)
+
+            pool._pool.getconn = MagicMock(side_effect=lambda: stale[0])
+            with pytest.raises(db_pool.PoolError):
+                pool.getconn()
+            assert pool._pool.getconn.call_count == 3
+            # 실패한 대여는 슬롯을 돌려줌
+            assert pool._slots.acquire(blocking=False)
+
+
+class TestContentHash:
+    """PostgresStorage content_hash 변경 감지 테스트."""
+
+    def test_hash_ignores_timestamps_and_tracks_field_changes(self):
+        """저장 시각/공백 차이는 무시하고 가격 변경은 감지하는지 확인."""
+        from crawler.db_storage import PostgresStorage
+
+        storage = PostgresStorage.__new__(PostgresStorage)
+        product = {"goods_no": "A000000001", "item_name": "토너", "price": 15000, "images": ["a.jpg", "b.jpg"]}
+
+        first = storage._transform_to_db_schema(product)
+        again = storage._transform_to_db_schema({**product, "item_name": " 토너 "})
+        changed = storage._transform_to_db_schema({**product, "price": 14000})
+
+        assert len(first["content_hash"]) == 64
+        assert first["content_hash"] == again["content_hash"]
+        assert first["content_hash"] != changed["content_hash"]
+
+
+class TestPriceHistoryStore:
+    """가격 이력 append 테스트."""
+
+    def test_append_creates_monthly_partitions(self):
+        """기록 시각이 속한 달마다 파티션을 만들고 한 번의 INSERT로 기록하는지 확인."""
+        from datetime import datetime
+        from crawler import price_history
+
+        store = price_history.PriceHistoryStore.__new__(price_history.PriceHistoryStore)
+        store.table_name = "product_price_history"
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (None,)
+        items = [
+            {"unique_item_id": "oliveyoung_A1", "goods_no": "A1", "price": 15000, "crawled_at": datetime(2025, 12, 31, 23)},
+            {"unique_item_id": "oliveyoung_A2", "goods_no": "A2", "price": 9000, "crawled_at": datetime(2026, 1, 1, 1)},
+        ]
+
+        with patch.object(price_history, "execute_values") as mock_execute_values:
+            assert store.append(cursor, items) == 2
+
+        partition_sql = [call.args[0] for call in cursor.execute.call_args_list if "PARTITION OF" in call.args[0]]
+        assert "product_price_history_202512 PARTITION OF product_price_history FOR VALUES FROM ('2025-12-01') TO ('2026-01-01')" in partition_sql[0]
+        assert "product_price_history_202601" in partition_sql[1]
+        rows = mock_execute_values.call_args.args[2]
+        assert rows[0][:3] == ("oliveyoung_A1", "A1", 15000)
+        assert rows[1][-1] == datetime(2026, 1, 1, 1)
+
+    def test_concurrent_partition_creation_is_tolerated(self):
+        """다른 워커가 먼저 만든 파티션은 세이브포인트만 되돌리고 이력 기록을 계속하는지 확인."""
+        from datetime import datetime
+        from psycopg2 import errors
+        from crawler import price_history
+
+        store = price_history.PriceHistoryStore.__new__(price_history.PriceHistoryStore)
+        store.table_name = "product_price_history"
+        store.logger = MagicMock()
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (None,)
+
+        def execute(sql, params=None):
+            if "PARTITION OF" in sql:
+                raise errors.DuplicateTable("relation already exists")
+        cursor.execute.side_effect = execute
+
+        items = [{"unique_item_id": "oliveyoung_A1", "goods_no": "A1", "price": 15000, "crawled_at": datetime(2026, 2, 1)}]
+        with patch.object(price_history, "execute_values") as mock_execute_values:
+            assert store.append(cursor, items) == 1
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert "ROLLBACK TO SAVEPOINT ensure_partition" in statements
+        assert statements[-1] == "RELEASE SAVEPOINT ensure_partition"
+        mock_execute_values.assert_called_once()
+
+        # 이미 있는 파티션은 생성 시도 없이 넘어감
+        cursor.reset_mock()
+        cursor.fetchone.return_value = ("product_price_history_202602",)
+        with patch.object(price_history, "execute_values"):
+            store.append(cursor, items)
+        assert not any("PARTITION OF" in call.args[0] for call in cursor.execute.call_args_list)
@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 from crawler.utils import (
     get_random_user_agent,
     get_random_viewport,
+    headless_from_env,
     parse_price,
     clean_text,
     extract_options_from_text,
@@ -96,4 +97,20 @@ class TestUtils:
         assert call_args["branduid"] == "test123"
         assert call_args["reason"] == "Test error"
         assert call_args["trace"] == "Stack trace"
-        assert "timestamp" in call_args
\ No newline at end of file
+        assert "timestamp" in call_args
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, False),
+        ("", False),
+        ("true", True),
+        ("1", True),
+        ("false", False),
+    ])
+    def test_headless_from_env(self, monkeypatch, value, expected):
+        """CRAWLER_HEADLESS 환경변수 해석 테스트 (없거나 비어 있으면 기본값)."""
+        if value is None:
+            monkeypatch.delenv("CRAWLER_HEADLESS", raising=False)
+        else:
+            monkeypatch.setenv("CRAWLER_HEADLESS", value)
+
+        assert headless_from_env() is expected
@@ -0,0 +1,90 @@
+"""흰색 비율 측정 커널 테스트."""
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+from uploader.image_processor import ImageProcessor
+from uploader.white_ratio import WhiteRatioKernel
+
+
+def naive_ratio(pixels: np.ndarray, threshold: int, region) -> float:
+    """영역을 잘라 직접 세는 기준 구현."""
+    x1, y1, x2, y2 = region
+    cropped = pixels[y1:y2, x1:x2]
+    total = cropped.shape[0] * cropped.shape[1]
+    return float(np.all(cropped >= threshold, axis=2).sum() / total) if total else 0.0
+
+
+class TestWhiteRatioKernel:
+    """적분 이미지 기반 영역 비율이 직접 센 값과 같은지 확인."""
+
+    def test_region_ratios_match_naive_counts(self):
+        """묶음의 모든 이미지에서 임의 영역 비율이 영역을 잘라 센 값과 일치하는지 확인."""
+        rng = np.random.default_rng(0)
+        pixels = rng.choice([0, 200, 235, 255], size=(3, 37, 53, 3)).astype(np.uint8)
+        kernel = WhiteRatioKernel.from_pixels(pixels)
+
+        for region in [(0, 0, 53, 37), (0, 0, 53, 3), (48, 0, 53, 37), (15, 11, 37, 25), (5, 5, 5, 20)]:
+            for threshold in (220, 240):
+                expected = [naive_ratio(image, threshold, region) for image in pixels]
+                assert np.allclose(kernel.ratio(threshold, region), expected)
+
+    def test_batch_measurements_match_single_image(self):
+        """같은 크기끼리 묶어 측정한 값이 이미지 하나씩 측정한 값과 같은지 확인."""
+        processor = ImageProcessor(filter_mode="advanced", site="oliveyoung", cache_dir=None, verdict_db=None)
+        rng = np.random.default_rng(1)
+        images = [
+            Image.fromarray(rng.choice([30, 245, 255], size=size + (3,)).astype(np.uint8))
+            for size in [(60, 80), (60, 80), (90, 40), (8, 8)]
+        ]
+        images[1].paste((255, 255, 255), (0, 0, 80, 60))
+
+        batch = processor._measure_images(images)
+        assert batch == [processor._measure_image(img) for img in images]
+        assert batch[1] == {"border_ok": True, "center_ratio": 1.0, "outside_ratio": 1.0}
+        assert batch[3]["border_ok"] is False
+        processor.downloader.close()
+
+
+def make_product_shot(background, fill_ratio, banner=False, size=(800, 800)) -> bytes:
+    """배경색/상품 크기/상단 배너를 바꾼 JPEG 상품 사진 픽스처."""
+    w, h = size
+    img = Image.new("RGB", size, background)
+    draw = ImageDraw.Draw(img)
+    margin_x, margin_y = int(w * (1 - fill_ratio) / 2), int(h * (1 - fill_ratio) / 2)
+    draw.ellipse((margin_x, margin_y, w - margin_x, h - margin_y), fill=(90, 60, 40))
+    if banner:
+        draw.rectangle((0, 0, w, int(h * 0.08)), fill=(20, 20, 20))
+    buffer = BytesIO()
+    img.filter(ImageFilter.GaussianBlur(1)).save(buffer, format="JPEG", quality=88)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("site", ["oliveyoung", "asmama"])
+def test_reduced_resolution_matches_full_resolution_verdicts(site):
+    """축소 디코딩(analysis_size) 판정이 원본 해상도 판정과 같은지 픽스처 묶음으로 확인."""
+    fixtures = [
+        make_product_shot(background, fill_ratio, banner)
+        for background in [(255, 255, 255), (246, 246, 244), (232, 220, 200), (210, 60, 80)]
+        for fill_ratio in [0.3, 0.6, 1.1]
+        for banner in [False, True]
+    ]
+    full = ImageProcessor(filter_mode="advanced", site=site, cache_dir=None, verdict_db=None, analysis_size=None)
+    reduced = ImageProcessor(filter_mode="advanced", site=site, cache_dir=None, verdict_db=None)
+
+    for data in fixtures:
+        img = reduced._decode_image(data)
+        assert max(img.size) <= reduced.analysis_size
+
+        expected = full._measure_image(full._decode_image(data))
+        measured = reduced._measure_image(img)
+        assert measured["border_ok"] == expected["border_ok"]
+        assert abs(measured["center_ratio"] - expected["center_ratio"]) < 0.02
+        assert abs(measured["outside_ratio"] - expected["outside_ratio"]) < 0.02
+        assert reduced._advanced_image_filter("u", measured)["passed"] == full._advanced_image_filter("u", expected)["passed"]
+
+    full.downloader.close()
+    reduced.downloader.close()
@@ -11,12 +11,14 @@ import os
 import json
 
 try:
-    import psycopg2
     from psycopg2.extras import RealDictCursor
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+# 공유 연결 풀 (스크립트 실행 모드에서는 진입 스크립트가 프로젝트 루트를 경로에 추가)
+from crawler.db_pool import get_pool
+
 
 class DataAdapter(ABC):
     """
@@ -155,17 +157,7 @@ class PostgresDataAdapter(DataAdapter):
 
         self.table_name = table_name
         self.source_filter = source_filter
-        self.conn = None
-
-    def _connect(self):
-        """데이터베이스에 연결한다."""
-        try:
-            if self.conn is None or self.conn.closed:
-                self.conn = psycopg2.connect(self.connection_string)
-                self.logger.info(f"PostgreSQL 연결 성공: {self.table_name}")
-        except Exception as e:
-            self.logger.error(f"PostgreSQL 연결 실패: {str(e)}")
-            raise
+        self.pool = get_pool(self.connection_string)
 
     def load_products(self) -> pd.DataFrame:
         """
@@ -181,8 +173,6 @@ class PostgresDataAdapter(DataAdapter):
             엑셀과 동일한 스키마의 DataFrame
         """
         try:
-            self._connect()
-
             self.logger.info(f"PostgreSQL에서 데이터 로딩 중: {self.table_name}")
 
             # 쿼리 실행
@@ -191,7 +181,8 @@ class PostgresDataAdapter(DataAdapter):
                 query += f" WHERE source = '{self.source_filter}'"
             query += " ORDER BY created_at DESC"
 
-            df = pd.read_sql_query(query, self.conn)
+            with self.pool.connection() as conn:
+                df = pd.read_sql_query(query, conn)
 
             if df.empty:
                 self.logger.warning("로드된 데이터가 없습니다.")
@@ -206,9 +197,6 @@ class PostgresDataAdapter(DataAdapter):
         except Exception as e:
             self.logger.error(f"PostgreSQL 데이터 로딩 실패: {str(e)}")
             raise
-        finally:
-            if self.conn and not self.conn.closed:
-                self.conn.close()
 
     def _transform_to_excel_schema(self, db_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -0,0 +1,233 @@
+"""상품 이미지 디스크 캐시.
+
+이미지 바이트를 내용 해시(sha256)로 저장하고, URL별 ETag/Last-Modified를
+SQLite 인덱스에 기록하여 다음 실행에서 조건부 GET(304)으로 재검증한다.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ImageDiskCache:
+    """
+    URL → 내용 해시 인덱스와 해시별 blob 파일로 구성된 이미지 캐시.
+
+    - 같은 이미지가 여러 URL로 노출되어도 blob은 하나만 저장된다 (content-addressed).
+    - 검증 후 max_age초 동안은 요청 없이 사용하고, 이후에는 조건부 GET으로 재검증한다.
+    - 전체 blob 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 URL부터 제거한다 (LRU).
+    - blob은 mmap으로 열어 디코더에 복사 없이 전달한다.
+    """
+
+    def __init__(self, cache_dir: str = "data/image_cache", max_bytes: int = 2 * 1024 ** 3, max_age: float = 24 * 3600):
+        """
+        ImageDiskCache 초기화.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (blobs/와 index.sqlite3 생성)
+            max_bytes: blob 전체 최대 크기 (바이트)
+            max_age: 재검증 없이 사용할 시간 (초, 0이면 매번 조건부 GET)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        # 다운로드 스레드들이 공유하므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.cache_dir / "index.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest)")
+        self._conn.commit()
+        # blob 전체 크기는 저장/제거 시 갱신하고, 시작할 때만 인덱스에서 합산
+        self._total_bytes = self._total_bytes_locked()
+
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evicted": 0}
+
+    def _blob_path(self, digest: str) -> Path:
+        """해시에 해당하는 blob 경로 (앞 2자리로 디렉토리 분산)."""
+        return self.blob_dir / digest[:2] / digest
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        URL의 캐시 항목을 조회한다 (blob 파일이 없으면 None).
+
+        Args:
+            url: 이미지 URL
+
+        Returns:
+            {"digest", "size", "etag", "last_modified", "validated_at", "fresh"} 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, size, etag, last_modified, validated_at FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or not self._blob_path(row[0]).exists():
+            return None
+        digest, size, etag, last_modified, validated_at = row
+        return {
+            "digest": digest,
+            "size": size,
+            "etag": etag,
+            "last_modified": last_modified,
+            "validated_at": validated_at,
+            "fresh": time.time() - validated_at < self.max_age,
+        }
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        캐시 항목의 재검증용 조건부 요청 헤더를 만든다.
+
+        Args:
+            entry: lookup 결과
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def open(self, digest: str) -> mmap.mmap:
+        """
+        blob을 읽기 전용 mmap으로 연다 (호출자가 close).
+
+        Args:
+            digest: 내용 해시
+
+        Returns:
+            mmap 객체 (파일 객체처럼 read/seek 가능)
+        """
+        with open(self._blob_path(digest), "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def touch(self, url: str, revalidated: bool = False) -> None:
+        """
+        캐시 사용 시각을 갱신한다.
+
+        Args:
+            url: 이미지 URL
+            revalidated: 서버가 304로 재검증했으면 True (validated_at도 갱신)
+        """
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ?, validated_at = ? WHERE url = ?", (now, now, url)
+                )
+                self.stats["revalidated"] += 1
+            else:
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE url = ?", (now, url))
+                self.stats["hits"] += 1
+            self._conn.commit()
+
+    def store(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> str:
+        """
+        다운로드한 이미지를 저장하고 필요하면 오래된 항목을 정리한다.
+
+        Args:
+            url: 이미지 URL
+            content: 이미지 바이트
+            etag: 응답 ETag 헤더
+            last_modified: 응답 Last-Modified 헤더
+
+        Returns:
+            내용 해시
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT digest, size FROM entries WHERE url = ?", (url,)).fetchone()
+            if not self._is_referenced_locked(digest):
+                self._total_bytes += len(content)
+            self._conn.execute(
+                """
+                INSERT INTO entries (url, digest, size, etag, last_modified, validated_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    digest = excluded.digest, size = excluded.size, etag = excluded.etag,
+                    last_modified = excluded.last_modified, validated_at = excluded.validated_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (url, digest, len(content), etag, last_modified, now, now)
+            )
+            # 같은 URL의 이미지가 바뀌어 이전 blob을 아무도 참조하지 않으면 함께 삭제
+            if previous is not None and previous[0] != digest:
+                self._release_blob_locked(*previous)
+            self._conn.commit()
+            self.stats["misses"] += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+        return digest
+
+    def _total_bytes_locked(self) -> int:
+        """저장된 blob 전체 크기 (같은 blob은 한 번만)."""
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM entries)").fetchone()
+        return row[0]
+
+    def _is_referenced_locked(self, digest: str) -> bool:
+        """해당 blob을 참조하는 URL이 남아 있는지 확인한다."""
+        return self._conn.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone() is not None
+
+    def _release_blob_locked(self, digest: str, size: int) -> None:
+        """참조가 없어진 blob을 삭제하고 전체 크기에서 뺀다."""
+        if self._is_referenced_locked(digest):
+            return
+        try:
+            self._blob_path(digest).unlink()
+        except OSError:
+            pass
+        self._total_bytes -= size
+
+    def _evict_locked(self) -> None:
+        """max_bytes를 넘으면 가장 오래 사용하지 않은 URL부터 제거하고 참조가 없어진 blob을 삭제한다."""
+        rows = self._conn.execute("SELECT url, digest, size FROM entries ORDER BY accessed_at")
+        for url, digest, size in rows.fetchall():
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self._release_blob_locked(digest, size)
+            self.stats["evicted"] += 1
+        self._conn.commit()
+
+    def close(self) -> None:
+        """인덱스 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+        self.logger.info(
+            f"이미지 캐시 통계: 적중 {self.stats['hits']}, 재검증(304) {self.stats['revalidated']}, "
+            f"다운로드 {self.stats['misses']}, 제거 {self.stats['evicted']}"
+        )
@@ -0,0 +1,248 @@
+"""상품 이미지 병렬 다운로더.
+
+호스트별 커넥션 풀(keep-alive)을 재사용하는 requests 세션과 스레드 풀로
+여러 이미지를 동시에 내려받는다. 디스크 캐시를 지정하면 조건부 GET으로 재검증한다.
+"""
+
+import logging
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 패키지 내부에서 import 시도, 실패하면 스크립트 실행 모드
+try:
+    from .image_cache import ImageDiskCache
+except ImportError:
+    from image_cache import ImageDiskCache
+
+
+# 403 Forbidden 에러 방지를 위한 기본 헤더
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'image',
+    'Sec-Fetch-Mode': 'no-cors',
+    'Sec-Fetch-Site': 'cross-site',
+}
+
+# 403 응답 시 재시도에 사용할 헤더 (다른 User-Agent)
+FALLBACK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+    'Accept': '*/*',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+}
+
+# URL 도메인별 Referer
+REFERERS = {
+    'asmama.com': 'http://www.asmama.com/',
+    'oliveyoung.co.kr': 'https://www.oliveyoung.co.kr/',
+    'coupang.com': 'https://www.coupang.com/',
+}
+
+
+class ImageDownloader:
+    """
+    이미지 다운로드 담당 클래스.
+
+    - 세션 하나를 공유하므로 같은 호스트(이미지 CDN)로의 연결을 keep-alive로 재사용한다.
+    - 커넥션 풀 크기는 동시 다운로드 수에 맞추고, 연결 오류/5xx/429는 백오프 후 재시도한다.
+    - 403 응답은 기존과 같이 다른 User-Agent 헤더로 한 번 더 요청한다.
+    - cache가 있으면 신선한 항목은 요청 없이, 오래된 항목은 조건부 GET(304)으로 재검증해 사용한다.
+    """
+
+    def __init__(self, max_workers: int = 8, max_retries: int = 2, timeout: float = 15, max_hosts: int = 10,
+                 cache: Optional[ImageDiskCache] = None):
+        """
+        ImageDownloader 초기화.
+
+        Args:
+            max_workers: 동시 다운로드 수 (호스트별 커넥션 풀 크기)
+            max_retries: 연결 오류/5xx/429 응답 시 재시도 횟수
+            timeout: 요청 타임아웃 (초)
+            max_hosts: 커넥션 풀을 유지할 최대 호스트 수
+            cache: 이미지 디스크 캐시 (None이면 캐시 없이 매번 다운로드)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,  # 마지막 응답을 그대로 받아 raise_for_status로 처리
+        )
+        adapter = HTTPAdapter(pool_connections=max_hosts, pool_maxsize=max_workers, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """다운로드 스레드 풀 (처음 사용할 때 생성)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-download")
+        return self._executor
+
+    @staticmethod
+    def _with_referer(url: str, headers: Dict[str, str], domains: Iterable[str]) -> Dict[str, str]:
+        """URL 도메인에 맞는 Referer를 추가한 헤더를 반환한다."""
+        headers = dict(headers)
+        for domain in domains:
+            if domain in url:
+                headers['Referer'] = REFERERS[domain]
+                break
+        return headers
+
+    def _get(self, url: str, extra_headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        이미지를 요청한다 (403이면 다른 User-Agent 헤더로 재시도).
+
+        Args:
+            url: 이미지 URL
+            extra_headers: 추가 헤더 (조건부 GET 헤더)
+
+        Returns:
+            성공(2xx) 또는 304 응답
+        """
+        extra_headers = extra_headers or {}
+        try:
+            headers = {**self._with_referer(url, DEFAULT_HEADERS, REFERERS), **extra_headers}
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 403:
+                raise
+            # 403 에러 시 다른 User-Agent로 재시도 (Referer는 asmama만)
+            self.logger.warning(f"403 에러 발생, 다른 User-Agent로 재시도: {url}")
+            try:
+                headers = {**self._with_referer(url, FALLBACK_HEADERS, ['asmama.com']), **extra_headers}
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+                return response
+            except Exception as retry_error:
+                self.logger.error(f"재시도 실패: {url} - {str(retry_error)}")
+                raise
+
+    def fetch(self, url: str) -> Union[bytes, mmap.mmap]:
+        """
+        이미지 바이트를 다운로드한다 (캐시가 있으면 캐시 우선).
+
+        Args:
+            url: 이미지 URL
+
+        Returns:
+            응답 본문 바이트, 또는 캐시 blob의 읽기 전용 mmap
+        """
+        if self.cache is None:
+            return self._get(url).content
+
+        entry = self.cache.lookup(url)
+        if entry and entry["fresh"]:
+            cached = self._open_cached(entry)
+            if cached is not None:
+                self.cache.touch(url)
+                return cached
+            entry = None
+
+        response = self._get(url, self.cache.conditional_headers(entry) if entry else None)
+        if entry and response.status_code == 304:
+            cached = self._open_cached(entry)
+            if cached is not None:
+                self.cache.touch(url, revalidated=True)
+                return cached
+            # 재검증 사이에 blob이 제거되었으면 조건부 헤더 없이 다시 받음
+            response = self._get(url)
+
+        content = response.content
+        if content:
+            self.cache.store(url, content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return content
+
+    def _open_cached(self, entry: Dict[str, Any]) -> Optional[mmap.mmap]:
+        """캐시 blob을 연다 (조회 후 다른 스레드가 제거했으면 None)."""
+        try:
+            return self.cache.open(entry["digest"])
+        except FileNotFoundError:
+            self.logger.debug(f"캐시 blob이 제거되어 다시 다운로드: {entry['digest']}")
+            return None
+
+    def _fetch_and_decode(self, url: str, decode: Optional[Callable[[bytes], Any]]) -> Any:
+        """다운로드 후 (지정 시) 워커 스레드에서 바로 디코딩한다."""
+        data = self.fetch(url)
+        return decode(data) if decode else data
+
+    def submit_many(self, urls: Iterable[str], decode: Optional[Callable[[bytes], Any]] = None) -> Dict[str, Any]:
+        """
+        여러 이미지의 다운로드를 스레드 풀에 제출한다 (중복 URL은 한 번만).
+
+        Args:
+            urls: 이미지 URL 목록
+            decode: 다운로드한 바이트를 변환할 함수 (예: PIL 디코딩, 워커 스레드에서 실행)
+
+        Returns:
+            {url: Future}
+        """
+        futures = {}
+        for url in urls:
+            if url not in futures:
+                futures[url] = self.executor.submit(self._fetch_and_decode, url, decode)
+        return futures
+
+    @staticmethod
+    def collect(futures: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        submit_many 결과를 기다려 {url: 결과 또는 예외}로 반환한다.
+
+        Args:
+            futures: {url: Future}
+
+        Returns:
+            {url: 디코딩 결과(또는 바이트) | Exception}
+        """
+        results = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                results[url] = e
+        return results
+
+    def download_many(self, urls: Iterable[str], decode: Optional[Callable[[bytes], Any]] = None) -> Dict[str, Any]:
+        """
+        여러 이미지를 동시에 다운로드한다.
+
+        Args:
+            urls: 이미지 URL 목록
+            decode: 다운로드한 바이트를 변환할 함수
+
+        Returns:
+            {url: 디코딩 결과(또는 바이트) | Exception}
+        """
+        return self.collect(self.submit_many(urls, decode))
+
+    def close(self) -> None:
+        """스레드 풀, 세션과 캐시 인덱스를 정리한다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
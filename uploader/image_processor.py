@@ -6,19 +6,42 @@ Claude Vision API를 사용하여 이미지 품질을 분석하고
 
 import os
 import json
+import hashlib
 import textwrap
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple, Union
 import logging
+import mmap
 import anthropic
 import dotenv
-import requests
 from PIL import Image
 import numpy as np
 from io import BytesIO
 
+# 패키지 내부에서 import 시도, 실패하면 스크립트 실행 모드
+try:
+    from .image_cache import ImageDiskCache
+    from .image_downloader import ImageDownloader
+    from .verdict_store import ImageVerdictStore, parameter_fingerprint
+    from .white_ratio import WhiteRatioKernel
+except ImportError:
+    from image_cache import ImageDiskCache
+    from image_downloader import ImageDownloader
+    from verdict_store import ImageVerdictStore, parameter_fingerprint
+    from white_ratio import WhiteRatioKernel
+
 # 환경변수 로드
 dotenv.load_dotenv()
 
+# check_product_image가 실패 시 채우는 사유 (판정 저장소에 저장하지 않음)
+FAILED_RULE_REASONS = ("파싱 실패", "분석 실패")
+
+
+class PreparedImage(NamedTuple):
+    """다운로드 스레드에서 준비한 이미지 (내용 해시와 디코딩 결과, 픽셀 분석이 필요 없으면 image=None)."""
+    digest: str
+    image: Optional[Image.Image]
+
+
 class ImageProcessor:
     """
     이미지 전처리 및 품질 검사 담당 클래스.
@@ -27,7 +50,15 @@ class ImageProcessor:
     이미지를 필터링하고 대표 이미지를 선정한다.
     """
     
-    def __init__(self, filter_mode: str = "none", site: str = "asmama"):
+    # Claude 규칙 검사 모델
+    AI_MODEL = "claude-3-7-sonnet-20250219"
+    # 고급 필터 측정 방식 버전 (측정 로직이 바뀌면 올려서 저장된 판정을 무효화)
+    ADVANCED_FILTER_VERSION = 2
+    
+    def __init__(self, filter_mode: str = "none", site: str = "asmama", download_workers: int = 8,
+                 cache_dir: Optional[str] = "data/image_cache", cache_max_bytes: int = 2 * 1024 ** 3,
+                 verdict_db: Optional[str] = "data/image_verdicts.sqlite3", analysis_size: Optional[int] = 256,
+                 verdict_url_max_age: float = 7 * 24 * 3600):
         """
         ImageProcessor 초기화.
 
@@ -38,6 +69,14 @@ class ImageProcessor:
                 - "advanced": 고급 로직 필터링만 사용
                 - "both": 두 방법 모두 사용
             site: 사이트 타입 ("asmama", "oliveyoung")
+            download_workers: 이미지 동시 다운로드 수 (호스트별 커넥션 풀 크기)
+            cache_dir: 이미지 디스크 캐시 디렉토리 (None이면 캐시 사용 안 함)
+            cache_max_bytes: 이미지 디스크 캐시 최대 크기 (바이트)
+            verdict_db: 이미지 판정 저장소 SQLite 경로 (None이면 매번 판정).
+                "ai" 모드에서도 판정 조회용 내용 해시를 위해 이미지를 다운로드하므로, 다운로드를 피하려면 None
+            analysis_size: 픽셀 분석용 디코딩 최대 변 길이 (None이면 원본 해상도)
+            verdict_url_max_age: URL → 내용 해시 매핑을 다시 다운로드하지 않고 신뢰할 시간(초).
+                그 사이 같은 URL의 이미지가 바뀌면 이전 판정이 쓰이므로, 0이면 매번 다운로드해 해시를 확인
         """
         self.logger = logging.getLogger(__name__)
         self.filter_mode = filter_mode
@@ -97,16 +136,27 @@ class ImageProcessor:
         
         # 이미지 품질 기준
         self.max_images_per_product = 10  # 상품당 최대 이미지 수
+        self.analysis_size = analysis_size  # 테두리/흰색 비율 검사는 원본 해상도가 필요 없음
         self.min_pass_rules = 6  # 최소 통과해야 할 규칙 수 (완화: 6/8)
         
         # 사이트별 고급 필터링 파라미터 설정
         self._set_site_parameters(site)
         
-        # 이미지 다운로드용 세션 생성
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        # 판정 저장소 (이미 판정한 이미지/파라미터 조합은 다운로드와 분석을 건너뜀)
+        self.verdict_store = (
+            ImageVerdictStore(verdict_db, url_max_age=verdict_url_max_age) if verdict_db and filter_mode != "none" else None
+        )
+        
+        # 이미지 다운로드 (keep-alive 세션 + 스레드 풀, 403 시 대체 헤더로 재시도)
+        cache = ImageDiskCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir and self._needs_download() else None
+        self.downloader = ImageDownloader(max_workers=download_workers, cache=cache)
+        self.session = self.downloader.session
+
+    def close(self) -> None:
+        """다운로더(스레드 풀, 세션, 디스크 캐시 인덱스)와 판정 저장소를 정리한다."""
+        self.downloader.close()
+        if self.verdict_store is not None:
+            self.verdict_store.close()
     
     def _set_site_parameters(self, site: str):
         """
@@ -161,19 +211,74 @@ class ImageProcessor:
         
         self.logger.info(f"{site.capitalize()} 사이트 파라미터 설정 완료")
     
-    def check_product_image(self, url: str) -> Dict[str, Any]:
+    def _filter_fingerprint(self, filter_mode: str) -> str:
+        """
+        판정 결과에 영향을 주는 파라미터의 지문을 계산한다.
+        
+        고급 필터는 측정값(테두리 통과 여부, 중앙/외곽 흰색 비율)을 저장하므로 측정에 쓰는 임계값만 포함한다
+        (center_white_max/outside_white_min은 저장된 측정값을 판정할 때 적용되므로 바꿔도 재측정하지 않음).
+        
+        Args:
+            filter_mode: 분석 종류 ("advanced", "ai")
+            
+        Returns:
+            파라미터 지문
+        """
+        if filter_mode == "advanced":
+            params = {
+                "version": self.ADVANCED_FILTER_VERSION,
+                "site": self.site,
+                "border_ratio": self.border_ratio,
+                "border_threshold": self.border_threshold,
+                "border_pass_threshold": self.border_pass_threshold,
+                "white_threshold": self.white_threshold,
+                "analysis_size": self.analysis_size,
+            }
+        else:
+            params = {
+                "model": self.AI_MODEL,
+                "prompt": hashlib.sha256(self.rules_prompt.encode("utf-8")).hexdigest(),
+            }
+        return parameter_fingerprint(params)
+    
+    def check_product_image(self, url: str, digest: Optional[str] = None) -> Dict[str, Any]:
         """
-        단일 이미지의 규칙 준수 여부를 검사한다.
+        단일 이미지의 규칙 준수 여부를 검사한다 (같은 이미지의 저장된 판정이 있으면 재사용).
         
         Args:
             url: 검사할 이미지 URL
+            digest: 이미지 내용 해시 (판정 저장소 키, None이면 저장소를 사용하지 않음)
             
         Returns:
             규칙 검사 결과
         """
+        use_store = self.verdict_store is not None and digest is not None
+        if use_store:
+            fingerprint = self._filter_fingerprint("ai")
+            cached = self.verdict_store.get(digest, "ai", fingerprint)
+            if cached is not None:
+                return cached
+        
+        result = self._request_rules_check(url)
+        
+        failed = all(rule.get("reason") in FAILED_RULE_REASONS for rule in result.values() if isinstance(rule, dict))
+        if use_store and not failed:
+            self.verdict_store.put(digest, "ai", fingerprint, result)
+        return result
+    
+    def _request_rules_check(self, url: str) -> Dict[str, Any]:
+        """
+        Claude Vision API로 이미지 규칙 검사를 요청한다.
+        
+        Args:
+            url: 검사할 이미지 URL
+            
+        Returns:
+            규칙 검사 결과 (실패 시 모든 규칙 FAIL)
+        """
         try:
             response = self.client.messages.create(
-                model="claude-3-7-sonnet-20250219",
+                model=self.AI_MODEL,
                 max_tokens=300,
                 temperature=0,
                 system=self.rules_prompt,
@@ -204,7 +309,7 @@ class ImageProcessor:
             # 재시도 1회
             try:
                 response = self.client.messages.create(
-                    model="claude-3-7-sonnet-20250219",
+                    model=self.AI_MODEL,
                     max_tokens=300,
                     temperature=0,
                     system=self.rules_prompt,
@@ -234,6 +339,64 @@ class ImageProcessor:
                 for i in range(1, 9)
             }
     
+    def _decode_image(self, data: Union[bytes, mmap.mmap]) -> Image.Image:
+        """
+        다운로드한 바이트를 분석용 RGB 이미지로 디코딩한다.
+        
+        analysis_size가 있으면 JPEG은 draft 모드로 디코더 단계에서 1/2~1/8 축소하고,
+        최대 변이 analysis_size가 되도록 영역 평균(BOX)으로 줄인다.
+        
+        Args:
+            data: 이미지 바이트 또는 캐시 blob의 mmap (디코딩 후 닫음)
+            
+        Returns:
+            PIL Image 객체
+        """
+        if isinstance(data, mmap.mmap):
+            # 캐시 파일을 복사 없이 디코더에 전달
+            try:
+                return self._open_for_analysis(data)
+            finally:
+                data.close()
+        return self._open_for_analysis(BytesIO(data))
+    
+    def _open_for_analysis(self, fp: Any) -> Image.Image:
+        """
+        파일 객체의 이미지를 analysis_size 이하 RGB 이미지로 연다.
+        
+        Args:
+            fp: 이미지 파일 객체
+            
+        Returns:
+            PIL Image 객체
+        """
+        img = Image.open(fp)
+        if self.analysis_size:
+            size = (self.analysis_size, self.analysis_size)
+            # JPEG이 아니면 아무 일도 하지 않음 (요청 크기 이상을 유지하는 가장 작은 배율로 디코딩)
+            img.draft("RGB", size)
+            img = img.convert("RGB")
+            img.thumbnail(size, Image.Resampling.BOX)
+            return img
+        return img.convert("RGB")
+    
+    def _prepare_image(self, data: Union[bytes, mmap.mmap]) -> PreparedImage:
+        """
+        다운로드한 이미지의 내용 해시를 계산하고 픽셀 분석이 필요하면 디코딩한다 (다운로드 스레드에서 실행).
+        
+        Args:
+            data: 이미지 바이트 또는 캐시 blob의 mmap
+            
+        Returns:
+            PreparedImage
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self.filter_mode in ("advanced", "both"):
+            return PreparedImage(digest, self._decode_image(data))
+        if isinstance(data, mmap.mmap):
+            data.close()
+        return PreparedImage(digest, None)
+    
     def _download_image(self, url: str) -> Image.Image:
         """
         URL에서 이미지를 다운로드하여 PIL Image로 반환한다.
@@ -245,90 +408,158 @@ class ImageProcessor:
             PIL Image 객체
         """
         try:
-            # 403 Forbidden 에러 방지를 위한 헤더 설정
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'image',
-                'Sec-Fetch-Mode': 'no-cors',
-                'Sec-Fetch-Site': 'cross-site',
-            }
-            
-            # URL의 도메인에 따라 Referer 헤더 추가
-            if 'asmama.com' in url:
-                headers['Referer'] = 'http://www.asmama.com/'
-            elif 'oliveyoung.co.kr' in url:
-                headers['Referer'] = 'https://www.oliveyoung.co.kr/'
-            elif 'coupang.com' in url:
-                headers['Referer'] = 'https://www.coupang.com/'
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content)).convert("RGB")
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                # 403 에러 시 다른 User-Agent로 재시도
-                self.logger.warning(f"403 에러 발생, 다른 User-Agent로 재시도: {url}")
-                try:
-                    fallback_headers = {
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-                        'Accept': '*/*',
-                        'Accept-Language': 'ko-KR,ko;q=0.9',
-                        'Cache-Control': 'no-cache',
-                        'Pragma': 'no-cache',
-                    }
-                    
-                    if 'asmama.com' in url:
-                        fallback_headers['Referer'] = 'http://www.asmama.com/'
-                    
-                    response = requests.get(url, headers=fallback_headers, timeout=15)
-                    response.raise_for_status()
-                    return Image.open(BytesIO(response.content)).convert("RGB")
-                except Exception as retry_error:
-                    self.logger.error(f"재시도 실패: {url} - {str(retry_error)}")
-                    raise
-            else:
-                raise
-                
+            return self._decode_image(self.downloader.fetch(url))
         except Exception as e:
             self.logger.error(f"이미지 다운로드 실패: {url} - {str(e)}")
             raise
     
-    def _measure_white_ratio_in_region(self, img: Image.Image, x1: int, y1: int, x2: int, y2: int, threshold: int = None) -> float:
+    def _needs_download(self) -> bool:
+        """현재 필터링 모드가 이미지 다운로드(픽셀 분석 또는 판정 저장소용 내용 해시)를 필요로 하는지 여부."""
+        return self.filter_mode in ("advanced", "both") or (self.filter_mode == "ai" and self.verdict_store is not None)
+    
+    def _needs_image_data(self, url: str) -> bool:
         """
-        이미지의 특정 영역에서 흰색 픽셀의 비율을 측정한다.
+        URL 이미지를 다운로드해야 하는지 확인한다.
+        
+        최근 내용 해시를 아는 URL은 고급 필터 측정값이 저장되어 있으면(AI 판정은 해시만 있으면 조회 가능) 건너뛴다.
         
         Args:
-            img: 분석할 이미지 객체
-            x1, y1, x2, y2: 영역 좌표
+            url: 이미지 URL
+            
+        Returns:
+            다운로드 필요 여부
+        """
+        if self.verdict_store is None:
+            return True
+        digest = self.verdict_store.digest_for_url(url)
+        if digest is None:
+            return True
+        if self.filter_mode in ("advanced", "both"):
+            return not self.verdict_store.has(digest, "advanced", self._filter_fingerprint("advanced"))
+        return False
+    
+    def _resolve_prefetched(self, url: str, prefetched: Any) -> Tuple[Any, Optional[str]]:
+        """
+        미리 받은 결과에서 분석할 이미지와 내용 해시를 꺼낸다.
+        
+        Args:
+            url: 이미지 URL
+            prefetched: PreparedImage, 다운로드 예외, 또는 None (다운로드를 건너뛴 URL)
+            
+        Returns:
+            (PIL Image | Exception | None, 내용 해시 또는 None)
+        """
+        if isinstance(prefetched, PreparedImage):
+            if self.verdict_store is not None:
+                self.verdict_store.remember_url(url, prefetched.digest)
+            return prefetched.image, prefetched.digest
+        digest = self.verdict_store.digest_for_url(url) if self.verdict_store is not None else None
+        return prefetched, digest
+    
+    def _get_image_urls(self, product_data: Dict[str, Any]) -> List[str]:
+        """
+        상품 데이터에서 이미지 URL 목록을 추출한다.
+        
+        Args:
+            product_data: 상품 데이터 (images 문자열 또는 image_urls 리스트)
+            
+        Returns:
+            이미지 URL 목록
+        """
+        # images (문자열) 또는 image_urls (리스트) 지원
+        images_data = product_data.get("images") or product_data.get("image_urls")
+        
+        if isinstance(images_data, list):
+            # 이미 리스트인 경우 (PostgreSQL adapter)
+            return [url.strip() for url in images_data if url and url.strip()]
+        elif isinstance(images_data, str):
+            # 문자열인 경우 ($$로 구분, Excel adapter)
+            return [url.strip() for url in images_data.split("$$") if url.strip()]
+        return []
+    
+    def _submit_product_downloads(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
+        """상품의 분석 대상 이미지 다운로드/디코딩을 스레드 풀에 제출한다."""
+        urls = [url for url in self._get_image_urls(product_data)[:self.max_images_per_product] if self._needs_image_data(url)]
+        return self.downloader.submit_many(urls, decode=self._prepare_image)
+    
+    def prefetch_product_images(self, products: List[Dict[str, Any]], chunk_size: int = 16) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        상품 목록의 이미지를 미리 병렬로 다운로드하면서 상품을 순서대로 내보낸다.
+        
+        chunk_size개 상품의 이미지를 한 번에 제출하고, 현재 묶음을 분석하는 동안 다음 묶음을 내려받는다
+        (메모리에는 최대 두 묶음의 디코딩된 이미지만 유지). 다운로드가 필요 없는 모드에서는 None을 함께 내보낸다.
+        판정 저장소로 판정이 끝난 URL은 다운로드하지 않는다.
+        
+        Args:
+            products: 상품 목록
+            chunk_size: 한 번에 다운로드를 제출할 상품 수
+            
+        Yields:
+            (상품 데이터, {url: PreparedImage | Exception} 또는 None)
+        """
+        if not self._needs_download():
+            for product in products:
+                yield product, None
+            return
+        
+        chunks = [products[i:i + chunk_size] for i in range(0, len(products), chunk_size)]
+        pending = [self._submit_product_downloads(product) for product in chunks[0]] if chunks else []
+        for index, chunk in enumerate(chunks):
+            current = pending
+            # 다음 묶음 다운로드를 미리 제출
+            if index + 1 < len(chunks):
+                pending = [self._submit_product_downloads(product) for product in chunks[index + 1]]
+            for product, futures in zip(chunk, current):
+                yield product, self.downloader.collect(futures)
+    
+    def _border_white_flags(self, kernel: WhiteRatioKernel, n: float, threshold: int) -> np.ndarray:
+        """
+        이미지 묶음의 테두리 영역(상/하/좌/우)이 충분히 흰색인지 확인한다.
+        
+        Args:
+            kernel: 같은 크기 이미지 묶음의 흰색 비율 커널
+            n: 테두리 영역의 비율
             threshold: 흰색 판정 임계값
             
         Returns:
-            흰색 픽셀의 비율 (0.0 ~ 1.0)
+            이미지별 테두리 통과 여부 (N,)
         """
-        try:
-            if threshold is None:
-                threshold = self.measure_white_threshold
-                
-            cropped = img.crop((x1, y1, x2, y2))
-            pixels = np.array(cropped)
-            if len(pixels.shape) != 3 or pixels.shape[2] != 3:
-                return 0.0
-
-            total = pixels.shape[0] * pixels.shape[1]
-            white = np.sum(
-                (pixels[:, :, 0] >= threshold) &
-                (pixels[:, :, 1] >= threshold) &
-                (pixels[:, :, 2] >= threshold)
-            )
-            return white / total if total > 0 else 0.0
-        except Exception:
-            return 0.0
+        w, h = kernel.width, kernel.height
+        if w < 10 or h < 10:
+            return np.zeros(kernel.count_images, dtype=bool)
+        
+        x_th = int(n * w)
+        y_th = int(n * h)
+        regions = [(0, 0, w, y_th), (0, h - y_th, w, h), (0, 0, x_th, h), (w - x_th, 0, w, h)]
+        ratios = kernel.ratios(threshold, regions)
+        
+        # 사이트별 기준 적용 (Oliveyoung: 1-n 기준, Asmama: 고정 90% 기준)
+        pass_ratio = 1 - n if self.site == "oliveyoung" else self.border_pass_threshold
+        return (ratios >= pass_ratio).all(axis=1)
+    
+    def _center_outside_ratios(self, kernel: WhiteRatioKernel, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        이미지 묶음의 중앙 영역(30%~70%)과 외곽 영역의 흰색 픽셀 비율을 측정한다.
+        
+        Args:
+            kernel: 같은 크기 이미지 묶음의 흰색 비율 커널
+            threshold: 흰색 판정 임계값
+            
+        Returns:
+            (이미지별 중앙 영역 흰색 비율, 이미지별 외곽 영역 흰색 비율)
+        """
+        w, h = kernel.width, kernel.height
+        x1, x2 = int(0.3 * w), int(0.7 * w)
+        y1, y2 = int(0.3 * h), int(0.7 * h)
+        
+        center_pixels = (x2 - x1) * (y2 - y1)
+        outside_pixels = w * h - center_pixels
+        counts = kernel.counts(threshold, [(x1, y1, x2, y2), (0, 0, w, h)])
+        
+        center_ratio = counts[:, 0] / center_pixels if center_pixels > 0 else np.zeros(kernel.count_images)
+        if outside_pixels <= 0:
+            return center_ratio, np.zeros(kernel.count_images)
+        return center_ratio, (counts[:, 1] - counts[:, 0]) / outside_pixels
     
     def _check_border_white(self, img: Image.Image, n: float = None, threshold: int = None) -> bool:
         """
@@ -347,26 +578,7 @@ class ImageProcessor:
                 n = self.border_check_ratio
             if threshold is None:
                 threshold = self.border_check_threshold
-                
-            w, h = img.size
-            if w < 10 or h < 10:
-                return False
-            
-            x_th = int(n * w)
-            y_th = int(n * h)
-
-            top = self._measure_white_ratio_in_region(img, 0, 0, w, y_th, threshold)
-            bottom = self._measure_white_ratio_in_region(img, 0, h - y_th, w, h, threshold)
-            left = self._measure_white_ratio_in_region(img, 0, 0, x_th, h, threshold)
-            right = self._measure_white_ratio_in_region(img, w - x_th, 0, w, h, threshold)
-
-            # 사이트별 기준 적용
-            if self.site == "oliveyoung":
-                # Oliveyoung: 1-n 기준
-                return all(r >= 1 - n for r in [top, bottom, left, right])
-            else:
-                # Asmama: 고정 90% 기준
-                return all(r >= self.border_pass_threshold for r in [top, bottom, left, right])
+            return bool(self._border_white_flags(WhiteRatioKernel.from_images([img]), n, threshold)[0])
         except Exception:
             return False
     
@@ -384,58 +596,121 @@ class ImageProcessor:
         try:
             if threshold is None:
                 threshold = self.center_outside_threshold
-                
-            w, h = img.size
-            x1, x2 = int(0.3 * w), int(0.7 * w)
-            y1, y2 = int(0.3 * h), int(0.7 * h)
-
-            center_ratio = self._measure_white_ratio_in_region(img, x1, y1, x2, y2, threshold)
-
-            pixels = np.array(img)
-            total_pixels = pixels.shape[0] * pixels.shape[1]
-            total_white = np.sum((pixels[:, :, 0] >= threshold) & 
-                                 (pixels[:, :, 1] >= threshold) & 
-                                 (pixels[:, :, 2] >= threshold))
-
-            center_cropped = pixels[y1:y2, x1:x2, :]
-            center_white = np.sum((center_cropped[:, :, 0] >= threshold) &
-                                  (center_cropped[:, :, 1] >= threshold) &
-                                  (center_cropped[:, :, 2] >= threshold))
-
-            outside_pixels = total_pixels - (x2 - x1) * (y2 - y1)
-            outside_white = total_white - center_white
-
-            outside_ratio = outside_white / outside_pixels if outside_pixels > 0 else 0.0
-
-            return center_ratio, outside_ratio
+            center_ratio, outside_ratio = self._center_outside_ratios(WhiteRatioKernel.from_images([img]), threshold)
+            return float(center_ratio[0]), float(outside_ratio[0])
         except Exception:
             return 0.0, 0.0
     
-    def _advanced_image_filter(self, url: str) -> Dict[str, Any]:
+    def _measure_images(self, images: List[Image.Image]) -> List[Dict[str, Any]]:
+        """
+        고급 필터링 측정값을 계산한다 (판정 저장소에 저장되는 값).
+        
+        같은 크기의 이미지끼리 묶어 한 번에 배열로 변환하고, 임계값별 적분 이미지로
+        테두리/중앙/외곽 비율을 모두 계산한다. 측정에 실패한 묶음의 이미지는 측정값 대신
+        예외 객체를 돌려주어 판정 저장소에 저장되지 않게 한다.
+        
+        Args:
+            images: 분석할 이미지 객체 목록
+            
+        Returns:
+            이미지별 {"border_ok", "center_ratio", "outside_ratio"} 또는 예외 객체 (입력 순서)
+        """
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for index, img in enumerate(images):
+            groups.setdefault(img.size, []).append(index)
+        
+        results: List[Union[Dict[str, Any], Exception]] = [{}] * len(images)
+        for indices in groups.values():
+            try:
+                kernel = WhiteRatioKernel.from_images([images[i] for i in indices])
+                # 1. 테두리 검사
+                border_ok = self._border_white_flags(kernel, self.border_ratio, self.border_threshold)
+                # 2. 중앙/외곽 흰색 비율 검사
+                center_ratio, outside_ratio = self._center_outside_ratios(kernel, self.white_threshold)
+                for position, index in enumerate(indices):
+                    results[index] = {
+                        "border_ok": bool(border_ok[position]),
+                        "center_ratio": float(center_ratio[position]),
+                        "outside_ratio": float(outside_ratio[position]),
+                    }
+            except Exception as e:
+                for index in indices:
+                    results[index] = e
+        return results
+    
+    def _measure_image(self, img: Image.Image) -> Dict[str, Any]:
+        """
+        단일 이미지의 고급 필터링 측정값을 계산한다.
+        
+        Args:
+            img: 분석할 이미지 객체
+            
+        Returns:
+            {"border_ok", "center_ratio", "outside_ratio"}
+        """
+        measurements = self._measure_images([img])[0]
+        if isinstance(measurements, Exception):
+            raise measurements
+        return measurements
+    
+    def _measure_prefetched(self, resolved: Dict[str, Tuple[Any, Optional[str]]]) -> Dict[str, Tuple[Any, Optional[str]]]:
+        """
+        상품의 미리 받은 이미지 중 측정이 필요한 것들을 한 번에 측정한다.
+        
+        Args:
+            resolved: {url: (PIL Image | Exception | None, 내용 해시)}
+            
+        Returns:
+            측정한 이미지를 측정값 딕셔너리(실패 시 예외 객체)로 바꾼 {url: (이미지 또는 측정값, 내용 해시)}
+        """
+        fingerprint = self._filter_fingerprint("advanced")
+        pending = [
+            url for url, (img, digest) in resolved.items()
+            if isinstance(img, Image.Image)
+            and not (self.verdict_store is not None and digest and self.verdict_store.has(digest, "advanced", fingerprint))
+        ]
+        if not pending:
+            return resolved
+        
+        resolved = dict(resolved)
+        for url, measurements in zip(pending, self._measure_images([resolved[url][0] for url in pending])):
+            resolved[url] = (measurements, resolved[url][1])
+        return resolved
+    
+    def _advanced_image_filter(self, url: str, img: Any = None, digest: Optional[str] = None) -> Dict[str, Any]:
         """
         고급 이미지 필터링을 수행한다 (테두리 검사 + 흰색 비율 검사).
         
         Args:
             url: 이미지 URL
+            img: 미리 다운로드한 이미지 또는 미리 계산한 측정값 딕셔너리
+                (다운로드 실패 시 예외 객체, None이면 직접 다운로드)
+            digest: 이미지 내용 해시 (있으면 판정 저장소의 측정값을 재사용하고 새 측정값을 저장)
             
         Returns:
             필터링 결과 딕셔너리
         """
         try:
-            img = self._download_image(url)
-            
-            # 1. 테두리 검사
-            border_ok = self._check_border_white(
-                img, 
-                n=self.border_ratio, 
-                threshold=self.border_threshold
-            )
-            
-            # 2. 중앙/외곽 흰색 비율 검사
-            center_ratio, outside_ratio = self._measure_center_outside_white_ratio(
-                img, 
-                threshold=self.white_threshold
-            )
+            use_store = self.verdict_store is not None and digest is not None
+            fingerprint = self._filter_fingerprint("advanced")
+            measurements = self.verdict_store.get(digest, "advanced", fingerprint) if use_store else None
+            
+            if measurements is None and isinstance(img, dict):
+                measurements = img
+                if use_store:
+                    self.verdict_store.put(digest, "advanced", fingerprint, measurements)
+            elif measurements is None:
+                if isinstance(img, Exception):
+                    raise img
+                if img is None:
+                    img = self._download_image(url)
+                measurements = self._measure_image(img)
+                if use_store:
+                    self.verdict_store.put(digest, "advanced", fingerprint, measurements)
+            
+            border_ok = measurements["border_ok"]
+            center_ratio = measurements["center_ratio"]
+            outside_ratio = measurements["outside_ratio"]
             
             # 3. 종합 판정 (완화된 기준)
             white_ratio_ok = (center_ratio <= self.center_white_max and 
@@ -478,12 +753,12 @@ class ImageProcessor:
         else:
             return f"통과(중앙:{center_ratio:.2f}/외곽:{outside_ratio:.2f})"
     
-    def _filter_with_ai_only(self, url: str) -> Dict[str, Any]:
+    def _filter_with_ai_only(self, url: str, digest: Optional[str] = None) -> Dict[str, Any]:
         """
         Claude Vision API만 사용하여 필터링한다.
         """
         try:
-            rules_result = self.check_product_image(url)
+            rules_result = self.check_product_image(url, digest)
             pass_count = sum(1 for rule_data in rules_result.values() 
                            if rule_data.get("result") == "PASS")
             compliance_score = pass_count / 8.0
@@ -501,12 +776,12 @@ class ImageProcessor:
             self.logger.error(f"AI 필터링 실패: {url} - {str(e)}")
             return {"url": url, "passed": False, "compliance_score": 0.0, "reason": "AI 검사 실패"}
     
-    def _filter_with_advanced_only(self, url: str) -> Dict[str, Any]:
+    def _filter_with_advanced_only(self, url: str, img: Any = None, digest: Optional[str] = None) -> Dict[str, Any]:
         """
         고급 로직만 사용하여 필터링한다.
         """
         try:
-            advanced_filter = self._advanced_image_filter(url)
+            advanced_filter = self._advanced_image_filter(url, img, digest)
             
             return {
                 "url": url,
@@ -519,13 +794,13 @@ class ImageProcessor:
             self.logger.error(f"고급 필터링 실패: {url} - {str(e)}")
             return {"url": url, "passed": False, "compliance_score": 0.0, "reason": "고급 필터링 실패"}
     
-    def _filter_with_both(self, url: str) -> Dict[str, Any]:
+    def _filter_with_both(self, url: str, img: Any = None, digest: Optional[str] = None) -> Dict[str, Any]:
         """
         두 방법을 모두 사용하여 필터링한다 (고급 로직 먼저, 통과 시 AI 검사).
         """
         try:
             # 1. 고급 필터링 (빠른 사전 필터링)
-            advanced_filter = self._advanced_image_filter(url)
+            advanced_filter = self._advanced_image_filter(url, img, digest)
             
             if not advanced_filter["passed"]:
                 return {
@@ -537,7 +812,7 @@ class ImageProcessor:
                 }
             
             # 2. AI 검사 (고급 필터링 통과 시)
-            rules_result = self.check_product_image(url)
+            rules_result = self.check_product_image(url, digest)
             pass_count = sum(1 for rule_data in rules_result.values() 
                            if rule_data.get("result") == "PASS")
             compliance_score = pass_count / 8.0
@@ -592,12 +867,14 @@ class ImageProcessor:
         except Exception:
             return ""
     
-    def process_product_images(self, product_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_product_images(self, product_data: Dict[str, Any], images: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         상품의 모든 이미지를 처리한다.
         
         Args:
             product_data: 상품 데이터 (images 필드 포함)
+            images: prefetch_product_images로 미리 받은 {url: PreparedImage | Exception}
+                (None이고 다운로드가 필요한 모드면 이 상품의 이미지를 병렬로 다운로드)
             
         Returns:
             처리된 상품 데이터 (filtered_images, representative_image 필드 추가)
@@ -613,14 +890,7 @@ class ImageProcessor:
             return product_data
 
         # 이미지 URL 분리
-        if isinstance(images_data, list):
-            # 이미 리스트인 경우 (PostgreSQL adapter)
-            image_urls = [url.strip() for url in images_data if url and url.strip()]
-        elif isinstance(images_data, str):
-            # 문자열인 경우 ($$로 구분, Excel adapter)
-            image_urls = [url.strip() for url in images_data.split("$$") if url.strip()]
-        else:
-            image_urls = []
+        image_urls = self._get_image_urls(product_data)
         
         if not image_urls:
             product_data["alternative_images"] = ""
@@ -645,17 +915,27 @@ class ImageProcessor:
                         "reason": "필터링 비활성화"
                     })
             else:
-                # 필터링 활성화된 경우
+                # 필터링 활성화된 경우 (픽셀 분석이 필요하면 이미지를 먼저 병렬로 다운로드)
+                if images is None and self._needs_download():
+                    images = self.downloader.collect(self._submit_product_downloads(product_data))
+                images = images or {}
+                
+                resolved = {url: self._resolve_prefetched(url, images.get(url)) for url in image_urls[:self.max_images_per_product]}
+                if self.filter_mode in ("advanced", "both"):
+                    # 픽셀 분석은 상품 단위로 묶어서 한 번에
+                    resolved = self._measure_prefetched(resolved)
+                
                 for url in image_urls[:self.max_images_per_product]:
+                    img, digest = resolved[url]
                     if self.filter_mode == "ai":
                         # AI만 사용
-                        result = self._filter_with_ai_only(url)
+                        result = self._filter_with_ai_only(url, digest)
                     elif self.filter_mode == "advanced":
                         # 고급 로직만 사용
-                        result = self._filter_with_advanced_only(url)
+                        result = self._filter_with_advanced_only(url, img, digest)
                     else:  # "both"
                         # 두 방법 모두 사용
-                        result = self._filter_with_both(url)
+                        result = self._filter_with_both(url, img, digest)
 
                     if result and result["passed"]:
                         compliant_images.append(result)
@@ -1,6 +1,7 @@
 """Oliveyoung 크롤링 데이터를 Qoo10 업로드 형식으로 변환하는 메인 시스템."""
 
 import os
+import sys
 import json
 import logging
 from pathlib import Path
@@ -17,7 +18,8 @@ try:
     from .oliveyoung_field_transformer import OliveyoungFieldTransformer
     from .data_adapter import DataAdapterFactory
 except ImportError:
-    # 스크립트로 직접 실행하는 경우
+    # 스크립트로 직접 실행하는 경우 (crawler 패키지를 찾도록 프로젝트 루트를 경로에 추가)
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
     from data_loader import TemplateLoader
     from image_processor import ImageProcessor
     from product_filter import ProductFilter
@@ -244,9 +246,10 @@ class OliveyoungUploader:
         self.logger.info(f"이미지 처리 시작: {len(products)}개 상품")
         
         processed_products = []
-        for i, product in enumerate(products, 1):
+        # 다음 상품들의 이미지를 미리 병렬로 다운로드하면서 순서대로 처리
+        for i, (product, images) in enumerate(self.image_processor.prefetch_product_images(products), 1):
             try:
-                processed_product = self.image_processor.process_product_images(product)
+                processed_product = self.image_processor.process_product_images(product, images)
                 processed_products.append(processed_product)
                 
                 if i % 10 == 0:
@@ -542,6 +545,10 @@ def main():
         print(f"❌ 실행 오류: {str(e)}")
         return False
 
+    finally:
+        # 이미지 다운로더/디스크 캐시/판정 저장소 정리 (SQLite 인덱스 닫기)
+        uploader.image_processor.close()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
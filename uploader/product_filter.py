@@ -16,11 +16,8 @@ try:
 except ImportError:
     from data_loader import TemplateLoader
 
-try:
-    import psycopg2
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
+# 공유 연결 풀 (스크립트 실행 모드에서는 진입 스크립트가 프로젝트 루트를 경로에 추가)
+from crawler.db_pool import PSYCOPG2_AVAILABLE, get_pool
 
 # 환경변수 로드
 dotenv.load_dotenv()
@@ -50,8 +47,8 @@ class ProductFilter:
             api_key=os.getenv("OPENAI_API_KEY")
         )
 
-        # DB 연결 (upload_history 조회용)
-        self.db_conn = None
+        # DB 연결 풀 (upload_history 조회용)
+        self.db_pool = None
         if uploaded_by and PSYCOPG2_AVAILABLE:
             self._init_db_connection()
 
@@ -359,18 +356,21 @@ class ProductFilter:
             return None
     
     def _init_db_connection(self):
-        """DB 연결을 초기화한다."""
+        """공유 연결 풀을 가져오고 연결 상태를 확인한다."""
         try:
             connection_string = os.getenv("DATABASE_URL")
             if not connection_string:
                 self.logger.warning("DATABASE_URL 환경변수가 없습니다. 레거시 방식(Excel) 사용")
                 return
 
-            self.db_conn = psycopg2.connect(connection_string)
+            pool = get_pool(connection_string)
+            with pool.connection():
+                pass
+            self.db_pool = pool
             self.logger.info(f"upload_history DB 연결 성공 (user: {self.uploaded_by})")
         except Exception as e:
             self.logger.error(f"DB 연결 실패: {str(e)}, 레거시 방식(Excel) 사용")
-            self.db_conn = None
+            self.db_pool = None
 
     def _get_uploaded_product_ids_from_db(self) -> set:
         """
@@ -379,11 +379,11 @@ class ProductFilter:
         Returns:
             업로드한 crawled_product_id set
         """
-        if not self.db_conn or not self.uploaded_by:
+        if not self.db_pool or not self.uploaded_by:
             return set()
 
         try:
-            with self.db_conn.cursor() as cursor:
+            with self.db_pool.connection() as conn, conn.cursor() as cursor:
                 cursor.execute("""
                     SELECT DISTINCT cp.unique_item_id
                     FROM upload_history uh
@@ -414,7 +414,7 @@ class ProductFilter:
             return False
 
         # DB 방식 (upload_history 테이블)
-        if self.db_conn and self.uploaded_by:
+        if self.db_pool and self.uploaded_by:
             if self._uploaded_product_ids_cache is None:
                 self._uploaded_product_ids_cache = self._get_uploaded_product_ids_from_db()
             return unique_item_id in self._uploaded_product_ids_cache
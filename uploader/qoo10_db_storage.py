@@ -6,18 +6,21 @@ import os
 from datetime import datetime
 
 try:
-    import psycopg2
     from psycopg2.extras import execute_values
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+# 공유 연결 풀 (스크립트 실행 모드에서는 진입 스크립트가 프로젝트 루트를 경로에 추가)
+from crawler.db_pool import get_pool
+
 
 class Qoo10ProductsStorage:
     """
     qoo10_products 테이블용 PostgreSQL 저장소.
 
     업로드용으로 변환된 제품 데이터를 qoo10_products 테이블에 저장한다.
+    연결은 프로세스 공유 풀(crawler.db_pool)에서 작업마다 빌려 쓴다.
     """
 
     def __init__(self, connection_string: Optional[str] = None, table_name: str = "qoo10_products"):
@@ -39,30 +42,20 @@ class Qoo10ProductsStorage:
             raise ValueError("DATABASE_URL 환경변수가 설정되지 않았습니다.")
 
         self.table_name = table_name
-        self.conn = None
+        self.pool = get_pool(self.connection_string)
 
         # 연결 테스트
         self._connect()
 
     def _connect(self):
-        """데이터베이스에 연결한다."""
+        """공유 풀에서 연결을 한 번 빌려 연결 상태를 확인한다."""
         try:
-            if self.conn is None or self.conn.closed:
-                self.conn = psycopg2.connect(self.connection_string)
+            with self.pool.connection():
                 self.logger.info(f"PostgreSQL 연결 성공: {self.table_name}")
         except Exception as e:
             self.logger.error(f"PostgreSQL 연결 실패: {str(e)}")
             raise
 
-    def _ensure_connection(self):
-        """연결이 유효한지 확인하고 필요시 재연결한다."""
-        try:
-            if self.conn is None or self.conn.closed:
-                self._connect()
-        except Exception as e:
-            self.logger.error(f"연결 확인 실패: {str(e)}")
-            raise
-
     def save(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> bool:
         """
         데이터를 qoo10_products 테이블에 저장한다.
@@ -74,8 +67,6 @@ class Qoo10ProductsStorage:
             저장 성공 여부
         """
         try:
-            self._ensure_connection()
-
             # 단일 데이터를 리스트로 변환
             if isinstance(data, dict):
                 data = [data]
@@ -85,7 +76,7 @@ class Qoo10ProductsStorage:
                 return True
 
             # INSERT 쿼리 실행
-            with self.conn.cursor() as cursor:
+            with self.pool.connection() as conn, conn.cursor() as cursor:
                 # UPSERT 쿼리 (seller_unique_item_id 기준 중복 체크)
                 insert_query = f"""
                     INSERT INTO {self.table_name} (
@@ -178,23 +169,14 @@ class Qoo10ProductsStorage:
                     ))
 
                 execute_values(cursor, insert_query, values)
-                self.conn.commit()
+                conn.commit()
 
             self.logger.info(f"qoo10_products 저장 완료: {len(data)}개 항목")
             return True
 
         except Exception as e:
             self.logger.error(f"qoo10_products 저장 실패: {str(e)}")
-            if self.conn:
-                self.conn.rollback()
             return False
 
     def close(self):
-        """데이터베이스 연결을 닫는다."""
-        if self.conn and not self.conn.closed:
-            self.conn.close()
-            self.logger.info("PostgreSQL 연결 종료")
-
-    def __del__(self):
-        """소멸자에서 연결을 닫는다."""
-        self.close()
+        """공유 풀을 사용하므로 개별 연결은 닫지 않는다 (풀은 프로세스 종료 시 닫힘)."""
@@ -0,0 +1,162 @@
+"""이미지 필터링 판정 결과 저장소.
+
+이미지 내용 해시(sha256), 분석 종류(filter_mode), 판정에 사용한 파라미터 지문을 키로
+고급 필터 측정값과 Claude 규칙 검사 결과를 SQLite에 저장한다.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def parameter_fingerprint(params: Dict[str, Any]) -> str:
+    """
+    판정 파라미터의 지문을 계산한다 (키 순서와 무관).
+
+    Args:
+        params: 판정에 영향을 주는 파라미터
+
+    Returns:
+        sha256 hex 앞 16자리
+    """
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ImageVerdictStore:
+    """
+    (내용 해시, filter_mode, 파라미터 지문) → 판정 결과 저장소.
+
+    - 같은 이미지는 URL이 달라도 판정을 재사용한다.
+    - 임계값을 바꾸면 지문이 달라지므로 그 파라미터를 쓰는 판정만 다시 계산된다.
+    - URL → 내용 해시 매핑(url_max_age 이내)을 함께 저장하여 이미 판정한 URL은 다운로드도 건너뛴다.
+    """
+
+    def __init__(self, db_path: str = "data/image_verdicts.sqlite3", url_max_age: float = 7 * 24 * 3600):
+        """
+        ImageVerdictStore 초기화.
+
+        Args:
+            db_path: SQLite 파일 경로
+            url_max_age: URL → 내용 해시 매핑을 다운로드 없이 신뢰할 시간 (초)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.url_max_age = url_max_age
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS verdicts (
+                digest TEXT NOT NULL,
+                filter_mode TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (digest, filter_mode, fingerprint)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_digests (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self.stats = {"hits": 0, "misses": 0}
+
+    def digest_for_url(self, url: str) -> Optional[str]:
+        """
+        최근(url_max_age 이내)에 다운로드한 URL의 내용 해시를 반환한다.
+
+        Args:
+            url: 이미지 URL
+
+        Returns:
+            내용 해시 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT digest, seen_at FROM url_digests WHERE url = ?", (url,)).fetchone()
+        if row is None or time.time() - row[1] > self.url_max_age:
+            return None
+        return row[0]
+
+    def remember_url(self, url: str, digest: str) -> None:
+        """
+        다운로드한 URL의 내용 해시를 기록한다.
+
+        Args:
+            url: 이미지 URL
+            digest: 내용 해시
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO url_digests (url, digest, seen_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET digest = excluded.digest, seen_at = excluded.seen_at",
+                (url, digest, time.time())
+            )
+            self._conn.commit()
+
+    def get(self, digest: str, filter_mode: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 판정 결과를 조회한다.
+
+        Args:
+            digest: 이미지 내용 해시
+            filter_mode: 분석 종류 ("advanced", "ai")
+            fingerprint: 파라미터 지문
+
+        Returns:
+            판정 결과 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM verdicts WHERE digest = ? AND filter_mode = ? AND fingerprint = ?",
+                (digest, filter_mode, fingerprint)
+            ).fetchone()
+            self.stats["hits" if row else "misses"] += 1
+        return json.loads(row[0]) if row else None
+
+    def has(self, digest: str, filter_mode: str, fingerprint: str) -> bool:
+        """판정 결과가 있는지 확인한다 (통계에 세지 않음)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM verdicts WHERE digest = ? AND filter_mode = ? AND fingerprint = ?",
+                (digest, filter_mode, fingerprint)
+            ).fetchone()
+        return row is not None
+
+    def put(self, digest: str, filter_mode: str, fingerprint: str, result: Dict[str, Any]) -> None:
+        """
+        판정 결과를 저장한다.
+
+        Args:
+            digest: 이미지 내용 해시
+            filter_mode: 분석 종류 ("advanced", "ai")
+            fingerprint: 파라미터 지문
+            result: JSON 직렬화 가능한 판정 결과
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (digest, filter_mode, fingerprint, result, created_at) VALUES (?, ?, ?, ?, ?)",
+                (digest, filter_mode, fingerprint, json.dumps(result, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+        self.logger.info(f"이미지 판정 저장소 통계: 재사용 {self.stats['hits']}, 신규 판정 {self.stats['misses']}")
@@ -0,0 +1,167 @@
+"""흰색 픽셀 비율 측정 커널.
+
+이미지(또는 같은 크기의 이미지 묶음)를 한 번만 배열로 변환하고, 임계값마다 흰색 마스크를 한 번 만든 뒤
+적분 이미지(summed-area table)로 사각형 영역의 흰색 비율을 영역당 O(1)로 계산한다.
+"""
+
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+# (x1, y1, x2, y2) - PIL crop과 같은 좌표 규칙 (x2, y2 미포함)
+Region = Tuple[int, int, int, int]
+
+
+class WhiteRatioKernel:
+    """
+    같은 크기 이미지 묶음의 영역별 흰색 비율 계산기.
+
+    - RGB 세 채널이 모두 임계값 이상인 픽셀을 흰색으로 본다 (채널 최솟값 >= 임계값).
+    - 채널 최솟값은 생성 시 한 번, 흰색 마스크는 임계값마다 한 번만 계산한다.
+    - 적분 이미지는 조회할 영역들의 y 경계로 압축해 만든다 (마스크를 행 구간별로 한 번 합산한 뒤
+      열 방향 누적합, 픽셀 단위 2차원 누적합보다 훨씬 가벼움).
+    - 영역 조회는 묶음 전체에 대해 벡터화되어 이미지별 배열을 반환한다.
+    """
+
+    def __init__(self, channel_min: np.ndarray):
+        """
+        WhiteRatioKernel 초기화 (from_pixels / from_images 사용).
+
+        Args:
+            channel_min: (N, H, W) 픽셀별 RGB 채널 최솟값
+        """
+        self.count_images, self.height, self.width = channel_min.shape
+        self._channel_min = channel_min
+        self._masks: Dict[int, np.ndarray] = {}
+
+    @staticmethod
+    def channel_min(pixels: np.ndarray) -> np.ndarray:
+        """
+        픽셀별 RGB 채널 최솟값을 계산한다.
+
+        Args:
+            pixels: (..., 3) uint8 RGB 배열
+
+        Returns:
+            채널 최솟값 배열
+        """
+        if pixels.ndim < 3 or pixels.shape[-1] != 3:
+            raise ValueError(f"RGB 이미지 배열이 아닙니다: shape={pixels.shape}")
+        # 크기 3인 마지막 축의 min(axis=-1)보다 채널끼리 np.minimum이 훨씬 빠름
+        return np.minimum(np.minimum(pixels[..., 0], pixels[..., 1]), pixels[..., 2])
+
+    @classmethod
+    def from_pixels(cls, pixels: np.ndarray) -> "WhiteRatioKernel":
+        """
+        RGB 배열로 커널을 만든다.
+
+        Args:
+            pixels: (N, H, W, 3) 또는 (H, W, 3) uint8 RGB 배열
+
+        Returns:
+            WhiteRatioKernel
+        """
+        channel_min = cls.channel_min(pixels)
+        return cls(channel_min[np.newaxis] if channel_min.ndim == 2 else channel_min)
+
+    @classmethod
+    def from_images(cls, images: Sequence[Image.Image]) -> "WhiteRatioKernel":
+        """
+        같은 크기의 PIL 이미지들로 커널을 만든다 (RGB 배열 전체를 쌓지 않고 이미지별 채널 최솟값만 쌓음).
+
+        Args:
+            images: PIL 이미지 목록 (RGB가 아니면 변환)
+
+        Returns:
+            WhiteRatioKernel
+        """
+        return cls(np.stack([
+            cls.channel_min(np.asarray(img if img.mode == "RGB" else img.convert("RGB"))) for img in images
+        ]))
+
+    def mask(self, threshold: int) -> np.ndarray:
+        """
+        임계값의 흰색 마스크를 반환한다 (임계값별로 한 번만 계산).
+
+        Args:
+            threshold: 흰색 판정 임계값
+
+        Returns:
+            (N, H, W) bool 배열
+        """
+        mask = self._masks.get(threshold)
+        if mask is None:
+            mask = self._masks[threshold] = self._channel_min >= threshold
+        return mask
+
+    def table(self, threshold: int, ys: Sequence[int]) -> np.ndarray:
+        """
+        y 경계로 압축한 흰색 마스크 적분 이미지를 만든다.
+
+        Args:
+            threshold: 흰색 판정 임계값
+            ys: 정렬된 y 경계 좌표 (0과 높이 포함)
+
+        Returns:
+            (N, len(ys), W+1) int64 배열, [n, i, x]는 (0, 0)~(x, ys[i]) 직전 영역의 흰색 픽셀 수
+        """
+        mask = self.mask(threshold)
+        table = np.zeros((self.count_images, len(ys), self.width + 1), dtype=np.int64)
+        bands = np.stack([mask[:, y1:y2].sum(axis=1, dtype=np.int64) for y1, y2 in zip(ys, ys[1:])], axis=1)
+        np.cumsum(np.cumsum(bands, axis=2), axis=1, out=table[:, 1:, 1:])
+        return table
+
+    def counts(self, threshold: int, regions: Sequence[Region]) -> np.ndarray:
+        """
+        여러 영역의 흰색 픽셀 수를 한 번에 계산한다.
+
+        Args:
+            threshold: 흰색 판정 임계값
+            regions: (x1, y1, x2, y2) 목록
+
+        Returns:
+            (N, 영역 수) 흰색 픽셀 수
+        """
+        regions = [
+            (min(max(x1, 0), self.width), min(max(y1, 0), self.height), min(max(x2, 0), self.width), min(max(y2, 0), self.height))
+            for x1, y1, x2, y2 in regions
+        ]
+        ys = sorted({0, self.height, *(y for region in regions for y in (region[1], region[3]))})
+        y_index = {y: i for i, y in enumerate(ys)}
+        table = self.table(threshold, ys)
+
+        result = np.zeros((self.count_images, len(regions)), dtype=np.int64)
+        for column, (x1, y1, x2, y2) in enumerate(regions):
+            if x2 <= x1 or y2 <= y1:
+                continue
+            top, bottom = y_index[y1], y_index[y2]
+            result[:, column] = table[:, bottom, x2] - table[:, top, x2] - table[:, bottom, x1] + table[:, top, x1]
+        return result
+
+    def ratios(self, threshold: int, regions: Sequence[Region]) -> np.ndarray:
+        """
+        여러 영역의 흰색 픽셀 비율을 한 번에 계산한다.
+
+        Args:
+            threshold: 흰색 판정 임계값
+            regions: (x1, y1, x2, y2) 목록
+
+        Returns:
+            (N, 영역 수) 흰색 비율, 빈 영역은 0.0
+        """
+        areas = np.array([max(x2 - x1, 0) * max(y2 - y1, 0) for x1, y1, x2, y2 in regions], dtype=np.float64)
+        return np.divide(self.counts(threshold, regions), areas, out=np.zeros((self.count_images, len(regions))), where=areas > 0)
+
+    def ratio(self, threshold: int, region: Region) -> np.ndarray:
+        """
+        영역의 흰색 픽셀 비율을 반환한다.
+
+        Args:
+            threshold: 흰색 판정 임계값
+            region: (x1, y1, x2, y2)
+
+        Returns:
+            이미지별 흰색 비율 (N,)
+        """
+        return self.ratios(threshold, [region])[:, 0]